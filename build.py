@@ -145,8 +145,9 @@ def safe_zip_dir(src_dir: pathlib.Path, out_zip: pathlib.Path, context: BuildCon
                 if p.is_file():
                     rel = p.relative_to(src_dir).as_posix()
                     zi = zipfile.ZipInfo(rel, EPOCH_1980)
-                    data = p.read_bytes()
-                    z.writestr(zi, data)
+                    # Stream the file into the entry instead of reading it whole
+                    with p.open("rb") as src, z.open(zi, "w") as dst:
+                        shutil.copyfileobj(src, dst)
     except Exception as e:
         raise StyleStackError(
             f"Failed to create ZIP: {e}",
@@ -532,10 +533,10 @@ def process_json_patches(context: BuildContext, pkg_dir: pathlib.Path, org: Opti
                                 break
                         
                         if final_doc is not None:
-                            # Write back the modified XML
-                            xml_str = ET.tostring(final_doc, encoding='utf-8', xml_declaration=True)
-                            with open(xml_file, 'wb') as f:
-                                f.write(xml_str)
+                            # Write the modified tree straight to disk (no intermediate string)
+                            tree = final_doc.getroottree()
+                            tree.write(str(xml_file), encoding='UTF-8', xml_declaration=True,
+                                       standalone=tree.docinfo.standalone)
                             patches_applied += batch_result.successful_patches
                         
                     else:
@@ -629,7 +630,12 @@ def process_extension_variables(context: BuildContext, pkg_dir: pathlib.Path):
 @click.option('--supertheme', is_flag=True, help='Generate Microsoft SuperTheme package (.thmx)')
 @click.option('--designs', help='Directory containing design variant JSON files')
 @click.option('--ratios', help='Aspect ratios (comma-separated: 16:9,4:3,a4,letter)')
-def main(src, as_potx, as_dotx, as_xltx, out, verbose, org, channel, supertheme, designs, ratios):
+@click.option('--cache-dir', type=click.Path(file_okay=False, path_type=pathlib.Path),
+              default=pathlib.Path('.stylestack-cache'), show_default=True,
+              help='Build cache directory (SuperTheme variants are rebuilt only when their inputs change)')
+@click.option('--no-cache', is_flag=True, help='Regenerate every SuperTheme variant without reading or writing the cache')
+def main(src, as_potx, as_dotx, as_xltx, out, verbose, org, channel, supertheme, designs, ratios,
+         cache_dir, no_cache):
     """StyleStack OOXML Extension Variable System"""
     
     # License validation for commercial use (GitHub-native)
@@ -663,6 +669,7 @@ def main(src, as_potx, as_dotx, as_xltx, out, verbose, org, channel, supertheme,
         # Import SuperTheme generator
         try:
             from tools.supertheme_generator import SuperThemeGenerator
+            from tools.supertheme_build_cache import SuperThemeBuildCache
             from tools.aspect_ratio_resolver import create_standard_aspect_ratios
             import json
         except ImportError as e:
@@ -732,6 +739,9 @@ def main(src, as_potx, as_dotx, as_xltx, out, verbose, org, channel, supertheme,
         # Generate SuperTheme
         try:
             generator = SuperThemeGenerator(verbose=verbose)
+            out_path = pathlib.Path(out)
+            # One manifest per output package, so builds of different packages don't evict each other
+            build_cache = None if no_cache else SuperThemeBuildCache(cache_dir / 'supertheme' / out_path.stem)
             
             if verbose:
                 click.echo("🔨 Generating SuperTheme package...")
@@ -742,11 +752,11 @@ def main(src, as_potx, as_dotx, as_xltx, out, verbose, org, channel, supertheme,
             # Generate the SuperTheme package
             supertheme_bytes = generator.generate_supertheme(
                 design_variants=design_variants,
-                aspect_ratios=aspect_ratio_list
+                aspect_ratios=aspect_ratio_list,
+                build_cache=build_cache
             )
             
             # Write output file
-            out_path = pathlib.Path(out)
             out_path.write_bytes(supertheme_bytes)
             
             # Report success
@@ -754,6 +764,9 @@ def main(src, as_potx, as_dotx, as_xltx, out, verbose, org, channel, supertheme,
             click.echo(f"✅ SuperTheme generated: {out_path}")
             click.echo(f"   Size: {size_mb:.2f} MB")
             click.echo(f"   Variants: {len(design_variants) * len(aspect_ratio_list)}")
+            if build_cache is not None:
+                click.echo(f"   Cache: {build_cache.stats.reused} reused, "
+                           f"{build_cache.stats.regenerated} regenerated")
             
             if size_mb > 5.0:
                 click.echo(f"⚠️  Warning: Package size ({size_mb:.2f}MB) exceeds recommended 5MB limit")
@@ -410,5 +410,64 @@ class TestAspectRatioConditionalResolution:
         assert document_resolved["layout"]["margins"]["top"] == "720000"
 
 
+class TestAspectRatioStructuralSharing:
+    """Test conditional-site indexing and shared subtrees across ratios"""
+    
+    @pytest.fixture
+    def design_tokens(self):
+        return {
+            "aspectRatios": {
+                name: {
+                    "$type": "aspectRatio",
+                    "$value": {"name": name, "width": width, "height": height, "powerpoint_type": "custom"}
+                }
+                for name, width, height in [("widescreen", "12192000", "6858000"),
+                                            ("a4_portrait", "7560000", "10692000")]
+            },
+            "colors": {"primary": {"$value": "#0066CC"}, "palette": [{"$value": "#FFFFFF"}]},
+            "layout": {
+                "slide": {"width": {"$aspectRatio": {"{aspectRatios.widescreen}": "1920",
+                                                     "{aspectRatios.a4_portrait}": "794"}}},
+                "columns": [{"$aspectRatio": {"{aspectRatios.widescreen}": 12,
+                                              "{aspectRatios.a4_portrait}": 6}}, 4],
+            },
+        }
+    
+    def test_conditional_sites_indexed_once(self, design_tokens):
+        resolver = AspectRatioResolver()
+        
+        index = resolver.index_tokens(design_tokens)
+        
+        assert index.site_count == 2
+        assert resolver.index_tokens(design_tokens) is index
+        assert index.fingerprint == resolver.index_tokens(json.loads(json.dumps(design_tokens))).fingerprint
+    
+    def test_only_conditional_paths_are_copied(self, design_tokens):
+        resolver = AspectRatioResolver()
+        
+        widescreen = resolver.resolve_aspect_ratio_tokens(design_tokens, "aspectRatios.widescreen")
+        portrait = resolver.resolve_aspect_ratio_tokens(design_tokens, "aspectRatios.a4_portrait")
+        
+        assert widescreen["layout"]["slide"]["width"] == "1920"
+        assert widescreen["layout"]["columns"] == [12, 4]
+        assert portrait["layout"]["slide"]["width"] == "794"
+        assert portrait["layout"]["columns"] == [6, 4]
+        # Subtrees without conditionals are shared with the input
+        assert widescreen["colors"] is design_tokens["colors"]
+        assert portrait["aspectRatios"] is design_tokens["aspectRatios"]
+        # The input tree is left untouched
+        assert "$aspectRatio" in design_tokens["layout"]["slide"]["width"]
+    
+    def test_clear_cache_reindexes_mutated_trees(self, design_tokens):
+        resolver = AspectRatioResolver()
+        resolver.resolve_aspect_ratio_tokens(design_tokens, "aspectRatios.widescreen")
+        
+        design_tokens["layout"]["gutter"] = {"$aspectRatio": {"{aspectRatios.widescreen}": "24"}}
+        resolver.clear_cache()
+        resolved = resolver.resolve_aspect_ratio_tokens(design_tokens, "aspectRatios.widescreen")
+        
+        assert resolved["layout"]["gutter"] == "24"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+Tests for grid-bucketed colour clustering
+"""
+
+import random
+
+import pytest
+
+from tools.color_clustering import cluster_colors, delta_e, find_similar_color_pairs, parse_hex_color, rgb_to_lab
+from tools.design_token_extractor import DesignTokenExtractor
+from tools.performance.color_clustering_benchmark import pairwise_similar_pairs, synthetic_palette
+
+
+def random_palette(size, seed):
+    rng = random.Random(seed)
+    return ["#%06X" % rng.randrange(0x1000000) for _ in range(size)]
+
+
+class TestSimilarColorPairs:
+    """Bucketed search finds exactly the pairs of a pairwise scan"""
+
+    @pytest.mark.parametrize("threshold", [2.0, 5.0, 20.0])
+    def test_matches_pairwise_scan(self, threshold):
+        palette = synthetic_palette(600, seed=3) + random_palette(200, seed=4)
+
+        assert find_similar_color_pairs(palette, threshold) == pairwise_similar_pairs(palette, threshold)
+
+    def test_lab_reference_values(self):
+        assert rgb_to_lab((255, 255, 255)) == pytest.approx((100.0, 0.0, 0.0), abs=0.01)
+        assert rgb_to_lab((255, 0, 0)) == pytest.approx((53.24, 80.09, 67.20), abs=0.05)
+        assert delta_e(rgb_to_lab((0, 0, 0)), rgb_to_lab((255, 255, 255))) == pytest.approx(100.0, abs=0.01)
+
+    def test_non_hex_values_are_ignored(self):
+        pairs = find_similar_color_pairs(["#FF0000", "invalid", "FF0101", "#12345G"])
+
+        assert pairs == [("#FF0000", "FF0101")]
+        assert parse_hex_color("#12345G") is None
+
+
+class TestClusterColors:
+    """Similar colours are merged transitively"""
+
+    def test_chains_merge_into_first_color(self):
+        ramp = ["#%02X0000" % value for value in range(200, 256, 4)]
+        clusters = cluster_colors(["#0000FF"] + ramp + ["#0000FE"])
+
+        assert clusters == [["#0000FF", "#0000FE"], ramp]
+
+    def test_ten_thousand_colors(self):
+        palette = synthetic_palette(10000)
+
+        clusters = cluster_colors(palette)
+
+        assert sum(len(cluster) for cluster in clusters) == len(palette)
+        assert len(clusters) < len(palette)
+
+
+class TestExtractorIntegration:
+    """DesignTokenExtractor keeps its pair output"""
+
+    def test_find_similar_colors(self):
+        extractor = DesignTokenExtractor()
+
+        pairs = extractor._find_similar_colors(["#FF0000", "#FF1111", "#00FF00", "#0000FF", "#FF0000"])
+
+        assert pairs == [("#FF0000", "#FF1111"), ("#FF0000", "#FF0000"), ("#FF1111", "#FF0000")]
@@ -0,0 +1,89 @@
+"""
+Tests for batch colour transformation chains
+"""
+
+import itertools
+
+import pytest
+
+from tools.theme_resolver import NUMPY_AVAILABLE, ColorTransformationEngine
+
+BASE_COLORS = ["4472C4", "70AD47", "FFC000", "000000", "FFFFFF", "808080", "#7030a0"]
+
+CHAINS = [
+    [],
+    [("tint", 40000)],
+    [("shade", 25000)],
+    [("lumMod", 75000), ("lumOff", 25000)],
+    [("satMod", 120000), ("hueOff", 60000)],
+    [("satOff", -20000), ("hueMod", 50000)],
+    [("shade", -20000), ("hueMod", 75000), ("lumOff", 100000)],  # out-of-range intermediate
+    [("unknown", 1), ("tint", 10000)],
+    [("unknown", 1)],
+]
+
+
+def apply_one_at_a_time(engine, base_color, chain):
+    for transform_type, value in chain:
+        base_color = engine.apply_transformation(base_color, transform_type, value)
+    return base_color
+
+
+def expected_ramps():
+    engine = ColorTransformationEngine(use_numpy=False)
+    return [[apply_one_at_a_time(engine, color, chain) for chain in CHAINS] for color in BASE_COLORS]
+
+
+class TestBatchTransformations:
+    """Batch results match one-at-a-time transformations exactly"""
+
+    def test_python_backend_matches_single_transformations(self):
+        engine = ColorTransformationEngine(use_numpy=False)
+
+        assert engine.generate_color_ramps(BASE_COLORS, CHAINS) == expected_ramps()
+
+    def test_numpy_backend_is_bit_identical(self):
+        pytest.importorskip("numpy")
+        engine = ColorTransformationEngine(use_numpy=True)
+        engine.NUMPY_MIN_BATCH = 1
+
+        assert engine.generate_color_ramps(BASE_COLORS, CHAINS) == expected_ramps()
+
+    def test_pairs_keep_input_order(self):
+        engine = ColorTransformationEngine(use_numpy=False)
+        pairs = list(itertools.product(BASE_COLORS, CHAINS))
+
+        results = engine.apply_transformation_chains([color for color, _ in pairs], [chain for _, chain in pairs])
+
+        assert results == [value for row in expected_ramps() for value in row]
+
+    def test_repeated_pairs_are_memoized(self, monkeypatch):
+        engine = ColorTransformationEngine(use_numpy=False)
+        first = engine.generate_color_ramps(BASE_COLORS, CHAINS)
+
+        def fail(keys):
+            raise AssertionError("memoized pairs must not be recomputed")
+        monkeypatch.setattr(engine, "_apply_chains_python", fail)
+
+        # Equal chains given as new objects still hit the memo
+        assert engine.generate_color_ramps(BASE_COLORS, [list(chain) for chain in CHAINS]) == first
+
+    def test_memo_is_bounded(self):
+        engine = ColorTransformationEngine(use_numpy=False, memo_size_limit=10)
+
+        # One batch of 63 distinct pairs, more than the memo holds
+        ramps = engine.generate_color_ramps(BASE_COLORS, CHAINS)
+
+        assert ramps == expected_ramps()
+        assert len(engine._chain_memo) == 10
+        engine.generate_color_ramps(["123456"], [[("tint", 1)]])
+        assert len(engine._chain_memo) == 1
+
+    def test_mismatched_lengths_are_rejected(self):
+        with pytest.raises(ValueError):
+            ColorTransformationEngine().apply_transformation_chains(["4472C4"], [])
+
+    @pytest.mark.skipif(NUMPY_AVAILABLE, reason="NumPy is installed")
+    def test_numpy_backend_requires_numpy(self):
+        with pytest.raises(ImportError):
+            ColorTransformationEngine(use_numpy=True)
@@ -0,0 +1,115 @@
+"""
+Tests for the WCAG contrast matrix
+"""
+
+import pytest
+
+from tools import contrast_matrix
+from tools.contrast_matrix import compute_contrast_matrix, contrast_ratio, palette_hash
+from tools.theme_resolver import ThemeResolver
+
+PALETTE = ["000000", "FFFFFF", "#1f4788", "EEECE1", "4472C4", "FFC000", "767676", "777777"]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    contrast_matrix.clear_cache()
+    yield
+    contrast_matrix.clear_cache()
+
+
+class TestContrastMatrix:
+    """The matrix matches pairwise contrast ratios"""
+
+    def test_ratios_match_pairwise_computation(self):
+        matrix = compute_contrast_matrix(PALETTE)
+
+        for fg in PALETTE:
+            for bg in PALETTE:
+                assert matrix.ratio(fg, bg) == pytest.approx(contrast_ratio(fg, bg), abs=1e-12)
+        assert matrix.ratio("000000", "FFFFFF") == pytest.approx(21.0)
+
+    def test_numpy_table_is_identical(self):
+        pytest.importorskip("numpy")
+
+        python = compute_contrast_matrix(PALETTE, use_numpy=False, use_cache=False)
+        vectorized = compute_contrast_matrix(PALETTE, use_numpy=True, use_cache=False)
+
+        assert vectorized.ratios == python.ratios
+
+    def test_failing_pairs_against_thresholds(self):
+        matrix = compute_contrast_matrix(["FFFFFF", "767676", "777777"])
+
+        # #767676 is the lightest grey that passes AA on white
+        assert [(p.foreground, p.background) for p in matrix.failing_pairs("AA")] == [
+            ("FFFFFF", "777777"), ("767676", "777777")]
+        assert len(matrix.failing_pairs("AAA")) == 3
+        assert len(matrix.failing_pairs("AA", large_text=True)) == 1
+
+    def test_failing_pairs_for_foreground_and_background_subsets(self):
+        matrix = compute_contrast_matrix(PALETTE)
+
+        failing = matrix.failing_pairs("AA", foregrounds=["FFC000"], backgrounds=["FFFFFF", "000000"])
+
+        assert [(p.foreground, p.background) for p in failing] == [("FFC000", "FFFFFF")]
+
+    def test_identical_foreground_and_background_fail(self):
+        matrix = compute_contrast_matrix(["FFFFFF", "000000", "FFFFFF"])
+
+        failing = matrix.failing_pairs("AA", foregrounds=["FFFFFF"], backgrounds=["FFFFFF", "000000"])
+
+        assert [(p.foreground, p.background, p.ratio) for p in failing] == [("FFFFFF", "FFFFFF", 1.0)]
+
+    def test_results_are_cached_by_palette_hash(self):
+        first = compute_contrast_matrix(PALETTE)
+
+        assert compute_contrast_matrix([c.lower() for c in PALETTE]) is first
+        assert first.palette_hash == palette_hash(PALETTE)
+        assert compute_contrast_matrix(list(reversed(PALETTE))) is not first
+
+    def test_cache_is_bounded(self):
+        contrast_matrix.set_cache_size(2)
+        try:
+            for grey in ("111111", "222222", "333333"):
+                compute_contrast_matrix(["FFFFFF", grey])
+            assert contrast_matrix.cache_info()["size"] == 2
+        finally:
+            contrast_matrix.set_cache_size(contrast_matrix.DEFAULT_CACHE_SIZE)
+
+    def test_unknown_level_is_rejected(self):
+        with pytest.raises(ValueError):
+            compute_contrast_matrix(PALETTE).failing_pairs("A")
+
+
+class TestThemeContrastValidation:
+    """Theme variants are checked text-on-background"""
+
+    def test_default_theme_passes_aa(self):
+        resolver = ThemeResolver()
+
+        assert resolver.validate_theme_contrast(resolver.create_default_theme()) == []
+
+    def test_low_contrast_text_is_reported_for_every_variant(self):
+        resolver = ThemeResolver()
+        theme_variants = {"Brand": {ratio: resolver.create_default_theme() for ratio in ("16:9", "4:3")}}
+        for themes in theme_variants.values():
+            for theme in themes.values():
+                theme.colors = dict(theme.colors)
+                theme.colors["dk2"] = type(theme.colors["dk2"])("dk2", "Dark 2", "AAAAAA", "text")
+
+        report = resolver.validate_theme_variants_contrast(theme_variants)
+
+        for ratio in ("16:9", "4:3"):
+            assert {(p.foreground, p.background) for p in report["Brand"][ratio]} == {
+                ("AAAAAA", "FFFFFF"), ("AAAAAA", "EEECE1")}
+        assert contrast_matrix.cache_info()["size"] == 1
+
+    def test_text_in_background_colour_is_reported(self):
+        resolver = ThemeResolver()
+        theme = resolver.create_default_theme()
+        theme.colors = dict(theme.colors)
+        theme.colors["dk1"] = type(theme.colors["dk1"])("dk1", "Dark 1", "FFFFFF", "text")
+
+        failing = resolver.validate_theme_contrast(theme)
+
+        assert ("FFFFFF", "FFFFFF") in {(p.foreground, p.background) for p in failing}
@@ -0,0 +1,185 @@
+"""
+Tests for streaming design token extraction from package ZIPs
+"""
+
+import io
+import struct
+import zipfile
+import zlib
+
+import pytest
+
+from tools.design_token_extractor import (
+    IMAGE_HEADER_SIZE, JPEG_SKIP_CHUNK, DesignTokenExtractor, PackageSource, probe_image_dimensions
+)
+
+A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def png(width, height):
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(b"\0" * (width * 3 + 1) * height)) + chunk(b"IEND", b""))
+
+
+def jpeg(width, height, app_payload=b""):
+    app1 = b"\xff\xe1" + struct.pack(">H", len(app_payload) + 2) + app_payload
+    sof0 = b"\xff\xc0\x00\x11\x08" + struct.pack(">HH", height, width) + b"\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01"
+    return b"\xff\xd8" + app1 + sof0 + b"\xff\xda" + b"\0" * 64 + b"\xff\xd9"
+
+
+def emf(width, height):
+    header = struct.pack("<II4i4i", 1, 108, 10, 20, 10 + width - 1, 20 + height - 1, 0, 0, 1000, 1000)
+    return header + b" EMF" + b"\0" * 64
+
+
+def slide(index):
+    color = f"{index * 37 % 256:02X}{index * 11 % 256:02X}{index * 5 % 256:02X}"
+    run = (f'<a:r><a:rPr sz="{(18 + index % 4 * 6) * 100}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+           f'<a:latin typeface="Font{index % 3}"/></a:rPr><a:t>t</a:t></a:r>')
+    return (f'<p:sld xmlns:a="{A}" xmlns:p="{P}" xmlns:r="{R}"><p:cSld><p:spTree><p:sp>'
+            f'<p:spPr><a:solidFill><a:schemeClr val="4"/></a:solidFill></p:spPr>'
+            f'<p:txBody><a:p>{run * 2}</a:p></p:txBody></p:sp>'
+            f'<p:pic><p:blipFill><a:blip r:embed="rId{index % 2 + 2}"/></p:blipFill></p:pic>'
+            f'</p:spTree></p:cSld></p:sld>')
+
+
+@pytest.fixture
+def deck(tmp_path):
+    path = tmp_path / "deck.pptx"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("ppt/theme/theme1.xml",
+                    f'<a:theme xmlns:a="{A}"><a:themeElements><a:clrScheme name="t">'
+                    f'<a:accent1><a:srgbClr val="4472c4"/></a:accent1></a:clrScheme></a:themeElements></a:theme>')
+        zf.writestr("ppt/slideMasters/slideMaster1.xml", slide(100))
+        zf.writestr("ppt/slideLayouts/slideLayout1.xml",
+                    f'<p:sldLayout xmlns:a="{A}" xmlns:p="{P}"><a:xfrm><a:off x="457200" y="274638"/>'
+                    f'<a:ext cx="8229600" cy="1143000"/></a:xfrm></p:sldLayout>')
+        for index in range(1, 13):
+            zf.writestr(f"ppt/slides/slide{index}.xml", slide(index))
+        zf.writestr("ppt/slides/slide13.xml", "<broken")
+        zf.writestr("ppt/media/company_logo.png", png(120, 60))
+        zf.writestr("ppt/media/image2.png", png(40, 40))
+        zf.writestr("ppt/media/photo.jpg", jpeg(1280, 720, b"\0" * 20000) + b"\0" * 600000)
+        zf.writestr("ppt/media/chart.emf", emf(640, 480))
+    return path
+
+
+def extract(path, **options):
+    extractor = DesignTokenExtractor(**options)
+    tokens = extractor._extract_basic_ooxml(path, "ooxml_presentation")
+    return extractor, tokens
+
+
+class TestStreamingExtraction:
+    """Parts are read from the ZIP without extracting it"""
+
+    def test_package_is_not_extracted(self, deck, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("package must not be extracted")
+        monkeypatch.setattr(zipfile.ZipFile, "extractall", fail)
+
+        extractor, tokens = extract(deck)
+
+        assert extractor.theme_info == {"accent1": "#4472C4"}
+        # Two runs on the master and on each of the 12 readable slides
+        assert sum(extractor.extracted_fonts.values()) == 2 + 12 * 2
+        assert extractor.layout_patterns == [{"x": 457200, "y": 274638, "width": 8229600, "height": 1143000}]
+        assert tokens["stylestack"]["tokens"]["typography"]["font_family"]["value"]
+
+    def test_parallel_slides_match_serial(self, deck):
+        serial, serial_tokens = extract(deck)
+        parallel, parallel_tokens = extract(deck, max_workers=2)
+
+        assert parallel_tokens == serial_tokens
+        for attribute in ("extracted_colors", "extracted_fonts", "extracted_sizes", "image_usage"):
+            assert list(getattr(parallel, attribute).items()) == list(getattr(serial, attribute).items())
+
+    def test_image_dimensions_come_from_headers(self, deck):
+        extractor, _ = extract(deck)
+        images = {image["filename"]: image for image in extractor.extracted_images}
+
+        assert images["company_logo.png"]["dimensions"] == {"width": 120, "height": 60, "unit": "px"}
+        assert images["photo.jpg"]["dimensions"] == {"width": 1280, "height": 720, "unit": "px"}
+        assert images["chart.emf"]["dimensions"] == {"width": 640, "height": 480, "unit": "px"}
+        assert images["image2.png"]["classification"] == "icon"
+
+    def test_extracted_directory_is_still_supported(self, deck, tmp_path):
+        with zipfile.ZipFile(deck) as zf:
+            zf.extractall(tmp_path / "extracted")
+        from_zip, from_directory = DesignTokenExtractor(), DesignTokenExtractor()
+
+        with PackageSource(deck) as package:
+            from_zip._extract_theme_colors(package)
+            from_zip._extract_content_analysis(package)
+        from_directory._extract_theme_colors(tmp_path / "extracted")
+        from_directory._extract_content_analysis(tmp_path / "extracted")
+
+        assert list(from_directory.extracted_colors.items()) == list(from_zip.extracted_colors.items())
+
+    def test_only_packages_opened_by_a_step_are_closed_by_it(self, deck, monkeypatch):
+        closed = []
+        close = PackageSource.close
+        monkeypatch.setattr(PackageSource, "close", lambda self: closed.append(self) or close(self))
+        extractor = DesignTokenExtractor()
+
+        extractor._extract_theme_colors(deck)
+        assert len(closed) == 1
+
+        with PackageSource(deck) as package:
+            extractor._extract_theme_colors(package)
+            assert len(closed) == 1
+        assert closed[-1] is package
+
+    def test_assets_are_copied_from_the_package(self, deck, tmp_path):
+        extractor = DesignTokenExtractor()
+        tokens = extractor._extract_basic_ooxml(deck, "ooxml_presentation")
+
+        extractor._extract_image_files(deck, tmp_path / "assets", tokens)
+
+        assert (tmp_path / "assets" / "logos" / "company_logo.png").read_bytes() == png(120, 60)
+
+
+class TestProbeImageDimensions:
+    """Only image headers are read"""
+
+    class CountingStream(io.BytesIO):
+        bytes_read = 0
+        largest_read = 0
+
+        def read(self, size=-1):
+            data = super().read(size)
+            self.bytes_read += len(data)
+            self.largest_read = max(self.largest_read, len(data))
+            return data
+
+    @pytest.mark.parametrize("payload, expected", [
+        (png(300, 200), (300, 200)),
+        (b"GIF89a" + struct.pack("<HH", 16, 24) + b"\0" * 100, (16, 24)),
+        (emf(800, 600), (800, 600)),
+    ])
+    def test_fixed_headers(self, payload, expected):
+        stream = self.CountingStream(payload + b"\0" * 100000)
+
+        dimensions = probe_image_dimensions(stream)
+
+        assert (dimensions["width"], dimensions["height"]) == expected
+        assert stream.bytes_read <= IMAGE_HEADER_SIZE
+
+    def test_jpeg_skips_segments_up_to_frame_header(self):
+        stream = self.CountingStream(jpeg(1920, 1080, b"\0" * 30000) + b"\0" * 500000)
+
+        assert probe_image_dimensions(stream) == {"width": 1920, "height": 1080, "unit": "px"}
+        assert stream.bytes_read < 31000
+        assert stream.largest_read <= JPEG_SKIP_CHUNK
+
+    def test_svg_view_box(self):
+        svg = b'<?xml version="1.0"?><svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 32"/>'
+
+        assert probe_image_dimensions(io.BytesIO(svg), ".svg") == {"width": 64, "height": 32, "unit": "svg_units"}
+
+    def test_unknown_content(self):
+        assert probe_image_dimensions(io.BytesIO(b"fake image content")) is None
@@ -0,0 +1,116 @@
+"""
+Tests for the EMUValue fast path and bulk EMUArray conversions
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from tools.emu_types import (
+    EMUArray, EMUConversionError, EMUOverflowError, EMUValue, MAX_EMU_VALUE, MIN_EMU_VALUE, NUMPY_AVAILABLE,
+    Rectangle, cm_to_emu, inches_to_emu, pixels_to_emu, points_to_emu
+)
+from tools.powerpoint_positioning_calculator import PositioningCalculator
+from tools.token_integration_layer import ProductionEMUTypeSystem
+
+VALUES = [0, 1, 2.5, 13.7, -4.25, 0.1, 72, 1e-3, 333.333]
+
+
+class TestEMUValueFastPath:
+    """Validated construction, no re-conversion of valid values"""
+
+    def test_small_values_are_interned(self):
+        assert EMUValue(12700) is EMUValue(12700.9)
+        assert EMUValue(6350) + EMUValue(6350) is EMUValue(12700)
+
+    def test_values_are_slotted(self):
+        with pytest.raises(AttributeError):
+            EMUValue(1).extra = True
+
+    def test_pickle_and_copy_round_trip(self):
+        value = EMUValue(10**9)
+
+        assert pickle.loads(pickle.dumps(value)) == value
+        assert copy.deepcopy(value) == value
+
+    def test_results_are_still_range_checked(self):
+        with pytest.raises(EMUOverflowError):
+            EMUValue(MAX_EMU_VALUE) * 2
+        with pytest.raises(EMUOverflowError):
+            EMUValue(MAX_EMU_VALUE) + EMUValue(MAX_EMU_VALUE)
+        with pytest.raises(EMUOverflowError):
+            EMUValue(MIN_EMU_VALUE) - EMUValue(1)
+        with pytest.raises(EMUOverflowError):
+            EMUValue(MAX_EMU_VALUE) + (MAX_EMU_VALUE + 1)
+
+    def test_rectangle_intersection(self):
+        a = Rectangle(0, 0, 100, 100)
+        b = Rectangle(50, 60, 100, 100)
+
+        assert a.intersection(b) == Rectangle(50, 60, 50, 40)
+        assert not a.intersects(Rectangle(101, 0, 10, 10))
+
+    def test_formatted_values_keep_format_methods(self):
+        value = ProductionEMUTypeSystem().parse_value("12pt")
+
+        assert value == EMUValue(152400)
+        assert value.to_presentation_format() == "12pt"
+
+
+class TestEMUArray:
+    """Bulk conversions match the scalar functions"""
+
+    @pytest.mark.parametrize("use_numpy", [False, pytest.param(True, marks=pytest.mark.skipif(
+        not NUMPY_AVAILABLE, reason="NumPy not installed"))])
+    def test_conversions_match_scalar_functions(self, use_numpy):
+        assert EMUArray.from_points(VALUES, use_numpy=use_numpy) == [points_to_emu(v).value for v in VALUES]
+        assert EMUArray.from_inches(VALUES, use_numpy=use_numpy) == [inches_to_emu(v).value for v in VALUES]
+        assert EMUArray.from_cm(VALUES, use_numpy=use_numpy) == [cm_to_emu(v).value for v in VALUES]
+        assert EMUArray.from_pixels(VALUES, dpi=72, use_numpy=use_numpy) == [
+            pixels_to_emu(v, dpi=72).value for v in VALUES
+        ]
+
+    @pytest.mark.parametrize("use_numpy", [False, pytest.param(True, marks=pytest.mark.skipif(
+        not NUMPY_AVAILABLE, reason="NumPy not installed"))])
+    def test_snap_modes(self, use_numpy):
+        values = EMUArray([-19050, 6350, 19050, 20000], use_numpy=use_numpy)
+
+        assert values.snap(12700) == [round(v / 12700) * 12700 for v in values.to_list()]
+        assert values.snap(12700, mode="floor") == [-25400, 0, 12700, 12700]
+        assert values.snap(EMUValue(12700), mode="ceil") == [-12700, 12700, 25400, 25400]
+
+    def test_elementwise_arithmetic(self):
+        values = EMUArray([100, 200])
+
+        assert values + EMUValue(5) == [105, 205]
+        assert values - EMUArray([1, 2]) == [99, 198]
+        assert values.scale(1.5) == [150, 300]
+        assert values[1] == EMUValue(200)
+        assert list(values) == [EMUValue(100), EMUValue(200)]
+
+    def test_invalid_input_is_rejected_at_the_boundary(self):
+        with pytest.raises(EMUConversionError):
+            EMUArray.from_points([1, "wide"])
+        with pytest.raises(EMUOverflowError):
+            EMUArray([MAX_EMU_VALUE + 1])
+        with pytest.raises(ValueError):
+            EMUArray([1]).snap(0)
+
+    def test_results_are_range_checked(self):
+        values = EMUArray([MAX_EMU_VALUE, 0])
+
+        with pytest.raises(EMUOverflowError):
+            values + EMUValue(1)
+        with pytest.raises(EMUOverflowError):
+            EMUArray([MIN_EMU_VALUE]) - values[:1]
+        with pytest.raises(EMUOverflowError):
+            values.snap(MAX_EMU_VALUE - 1, mode="ceil")
+
+    def test_responsive_positions_match_single_calculation(self):
+        calculator = PositioningCalculator("4:3")
+        positions = [{"x": i * 1000, "y": i * 777, "width": 5000, "height": 3001 + i} for i in range(50)]
+
+        assert calculator.calculate_responsive_positions(positions) == [
+            calculator.calculate_responsive_position(position) for position in positions
+        ]
@@ -0,0 +1,89 @@
+"""
+Tests for compiled formulas and the expression cache
+"""
+
+import pytest
+
+from tools import formula_parser
+from tools.emu_types import EMUValue
+from tools.formula_parser import EvaluationError, FormulaParser
+from tools.formula_variable_resolver import FormulaVariableResolver
+
+CONTEXT = {'SAFE_L': 457200, 'col': 3, 'COL_W': 685800, 'GUT': 91440, 'scale': 1.5, 'w': EMUValue(914400)}
+
+EXPRESSIONS = [
+    "42",
+    "-SAFE_L",
+    "SAFE_L + (col - 1) * (COL_W + GUT)",
+    "COL_W / col % 7 - +GUT",
+    "2 ** 3 ** 2",
+    "w * scale + w / 4",
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    formula_parser.clear_cache()
+    yield
+    formula_parser.clear_cache()
+
+
+class TestCompiledFormula:
+    """Compiled closures evaluate exactly like the AST walker"""
+
+    @pytest.mark.parametrize("expression", EXPRESSIONS)
+    def test_matches_ast_evaluation(self, expression):
+        parser = FormulaParser()
+
+        assert parser.compile(expression)(CONTEXT) == parser.evaluate(parser.parse(expression), CONTEXT)
+
+    @pytest.mark.parametrize("expression, message", [
+        ("missing + 1", "Undefined variable 'missing'"),
+        ("col / (GUT - GUT)", "Division by zero"),
+        ("col % 0", "Modulo by zero"),
+        ("rect(col, 2)", "Function 'rect' not implemented"),
+        ("col = 1", "Unknown binary operator '='"),
+    ])
+    def test_errors_match_ast_evaluation(self, expression, message):
+        parser = FormulaParser()
+
+        with pytest.raises(EvaluationError, match=message):
+            parser.compile(expression)(CONTEXT)
+        with pytest.raises(EvaluationError, match=message):
+            parser.evaluate(parser.parse(expression), CONTEXT)
+
+    def test_variables_are_bound_by_slot(self):
+        formula = FormulaParser().compile("SAFE_L + (col - 1) * (COL_W + SAFE_L)")
+
+        assert formula.variables == ('SAFE_L', 'col', 'COL_W')
+        assert formula.evaluate_values([10, 3, 5]) == 10 + 2 * 15
+
+    def test_compiled_formulas_are_cached_by_text(self):
+        first = FormulaParser().compile("a + b")
+
+        assert FormulaParser().compile("a + b") is first
+        assert formula_parser.cache_info()['size'] == 1
+
+        formula_parser.set_cache_size(0)
+        assert FormulaParser().compile("a + b") is not first
+        formula_parser.set_cache_size(formula_parser.DEFAULT_CACHE_SIZE)
+
+
+class TestResolverCompilation:
+    """The variable resolver parses each formula text once"""
+
+    def test_each_formula_is_parsed_once(self, monkeypatch):
+        parsed = []
+        parse = FormulaParser.parse
+
+        def counting_parse(self, text):
+            parsed.append(text)
+            return parse(self, text)
+        monkeypatch.setattr(FormulaParser, "parse", counting_parse)
+
+        for _ in range(3):
+            resolver = FormulaVariableResolver()
+            resolver.add_layer('core', {'COL_W': 685800, 'GUT': 91440, 'SPAN': 'COL_W * 2 + GUT'})
+            assert resolver.resolve_all()['SPAN'] == 685800 * 2 + 91440
+
+        assert parsed == ['COL_W * 2 + GUT']
@@ -0,0 +1,144 @@
+"""
+Tests for optimized formula programs (constant folding and shared subexpressions)
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tools.formula_parser import EvaluationError
+from tools.formula_variable_resolver import (
+    CircularDependencyError, FormulaVariableResolver, VariableNotFoundError
+)
+
+GRID_CONFIG = Path(__file__).parent.parent / "config" / "grid-system-parametric.json"
+
+GRID_CONTEXT = {
+    'emu_per_in': 914400,
+    'slide.w_in': 13.333333,
+    'slide.h_in': 7.5,
+    'safe.inset_pct': 0.10,
+    'grid.cols': 12,
+    'grid.gutter_in': 0.166667,
+}
+
+ASPECT_RATIOS = [(13.333333, 7.5), (10.0, 7.5), (12.0, 7.5), (8.5, 11.0)]
+
+
+def grid_resolver():
+    resolver = FormulaVariableResolver()
+    resolver.add_layer('core', json.loads(GRID_CONFIG.read_text())['formulas'])
+    return resolver
+
+
+class TestGridProgram:
+    """The parametric grid evaluates like resolve_all() for every aspect ratio"""
+
+    def test_matches_resolve_all(self):
+        program = grid_resolver().optimize(inputs=GRID_CONTEXT)
+
+        for width, height in ASPECT_RATIOS:
+            context = dict(GRID_CONTEXT, **{'slide.w_in': width, 'slide.h_in': height})
+            assert program.evaluate(context) == grid_resolver().resolve_all(context)
+
+    def test_folding_a_layer_leaves_only_varying_inputs(self):
+        program = grid_resolver().optimize(inputs=GRID_CONTEXT)
+        fixed = {name: value for name, value in GRID_CONTEXT.items() if not name.startswith('slide.')}
+
+        folded = program.fold(fixed)
+
+        assert set(folded.inputs) == {'slide.w_in', 'slide.h_in'}
+        assert folded.step_count < program.step_count
+        assert folded.constants == {'GUTTER_W': 914400 * 0.166667}
+        assert folded.evaluate_many([{'slide.w_in': w, 'slide.h_in': h} for w, h in ASPECT_RATIOS]) == [
+            program.evaluate(dict(GRID_CONTEXT, **{'slide.w_in': w, 'slide.h_in': h})) for w, h in ASPECT_RATIOS
+        ]
+
+
+class TestOptimization:
+    """Constants are folded and shared subexpressions computed once"""
+
+    def test_constants_are_folded(self):
+        resolver = FormulaVariableResolver()
+        resolver.add_layer('core', {'MARGIN': 457200, 'DOUBLE': 'MARGIN * 2', 'INSET': 'DOUBLE + W'})
+
+        program = resolver.optimize()
+
+        assert program.constants == {'MARGIN': 457200, 'DOUBLE': 914400}
+        assert program.inputs == ('W',)
+        assert program.formula('INSET') == "(914400 + W)"
+        assert program.step_count == 1
+
+    def test_shared_subexpressions_reuse_named_variables(self):
+        resolver = FormulaVariableResolver()
+        resolver.add_layer('core', {
+            'COL_W': '(SLIDE_W - 2 * MARGIN) / COLUMNS',
+            'SPAN_2': '(SLIDE_W - 2 * MARGIN) / COLUMNS * 2 + GUT',
+            'SPAN_3': '(SLIDE_W - 2 * MARGIN) / COLUMNS * 3 + 2 * GUT',
+        })
+
+        program = resolver.optimize()
+
+        assert program.formula('SPAN_2') == "((COL_W * 2) + GUT)"
+        assert program.subexpressions == {}
+        assert program.step_count == 8
+
+        context = {'SLIDE_W': 12192000, 'MARGIN': 457200, 'COLUMNS': 12, 'GUT': 91440}
+        assert program.evaluate(context) == resolver.resolve_all(context)
+
+    def test_unnamed_shared_subexpressions_are_hoisted(self):
+        resolver = FormulaVariableResolver()
+        resolver.add_layer('core', {'A': '(W - M) * 2', 'B': '(W - M) * 3'})
+
+        program = resolver.optimize()
+
+        assert program.subexpressions == {'_cse0': "(W - M)"}
+        assert program.formula('B') == "(_cse0 * 3)"
+
+    def test_defined_inputs_are_read_from_context(self):
+        resolver = FormulaVariableResolver()
+        resolver.add_layer('core', {'COLS': 12, 'COL_W': 'W / COLS'})
+
+        program = resolver.optimize(inputs=['COLS'])
+
+        assert program.evaluate({'W': 1200, 'COLS': 6}) == {'COLS': 12, 'COL_W': 200.0}
+
+    def test_program_is_cached_until_layers_change(self):
+        resolver = grid_resolver()
+        program = resolver.optimize(inputs=GRID_CONTEXT)
+
+        assert resolver.optimize(inputs=list(GRID_CONTEXT)) is program
+        resolver.add_layer('org', {'GUTTER_W': 91440})
+        assert resolver.optimize(inputs=GRID_CONTEXT) is not program
+
+
+class TestProgramErrors:
+    """Failures surface at optimization or evaluation time like resolve_all()"""
+
+    def test_missing_input(self):
+        program = grid_resolver().optimize()
+
+        with pytest.raises(VariableNotFoundError):
+            program.evaluate({'emu_per_in': 914400})
+
+    def test_runtime_division_by_zero(self):
+        resolver = FormulaVariableResolver()
+        resolver.add_layer('core', {'COL_W': 'W / COLS'})
+
+        with pytest.raises(EvaluationError, match="Division by zero"):
+            resolver.optimize().evaluate({'W': 100, 'COLS': 0})
+
+    def test_constant_failure_is_reported_when_optimizing(self):
+        resolver = FormulaVariableResolver()
+        resolver.add_layer('core', {'BAD': 'W + 4 / (2 - 2)'})
+
+        with pytest.raises(ValueError, match="BAD"):
+            resolver.optimize()
+
+    def test_cycles_are_rejected(self):
+        resolver = FormulaVariableResolver()
+        resolver.add_layer('core', {'A': 'B + 1', 'B': 'A + 1'})
+
+        with pytest.raises(CircularDependencyError):
+            resolver.optimize()
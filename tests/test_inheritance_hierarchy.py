@@ -0,0 +1,130 @@
+"""
+Tests for whole-hierarchy inheritance resolution
+"""
+
+import copy
+
+from tools.style_inheritance_core import (
+    InheritanceMode, InheritedTypographyToken, create_inheritance_system
+)
+
+
+def token(token_id, base_style=None, mode=InheritanceMode.AUTO, **properties):
+    return InheritedTypographyToken(id=token_id, base_style=base_style, inheritance_mode=mode, **properties)
+
+
+class TestResolveHierarchy:
+    """Each token is resolved from its base token's effective style"""
+
+    def test_chain_inherits_effective_properties(self):
+        _, _, resolver = create_inheritance_system()
+        tokens = {
+            "caption": token("caption", "body", font_size="10pt"),
+            "body": token("body", "Normal", font_family="Inter", font_size="12pt", font_size_emu=152400),
+            "lead": token("lead", "body", font_weight=600),
+        }
+
+        resolved = resolver.resolve_hierarchy(tokens)
+
+        assert list(resolved) == ["caption", "body", "lead"]
+        assert resolved["caption"].inheritance_chain == ["caption", "body"]
+        assert resolved["caption"].resolved_base_properties["fontFamily"] == "Inter"
+        assert resolved["caption"].delta_properties == {"fontSize": "10pt"}
+        assert resolved["caption"].computed_full_style["fontFamily"] == "Inter"
+        assert resolved["lead"].computed_full_style["fontSize"] == "12pt"
+        assert resolved["lead"].computed_full_style["emu"]["fontSize"] == 152400
+        assert resolved["lead"].delta_properties == {"fontWeight": 600}
+
+    def test_registry_bases_match_single_token_resolution(self):
+        _, _, resolver = create_inheritance_system()
+        tokens = {
+            "body": token("body", "Normal", font_family="Inter", font_size="12pt", font_size_emu=152400),
+            "title": token("title", "Title", font_weight=700),
+            "plain": token("plain", "Normal", mode=InheritanceMode.COMPLETE, font_family="Arial"),
+        }
+
+        resolved = resolver.resolve_hierarchy(copy.deepcopy(tokens))
+
+        for token_id, original in tokens.items():
+            expected = resolver.resolve_inheritance(copy.deepcopy(original), tokens)
+            assert resolved[token_id].delta_properties == expected.delta_properties
+            assert resolved[token_id].inheritance_mode == expected.inheritance_mode
+            assert resolved[token_id].resolved_base_properties == expected.resolved_base_properties
+
+    def test_cycle_and_its_descendants_fall_back(self):
+        _, _, resolver = create_inheritance_system()
+        tokens = {
+            "a": token("a", "b", font_size="10pt"),
+            "b": token("b", "a", font_size="11pt"),
+            "c": token("c", "a", font_size="12pt"),
+            "d": token("d", "Normal", font_size="13pt"),
+        }
+
+        resolved = resolver.resolve_hierarchy(tokens)
+
+        for token_id in ("a", "b", "c"):
+            assert resolved[token_id].has_circular_reference
+            assert resolved[token_id].inheritance_mode == InheritanceMode.COMPLETE
+        assert resolved["c"].computed_full_style["fontSize"] == "12pt"
+        assert not resolved["d"].has_circular_reference
+        assert resolved["d"].delta_properties == {"fontSize": "13pt"}
+
+    def test_missing_base_falls_back_to_complete_style(self):
+        _, _, resolver = create_inheritance_system()
+
+        resolved = resolver.resolve_hierarchy({"orphan": token("orphan", "DoesNotExist", font_size="9pt")})
+
+        assert resolved["orphan"].inheritance_mode == InheritanceMode.COMPLETE
+        assert resolved["orphan"].computed_full_style["fontSize"] == "9pt"
+
+    def test_deep_hierarchy_is_resolved_in_one_pass(self):
+        _, _, resolver = create_inheritance_system()
+        resolver.max_inheritance_depth = 1000
+        tokens = {"level0": token("level0", "Normal", font_family="Inter")}
+        for level in range(1, 800):
+            tokens[f"level{level}"] = token(f"level{level}", f"level{level - 1}", font_size=f"{level}pt")
+
+        # Deepest tokens first, so every walk reaches already resolved bases
+        resolved = resolver.resolve_hierarchy(dict(reversed(list(tokens.items()))))
+
+        deepest = resolved["level799"]
+        assert deepest.inheritance_depth == 800
+        assert deepest.inheritance_chain[-1] == "level0"
+        assert deepest.computed_full_style["fontFamily"] == "Inter"
+        assert deepest.delta_properties == {"fontSize": "799pt"}
+
+    def test_depth_limit_cuts_the_chain(self):
+        _, _, resolver = create_inheritance_system()
+        resolver.max_inheritance_depth = 2
+        tokens = {
+            "a": token("a", "Normal", font_family="Inter"),
+            "b": token("b", "a", font_size="10pt"),
+            "c": token("c", "b", font_size="11pt"),
+            "d": token("d", "c", font_size="12pt"),
+        }
+
+        resolved = resolver.resolve_hierarchy(tokens)
+
+        assert resolved["b"].inheritance_chain == ["b", "a"]
+        for token_id in ("c", "d"):
+            assert resolved[token_id].inheritance_mode == InheritanceMode.COMPLETE
+            assert "fontFamily" not in resolved[token_id].computed_full_style
+        assert resolved["d"].computed_full_style["fontSize"] == "12pt"
+
+    def test_failing_token_falls_back_on_its_own(self, monkeypatch):
+        _, _, resolver = create_inheritance_system()
+        calculate_delta = resolver.delta_generator.calculate_delta
+
+        def failing_delta(token, base):
+            if token.id == "bad":
+                raise ValueError("broken token")
+            return calculate_delta(token, base)
+        monkeypatch.setattr(resolver.delta_generator, "calculate_delta", failing_delta)
+
+        resolved = resolver.resolve_hierarchy({
+            "bad": token("bad", "Normal", font_size="10pt"),
+            "good": token("good", "Normal", font_size="12pt"),
+        })
+
+        assert resolved["bad"].inheritance_mode == InheritanceMode.COMPLETE
+        assert resolved["good"].delta_properties == {"fontSize": "12pt"}
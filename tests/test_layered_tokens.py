@@ -0,0 +1,103 @@
+"""
+Tests for persistent layered token maps
+"""
+
+import copy
+
+import pytest
+
+from tools.layered_tokens import LayeredTokenMap, layered_merge
+from tools.token_resolver import TokenResolver
+
+
+def deep_merge(base, override):
+    """Reference implementation: the recursive merge layered maps replace"""
+    result = base.copy()
+    for key, value in override.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = deep_merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+@pytest.fixture
+def core_tokens():
+    return {
+        "colors": {
+            "primary": {"value": "#0066CC", "type": "color"},
+            "text": {"value": "#000000", "type": "color"},
+        },
+        "fonts": {"primary": "Liberation Sans", "fallback": "Arial"},
+        "grid": {"font_size": 24},
+    }
+
+
+class TestLayeredTokenMap:
+    """Lookup semantics match deep-merged dicts"""
+
+    def test_matches_deep_merge(self, core_tokens):
+        org = {"colors": {"primary": {"value": "#FF0000"}, "brand": "#123456"}, "grid": 8}
+        personal = {"colors": {"primary": "#00FF00"}, "grid": {"columns": 12}}
+
+        expected = deep_merge(deep_merge(core_tokens, org), personal)
+        layered = LayeredTokenMap(core_tokens, org, personal)
+
+        assert layered == expected
+        assert layered.to_dict() == expected
+        assert list(layered) == list(expected)
+        assert layered["colors"]["primary"] == "#00FF00"
+        assert layered["grid"] == {"columns": 12}
+
+    def test_layers_are_not_copied_or_modified(self, core_tokens):
+        snapshot = copy.deepcopy(core_tokens)
+        layered = LayeredTokenMap(core_tokens).with_overrides({"colors.primary.value": "#FF0000"})
+
+        assert layered.get_path("colors.primary.value") == "#FF0000"
+        assert layered.get_path("colors.primary.type") == "color"
+        assert core_tokens == snapshot
+        # Subtrees only the base provides are shared, not copied
+        assert layered["fonts"] is core_tokens["fonts"]
+        assert layered.to_dict()["fonts"] is core_tokens["fonts"]
+
+    def test_path_override_replaces_mappings(self, core_tokens):
+        layered = LayeredTokenMap(core_tokens).with_overrides({"colors.primary": {"value": "#FFFFFF"}})
+
+        assert layered["colors"]["primary"] == {"value": "#FFFFFF"}
+
+    def test_variants_share_the_base(self, core_tokens):
+        base = LayeredTokenMap(core_tokens)
+        variants = [base.with_overrides({"grid.font_size": size}) for size in range(10, 20)]
+
+        assert [variant.get_path("grid.font_size") for variant in variants] == list(range(10, 20))
+        assert all(variant.depth == 2 for variant in variants)
+        assert base.get_path("grid.font_size") == 24
+
+    def test_nested_layered_maps_are_flattened(self, core_tokens):
+        inner = LayeredTokenMap(core_tokens, {"grid": {"columns": 12}})
+        outer = LayeredTokenMap(inner, {"fonts": {"primary": "Inter"}})
+
+        assert outer.depth == 3
+        assert outer.get_path("grid.columns") == 12
+        assert outer.get_path("fonts.fallback") == "Arial"
+
+    def test_layered_merge(self, core_tokens):
+        override = {"fonts": {"primary": "Inter"}}
+
+        assert layered_merge(core_tokens, override) == deep_merge(core_tokens, override)
+
+
+class TestTokenResolverOverrides:
+    """TokenResolver layers overrides without mutating the base tokens"""
+
+    def test_apply_overrides_leaves_base_untouched(self, core_tokens):
+        resolver = TokenResolver()
+        snapshot = copy.deepcopy(core_tokens)
+
+        tokens = resolver.apply_overrides(core_tokens, {"fonts.primary": "Inter", "colors.new": "#FFFFFF"})
+        flattened = resolver.flatten_tokens(tokens)
+
+        assert flattened["fonts.primary"] == "Inter"
+        assert flattened["colors.new"] == "#FFFFFF"
+        assert flattened["colors.primary"] == "#0066CC"
+        assert core_tokens == snapshot
@@ -0,0 +1,81 @@
+"""
+Tests for single-pass multi-platform OOXML generation
+"""
+
+import pytest
+
+from tools.ooxml_multiplatform_support import MultiPlatformOOXMLGenerator, PlatformNeutralStyle
+from tools.style_inheritance_core import InheritanceMode, InheritedTypographyToken, create_inheritance_system
+
+
+@pytest.fixture
+def tokens():
+    _, _, resolver = create_inheritance_system()
+    resolved = resolver.resolve_hierarchy({
+        "body": InheritedTypographyToken(id="body", base_style="Normal", font_family="Inter",
+                                         font_size="12pt", font_weight=700, line_height="16pt"),
+        "caption": InheritedTypographyToken(id="caption", base_style="body", font_style="italic",
+                                            letter_spacing="0.05em", line_height=1.2, font_size="9pt"),
+        "plain": InheritedTypographyToken(id="plain", inheritance_mode=InheritanceMode.COMPLETE,
+                                          font_family="Arial", font_size="11pt"),
+    })
+    return list(resolved.values())
+
+
+class TestGenerateAllPlatforms:
+    """All platforms are emitted from one platform-neutral resolution"""
+
+    def test_matches_per_platform_generation(self, tokens):
+        generator = MultiPlatformOOXMLGenerator()
+
+        outputs = generator.generate_all_platforms(tokens)
+
+        assert list(outputs) == ["powerpoint", "word", "excel"]
+        for platform, xml in outputs.items():
+            assert xml == generator.generate_for_platform(tokens, platform)
+
+    def test_tokens_are_resolved_once(self, tokens, monkeypatch):
+        calls = []
+        from_token = PlatformNeutralStyle.from_token.__func__
+
+        def counting_from_token(cls, token):
+            calls.append(token.id)
+            return from_token(cls, token)
+        monkeypatch.setattr(PlatformNeutralStyle, "from_token", classmethod(counting_from_token))
+
+        MultiPlatformOOXMLGenerator().generate_all_platforms(tokens)
+
+        assert calls == [token.id for token in tokens]
+
+    def test_parallel_output_matches_serial(self, tokens):
+        generator = MultiPlatformOOXMLGenerator()
+
+        assert generator.generate_all_platforms(tokens, max_workers=3) == generator.generate_all_platforms(tokens)
+
+    def test_platform_subset(self, tokens):
+        outputs = MultiPlatformOOXMLGenerator().generate_all_platforms(tokens, platforms=["word"])
+
+        assert list(outputs) == ["word"]
+        assert 'w:basedOn w:val="body"' in outputs["word"]
+        assert 'w:line="203200"' in outputs["word"]
+
+    def test_unsupported_platform_is_rejected(self, tokens):
+        with pytest.raises(ValueError):
+            MultiPlatformOOXMLGenerator().generate_all_platforms(tokens, platforms=["visio"])
+
+
+class TestTokenHandlerApi:
+    """Token-based handler methods render through the neutral form"""
+
+    def test_inheritance_and_complete_xml(self, tokens):
+        generator = MultiPlatformOOXMLGenerator()
+        body, caption, plain = tokens
+
+        powerpoint_xml = generator.handlers["powerpoint"].generate_inheritance_xml(body, "Normal")
+        word_xml = generator.handlers["word"].generate_complete_xml(caption)
+
+        assert '<a:sz val="1200"/>' in powerpoint_xml
+        assert '<a:b val="1"/>' in powerpoint_xml
+        assert 'w:styleId="caption"' in word_xml
+        assert "<w:basedOn" not in word_xml
+        assert generator.handlers["excel"].validate_platform_compatibility(plain) == []
@@ -347,6 +347,50 @@ class TestNestedReferenceCache:
         # All keys should be unique
         assert len(set(cache_keys)) == len(cache_keys)
 
+    def test_cache_key_ignores_unrelated_variables(self):
+        """Adding variables the resolution never read keeps the cache hot"""
+        pattern = "{color.{theme}.primary}"
+        self.resolver.resolve_nested_reference(pattern, self.test_tokens)
+        
+        # Another layer that shares the same tokens plus unrelated ones
+        layered_tokens = dict(self.test_tokens)
+        for i in range(50):
+            layered_tokens[f'spacing.step{i}'] = ResolvedVariable(
+                f'spacing.step{i}', f'{i}px', TokenType.DIMENSION, TokenScope.ORG, 'json_tokens'
+            )
+        
+        assert self.resolver.resolve_nested_reference(pattern, layered_tokens) == '#0066CC'
+        stats = self.resolver.get_cache_stats()
+        assert stats['nested_cache_hits'] == 1
+        assert stats['nested_cache_misses'] == 1
+    
+    def test_cache_key_covers_read_variables_only(self):
+        """Cache keys are built from the variables a resolution actually read"""
+        pattern = "{color.{theme}.primary}"
+        self.resolver.resolve_nested_reference(pattern, self.test_tokens)
+        
+        (dependency_names,) = self.resolver._cache_dependency_sets[pattern]
+        assert 'theme' in dependency_names
+        assert 'color.dark.primary' in dependency_names
+        assert all(not name.startswith('spacing') for name in dependency_names)
+    
+    def test_lru_eviction_keeps_recently_used_entries(self):
+        """Eviction drops the least recently used entry, not the oldest inserted"""
+        resolver = VariableResolver(enable_cache=True)
+        resolver._max_cache_size = 2
+        
+        resolver._update_cache(('a', ()), 'A')
+        resolver._update_cache(('b', ()), 'B')
+        resolver._cache_dependency_sets.update({'a': [()], 'b': [()]})
+        
+        # Touch 'a' so 'b' becomes least recently used
+        result, _ = resolver._resolve_with_cache('a', {}, lambda ctx: 'unused')
+        assert result == 'A'
+        
+        resolver._update_cache(('c', ()), 'C')
+        assert ('a', ()) in resolver._nested_resolution_cache
+        assert ('b', ()) not in resolver._nested_resolution_cache
+
 
 class TestNestedReferenceIntegration:
     """Test integration with existing variable resolution system"""
@@ -470,5 +514,54 @@ class TestNestedReferenceErrorHandling:
                 resolver._validate_nested_pattern(pattern)
 
 
+class TestIncrementalResolution:
+    """Test incremental re-resolution through the reverse dependency graph"""
+    
+    def setup_method(self):
+        self.resolver = VariableResolver(enable_cache=True, strict_mode=False)
+        self.resolved = self.resolver.resolve_all({
+            'brand.primary': '#0066CC',
+            'brand.secondary': '#FF6600',
+            'button.background': '{brand.primary}',
+            'button.border': '1px solid {button.background}',
+            'link.color': '{brand.secondary}',
+        })
+    
+    def test_resolve_all_builds_reverse_edges(self):
+        """Reverse edges point from a token to everything that read it"""
+        graph = self.resolver.resolution_graph
+        assert graph.dependents['brand.primary'] == {'button.background'}
+        assert graph.transitive_dependents(['brand.primary']) == {'button.background', 'button.border'}
+    
+    def test_update_recomputes_only_transitive_dependents(self):
+        """Changing one token re-resolves its dependents and reports changed values"""
+        with patch.object(self.resolver, '_resolve_token_references_in_value',
+                          wraps=self.resolver._resolve_token_references_in_value) as resolve:
+            changed = self.resolver.update_variables({'brand.primary': '#112233'})
+        
+        assert set(changed) == {'brand.primary', 'button.background', 'button.border'}
+        assert changed['button.border'].value == '1px solid #112233'
+        assert self.resolver.resolution_graph.resolved['link.color'].value == '#FF6600'
+        resolved_values = {call.args[0] for call in resolve.call_args_list}
+        assert '{brand.secondary}' not in resolved_values
+    
+    def test_update_with_same_value_reports_no_changes(self):
+        """Re-applying an identical value changes nothing downstream"""
+        assert self.resolver.update_variables({'brand.primary': '#0066CC'}) == {}
+    
+    def test_update_defines_previously_missing_reference(self):
+        """Variables that referenced a missing token resolve once it is defined"""
+        self.resolver.resolve_all({'heading.color': '{brand.accent}'})
+        assert self.resolver.resolution_graph.resolved['heading.color'].value == '{brand.accent}'
+        
+        changed = self.resolver.update_variables({'brand.accent': '#00AA00'})
+        assert changed['heading.color'].value == '#00AA00'
+    
+    def test_update_requires_resolve_all(self):
+        """Incremental updates need a graph from a previous resolve_all"""
+        with pytest.raises(ValueError):
+            VariableResolver().update_variables({'brand.primary': '#000000'})
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -6,6 +6,7 @@ Tests the actual implementation methods to improve coverage.
 """
 
 import unittest
+import unittest.mock
 import tempfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -430,5 +431,124 @@ class TestProcessingResultHandling(unittest.TestCase):
         self.assertGreater(processor.stats["total_processing_time"], initial_time)
 
 
+class TestStreamingPackageProcessing(unittest.TestCase):
+    """Test that package parts are serialized straight into the output ZIP"""
+    
+    THEME_XML = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                 '<a:theme xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+                 '<a:themeElements><a:clrScheme name="Test"><a:accent1>'
+                 '<a:srgbClr val="4472C4"/></a:accent1></a:clrScheme></a:themeElements>'
+                 '</a:theme>')
+    
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.input_path = self.temp_dir / "input.potx"
+        self.output_path = self.temp_dir / "output.potx"
+        with zipfile.ZipFile(self.input_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('ppt/theme/theme1.xml', self.THEME_XML)
+            zf.writestr('docProps/thumbnail.jpeg', b'\xff\xd8\xff\xe0binary')
+        self.variables = {
+            "brandAccent1": {"id": "brandAccent1", "type": "color", "value": "#FF0000",
+                             "xpath": "//a:accent1//a:srgbClr"}
+        }
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_parts_written_compact_with_declaration(self):
+        """Parts are written without pretty-printing and keep the standalone declaration"""
+        processor = OOXMLProcessor()
+        result = processor.process_ooxml_file(self.input_path, self.variables, self.output_path)
+        
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.elements_modified, 1)
+        with zipfile.ZipFile(self.output_path) as zf:
+            theme = zf.read('ppt/theme/theme1.xml')
+            self.assertTrue(theme.startswith(b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>"))
+            self.assertIn(b'val="FF0000"', theme)
+            self.assertNotIn(b'\n  ', theme)
+            self.assertEqual(zf.read('docProps/thumbnail.jpeg'), b'\xff\xd8\xff\xe0binary')
+    
+    def test_part_not_serialized_to_string(self):
+        """The processed tree is never turned into an intermediate string"""
+        processor = OOXMLProcessor()
+        with unittest.mock.patch('tools.ooxml_processor.etree.tostring') as tostring:
+            processor.process_ooxml_file(self.input_path, self.variables, self.output_path)
+        tostring.assert_not_called()
+    
+    def test_elementtree_backend_streams_parts(self):
+        """The ElementTree fallback produces the same substitution"""
+        processor = OOXMLProcessor(use_lxml=False)
+        result = processor.process_ooxml_file(self.input_path, self.variables, self.output_path)
+        
+        self.assertEqual(result.elements_modified, 1)
+        with zipfile.ZipFile(self.output_path) as zf:
+            self.assertIn(b'val="FF0000"', zf.read('ppt/theme/theme1.xml'))
+        self.assertEqual(processor.stats["documents_processed"], 1)
+
+
+class TestInMemoryIntegrityValidation(unittest.TestCase):
+    """Test integrity checks that run on the tree instead of re-parsing output"""
+    
+    def setUp(self):
+        self.processor = OOXMLProcessor()
+    
+    def test_default_path_does_not_reparse_output(self):
+        """Normal validation never reads the serialized output back"""
+        xml_content = '<?xml version="1.0"?><root><element val="1"/></root>'
+        with unittest.mock.patch.object(self.processor, '_validate_xml_integrity') as reparse:
+            _, result = self.processor.apply_variables_to_xml(xml_content, {})
+        reparse.assert_not_called()
+        self.assertTrue(result.success)
+    
+    def test_paranoid_mode_reparses_output(self):
+        """Paranoid validation still runs the full re-parse"""
+        processor = OOXMLProcessor(paranoid_validation=True)
+        xml_content = '<?xml version="1.0"?><root><element val="1"/></root>'
+        with unittest.mock.patch.object(processor, '_validate_xml_integrity',
+                                        return_value=[]) as reparse:
+            processor.apply_variables_to_xml(xml_content, {})
+        reparse.assert_called_once()
+    
+    def test_unexpected_root_element_for_part(self):
+        """Known part types must carry their required root element"""
+        root = ET.fromstring('<sld xmlns="http://schemas.openxmlformats.org/presentationml/2006/main"/>')
+        errors = self.processor._validate_tree_integrity(root, part_name='ppt/theme/theme1.xml')
+        self.assertTrue(any("expected theme" in error for error in errors))
+        
+        self.assertEqual(
+            self.processor._validate_tree_integrity(root, part_name='ppt/slides/slide3.xml'), []
+        )
+    
+    def test_root_without_namespace_rejected(self):
+        """Known part roots must be namespace-qualified"""
+        root = ET.fromstring('<theme/>')
+        errors = self.processor._validate_tree_integrity(root, part_name='word/theme/theme1.xml')
+        self.assertTrue(any("has no namespace" in error for error in errors))
+    
+    def test_invalid_characters_detected(self):
+        """Control characters that would produce ill-formed output are reported"""
+        root = ET.fromstring('<root><element val="ok"/></root>')
+        root[0].set('val', 'bad\x01value')
+        errors = self.processor._validate_tree_integrity(root)
+        self.assertTrue(any("Invalid XML character" in error for error in errors))
+    
+    def test_structure_change_detected_against_baseline(self):
+        """Element count and root tag are compared with the pre-substitution baseline"""
+        root = ET.fromstring('<root><a/><b/></root>')
+        baseline = self.processor._capture_tree_baseline(root)
+        root.remove(root[0])
+        errors = self.processor._validate_tree_integrity(root, baseline=baseline)
+        self.assertIn("Element count changed: 3 -> 2", errors)
+    
+    def test_doctype_forbidden(self):
+        """DOCTYPE declarations are not permitted in OOXML parts"""
+        from lxml import etree
+        root = etree.fromstring(b'<!DOCTYPE root><root/>')
+        errors = self.processor._validate_tree_integrity(root)
+        self.assertIn("Forbidden construct: DOCTYPE declaration", errors)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
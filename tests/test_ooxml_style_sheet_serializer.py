@@ -0,0 +1,100 @@
+"""
+Tests for batch style sheet serialization
+"""
+
+import io
+
+import pytest
+
+pytest.importorskip("lxml")
+from lxml import etree
+
+from tools.ooxml_delta_serializer import OOXMLStyleSheetSerializer, STYLE_SHEET_NAMESPACES
+from tools.ooxml_inheritance_generator import OOXMLInheritanceGenerator
+from tools.style_inheritance_core import InheritanceMode, InheritedTypographyToken, create_inheritance_system
+
+W = STYLE_SHEET_NAMESPACES["word"]
+PPT = STYLE_SHEET_NAMESPACES["powerpoint"]
+
+
+@pytest.fixture
+def tokens():
+    _, _, resolver = create_inheritance_system()
+    resolved = resolver.resolve_hierarchy({
+        "body": InheritedTypographyToken(id="body", base_style="Normal", font_family="Inter",
+                                         font_size="12pt", font_weight=700),
+        "caption": InheritedTypographyToken(id="caption", base_style="body", font_style="italic",
+                                            letter_spacing="0.5pt", line_height="14pt"),
+        "plain": InheritedTypographyToken(id="plain", inheritance_mode=InheritanceMode.COMPLETE,
+                                          font_family="Arial", font_weight=400),
+    })
+    return list(resolved.values())
+
+
+class TestWordStyleSheet:
+    """styles.xml is built as one tree from resolved deltas"""
+
+    def test_delta_styles_reference_their_base(self, tokens):
+        root = OOXMLStyleSheetSerializer().build_style_sheet(tokens, "word")
+
+        assert root.xpath("w:style/@w:styleId", namespaces=W) == ["body", "caption", "plain"]
+        assert root.xpath("w:style[@w:styleId='caption']/w:basedOn/@w:val", namespaces=W) == ["body"]
+        assert root.xpath("w:style[@w:styleId='plain']/w:basedOn", namespaces=W) == []
+
+    def test_only_deltas_are_serialized(self, tokens):
+        root = OOXMLStyleSheetSerializer().build_style_sheet(tokens, "word")
+        caption = root.xpath("w:style[@w:styleId='caption']", namespaces=W)[0]
+
+        assert [etree.QName(child).localname for child in caption] == ["name", "basedOn", "pPr", "rPr"]
+        assert [etree.QName(child).localname for child in caption.find("w:rPr", W)] == ["i", "spacing"]
+        assert caption.xpath("w:rPr/w:rFonts", namespaces=W) == []
+
+    def test_run_properties_follow_schema_order(self, tokens):
+        root = OOXMLStyleSheetSerializer().build_style_sheet(tokens, "word")
+        run_properties = root.xpath("w:style[@w:styleId='body']/w:rPr", namespaces=W)[0]
+
+        assert [etree.QName(child).localname for child in run_properties] == ["rFonts", "b", "sz"]
+        assert run_properties.find("w:sz", W).get(f"{{{W['w']}}}val") == "24"
+
+    def test_regular_weight_emits_no_bold_flag(self, tokens):
+        root = OOXMLStyleSheetSerializer().build_style_sheet(tokens, "word")
+
+        assert root.xpath("w:style[@w:styleId='plain']/w:rPr/w:b", namespaces=W) == []
+
+
+class TestPowerPointTextStyles:
+    """txStyles carry one level style per token"""
+
+    def test_text_properties(self, tokens):
+        root = OOXMLStyleSheetSerializer().build_style_sheet(tokens, "powerpoint")
+
+        assert etree.QName(root).localname == "txStyles"
+        assert len(root.xpath("a:lvl1pPr", namespaces=PPT)) == 3
+        assert root.xpath("a:lvl1pPr[1]/a:defRPr/a:sz/@val", namespaces=PPT) == ["1200"]
+
+    def test_unsupported_platform_is_rejected(self, tokens):
+        with pytest.raises(ValueError):
+            OOXMLStyleSheetSerializer().build_style_sheet(tokens, "excel")
+
+
+class TestGeneratorStyleSheets:
+    """The inheritance generator serializes style sheets in one pass"""
+
+    def test_write_matches_generated_sheet(self, tokens):
+        generator = OOXMLInheritanceGenerator()
+        output = io.BytesIO()
+
+        generator.write_style_sheet_with_inheritance(tokens, output, "word")
+
+        assert output.getvalue().startswith(b"<?xml")
+        written = etree.fromstring(output.getvalue())
+        generated = etree.fromstring(generator.generate_style_sheet_with_inheritance(tokens, "word").encode())
+        assert etree.tostring(written) == etree.tostring(generated)
+
+    def test_excel_keeps_per_style_generation(self, tokens):
+        output = io.BytesIO()
+
+        OOXMLInheritanceGenerator().write_style_sheet_with_inheritance(tokens, output, "excel")
+
+        assert b"<styleSheet" in output.getvalue()
+        assert b"cellXfs" in output.getvalue()
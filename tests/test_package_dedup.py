@@ -0,0 +1,141 @@
+"""
+Tests for content-addressed OOXML package part deduplication
+"""
+
+import io
+import zipfile
+
+import pytest
+
+from tools.package_dedup import deduplicate_parts, resolve_target, source_part_of
+from tools.supertheme_generator import SuperThemeGenerator
+
+RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def rels(*targets):
+    body = "".join(f'<Relationship Id="rId{i}" Type="t" Target="{target}"/>'
+                   for i, target in enumerate(targets, 1))
+    return f'<Relationships xmlns="{RELS_NS}">{body}</Relationships>'.encode()
+
+
+@pytest.fixture
+def package_parts():
+    image = b"\x89PNG same logo"
+    layout = b"<sldLayout/>"
+    return [
+        ("a/slideMasters/slideMaster1.xml", b"<sldMaster/>"),
+        ("a/slideMasters/_rels/slideMaster1.xml.rels",
+         rels("../slideLayouts/slideLayout1.xml", "../media/image1.png")),
+        ("a/slideLayouts/slideLayout1.xml", layout),
+        ("a/media/image1.png", image),
+        ("b/slideMasters/slideMaster1.xml", b"<sldMaster/>"),
+        ("b/slideMasters/_rels/slideMaster1.xml.rels",
+         rels("../slideLayouts/slideLayout1.xml", "../media/image1.png")),
+        ("b/slideLayouts/slideLayout1.xml", layout),
+        ("b/media/image1.png", image),
+        ("b/media/unreferenced.png", image),
+    ]
+
+
+class TestDeduplicateParts:
+    """Identical payloads are stored once and relationships follow them"""
+
+    def test_duplicates_are_redirected_to_canonical_copy(self, package_parts):
+        parts, report = deduplicate_parts(package_parts)
+        names = [name for name, _ in parts]
+
+        assert "b/media/image1.png" not in names
+        assert report.duplicate_parts == 1
+        assert report.redirected_relationships == 1
+        assert report.bytes_saved > 0
+
+        b_rels = dict(parts)["b/slideMasters/_rels/slideMaster1.xml.rels"].decode()
+        assert 'Target="../../a/media/image1.png"' in b_rels
+        assert resolve_target("b/slideMasters/slideMaster1.xml", "../../a/media/image1.png") in names
+
+    def test_structural_parts_are_never_shared(self, package_parts):
+        parts, _ = deduplicate_parts(package_parts)
+        names = [name for name, _ in parts]
+
+        # Each layout belongs to exactly one master
+        assert "b/slideLayouts/slideLayout1.xml" in names
+        assert 'Target="../slideLayouts/slideLayout1.xml"' in dict(parts)[
+            "b/slideMasters/_rels/slideMaster1.xml.rels"].decode()
+
+    def test_parts_with_relationships_or_no_references_are_kept(self, package_parts):
+        parts, _ = deduplicate_parts(package_parts)
+        names = [name for name, _ in parts]
+
+        assert "b/slideMasters/slideMaster1.xml" in names
+        assert "b/media/unreferenced.png" in names
+
+    def test_pinned_parts_are_kept(self, package_parts):
+        parts, report = deduplicate_parts(package_parts, pinned=lambda name: name.startswith("b/"))
+
+        assert parts == package_parts
+        assert report.duplicate_parts == 0
+
+    def test_single_quoted_and_escaped_targets_are_redirected(self):
+        image = b"\x89PNG same logo"
+        parts = [
+            ("a/slides/_rels/slide1.xml.rels", rels("../media/a&amp;b.png")),
+            ("a/slides/slide1.xml", b"<sld/>"),
+            ("a/media/a&b.png", image),
+            ("b/slides/_rels/slide1.xml.rels", rels("../media/a&amp;b.png").replace(b'"', b"'")),
+            ("b/slides/slide1.xml", b"<sld/>"),
+            ("b/media/a&b.png", image),
+        ]
+
+        output, report = deduplicate_parts(parts)
+
+        assert "b/media/a&b.png" not in dict(output)
+        assert report.redirected_relationships == 1
+        assert 'Target="../../a/media/a&amp;b.png"' in dict(output)["b/slides/_rels/slide1.xml.rels"].decode()
+
+    def test_copy_is_kept_when_target_cannot_be_rewritten(self):
+        image = b"\x89PNG same logo"
+        # Character reference the rewrite does not recognise
+        parts = [
+            ("a/slides/_rels/slide1.xml.rels", rels("../media/image1.png")),
+            ("a/slides/slide1.xml", b"<sld/>"),
+            ("a/media/image1.png", image),
+            ("b/slides/_rels/slide1.xml.rels", rels("../media/image&#49;.png")),
+            ("b/slides/slide1.xml", b"<sld/>"),
+            ("b/media/image1.png", image),
+        ]
+
+        output, report = deduplicate_parts(parts)
+
+        assert output == parts
+        assert report.duplicate_parts == 0
+        assert report.redirected_relationships == 0
+
+    def test_source_part_of_package_relationships(self):
+        assert source_part_of("_rels/.rels") == ""
+        assert source_part_of("theme/_rels/presentation.xml.rels") == "theme/presentation.xml"
+
+
+class TestSuperThemeDeduplication:
+    """Every supertheme variant keeps its own masters and layouts"""
+
+    def test_variants_keep_their_own_layouts(self):
+        design_variants = {"Design A": {"colors": {"primary": "#FF0000"}},
+                           "Design B": {"colors": {"primary": "#00FF00"}}}
+        aspect_ratios = ["aspectRatios.widescreen_16_9", "aspectRatios.classic_4_3"]
+        generator = SuperThemeGenerator(dedupe_parts=True)
+
+        package = generator.generate_supertheme(design_variants, aspect_ratios)
+
+        with zipfile.ZipFile(io.BytesIO(package)) as zf:
+            names = set(zf.namelist())
+            for variant in range(1, 5):
+                variant_dir = f"themeVariants/variant{variant}/theme"
+                assert f"{variant_dir}/theme/theme1.xml" in names
+                assert f"{variant_dir}/slideLayouts/slideLayout1.xml" in names
+                master_rels = f"{variant_dir}/slideMasters/_rels/slideMaster1.xml.rels"
+                source = source_part_of(master_rels)
+                for target in zf.read(master_rels).decode().split('Target="')[1:]:
+                    resolved = resolve_target(source, target.split('"')[0])
+                    assert resolved in names
+                    assert resolved.startswith(f"{variant_dir}/")
@@ -0,0 +1,88 @@
+"""
+Tests for the shared token-reference scanner
+"""
+
+from tools.reference_scanner import (
+    LITERAL, REFERENCE, VARIABLE, clear_scan_cache, has_references, scan,
+    scan_cache_info, substitute
+)
+from tools.token_parser import TokenParser
+from tools.token_resolver import TokenResolver
+
+
+class TestScan:
+    """Segmenting strings into literals, references and variables"""
+
+    def test_segments(self):
+        scanned = scan("1px solid {colors.border} on ${theme}")
+
+        assert [segment.kind for segment in scanned.segments] == [LITERAL, REFERENCE, LITERAL, VARIABLE]
+        assert scanned.references == ("colors.border",)
+        assert scanned.variables == ("theme",)
+        assert "".join(segment.text for segment in scanned.segments) == scanned.text
+        assert scanned.segments[1].start == 10
+
+    def test_plain_strings(self):
+        scanned = scan("#0066CC")
+
+        assert not scanned.has_references
+        assert scanned.references == ()
+        assert not has_references("#0066CC")
+        assert scan("").segments == ()
+
+    def test_nested_references_match_innermost(self):
+        scanned = scan("{color.{theme}.primary}")
+
+        assert scanned.references == ("theme",)
+
+    def test_paths_exclude_non_identifiers(self):
+        scanned = scan("{colors.primary} {1 + 2}")
+
+        assert scanned.references == ("colors.primary", "1 + 2")
+        assert scanned.paths == ("colors.primary",)
+
+    def test_results_are_shared(self):
+        clear_scan_cache()
+        first = scan("{spacing.base}")
+        second = scan("{spacing.base}")
+
+        assert first is second
+        assert scan_cache_info().hits >= 1
+
+
+class TestSubstitute:
+    """Rendering scanned strings"""
+
+    def test_unresolved_references_are_kept(self):
+        resolved = {"colors.primary": "#0066CC"}
+
+        result = substitute("{colors.primary} / {colors.missing}", resolved.get)
+
+        assert result == "#0066CC / {colors.missing}"
+
+    def test_variables_resolve_separately(self):
+        result = substitute("${name}-{token}", lambda name: "ref", lambda name: name.upper())
+
+        assert result == "NAME-ref"
+
+
+class TestConsumers:
+    """Resolvers and parsers share the scanner's view of references"""
+
+    def test_token_resolver_resolves_chains(self):
+        resolver = TokenResolver()
+        flattened = resolver.flatten_tokens({
+            "colors": {"primary": "#0066CC", "accent": "{colors.primary}"},
+            "border": "1px solid {colors.accent}",
+        })
+
+        resolved = resolver.resolve_token_references(flattened)
+
+        assert resolved["border"] == "1px solid #0066CC"
+
+    def test_token_parser_finds_tokens_in_both_syntaxes(self):
+        content = "a {tokens.core.primary} b ${tokens.org.brand} {other.ref}"
+
+        tokens = TokenParser().parse(content)
+
+        assert [token.original for token in tokens] == ["{tokens.core.primary}", "{tokens.org.brand}"]
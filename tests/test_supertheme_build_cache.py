@@ -0,0 +1,105 @@
+"""
+Tests for incremental SuperTheme rebuilds from the build cache
+"""
+
+import json
+
+import pytest
+
+from tools.supertheme_build_cache import BUILD_CACHE_VERSION, SuperThemeBuildCache, variant_input_hash
+from tools.supertheme_generator import SuperThemeGenerator, variant_source_files
+
+ASPECT_RATIOS = ["aspectRatios.widescreen_16_9", "aspectRatios.classic_4_3"]
+
+
+@pytest.fixture
+def design_variants():
+    return {
+        "Design A": {"colors": {"primary": "#FF0000"}},
+        "Design B": {"colors": {"primary": "#00FF00"}},
+    }
+
+
+def build(design_variants, cache_dir, **generator_options):
+    cache = SuperThemeBuildCache(cache_dir)
+    generator = SuperThemeGenerator(**generator_options)
+    package = generator.generate_supertheme(design_variants, ASPECT_RATIOS, build_cache=cache)
+    return package, cache, generator.last_generation_report
+
+
+class TestIncrementalRebuild:
+    """Only variants with changed inputs are regenerated"""
+
+    def test_unchanged_inputs_reuse_every_variant(self, design_variants, tmp_path):
+        first, first_cache, _ = build(design_variants, tmp_path)
+        second, second_cache, report = build(design_variants, tmp_path)
+
+        assert first_cache.stats.regenerated == 4
+        assert second_cache.stats.reused == 4
+        assert second_cache.stats.regenerated == 0
+        assert len(report.cached_variants) == 4
+        assert second == first
+
+    def test_changed_design_regenerates_only_its_variants(self, design_variants, tmp_path):
+        build(design_variants, tmp_path)
+        design_variants["Design B"] = {"colors": {"primary": "#0000FF"}}
+
+        package, cache, _ = build(design_variants, tmp_path)
+
+        assert cache.stats.reused == 2
+        assert cache.stats.regenerated_variants == ["Design B Widescreen 16 9", "Design B Classic 4 3"]
+        assert package == SuperThemeGenerator().generate_supertheme(design_variants, ASPECT_RATIOS)
+
+    def test_removed_design_is_dropped_from_manifest(self, design_variants, tmp_path):
+        build(design_variants, tmp_path)
+        del design_variants["Design B"]
+
+        build(design_variants, tmp_path)
+
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["version"] == BUILD_CACHE_VERSION
+        assert sorted(manifest["variants"]) == [f"Design A::{ratio}" for ratio in sorted(ASPECT_RATIOS)]
+
+    def test_corrupt_part_is_regenerated(self, design_variants, tmp_path):
+        expected, _, _ = build(design_variants, tmp_path)
+        part_path = next((tmp_path / "parts").glob("*/*"))
+        part_path.write_bytes(b"corrupt")
+
+        package, cache, _ = build(design_variants, tmp_path)
+
+        assert cache.stats.regenerated > 0
+        assert package == expected
+
+
+class TestVariantInputHash:
+    """Input hashes cover every input a variant depends on"""
+
+    def test_hash_changes_with_each_input(self):
+        base = ({"colors": {"primary": "#FF0000"}}, {"width": 1}, "Design A", "aspectRatios.a4", "1")
+        variations = [
+            ({"colors": {"primary": "#FF0001"}}, {"width": 1}, "Design A", "aspectRatios.a4", "1"),
+            ({"colors": {"primary": "#FF0000"}}, {"width": 2}, "Design A", "aspectRatios.a4", "1"),
+            ({"colors": {"primary": "#FF0000"}}, {"width": 1}, "Design B", "aspectRatios.a4", "1"),
+            ({"colors": {"primary": "#FF0000"}}, {"width": 1}, "Design A", "aspectRatios.a3", "1"),
+            ({"colors": {"primary": "#FF0000"}}, {"width": 1}, "Design A", "aspectRatios.a4", "2"),
+        ]
+
+        hashes = {variant_input_hash(*inputs) for inputs in [base] + variations}
+
+        assert len(hashes) == len(variations) + 1
+
+    def test_hash_ignores_key_order(self):
+        first = variant_input_hash({"a": 1, "b": 2}, None, "D", "r", "1")
+        second = variant_input_hash({"b": 2, "a": 1}, None, "D", "r", "1")
+
+        assert first == second
+
+
+class TestGeneratorVersion:
+    """The generator version covers every module variant output depends on"""
+
+    def test_imported_modules_are_hashed(self):
+        names = {path.name for path in variant_source_files()}
+
+        assert {"supertheme_generator.py", "aspect_ratio_resolver.py", "theme_resolver.py",
+                "emu_types.py", "contrast_matrix.py", "xml_utils.py"} <= names
@@ -437,5 +437,54 @@ class TestSuperThemePerformance:
         assert second_time <= first_time * 1.2, "Caching did not improve performance"
 
 
+class TestParallelVariantGeneration:
+    """Test process-pool variant generation and deterministic assembly"""
+    
+    @pytest.fixture
+    def design_variants(self):
+        return {
+            f"Design {i}": {
+                "colors": {"primary": {"$type": "color", "$value": f"#{i:02d}66CC"}},
+                "layout": {
+                    "width": {
+                        "$aspectRatio": {
+                            "{aspectRatios.widescreen_16_9}": "13.33in",
+                            "{aspectRatios.a4_landscape}": "297mm"
+                        }
+                    }
+                }
+            }
+            for i in range(1, 4)
+        }
+    
+    @pytest.mark.skipif(SuperThemeGenerator is None, reason="SuperThemeGenerator not implemented yet")
+    def test_parallel_output_is_byte_identical(self, design_variants):
+        """Test that worker processes produce the same package bytes as serial generation"""
+        aspect_ratios = ["aspectRatios.widescreen_16_9", "aspectRatios.a4_landscape"]
+        
+        serial = SuperThemeGenerator().generate_supertheme(design_variants, aspect_ratios)
+        parallel_generator = SuperThemeGenerator(max_workers=2)
+        parallel = parallel_generator.generate_supertheme(design_variants, aspect_ratios)
+        
+        assert parallel == serial
+        assert parallel_generator.last_generation_report.workers == 2
+    
+    @pytest.mark.skipif(SuperThemeGenerator is None, reason="SuperThemeGenerator not implemented yet")
+    def test_generation_report_times_each_variant(self, design_variants):
+        """Test per-variant timings, including skipped variants, in generation order"""
+        generator = SuperThemeGenerator()
+        aspect_ratios = ["aspectRatios.widescreen_16_9", "aspectRatios.missing"]
+        
+        generator.generate_supertheme(design_variants, aspect_ratios)
+        report = generator.last_generation_report
+        
+        assert [(t.design_name, t.aspect_ratio_token) for t in report.variant_timings] == [
+            (design, ratio) for design in design_variants for ratio in aspect_ratios
+        ]
+        assert len(report.failed_variants) == len(design_variants)
+        assert all(t.seconds >= 0 for t in report.variant_timings)
+        assert report.to_dict()["variants"][0]["design"] == "Design 1"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -363,5 +363,77 @@ class TestSuperThemeValidator:
             pytest.skip("lxml not available")
 
 
+
+def findings(result):
+    return ([(e.field, e.message) for e in result.errors],
+            [(w.field, w.message) for w in result.warnings])
+
+
+class TestStreamingValidation:
+    """Packages are read on demand and variants are validated concurrently"""
+    
+    @pytest.fixture
+    def supertheme_data(self):
+        from tools.supertheme_generator import SuperThemeGenerator
+        generator = SuperThemeGenerator(dedupe_parts=False)
+        return generator.generate_supertheme(
+            {"Design A": {}, "Design B": {}},
+            ["aspectRatios.widescreen_16_9", "aspectRatios.classic_4_3"]
+        )
+    
+    @pytest.fixture
+    def broken_relationships_data(self, supertheme_data):
+        source = zipfile.ZipFile(io.BytesIO(supertheme_data))
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            for name in source.namelist():
+                payload = source.read(name)
+                if name.startswith('themeVariants/variant') and name.endswith('.rels'):
+                    payload = b'<?xml version="1.0"?><Relationships><Relationship/></Relationships>'
+                zf.writestr(name, payload)
+        return buffer.getvalue()
+    
+    def test_path_and_file_object_sources(self, supertheme_data, tmp_path):
+        package_path = tmp_path / "supertheme.thmx"
+        package_path.write_bytes(supertheme_data)
+        expected = SuperThemeValidator().validate_package(supertheme_data)
+        
+        from_path = SuperThemeValidator().validate_package(package_path)
+        with open(package_path, 'rb') as f:
+            from_file = SuperThemeValidator().validate_package(f)
+        
+        for result in (from_path, from_file):
+            assert result.is_valid == expected.is_valid
+            assert result.variant_count == 4
+            assert result.package_size_mb == expected.package_size_mb
+            assert findings(result) == findings(expected)
+    
+    def test_concurrent_findings_match_serial_order(self, broken_relationships_data):
+        serial = SuperThemeValidator(max_workers=1).validate_package(broken_relationships_data)
+        concurrent = SuperThemeValidator(max_workers=4).validate_package(broken_relationships_data)
+        
+        assert not serial.is_valid
+        assert findings(concurrent) == findings(serial)
+    
+    def test_fail_fast_stops_at_first_error(self, broken_relationships_data):
+        complete = SuperThemeValidator().validate_package(broken_relationships_data)
+        fail_fast = SuperThemeValidator(fail_fast=True, max_workers=1).validate_package(broken_relationships_data)
+        
+        assert not fail_fast.is_valid
+        assert fail_fast.metadata['stopped_early'] is True
+        assert 0 < len(fail_fast.errors) < len(complete.errors)
+        assert 'stopped_early' not in complete.metadata
+    
+    def test_corrupt_entry_fails_integrity_check(self, supertheme_data):
+        info = zipfile.ZipFile(io.BytesIO(supertheme_data)).getinfo('themeVariants/variant2/theme/theme/theme1.xml')
+        data_start = info.header_offset + 30 + len(info.filename) + len(info.extra)
+        corrupt = bytearray(supertheme_data)
+        corrupt[data_start + info.compress_size // 2] ^= 0xFF
+        
+        result = SuperThemeValidator().validate_package(bytes(corrupt))
+        
+        assert not result.is_valid
+        assert result.errors[-1].message.startswith("ZIP integrity check failed")
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -14,7 +14,7 @@ from unittest.mock import Mock, patch, MagicMock
 from lxml import etree
 from tools.token_integration_layer import (
     TokenIntegrationLayer, TokenScope, TokenContext, TokenResolutionResult,
-    create_default_integration_layer, integrate_tokens_with_processor
+    ResolutionMemo, create_default_integration_layer, integrate_tokens_with_processor
 )
 
 
@@ -306,6 +306,68 @@ class TestTokenIntegrationLayer(unittest.TestCase):
         self.assertEqual(resolved_data['level1']['level2'][1], 'literal_value')
 
 
+class TestMemoizedResolution(unittest.TestCase):
+    """Test memoized patch-value resolution and its fast path."""
+    
+    def setUp(self):
+        self.integration_layer = TokenIntegrationLayer()
+        self.context = TokenContext(
+            scope=TokenScope.OPERATION,
+            template_type='potx',
+            variables={},
+            metadata={}
+        )
+    
+    def test_literal_values_skip_resolution(self):
+        """Values without token braces are returned without scanning."""
+        patch_data = {'operation': 'set', 'target': '//a:latin/@typeface', 'value': 'Arial', 'size': 12}
+        
+        with patch.object(self.integration_layer, '_resolve_string_tokens') as resolve:
+            resolved = self.integration_layer.resolve_patch_tokens(patch_data, self.context)
+        
+        resolve.assert_not_called()
+        self.assertEqual(resolved, patch_data)
+    
+    def test_repeated_values_resolve_once(self):
+        """Identical token values are resolved once per token-set version."""
+        self.integration_layer.register_token('brand', 'FF0000', TokenScope.GLOBAL)
+        memo = ResolutionMemo()
+        patch_data = {'value': '${brand}'}
+        
+        with patch.object(self.integration_layer, '_resolve_string_tokens',
+                          wraps=self.integration_layer._resolve_string_tokens) as resolve:
+            for _ in range(5):
+                resolved = self.integration_layer.resolve_patch_tokens(patch_data, self.context, memo)
+        
+        self.assertEqual(resolved['value'], 'FF0000')
+        self.assertEqual(resolve.call_count, 1)
+        self.assertEqual((memo.hits, memo.misses), (4, 1))
+    
+    def test_registering_tokens_invalidates_memo(self):
+        """A changed token set is picked up by later resolutions."""
+        self.integration_layer.register_token('brand', 'FF0000', TokenScope.GLOBAL)
+        patch_data = {'value': '${brand}'}
+        self.assertEqual(self.integration_layer.resolve_patch_tokens(patch_data, self.context)['value'], 'FF0000')
+        
+        self.integration_layer.register_token('brand', '00FF00', TokenScope.GLOBAL)
+        
+        self.assertEqual(self.integration_layer.resolve_patch_tokens(patch_data, self.context)['value'], '00FF00')
+    
+    def test_emu_conversions_cached_per_call_site(self):
+        """EMU expressions are converted once per call-site memo."""
+        memo = ResolutionMemo()
+        
+        with patch.object(self.integration_layer.emu_system, 'parse_value',
+                          wraps=self.integration_layer.emu_system.parse_value) as parse_value:
+            first = self.integration_layer.resolve_patch_tokens({'value': '#{12pt}'}, self.context, memo)
+            second = self.integration_layer.resolve_patch_tokens({'value': 'size #{12pt}'}, self.context, memo)
+        
+        self.assertEqual(first['value'], '12pt')
+        self.assertEqual(second['value'], 'size 12pt')
+        self.assertEqual(parse_value.call_count, 1)
+        self.assertEqual(memo.emu, {('12pt', 'potx'): '12pt'})
+
+
 class TestConvenienceFunctions(unittest.TestCase):
     """Test convenience functions for common operations."""
     
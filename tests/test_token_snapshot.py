@@ -0,0 +1,159 @@
+"""
+Tests for compiled, memory-mapped token hierarchy snapshots
+"""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from tools.token_snapshot import (
+    SnapshotError, TokenSnapshot, compile_token_snapshot, compile_tokens,
+    load_or_compile_snapshot, snapshot_path_for
+)
+
+
+@pytest.fixture
+def layer_files(tmp_path):
+    core = tmp_path / "core.json"
+    core.write_text(json.dumps({
+        "$schema": "https://stylestack.dev/schemas/design-tokens.schema.json",
+        "color": {
+            "primary": {"value": "#0066CC", "type": "color"},
+            "text": "{color.primary}",
+        },
+        "size": {"base": 12},
+    }))
+    org = tmp_path / "org.json"
+    org.write_text(json.dumps({
+        "color": {"primary": "#FF0000"},
+        "spacing": {"scale": {"$value": [4, 8, 16]}},
+    }))
+    return [("core", core), ("org", org)]
+
+
+@pytest.fixture
+def bulk_layer_files(tmp_path):
+    # BulkTokenResolver keys tokens by the layers' top-level entries
+    core = tmp_path / "bulk-core.json"
+    core.write_text(json.dumps({
+        "primary": "#0066CC",
+        "text": "{primary}",
+        "size": {"base": 12},
+        "color": {"accent": {"value": "#00AA00"}},
+    }))
+    org = tmp_path / "bulk-org.json"
+    org.write_text(json.dumps({"primary": "#FF0000"}))
+    return [("core", core), ("org", org)]
+
+
+@pytest.fixture
+def bulk_resolver_module(monkeypatch):
+    # tests/test_bulk_token_resolver.py replaces the module with a MagicMock
+    monkeypatch.delitem(sys.modules, "tools.bulk_token_resolver", raising=False)
+    return importlib.import_module("tools.bulk_token_resolver")
+
+
+class TestSnapshotCompilation:
+    """Compiling layer stacks and reading them back"""
+
+    def test_higher_layers_take_precedence(self, layer_files, tmp_path):
+        out = tmp_path / "tokens.snap"
+        assert compile_token_snapshot(layer_files, out) == 4
+
+        with TokenSnapshot(out) as snapshot:
+            assert snapshot.levels == ["core", "org"]
+            assert snapshot.get_entry("color.primary") == ("#FF0000", "org")
+            assert snapshot.get_entry("color.text") == ("{color.primary}", "core")
+            assert snapshot["size.base"] == 12
+            assert snapshot["spacing.scale"] == [4, 8, 16]
+            assert snapshot.get_entry("color.missing") is None
+            assert "color" not in snapshot
+            assert list(snapshot) == sorted(snapshot)
+            assert len(snapshot) == 4
+
+    def test_rejects_foreign_files(self, tmp_path):
+        bogus = tmp_path / "bogus.snap"
+        bogus.write_bytes(b"not a snapshot" * 10)
+
+        with pytest.raises(SnapshotError):
+            TokenSnapshot(bogus)
+
+    def test_stale_snapshot_is_rebuilt(self, layer_files, tmp_path):
+        cache_dir = tmp_path / "cache"
+        first = load_or_compile_snapshot(layer_files, cache_dir)
+        first_path = first.path
+        first.close()
+
+        layer_files[1][1].write_text(json.dumps({"color": {"primary": "#00FF00"}}))
+        second = load_or_compile_snapshot(layer_files, cache_dir)
+
+        assert second.path != first_path
+        assert second.matches_sources(layer_files)
+        assert second["color.primary"] == "#00FF00"
+        second.close()
+
+    def test_compile_tokens_command(self, layer_files, tmp_path):
+        cache_dir = tmp_path / "cache"
+        args = ["--core", str(layer_files[0][1]), "--org", str(layer_files[1][1]),
+                "--cache-dir", str(cache_dir)]
+        runner = CliRunner()
+
+        result = runner.invoke(compile_tokens, args)
+        assert result.exit_code == 0, result.output
+        assert snapshot_path_for(layer_files, cache_dir).exists()
+
+        result = runner.invoke(compile_tokens, args)
+        assert "up to date" in result.output
+
+
+class TestBulkResolverSnapshot:
+    """BulkTokenResolver resolving from a snapshot instead of JSON files"""
+
+    def test_resolves_references_from_snapshot(self, bulk_resolver_module, bulk_layer_files, tmp_path):
+        resolver = bulk_resolver_module.BulkTokenResolver(enable_parallel_loading=False)
+        resolver.use_snapshot(dict(bulk_layer_files), tmp_path / "cache")
+
+        result = resolver.resolve_token_batch(["text", "size"])
+
+        assert result.resolved_tokens["text"].value == "#FF0000"
+        assert result.resolved_tokens["text"].source == "bulk_snapshot_core"
+        assert result.resolved_tokens["size"].value == {"base": 12}
+        assert result.hierarchy_loads == 0
+        resolver.shutdown()
+
+    def test_snapshot_resolves_like_json_files(self, bulk_resolver_module, bulk_layer_files, tmp_path):
+        token_ids = ["primary", "text", "size", "color"]
+        from_json = bulk_resolver_module.BulkTokenResolver(enable_parallel_loading=False)
+        from_snapshot = bulk_resolver_module.BulkTokenResolver(enable_parallel_loading=False)
+        from_snapshot.use_snapshot(dict(bulk_layer_files), tmp_path / "cache")
+
+        expected = from_json.resolve_token_batch(token_ids, hierarchy_paths=dict(bulk_layer_files))
+        actual = from_snapshot.resolve_token_batch(token_ids)
+
+        for token_id in token_ids:
+            json_token, snapshot_token = expected.resolved_tokens[token_id], actual.resolved_tokens[token_id]
+            assert snapshot_token.value == json_token.value
+            assert snapshot_token.source.rsplit("_", 1)[-1] == json_token.source.rsplit("_", 1)[-1]
+        from_json.shutdown()
+        from_snapshot.shutdown()
+
+    def test_hierarchy_paths_are_reported_while_a_snapshot_is_active(self, bulk_resolver_module,
+                                                                      bulk_layer_files, tmp_path, caplog):
+        resolver = bulk_resolver_module.BulkTokenResolver(enable_parallel_loading=False)
+        resolver.use_snapshot(dict(bulk_layer_files), tmp_path / "cache")
+
+        resolver.resolve_token_batch(["text"], hierarchy_paths=dict(bulk_layer_files))
+
+        assert "hierarchy_paths ignored" in caplog.text
+        resolver.shutdown()
+
+    def test_level_hash_uses_source_bytes(self, bulk_resolver_module, layer_files):
+        resolver = bulk_resolver_module.BulkTokenResolver(enable_parallel_loading=False)
+        level = resolver._load_hierarchy_level("core", Path(layer_files[0][1]))
+
+        assert level.get_token_hash() == level.source_hash
+        assert len(level.source_hash) == 64
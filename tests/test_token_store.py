@@ -0,0 +1,151 @@
+"""
+Unit tests for the StyleStack columnar token store
+
+Covers loading nested token trees into the store, the zero-copy Mapping
+views, layered overrides and reference linking.
+"""
+
+import sys
+
+import pytest
+
+from tools.token_resolver import TokenResolver
+from tools.token_store import MISSING_REFERENCE, TokenStore, TokenTreeView, TokenView
+from tools.typography_token_system import TypographyToken
+from tools.style_inheritance_core import InheritedTypographyToken
+
+
+@pytest.fixture
+def token_tree():
+    return {
+        "$schema": "https://stylestack.dev/schemas/design-tokens.schema.json",
+        "fonts": {"primary": "Liberation Sans", "fallback": "Arial"},
+        "colors": {
+            "brand": {
+                "value": "#0066CC",
+                "type": "color",
+                "description": "Primary brand colour",
+            },
+            "accent": {"$value": "{colors.brand}", "$type": "color"},
+            "border": {"value": "1px solid {colors.brand} {colors.missing}"},
+        },
+    }
+
+
+class TestTokenStoreLoading:
+    """Building the store from nested dicts"""
+
+    def test_flatten_matches_token_resolver(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+        tree = {k: v for k, v in token_tree.items() if k != "$schema"}
+        expected = TokenResolver().flatten_tokens(tree)
+        # TokenResolver predates W3C $value tokens
+        del expected["colors.accent.$value"], expected["colors.accent.$type"]
+        expected["colors.accent"] = "{colors.brand}"
+
+        assert len(store) == 5
+        assert store.flatten() == expected
+
+    def test_round_trip_to_dict(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+        expected = {k: v for k, v in token_tree.items() if k != "$schema"}
+
+        assert store.to_dict() == expected
+
+    def test_columnar_accessors(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+        brand_id = store.id_of("colors.brand")
+        accent_id = store.id_of("colors.accent")
+
+        assert store.path_of(accent_id) == "colors.accent"
+        assert store.type_of(brand_id) == "color"
+        assert store.type_of(store.id_of("fonts.primary")) is None
+        assert store.references_of(accent_id) == (brand_id,)
+        assert store.references_of(store.id_of("colors.border")) == (brand_id, MISSING_REFERENCE)
+        assert store.is_group(store.parent_of(brand_id))
+
+    def test_keys_are_interned(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+        key = store.path_of(store.id_of("colors.brand")).split(".")[-1]
+
+        assert store._keys[store.id_of("colors.brand")] is sys.intern(key)
+
+    def test_later_layer_overrides_and_merges(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+        store.load_tree({"colors": {"brand": {"value": "#FF0000", "type": "color"}, "new": "#000000"}})
+
+        assert store.get("colors.brand") == "#FF0000"
+        assert store.get("colors.new") == "#000000"
+        assert store.get("colors.accent") == "{colors.brand}"
+        assert len(store) == 6
+
+    def test_group_replaced_by_token_drops_descendants(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+        store.load_tree({"fonts": {"value": "Inter"}})
+
+        assert store.get("fonts") == "Inter"
+        assert "fonts.primary" not in store
+        assert "fonts.primary" not in store.flatten()
+        assert len(store) == 4
+
+
+class TestTokenStoreViews:
+    """Dict-compatible read facades"""
+
+    def test_tree_view_behaves_like_nested_dict(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+        view = store.view()
+
+        assert isinstance(view, TokenTreeView)
+        assert list(view) == ["fonts", "colors"]
+        assert view["fonts"]["primary"] == "Liberation Sans"
+        assert view["colors"]["brand"]["value"] == "#0066CC"
+        assert view["colors"]["brand"]["description"] == "Primary brand colour"
+        assert view["colors"]["accent"]["$type"] == "color"
+        assert "value" not in view["colors"]["accent"]
+        with pytest.raises(KeyError):
+            view["colors"]["unknown"]
+
+    def test_token_view_reflects_updates(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+        brand = store.view("colors")["brand"]
+
+        store.set_value("colors.brand", "#123456")
+
+        assert isinstance(brand, TokenView)
+        assert brand["value"] == "#123456"
+        assert brand.type == "color"
+        assert brand["description"] == "Primary brand colour"
+
+    def test_set_value_links_new_reference_targets(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+        border_id = store.id_of("colors.border")
+
+        missing_id = store.set_value("colors.missing", "#EEEEEE")
+
+        assert store.references_of(border_id)[-1] == missing_id
+
+    def test_views_are_slotted(self, token_tree):
+        store = TokenStore.from_tree(token_tree)
+
+        assert not hasattr(store.view(), "__dict__")
+        assert not hasattr(store.view("colors")["brand"], "__dict__")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+class TestSlottedTypographyTokens:
+    """Typography value objects carry no per-instance __dict__"""
+
+    def test_typography_token_is_slotted(self):
+        token = TypographyToken(id="body", font_size="12pt")
+
+        assert not hasattr(token, "__dict__")
+        with pytest.raises(AttributeError):
+            token.unknown_attribute = True
+
+    def test_inherited_token_is_slotted(self):
+        token = InheritedTypographyToken(id="heading", base_style="Normal")
+        token.delta_properties = {"fontSize": "18pt"}
+
+        assert not hasattr(token, "__dict__")
+        assert token.get_effective_property("fontSize") == "18pt"
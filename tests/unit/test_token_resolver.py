@@ -37,11 +37,52 @@ class TestTokenResolver:
         # This test ensures the module loads without import errors
         assert True, "Module imported successfully"
     
-    # TODO: Add specific unit tests for token_resolver functions and classes
-    # Example test methods:
-    # def test_function_name(self):
-    #     """Test specific function behavior."""
-    #     pass
+    def test_resolve_alias_chain_beyond_ten_levels(self):
+        """Deep alias chains resolve fully instead of truncating at depth 10"""
+        resolver = TokenResolver()
+        flattened = {f"alias.{i}": f"{{alias.{i + 1}}}" for i in range(25)}
+        flattened["alias.25"] = "#0066CC"
+        
+        resolved = resolver.resolve_token_references(flattened)
+        
+        assert all(value == "#0066CC" for value in resolved.values())
+        assert list(resolved) == list(flattened)
+    
+    def test_resolve_mixed_literal_and_reference_segments(self):
+        """Templates keep literal text around references and leave unknown ones"""
+        resolver = TokenResolver()
+        resolved = resolver.resolve_token_references({
+            "space.base": 8,
+            "border.width": "{space.base}px solid {color.missing}",
+        })
+        
+        assert resolved["space.base"] == 8
+        assert resolved["border.width"] == "8px solid {color.missing}"
+    
+    def test_each_value_compiled_once(self):
+        """Identical values share one compiled template"""
+        resolver = TokenResolver()
+        resolver.resolve_token_references({"a": "x", "b": "{a}", "c": "{a}"})
+        
+        assert resolver._compile_template("{a}") is resolver._template_cache["{a}"]
+        assert resolver._compile_template("no references") is None
+    
+    def test_circular_references_detected_exactly(self):
+        """Cycles are reported with their exact path and do not loop"""
+        resolver = TokenResolver()
+        resolved = resolver.resolve_token_references({"a": "{b}", "b": "{a}", "c": "{d}", "d": "1"})
+        
+        assert resolver.circular_references == [["a", "b", "a"]]
+        assert resolved["c"] == "1"
+    
+    def test_each_cycle_reported_once(self):
+        """A cycle is reported once however many references follow it"""
+        resolver = TokenResolver()
+        resolved = resolver.resolve_token_references({"a": "{b}", "b": "{a} {c} {d}", "c": "x", "d": "y"})
+        
+        assert len(resolver.circular_references) == 1
+        assert resolver.circular_references == [["a", "b", "a"]]
+        assert resolved["b"] == "{a} x y"
     
     @pytest.mark.slow
     def test_module_performance_baseline(self):
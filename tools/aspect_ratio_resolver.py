@@ -11,7 +11,9 @@ Features:
 - EMU precision calculations from mm/inches/pixels
 - Conditional token resolution with nested references
 - Schema validation and error handling
-- Performance optimization with caching
+- Performance optimization with caching: each token tree is indexed once
+  (fingerprint + conditional sites) and per-ratio results copy only the paths
+  to $aspectRatio conditionals, sharing all other subtrees with the input
 
 Usage:
     resolver = AspectRatioResolver()
@@ -84,6 +86,22 @@ class AspectRatioTokenError(Exception):
     pass
 
 
+# Marks a $aspectRatio conditional in a site trie
+_CONDITIONAL_SITE = None
+
+
+@dataclass
+class TokenTreeIndex:
+    """Fingerprint and $aspectRatio conditional sites of a token tree, computed once
+
+    ``sites`` is a trie of dict keys / list indices leading to each
+    conditional; a leaf (``_CONDITIONAL_SITE``) is the conditional itself.
+    """
+    fingerprint: str
+    sites: Optional[Dict[Union[str, int], Any]]
+    site_count: int = 0
+
+
 class AspectRatioResolver:
     """
     Resolves tokens with aspect ratio conditional values using token-defined aspect ratios.
@@ -105,6 +123,10 @@ class AspectRatioResolver:
         self._resolution_cache: Dict[str, Dict[str, Any]] = {}
         self._token_path_cache: Dict[str, Any] = {}
         
+        # Token trees are indexed once per object; (tree, index) keeps the id valid
+        self._tree_indexes: Dict[int, Tuple[Any, TokenTreeIndex]] = {}
+        self._tree_index_limit = 64
+        
         # Token pattern matching
         self._aspect_ratio_token_pattern = re.compile(r'^\{aspectRatios\.([a-zA-Z][a-zA-Z0-9_]*)\}$')
         self._token_reference_pattern = re.compile(r'^\{([a-zA-Z][a-zA-Z0-9_]*(?:\.[a-zA-Z][a-zA-Z0-9_]*)*)\}$')
@@ -128,8 +150,9 @@ class AspectRatioResolver:
         Raises:
             AspectRatioTokenError: If aspect ratio token not found or malformed
         """
-        # Generate cache key
-        cache_key = self._generate_cache_key(base_tokens, aspect_ratio_token)
+        # Generate cache key from the tree's precomputed fingerprint
+        tree_index = self.index_tokens(base_tokens)
+        cache_key = f"{tree_index.fingerprint}:{aspect_ratio_token}"
         if self.enable_cache and cache_key in self._resolution_cache:
             if self.verbose:
                 logger.debug(f"Cache hit for aspect ratio resolution: {aspect_ratio_token}")
@@ -143,8 +166,8 @@ class AspectRatioResolver:
         if self.verbose:
             logger.debug(f"Resolving tokens for aspect ratio: {ratio_token.name} ({ratio_token.width_emu}x{ratio_token.height_emu})")
         
-        # Recursively resolve all tokens with aspect ratio conditions
-        resolved = self._resolve_recursive(base_tokens, aspect_ratio_token, set())
+        # Rebuild only the paths leading to conditionals; other subtrees are shared
+        resolved = self._resolve_sites(base_tokens, tree_index.sites, aspect_ratio_token)
         
         # Cache result
         if self.enable_cache:
@@ -167,7 +190,7 @@ class AspectRatioResolver:
             AspectRatioTokenError: If token is malformed
         """
         # Check cache first
-        cache_key = f"{hash(str(tokens))}:{token_path}"
+        cache_key = f"{self.index_tokens(tokens).fingerprint}:{token_path}"
         if self.enable_cache and cache_key in self._aspect_ratio_cache:
             return self._aspect_ratio_cache[cache_key]
         
@@ -291,29 +314,77 @@ class AspectRatioResolver:
             }
         }
     
+    def index_tokens(self, tokens: Dict[str, Any]) -> TokenTreeIndex:
+        """
+        Fingerprint a token tree and index its $aspectRatio conditional sites
+        
+        The index is computed once per tree object and reused for every aspect
+        ratio, so trees must not be mutated after they have been resolved
+        (call ``clear_cache()`` if they are).
+        
+        Args:
+            tokens: Token structure
+            
+        Returns:
+            TokenTreeIndex for the tree
+        """
+        cached = self._tree_indexes.get(id(tokens))
+        if cached is not None and cached[0] is tokens:
+            return cached[1]
+        
+        sites, site_count = self._index_conditional_sites(tokens)
+        fingerprint = hashlib.md5(json.dumps(tokens, sort_keys=True, default=str).encode()).hexdigest()
+        tree_index = TokenTreeIndex(fingerprint=fingerprint, sites=sites, site_count=site_count)
+        
+        if len(self._tree_indexes) >= self._tree_index_limit:
+            self._tree_indexes.clear()
+        self._tree_indexes[id(tokens)] = (tokens, tree_index)
+        
+        return tree_index
+    
+    def clear_cache(self):
+        """Clear resolution caches and tree indexes"""
+        self._aspect_ratio_cache.clear()
+        self._resolution_cache.clear()
+        self._token_path_cache.clear()
+        self._tree_indexes.clear()
+    
     # Helper methods
     
-    def _resolve_recursive(self, 
-                         obj: Any, 
-                         aspect_ratio_token: str, 
-                         visited: set) -> Any:
-        """Recursively resolve aspect ratio conditions in token structure"""
+    def _index_conditional_sites(self, obj: Any) -> Tuple[Any, int]:
+        """Build the site trie for obj: _CONDITIONAL_SITE, a dict of child tries, or {} if none"""
         if isinstance(obj, dict):
             if "$aspectRatio" in obj:
-                # Resolve aspect ratio conditional
-                return self._resolve_aspect_ratio_conditional(obj["$aspectRatio"], aspect_ratio_token)
-            else:
-                # Recursively process dictionary
-                resolved = {}
-                for key, value in obj.items():
-                    resolved[key] = self._resolve_recursive(value, aspect_ratio_token, visited)
-                return resolved
+                return _CONDITIONAL_SITE, 1
+            items = obj.items()
         elif isinstance(obj, list):
-            # Recursively process list
-            return [self._resolve_recursive(item, aspect_ratio_token, visited) for item in obj]
+            items = enumerate(obj)
+        else:
+            return {}, 0
+        
+        trie = {}
+        count = 0
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                child, child_count = self._index_conditional_sites(value)
+                if child_count:
+                    trie[key] = child
+                    count += child_count
+        return trie, count
+    
+    def _resolve_sites(self, obj: Any, sites: Any, aspect_ratio_token: str) -> Any:
+        """Copy the containers along each conditional's path, sharing everything else"""
+        if sites is _CONDITIONAL_SITE:
+            return self._resolve_aspect_ratio_conditional(obj["$aspectRatio"], aspect_ratio_token)
+        if isinstance(obj, dict):
+            resolved = dict(obj)
+        elif isinstance(obj, list):
+            resolved = list(obj)
         else:
-            # Return primitive values as-is
             return obj
+        for key, child_sites in sites.items():
+            resolved[key] = self._resolve_sites(obj[key], child_sites, aspect_ratio_token)
+        return resolved
     
     def _resolve_aspect_ratio_conditional(self, 
                                         conditional: Dict[str, Any], 
@@ -390,11 +461,6 @@ class AspectRatioResolver:
             )
         except (AttributeError, TypeError):
             return False
-    
-    def _generate_cache_key(self, tokens: Dict[str, Any], aspect_ratio_token: str) -> str:
-        """Generate cache key for resolution results"""
-        tokens_hash = hashlib.md5(json.dumps(tokens, sort_keys=True).encode()).hexdigest()
-        return f"{tokens_hash}:{aspect_ratio_token}"
 
 
 # Utility functions for common aspect ratios
@@ -28,10 +28,13 @@ from typing import Dict, List, Optional, Set, Any, Union, Tuple, FrozenSet
 import logging
 import hashlib
 
+from tools.reference_scanner import scan, substitute
+
 # Use shared utilities from refactored core
 try:
     from .core import get_logger, ValidationError, safe_load_json
     from .variable_resolver import VariableResolver, ResolvedVariable
+    from .token_snapshot import TokenSnapshot, load_or_compile_snapshot
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -39,6 +42,7 @@ except ImportError:
     try:
         from core import get_logger, ValidationError, safe_load_json
         from variable_resolver import VariableResolver, ResolvedVariable
+        from token_snapshot import TokenSnapshot, load_or_compile_snapshot
     except ImportError:
         # Mock for development
         def get_logger(name): 
@@ -63,6 +67,10 @@ except ImportError:
             
             def resolve_variable(self, var_id: str) -> ResolvedVariable:
                 return ResolvedVariable(var_id, f"resolved_{var_id}", "mock", "mock", "mock")
+        
+        TokenSnapshot = None
+        def load_or_compile_snapshot(layers, cache_dir, flatten=True):
+            raise ImportError("Token snapshots require tools.token_snapshot")
 
 logger = get_logger(__name__)
 
@@ -76,6 +84,7 @@ class TokenHierarchyLevel:
     last_modified: float = 0.0
     load_time: float = 0.0
     dependency_graph: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
+    source_hash: Optional[str] = None  # SHA-256 of the source file bytes
     
     @property
     def token_count(self) -> int:
@@ -84,6 +93,8 @@ class TokenHierarchyLevel:
     
     def get_token_hash(self) -> str:
         """Generate hash for cache invalidation."""
+        if self.source_hash:
+            return self.source_hash
         content = json.dumps(self.tokens, sort_keys=True)
         return hashlib.md5(content.encode()).hexdigest()
 
@@ -232,7 +243,8 @@ class BulkTokenResolver:
                  max_cache_size: int = 10,
                  enable_parallel_loading: bool = True,
                  max_workers: int = 4,
-                 enable_dependency_resolution: bool = True):
+                 enable_dependency_resolution: bool = True,
+                 snapshot: Optional[TokenSnapshot] = None):
         """
         Initialize BulkTokenResolver.
         
@@ -242,6 +254,7 @@ class BulkTokenResolver:
             enable_parallel_loading: Enable parallel hierarchy loading
             max_workers: Maximum worker threads for parallel operations
             enable_dependency_resolution: Enable token dependency resolution
+            snapshot: Compiled token snapshot to resolve from instead of JSON files
         """
         self.base_resolver = base_resolver or VariableResolver()
         self.max_cache_size = max_cache_size
@@ -262,6 +275,9 @@ class BulkTokenResolver:
         self._dependency_graph: Dict[str, Set[str]] = defaultdict(set)
         self._resolved_dependencies: Dict[str, Any] = {}
         
+        # Precompiled, memory-mapped layer stack (see tools/token_snapshot.py)
+        self._snapshot = snapshot
+        
         logger.info(f"Initialized BulkTokenResolver with cache_size={max_cache_size}, parallel={enable_parallel_loading}")
     
     def resolve_token_batch(self, 
@@ -293,8 +309,14 @@ class BulkTokenResolver:
                     logger.debug(f"Bulk cache hit for {len(token_ids)} tokens")
                     return cached_result
                 
-                # Load hierarchy data
-                hierarchy_data = self._load_hierarchy_bulk(hierarchy_paths)
+                # Load hierarchy data (a snapshot already holds the merged layers)
+                if self._snapshot is not None:
+                    if hierarchy_paths:
+                        logger.warning("hierarchy_paths ignored: resolving from the token snapshot "
+                                       f"{self._snapshot.path}; call use_snapshot() to change layers")
+                    hierarchy_data = {}
+                else:
+                    hierarchy_data = self._load_hierarchy_bulk(hierarchy_paths)
                 
                 # Resolve tokens in bulk
                 resolved_tokens = {}
@@ -406,8 +428,9 @@ class BulkTokenResolver:
                 logger.debug(f"Hierarchy file not found: {level_name}")
                 return None
             
-            # Load tokens from file
-            tokens = safe_load_json(file_path)
+            # Load tokens from file; the level hash comes from the same bytes
+            source = file_path.read_bytes()
+            tokens = json.loads(source)
             last_modified = file_path.stat().st_mtime
             load_time = time.time() - load_start
             
@@ -417,7 +440,8 @@ class BulkTokenResolver:
                 file_path=file_path,
                 tokens=tokens,
                 last_modified=last_modified,
-                load_time=load_time
+                load_time=load_time,
+                source_hash=hashlib.sha256(source).hexdigest()
             )
             
             # Build dependency graph if enabled
@@ -453,6 +477,9 @@ class BulkTokenResolver:
                                      hierarchy_data: Dict[str, TokenHierarchyLevel],
                                      context: Optional[Dict[str, Any]] = None) -> ResolvedVariable:
         """Resolve single token from loaded hierarchy data."""
+        if self._snapshot is not None:
+            return self._resolve_single_from_snapshot(token_id)
+        
         # Walk hierarchy in precedence order (lowest to highest)
         resolved_value = None
         source_level = None
@@ -484,6 +511,56 @@ class BulkTokenResolver:
             source=f"bulk_hierarchy_{source_level}"
         )
     
+    def _resolve_single_from_snapshot(self, token_id: str) -> ResolvedVariable:
+        """Resolve single token from the memory-mapped snapshot."""
+        entry = self._snapshot.get_entry(token_id)
+        if entry is None:
+            logger.debug(f"Token {token_id} not found in snapshot, using base resolver")
+            return self.base_resolver.resolve_variable(token_id)
+        
+        resolved_value, source_level = entry
+        if self.enable_dependency_resolution and isinstance(resolved_value, str):
+            resolved_value = self._resolve_dependencies(resolved_value, {})
+        
+        return ResolvedVariable(
+            id=token_id,
+            value=resolved_value,
+            type="mock",
+            scope="mock",
+            source=f"bulk_snapshot_{source_level}"
+        )
+    
+    def use_snapshot(self,
+                     hierarchy_paths: Dict[str, Path],
+                     cache_dir: Path) -> TokenSnapshot:
+        """
+        Resolve from a compiled snapshot of the given hierarchy files.
+        
+        The snapshot holds the layers' top-level entries with their raw values,
+        so tokens resolve exactly as from the JSON files. It is rebuilt
+        automatically when any source file changed, and it replaces the
+        hierarchy_paths of later resolve_token_batch calls.
+        
+        Args:
+            hierarchy_paths: Token file per hierarchy level
+            cache_dir: Directory holding compiled snapshots
+            
+        Returns:
+            TokenSnapshot: The snapshot now used for resolution
+        """
+        layers = [(level_name, Path(hierarchy_paths[level_name]))
+                  for level_name in self.HIERARCHY_LEVELS if level_name in hierarchy_paths]
+        snapshot = load_or_compile_snapshot(layers, Path(cache_dir), flatten=False)
+        
+        with self._resolution_lock:
+            if self._snapshot is not None:
+                self._snapshot.close()
+            self._snapshot = snapshot
+            self._bulk_resolution_cache.clear()
+        
+        logger.info(f"Using token snapshot {snapshot.path} ({len(snapshot)} tokens)")
+        return snapshot
+    
     def _build_dependency_graph(self, tokens: Dict[str, Any]) -> Dict[str, Set[str]]:
         """Build dependency graph for tokens with references."""
         dependencies = defaultdict(set)
@@ -491,9 +568,7 @@ class BulkTokenResolver:
         for token_id, value in tokens.items():
             if isinstance(value, str):
                 # Look for token references (e.g., "{color.primary}")
-                import re
-                refs = re.findall(r'\{([^}]+)\}', value)
-                for ref in refs:
+                for ref in scan(value).references:
                     dependencies[token_id].add(ref)
         
         return dict(dependencies)
@@ -506,18 +581,15 @@ class BulkTokenResolver:
             return value
         
         # Simple dependency resolution (can be enhanced)
-        import re
-        
-        def replace_reference(match):
-            ref_token = match.group(1)
+        def replace_reference(ref_token):
             try:
                 resolved = self._resolve_single_from_hierarchy(ref_token, hierarchy_data)
                 return str(resolved.value)
             except Exception as e:
                 logger.warning(f"Failed to resolve dependency {ref_token}: {e}")
-                return match.group(0)  # Return original reference
+                return None  # Keep original reference
         
-        return re.sub(r'\{([^}]+)\}', replace_reference, value)
+        return substitute(value, replace_reference)
     
     def _update_stats(self, result: BulkResolutionResult) -> None:
         """Update resolver statistics."""
@@ -621,6 +693,10 @@ class BulkTokenResolver:
         self._resolved_dependencies.clear()
         self._active_operations.clear()
         
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+        
         logger.info("BulkTokenResolver shutdown complete")
 
 
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+StyleStack Colour Clustering
+
+Near-duplicate detection for extracted colour palettes. Colours are converted
+to CIELAB once and bucketed on a grid whose cell size equals the ΔE
+threshold, so each colour is only compared against the colours in its own and
+the 26 neighbouring cells instead of against the whole palette. Palettes from
+gradients and imported charts (thousands of distinct colours) are handled in
+roughly linear time; the output is identical to comparing every pair.
+
+Features:
+- sRGB → CIELAB (D65) conversion
+- CIE76 ΔE colour difference
+- Similar pairs in the same order as a pairwise scan
+- Merged clusters (first occurrence is the representative)
+
+Usage:
+    pairs = find_similar_color_pairs(['#FF0000', '#FF1111', '#0000FF'], delta_e_threshold=5.0)
+    clusters = cluster_colors(palette, delta_e_threshold=5.0)
+"""
+
+import logging
+import math
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# CIE76 ΔE below which two colours are treated as the same brand colour
+DEFAULT_DELTA_E_THRESHOLD = 5.0
+
+# D65 reference white
+_XN, _YN, _ZN = 0.95047, 1.0, 1.08883
+_LAB_EPSILON = 216 / 24389
+_LAB_KAPPA = 24389 / 27
+
+Lab = Tuple[float, float, float]
+
+
+def _linearize(channel: int) -> float:
+    c = channel / 255.0
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _lab_f(t: float) -> float:
+    return t ** (1 / 3) if t > _LAB_EPSILON else (_LAB_KAPPA * t + 16) / 116
+
+
+def parse_hex_color(color: str) -> Optional[Tuple[int, int, int]]:
+    """RGB tuple for '#RRGGBB' / 'RRGGBB', or None if the value is not a hex colour"""
+    value = color.strip().lstrip('#') if isinstance(color, str) else ''
+    if len(value) != 6:
+        return None
+    try:
+        return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+    except ValueError:
+        return None
+
+
+def rgb_to_lab(rgb: Tuple[int, int, int]) -> Lab:
+    """CIELAB coordinates of an 8-bit sRGB colour"""
+    r, g, b = (_linearize(c) for c in rgb)
+    fx = _lab_f((0.4124564 * r + 0.3575761 * g + 0.1804375 * b) / _XN)
+    fy = _lab_f((0.2126729 * r + 0.7151522 * g + 0.0721750 * b) / _YN)
+    fz = _lab_f((0.0193339 * r + 0.1191920 * g + 0.9503041 * b) / _ZN)
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def delta_e(lab1: Lab, lab2: Lab) -> float:
+    """CIE76 colour difference"""
+    return math.dist(lab1, lab2)
+
+
+def _similar_index_pairs(colors: List[str], threshold: float) -> List[Tuple[int, int]]:
+    if threshold <= 0:
+        return []
+
+    grid: Dict[Tuple[int, int, int], List[Tuple[int, Lab]]] = {}
+    lab_cache: Dict[Tuple[int, int, int], Lab] = {}
+    pairs = []
+    for i, color in enumerate(colors):
+        rgb = parse_hex_color(color)
+        if rgb is None:
+            logger.debug(f"Skipping non-hex colour {color!r}")
+            continue
+        lab = lab_cache.get(rgb)
+        if lab is None:
+            lab = lab_cache[rgb] = rgb_to_lab(rgb)
+
+        # A neighbour closer than the threshold is at most one cell away on each axis
+        cell = (math.floor(lab[0] / threshold), math.floor(lab[1] / threshold), math.floor(lab[2] / threshold))
+        for dl in (-1, 0, 1):
+            for da in (-1, 0, 1):
+                for db in (-1, 0, 1):
+                    bucket = grid.get((cell[0] + dl, cell[1] + da, cell[2] + db))
+                    if bucket:
+                        pairs.extend((j, i) for j, other in bucket if math.dist(lab, other) < threshold)
+        grid.setdefault(cell, []).append((i, lab))
+
+    # Same order as the nested pairwise loop
+    pairs.sort()
+    return pairs
+
+
+def find_similar_color_pairs(colors: List[str],
+                             delta_e_threshold: float = DEFAULT_DELTA_E_THRESHOLD) -> List[Tuple[str, str]]:
+    """
+    Pairs of colours closer than the ΔE threshold
+
+    Args:
+        colors: Hex colours; values that are not hex colours are ignored
+        delta_e_threshold: CIE76 ΔE below which two colours are similar
+
+    Returns:
+        (earlier colour, later colour) pairs, ordered as a pairwise scan would find them
+    """
+    return [(colors[i], colors[j]) for i, j in _similar_index_pairs(colors, delta_e_threshold)]
+
+
+def cluster_colors(colors: List[str],
+                   delta_e_threshold: float = DEFAULT_DELTA_E_THRESHOLD) -> List[List[str]]:
+    """
+    Merge similar colours into clusters (single linkage)
+
+    Returns:
+        Clusters in order of first appearance; the first colour of each cluster
+        is its representative. Non-hex values are left out.
+    """
+    parent = list(range(len(colors)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in _similar_index_pairs(colors, delta_e_threshold):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # Keep the earliest colour as root
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters: Dict[int, List[str]] = {}
+    for i, color in enumerate(colors):
+        if parse_hex_color(color) is not None:
+            clusters.setdefault(find(i), []).append(color)
+    return list(clusters.values())
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+StyleStack WCAG Contrast Matrix
+
+Palette-wide contrast validation. Relative luminance is computed once per
+colour and the full N×N contrast table is built in one pass (vectorized with
+NumPy when it is installed), instead of converting both colours for every
+foreground/background pair. Matrices are cached by palette hash, so themes
+that share a palette - every aspect ratio of a design, or the same brand
+colours across tenants - are only computed once per process.
+
+Features:
+- WCAG 2.x relative luminance and contrast ratios
+- AA / AAA thresholds for normal and large text
+- Failing pairs for the whole palette or for foreground × background subsets
+- Bounded matrix cache keyed by palette hash
+
+Usage:
+    matrix = compute_contrast_matrix(['000000', 'FFFFFF', '4472C4'])
+    ratio = matrix.ratio('000000', 'FFFFFF')  # 21.0
+
+    for pair in matrix.failing_pairs(level='AA'):
+        print(f"{pair.foreground} on {pair.background}: {pair.ratio:.2f}")
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Optional vectorized backend for the contrast table
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Minimum contrast ratios (WCAG 2.x success criteria 1.4.3 and 1.4.6)
+WCAG_THRESHOLDS = {
+    'AA': {'normal': 4.5, 'large': 3.0},
+    'AAA': {'normal': 7.0, 'large': 4.5},
+}
+
+DEFAULT_CACHE_SIZE = 1024
+
+# Below this palette size the pure-Python table is faster than NumPy setup
+NUMPY_MIN_COLORS = 32
+
+
+def normalize_color(color: str) -> str:
+    """Upper-case 6-digit hex without '#'"""
+    value = color.strip().lstrip('#').upper()
+    if len(value) == 3:
+        value = ''.join(c * 2 for c in value)
+    if len(value) != 6:
+        raise ValueError(f"Invalid hex color: {color!r}")
+    int(value, 16)
+    return value
+
+
+@lru_cache(maxsize=4096)
+def relative_luminance(color: str) -> float:
+    """WCAG relative luminance of a normalized hex colour"""
+    channels = []
+    for i in (0, 2, 4):
+        c = int(color[i:i + 2], 16) / 255.0
+        channels.append(c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4)
+    return 0.2126 * channels[0] + 0.7152 * channels[1] + 0.0722 * channels[2]
+
+
+def contrast_ratio(color_a: str, color_b: str) -> float:
+    """Contrast ratio between two colours (1.0 to 21.0)"""
+    lum_a = relative_luminance(normalize_color(color_a))
+    lum_b = relative_luminance(normalize_color(color_b))
+    return (max(lum_a, lum_b) + 0.05) / (min(lum_a, lum_b) + 0.05)
+
+
+def palette_hash(colors: Iterable[str]) -> str:
+    """Stable hash of an ordered palette (colours are normalized first)"""
+    return hashlib.sha256(','.join(normalize_color(c) for c in colors).encode('ascii')).hexdigest()
+
+
+def threshold_for(level: str = 'AA', large_text: bool = False) -> float:
+    try:
+        return WCAG_THRESHOLDS[level.upper()]['large' if large_text else 'normal']
+    except KeyError:
+        raise ValueError(f"Unknown WCAG level: {level!r} (expected one of {sorted(WCAG_THRESHOLDS)})") from None
+
+
+@dataclass
+class ContrastPair:
+    """A foreground/background pair and its contrast ratio"""
+    foreground: str
+    background: str
+    ratio: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'foreground': self.foreground,
+            'background': self.background,
+            'ratio': round(self.ratio, 2),
+        }
+
+
+@dataclass
+class ContrastMatrix:
+    """Luminance of every palette colour and the full contrast table"""
+    colors: List[str]
+    luminances: List[float]
+    ratios: List[List[float]]
+    palette_hash: str
+    _index: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        if not self._index:
+            # First occurrence wins for palettes that repeat a colour
+            for i, color in reversed(list(enumerate(self.colors))):
+                self._index[color] = i
+
+    def index_of(self, color: str) -> int:
+        try:
+            return self._index[normalize_color(color)]
+        except KeyError:
+            raise KeyError(f"Color {color!r} is not in this palette") from None
+
+    def ratio(self, foreground: str, background: str) -> float:
+        """Contrast ratio between two palette colours"""
+        return self.ratios[self.index_of(foreground)][self.index_of(background)]
+
+    def failing_pairs(self, level: str = 'AA', large_text: bool = False,
+                      foregrounds: Optional[Iterable[str]] = None,
+                      backgrounds: Optional[Iterable[str]] = None) -> List[ContrastPair]:
+        """
+        Pairs below the WCAG threshold
+
+        Args:
+            level: 'AA' or 'AAA'
+            large_text: Use the large-text threshold
+            foregrounds: Palette colours used as text (default: all)
+            backgrounds: Palette colours used as backgrounds (default: all)
+
+        Returns:
+            Failing pairs in palette order. Without explicit foregrounds and
+            backgrounds each unordered pair of distinct colours is reported once;
+            otherwise every requested foreground/background pair is checked,
+            including a colour against itself.
+        """
+        threshold = threshold_for(level, large_text)
+
+        if foregrounds is None and backgrounds is None:
+            unique = self._indexes(None)
+            return [
+                ContrastPair(self.colors[i], self.colors[j], self.ratios[i][j])
+                for position, i in enumerate(unique)
+                for j in unique[position + 1:]
+                if self.ratios[i][j] < threshold
+            ]
+
+        fg_indexes = self._indexes(foregrounds)
+        bg_indexes = self._indexes(backgrounds)
+        return [
+            ContrastPair(self.colors[i], self.colors[j], self.ratios[i][j])
+            for i in fg_indexes
+            for j in bg_indexes
+            if self.ratios[i][j] < threshold
+        ]
+
+    def _indexes(self, colors: Optional[Iterable[str]]) -> List[int]:
+        if colors is None:
+            return sorted(set(self._index.values()))
+        return [self.index_of(color) for color in colors]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'palette_hash': self.palette_hash,
+            'colors': list(self.colors),
+            'luminances': [round(lum, 6) for lum in self.luminances],
+            'ratios': [[round(ratio, 2) for ratio in row] for row in self.ratios],
+        }
+
+
+def _ratio_table_python(luminances: Sequence[float]) -> List[List[float]]:
+    return [
+        [(lum_a + 0.05) / (lum_b + 0.05) if lum_a >= lum_b else (lum_b + 0.05) / (lum_a + 0.05)
+         for lum_b in luminances]
+        for lum_a in luminances
+    ]
+
+
+def _ratio_table_numpy(luminances: Sequence[float]) -> List[List[float]]:
+    lum = np.asarray(luminances, dtype=np.float64) + 0.05
+    return (np.maximum.outer(lum, lum) / np.minimum.outer(lum, lum)).tolist()
+
+
+_matrix_cache: 'OrderedDict[str, ContrastMatrix]' = OrderedDict()
+_cache_size = DEFAULT_CACHE_SIZE
+
+
+def compute_contrast_matrix(colors: Iterable[str], use_numpy: Optional[bool] = None,
+                            use_cache: bool = True) -> ContrastMatrix:
+    """
+    Contrast matrix for a palette
+
+    Args:
+        colors: Hex colours, with or without '#'
+        use_numpy: Force (True) or disable (False) the NumPy backend;
+                   None uses it when installed and the palette is large enough
+        use_cache: Look up and store the matrix by palette hash
+
+    Returns:
+        ContrastMatrix with ratios[i][j] for colors[i] against colors[j]
+    """
+    if use_numpy and not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for use_numpy=True")
+
+    normalized = [normalize_color(color) for color in colors]
+    key = palette_hash(normalized)
+
+    if use_cache:
+        cached = _matrix_cache.get(key)
+        if cached is not None:
+            _matrix_cache.move_to_end(key)
+            return cached
+
+    luminances = [relative_luminance(color) for color in normalized]
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE and len(normalized) >= NUMPY_MIN_COLORS
+    ratios = _ratio_table_numpy(luminances) if use_numpy else _ratio_table_python(luminances)
+
+    matrix = ContrastMatrix(colors=normalized, luminances=luminances, ratios=ratios, palette_hash=key)
+    if use_cache:
+        _matrix_cache[key] = matrix
+        while len(_matrix_cache) > _cache_size:
+            _matrix_cache.popitem(last=False)
+    return matrix
+
+
+def set_cache_size(size: int) -> None:
+    """Bound the number of cached matrices (0 disables caching)"""
+    global _cache_size
+    _cache_size = max(0, size)
+    while len(_matrix_cache) > _cache_size:
+        _matrix_cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    _matrix_cache.clear()
+
+
+def cache_info() -> Dict[str, int]:
+    return {'size': len(_matrix_cache), 'max_size': _cache_size}
@@ -45,6 +45,9 @@ DEFAULT_ENCODING = 'utf-8'
 OOXML_EXTENSIONS = {'.potx', '.dotx', '.xltx', '.pptx', '.docx', '.xlsx'}
 LIBREOFFICE_EXTENSIONS = {'.otp', '.ott', '.ots', '.odp', '.odt', '.ods'}
 
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # Configure logging for consistent behavior
 def get_logger(name: str) -> logging.Logger:
     """Get a consistently configured logger"""
@@ -72,7 +75,7 @@ __all__ = [
     # Type aliases
     'COMMON_TYPES', 'JSON_DICT', 'FILE_PATH', 'VALIDATION_ERRORS',
     # Constants
-    'DEFAULT_ENCODING', 'OOXML_EXTENSIONS', 'LIBREOFFICE_EXTENSIONS',
+    'DEFAULT_ENCODING', 'OOXML_EXTENSIONS', 'LIBREOFFICE_EXTENSIONS', 'DATACLASS_SLOTS',
     # Utilities
     'get_logger'
 ]
\ No newline at end of file
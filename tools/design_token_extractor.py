@@ -12,13 +12,22 @@ This tool analyzes Office and OpenOffice files and extracts:
 Supported formats:
 - Microsoft Office: .pptx, .potx, .ppsx (PowerPoint)
 - OpenOffice/LibreOffice: .odp, .otp (Impress), .ods, .ots (Calc), .odt, .ott (Writer)
+
+Parts are read straight from the package ZIP (nothing is extracted to disk),
+slides can be analyzed on a process pool (max_workers), and image dimensions
+come from the PNG/GIF/JPEG/EMF/SVG headers rather than whole media files.
 """
 
 
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import io
 import json
+import shutil
+import struct
 import zipfile
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from lxml import etree as ET
 import colorsys
@@ -52,15 +61,336 @@ try:
 except ImportError:
     pass
 
+try:
+    from .color_clustering import DEFAULT_DELTA_E_THRESHOLD, find_similar_color_pairs
+except ImportError:
+    from color_clustering import DEFAULT_DELTA_E_THRESHOLD, find_similar_color_pairs
+
+OOXML_NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+}
+
+# Office theme color indices (schemeClr values)
+THEME_COLOR_INDEXES = {
+    '0': 'background1', '1': 'text1', '2': 'background2', '3': 'text2',
+    '4': 'accent1', '5': 'accent2', '6': 'accent3', '7': 'accent4',
+    '8': 'accent5', '9': 'accent6', '10': 'hyperlink', '11': 'followedHyperlink'
+}
+
+# Image references in masters and layouts are more likely to be logos
+IMAGE_REFERENCE_WEIGHTS = {'master': 3, 'layout': 2, 'slide': 1}
+
+# EMF is what PowerPoint stores pasted vector art and many logos as; its
+# header carries the bounds, so it is measured like the other formats
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.svg', '.gif', '.emf')
+
+# Bytes read to identify an image and find its dimensions
+IMAGE_HEADER_SIZE = 512
+SVG_HEADER_SIZE = 8192
+JPEG_SCAN_LIMIT = 1 << 20
+# Skipped JPEG segments are read and dropped in chunks of this size
+JPEG_SKIP_CHUNK = 4096
+
+# Start-of-frame markers carry the JPEG dimensions (DHT/JPG/DAC share the range)
+_JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _natural_key(name: str) -> List:
+    # slide2.xml before slide10.xml
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+
+class PackageSource:
+    """Parts of an Office/ODF package, read from the ZIP or an extracted directory"""
+    
+    def __init__(self, location: Union[str, Path]):
+        self.location = Path(location)
+        if self.location.is_dir():
+            self._zip = None
+            self._sizes = {
+                path.relative_to(self.location).as_posix(): path.stat().st_size
+                for path in self.location.rglob('*') if path.is_file()
+            }
+        else:
+            # Only the central directory is read here
+            self._zip = zipfile.ZipFile(self.location, 'r')
+            self._sizes = {info.filename: info.file_size for info in self._zip.infolist() if not info.is_dir()}
+    
+    def __enter__(self) -> 'PackageSource':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+    
+    def exists(self, name: str) -> bool:
+        return name in self._sizes
+    
+    def size(self, name: str) -> int:
+        return self._sizes[name]
+    
+    def names_in(self, directory: str, suffixes: Optional[Tuple[str, ...]] = None) -> List[str]:
+        """Files directly inside a package directory, in natural order"""
+        prefix = directory.rstrip('/') + '/'
+        names = [
+            name for name in self._sizes
+            if name.startswith(prefix) and '/' not in name[len(prefix):]
+            and (suffixes is None or name.lower().endswith(suffixes))
+        ]
+        return sorted(names, key=_natural_key)
+    
+    def open(self, name: str) -> BinaryIO:
+        if self._zip is not None:
+            return self._zip.open(name)
+        return open(self.location / name, 'rb')
+    
+    def read(self, name: str) -> bytes:
+        with self.open(name) as stream:
+            return stream.read()
+    
+    def parse(self, name: str):
+        """Root element of an XML part"""
+        return ET.fromstring(self.read(name))
+
+
+@dataclass
+class TokenUsage:
+    """Colors, fonts, sizes, positions and image references found in package parts"""
+    colors: Counter = field(default_factory=Counter)
+    fonts: Counter = field(default_factory=Counter)
+    sizes: Counter = field(default_factory=Counter)
+    image_refs: Counter = field(default_factory=Counter)
+    positions: List[Dict[str, int]] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+def _collect_color_usage(props_elem, usage: TokenUsage, theme_info: Dict[str, str]) -> None:
+    ns = OOXML_NAMESPACES
+    
+    # Look for sRGB colors
+    for srgb in props_elem.xpath('.//a:srgbClr', namespaces=ns):
+        color_val = srgb.get('val', '')
+        if color_val:
+            usage.colors[f"#{color_val.upper()}"] += 1
+    
+    # Look for scheme colors (theme references)
+    for scheme_clr in props_elem.xpath('.//a:schemeClr', namespaces=ns):
+        scheme_val = scheme_clr.get('val', '')
+        if scheme_val in THEME_COLOR_INDEXES:
+            theme_name = THEME_COLOR_INDEXES[scheme_val]
+            if theme_name in theme_info:
+                usage.colors[theme_info[theme_name]] += 1
+
+
+def _collect_text_usage(root, usage: TokenUsage, theme_info: Dict[str, str]) -> None:
+    ns = OOXML_NAMESPACES
+    
+    # Find all text properties
+    for text_elem in root.xpath('.//a:t', namespaces=ns):
+        # Look for parent run properties
+        run_props = text_elem.xpath('ancestor::a:r/a:rPr', namespaces=ns)
+        
+        if run_props:
+            rpr = run_props[0]
+            
+            # Extract font information
+            latin_font = rpr.find('.//a:latin', ns)
+            if latin_font is not None:
+                font_name = latin_font.get('typeface', '')
+                if font_name and font_name != '+mn-lt' and font_name != '+mj-lt':
+                    usage.fonts[font_name] += 1
+            
+            # Extract font size
+            size_attr = rpr.get('sz')
+            if size_attr:
+                # Convert from hundredths of a point to points
+                size_pt = int(size_attr) / 100
+                usage.sizes[f"{size_pt}pt"] += 1
+            
+            # Extract colors
+            _collect_color_usage(rpr, usage, theme_info)
+
+
+def _collect_shape_usage(root, usage: TokenUsage, theme_info: Dict[str, str]) -> None:
+    for shape_props in root.xpath('.//a:spPr', namespaces=OOXML_NAMESPACES):
+        _collect_color_usage(shape_props, usage, theme_info)
+
+
+def _collect_positions(root, usage: TokenUsage) -> None:
+    ns = OOXML_NAMESPACES
+    for transform in root.xpath('.//a:xfrm', namespaces=ns):
+        off_elem = transform.find('a:off', ns)
+        ext_elem = transform.find('a:ext', ns)
+        
+        if off_elem is not None and ext_elem is not None:
+            usage.positions.append({
+                'x': int(off_elem.get('x', '0')),
+                'y': int(off_elem.get('y', '0')),
+                'width': int(ext_elem.get('cx', '0')),
+                'height': int(ext_elem.get('cy', '0'))
+            })
+
+
+def _collect_image_refs(root, usage: TokenUsage, context: str) -> None:
+    embed_attr = f"{{{OOXML_NAMESPACES['r']}}}embed"
+    for blip in root.xpath('.//a:blip', namespaces=OOXML_NAMESPACES):
+        embed_id = blip.get(embed_attr)
+        if embed_id:
+            usage.image_refs[embed_id] += IMAGE_REFERENCE_WEIGHTS[context]
+
+
+def analyze_slide(package: PackageSource, name: str, theme_info: Dict[str, str]) -> TokenUsage:
+    """Colors, fonts, sizes and image references used on one slide"""
+    usage = TokenUsage()
+    try:
+        root = package.parse(name)
+        _collect_text_usage(root, usage, theme_info)
+        _collect_shape_usage(root, usage, theme_info)
+        _collect_image_refs(root, usage, 'slide')
+    except Exception as e:
+        usage.warnings.append(f"Warning: Could not analyze slide {name}: {e}")
+    return usage
+
+
+# Per-process state for slide workers: each worker opens the package once
+_worker_package: Optional[PackageSource] = None
+_worker_theme_info: Dict[str, str] = {}
+
+
+def _init_slide_worker(location: str, theme_info: Dict[str, str]) -> None:
+    global _worker_package, _worker_theme_info
+    _worker_package = PackageSource(location)
+    _worker_theme_info = theme_info
+
+
+def _analyze_slide_in_worker(name: str) -> TokenUsage:
+    return analyze_slide(_worker_package, name, _worker_theme_info)
+
+
+def _read_exactly(head: bytes, stream: BinaryIO) -> Callable[[int], bytes]:
+    # Reader that continues from an already consumed header into the stream
+    buffered = io.BytesIO(head)
+    
+    def read(size: int) -> bytes:
+        data = buffered.read(size)
+        if len(data) < size:
+            data += stream.read(size - len(data))
+        return data
+    return read
+
+
+def _skip(read: Callable[[int], bytes], count: int) -> bool:
+    # Discard count bytes without holding more than one chunk; False at end of data
+    while count > 0:
+        chunk = read(min(count, JPEG_SKIP_CHUNK))
+        if not chunk:
+            return False
+        count -= len(chunk)
+    return True
+
+
+def _jpeg_dimensions(read: Callable[[int], bytes]) -> Optional[Tuple[int, int]]:
+    """Walk JPEG segments up to the start-of-frame marker"""
+    if read(2) != b'\xff\xd8':
+        return None
+    scanned = 2
+    while scanned < JPEG_SCAN_LIMIT:
+        if read(1) != b'\xff':
+            return None
+        marker = read(1)
+        while marker == b'\xff':
+            marker = read(1)
+        if not marker:
+            return None
+        code = marker[0]
+        scanned += 2
+        if code == 0x01 or 0xD0 <= code <= 0xD7:
+            continue
+        if code in (0xD9, 0xDA):
+            # End of image or start of scan before any frame header
+            return None
+        length_bytes = read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        if code in _JPEG_SOF_MARKERS:
+            frame = read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack('>HH', frame[1:5])
+            return width, height
+        if not _skip(read, length - 2):
+            return None
+        scanned += length
+    return None
+
+
+def _svg_dimensions(content: str) -> Optional[Dict]:
+    # Look for viewBox
+    viewbox_match = re.search(r'viewBox=["\'][\d\s.]+\s+(\d+)\s+(\d+)["\']', content)
+    if viewbox_match:
+        return {
+            'width': int(viewbox_match.group(1)),
+            'height': int(viewbox_match.group(2)),
+            'unit': 'svg_units'
+        }
+    
+    # Look for width/height attributes
+    width_match = re.search(r'width=["\'](\d+)', content)
+    height_match = re.search(r'height=["\'](\d+)', content)
+    if width_match and height_match:
+        return {
+            'width': int(width_match.group(1)),
+            'height': int(height_match.group(1)),
+            'unit': 'px'
+        }
+    return None
+
+
+def probe_image_dimensions(stream: BinaryIO, extension: str = '') -> Optional[Dict]:
+    """
+    Image dimensions from the file header (PNG, GIF, JPEG, EMF, SVG)
+    
+    Only the first IMAGE_HEADER_SIZE bytes are read, except for JPEG (segments
+    are skipped up to the frame header) and SVG (the root element is searched
+    in the first SVG_HEADER_SIZE bytes).
+    """
+    head = stream.read(IMAGE_HEADER_SIZE)
+    
+    if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+        width, height = struct.unpack('>II', head[16:24])
+        return {'width': width, 'height': height, 'unit': 'px'}
+    
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        width, height = struct.unpack('<HH', head[6:10])
+        return {'width': width, 'height': height, 'unit': 'px'}
+    
+    if head.startswith(b'\xff\xd8'):
+        size = _jpeg_dimensions(_read_exactly(head, stream))
+        return {'width': size[0], 'height': size[1], 'unit': 'px'} if size else None
+    
+    # EMR_HEADER record: type 1, bounds in device units, ' EMF' signature at offset 40
+    if len(head) >= 44 and head[:4] == b'\x01\x00\x00\x00' and head[40:44] == b' EMF':
+        left, top, right, bottom = struct.unpack('<4i', head[8:24])
+        return {'width': right - left + 1, 'height': bottom - top + 1, 'unit': 'px'}
+    
+    if extension.lower() == '.svg' or b'<svg' in head:
+        content = head + stream.read(SVG_HEADER_SIZE - len(head))
+        return _svg_dimensions(content.decode('utf-8', errors='ignore'))
+    
+    return None
+
+
 class DesignTokenExtractor:
     """Extract design tokens from Office and OpenOffice files"""
     
     # Office theme color indices
-    THEME_COLORS = {
-        '0': 'background1', '1': 'text1', '2': 'background2', '3': 'text2',
-        '4': 'accent1', '5': 'accent2', '6': 'accent3', '7': 'accent4',
-        '8': 'accent5', '9': 'accent6', '10': 'hyperlink', '11': 'followedHyperlink'
-    }
+    THEME_COLORS = THEME_COLOR_INDEXES
     
     # Common font weight mappings
     FONT_WEIGHTS = {
@@ -68,14 +398,16 @@ class DesignTokenExtractor:
         'normal': 'normal', 'bold': 'bold'
     }
     
-    def __init__(self, output_format='stylestack'):
+    def __init__(self, output_format='stylestack', max_workers: Optional[int] = None):
         """
         Initialize extractor
         
         Args:
             output_format: 'stylestack', 'w3c', 'figma', or 'custom'
+            max_workers: Worker processes for slide analysis (None or 1 analyzes serially)
         """
         self.output_format = output_format
+        self.max_workers = max_workers
         self.extracted_colors = Counter()
         self.extracted_fonts = Counter()
         self.extracted_sizes = Counter()
@@ -157,22 +489,45 @@ class DesignTokenExtractor:
 
     def _extract_basic_ooxml(self, file_path: Path, format_type: str) -> Dict:
         """Basic extraction (fallback when advanced tools unavailable)"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Extract OOXML file
-            with zipfile.ZipFile(file_path, 'r') as zip_file:
-                zip_file.extractall(temp_dir)
-            
-            temp_path = Path(temp_dir)
-            
+        with PackageSource(file_path) as package:
             # Extract different types of tokens
-            self._extract_theme_colors(temp_path)
-            self._extract_master_styles(temp_path)
-            self._extract_content_analysis(temp_path)
-            self._extract_layout_patterns(temp_path)
-            self._extract_logos_and_images(temp_path)
+            self._extract_theme_colors(package)
+            self._extract_master_styles(package)
+            self._extract_content_analysis(package)
+            self._extract_layout_patterns(package)
+            self._extract_logos_and_images(package)
             
             # Compile final token set
             return self._compile_tokens()
+    
+    @staticmethod
+    @contextmanager
+    def _package(source: Union[Path, PackageSource]) -> Iterator[PackageSource]:
+        """Accept an open package or a package path; only a package opened here is closed here"""
+        if isinstance(source, PackageSource):
+            yield source
+        else:
+            with PackageSource(source) as package:
+                yield package
+    
+    def _usage(self) -> TokenUsage:
+        """Usage record that writes straight into this extractor's counters"""
+        return TokenUsage(
+            colors=self.extracted_colors,
+            fonts=self.extracted_fonts,
+            sizes=self.extracted_sizes,
+            image_refs=self.image_usage,
+            positions=self.layout_patterns
+        )
+    
+    def _merge_usage(self, usage: TokenUsage) -> None:
+        self.extracted_colors.update(usage.colors)
+        self.extracted_fonts.update(usage.fonts)
+        self.extracted_sizes.update(usage.sizes)
+        self.image_usage.update(usage.image_refs)
+        self.layout_patterns.extend(usage.positions)
+        for warning in usage.warnings:
+            print(warning)
 
     def _convert_analysis_to_tokens(self, analysis: 'AnalysisResult', theme: Optional['Theme'], file_path: Path) -> Dict:
         """Convert StyleStack analysis results to design tokens format"""
@@ -340,11 +695,8 @@ class DesignTokenExtractor:
             token_data["spacing"] = spacing_tokens
         
         # Extract brand assets (keep existing image extraction)
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with zipfile.ZipFile(file_path, 'r') as zip_file:
-                zip_file.extractall(temp_dir)
-            temp_path = Path(temp_dir)
-            self._extract_logos_and_images(temp_path)
+        with PackageSource(file_path) as package:
+            self._extract_logos_and_images(package)
         
         if self.extracted_images:
             brand_assets = self._organize_brand_assets()
@@ -392,269 +744,182 @@ class DesignTokenExtractor:
 
     def _extract_from_odf(self, file_path: Path, format_type: str) -> Dict:
         """Extract tokens from ODF formats (OpenOffice/LibreOffice)"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Extract ODF file (also ZIP-based)
-            with zipfile.ZipFile(file_path, 'r') as zip_file:
-                zip_file.extractall(temp_dir)
-            
-            temp_path = Path(temp_dir)
-            
+        # ODF is also ZIP-based
+        with PackageSource(file_path) as package:
             # ODF has different structure - extract from content.xml, styles.xml, etc.
-            self._extract_odf_styles(temp_path)
-            self._extract_odf_content(temp_path)
-            self._extract_odf_images(temp_path)
+            self._extract_odf_styles(package)
+            self._extract_odf_content(package)
+            self._extract_odf_images(package)
             
             # Compile final token set
             return self._compile_tokens()
 
-    def _extract_odf_styles(self, odf_dir: Path):
+    def _extract_odf_styles(self, odf_package: Union[Path, PackageSource]):
         """Extract styles from ODF styles.xml"""
-        styles_file = odf_dir / "styles.xml"
-        
-        if not styles_file.exists():
-            return
+        with self._package(odf_package) as package:
+            if not package.exists("styles.xml"):
+                return
             
-        try:
-            tree = ET.parse(styles_file)
-            root = tree.getroot()
+            try:
+                root = package.parse("styles.xml")
             
-            # ODF namespaces
-            ns = {
-                'style': 'urn:oasis:names:tc:opendocument:xmlns:style:1.0',
-                'fo': 'urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0'
-            }
+                # ODF namespaces
+                ns = {
+                    'style': 'urn:oasis:names:tc:opendocument:xmlns:style:1.0',
+                    'fo': 'urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0'
+                }
             
-            # Extract text styles for typography
-            for style in root.findall('.//style:style[@style:family="text"]', ns):
-                style_name = style.get('{urn:oasis:names:tc:opendocument:xmlns:style:1.0}name', '')
+                # Extract text styles for typography
+                for style in root.findall('.//style:style[@style:family="text"]', ns):
+                    style_name = style.get('{urn:oasis:names:tc:opendocument:xmlns:style:1.0}name', '')
                 
-                # Extract font properties
-                text_props = style.find('.//style:text-properties', ns)
-                if text_props is not None:
-                    font_family = text_props.get('{urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0}font-family', '')
-                    font_size = text_props.get('{urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0}font-size', '')
-                    font_color = text_props.get('{urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0}color', '')
+                    # Extract font properties
+                    text_props = style.find('.//style:text-properties', ns)
+                    if text_props is not None:
+                        font_family = text_props.get('{urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0}font-family', '')
+                        font_size = text_props.get('{urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0}font-size', '')
+                        font_color = text_props.get('{urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0}color', '')
                     
-                    if font_family:
-                        self.extracted_fonts[font_family] += 1
-                    if font_size:
-                        self.extracted_sizes[font_size] += 1
-                    if font_color and font_color.startswith('#'):
-                        self.extracted_colors[font_color.upper()] += 1
+                        if font_family:
+                            self.extracted_fonts[font_family] += 1
+                        if font_size:
+                            self.extracted_sizes[font_size] += 1
+                        if font_color and font_color.startswith('#'):
+                            self.extracted_colors[font_color.upper()] += 1
                         
-        except Exception as e:
-            print(f"Warning: Could not extract ODF styles: {e}")
+            except Exception as e:
+                print(f"Warning: Could not extract ODF styles: {e}")
 
-    def _extract_odf_content(self, odf_dir: Path):
+    def _extract_odf_content(self, odf_package: Union[Path, PackageSource]):
         """Extract content analysis from ODF content.xml"""
-        content_file = odf_dir / "content.xml"
-        
-        if not content_file.exists():
-            return
-            
-        try:
-            tree = ET.parse(content_file)
-            root = tree.getroot()
+        with self._package(odf_package) as package:
+            if not package.exists("content.xml"):
+                return
             
-            # Basic content analysis for layout patterns
-            # This is simplified - ODF content structure varies by application
-            text_elements = root.findall('.//*')
-            self.layout_patterns.append({
-                'type': 'odf_content',
-                'element_count': len(text_elements)
-            })
+            try:
+                root = package.parse("content.xml")
+            
+                # Basic content analysis for layout patterns
+                # This is simplified - ODF content structure varies by application
+                text_elements = root.findall('.//*')
+                self.layout_patterns.append({
+                    'type': 'odf_content',
+                    'element_count': len(text_elements)
+                })
                         
-        except Exception as e:
-            print(f"Warning: Could not extract ODF content: {e}")
+            except Exception as e:
+                print(f"Warning: Could not extract ODF content: {e}")
 
-    def _extract_odf_images(self, odf_dir: Path):
+    def _extract_odf_images(self, odf_package: Union[Path, PackageSource]):
         """Extract images from ODF Pictures/ directory"""
-        pictures_dir = odf_dir / "Pictures"
+        with self._package(odf_package) as package:
         
-        if not pictures_dir.exists():
-            return
-            
-        try:
-            for image_file in pictures_dir.iterdir():
-                if image_file.is_file():
-                    image_info = self._analyze_image_file(image_file)
+            try:
+                for name in package.names_in("Pictures"):
+                    image_info = self._analyze_package_image(package, name)
                     self.extracted_images.append(image_info)
                     
-        except Exception as e:
-            print(f"Warning: Could not extract ODF images: {e}")
+            except Exception as e:
+                print(f"Warning: Could not extract ODF images: {e}")
     
-    def _extract_theme_colors(self, pptx_dir: Path):
+    def _extract_theme_colors(self, pptx_package: Union[Path, PackageSource]):
         """Extract colors from theme definition"""
-        theme_file = pptx_dir / "ppt" / "theme" / "theme1.xml"
-        
-        if not theme_file.exists():
-            return
+        with self._package(pptx_package) as package:
+            if not package.exists("ppt/theme/theme1.xml"):
+                return
             
-        try:
-            tree = ET.parse(theme_file)
-            root = tree.getroot()
+            try:
+                root = package.parse("ppt/theme/theme1.xml")
             
-            # Extract theme color scheme
-            ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
+                # Extract theme color scheme
+                ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
             
-            color_scheme = root.find('.//a:clrScheme', ns)
-            if color_scheme is not None:
-                for color_elem in color_scheme:
-                    color_name = color_elem.tag.split('}')[-1]  # Remove namespace
+                color_scheme = root.find('.//a:clrScheme', ns)
+                if color_scheme is not None:
+                    for color_elem in color_scheme:
+                        color_name = color_elem.tag.split('}')[-1]  # Remove namespace
                     
-                    # Look for srgbClr or sysClr
-                    srgb = color_elem.find('.//a:srgbClr', ns)
-                    if srgb is not None:
-                        color_value = srgb.get('val', '')
-                        if color_value:
-                            self.theme_info[color_name] = f"#{color_value.upper()}"
+                        # Look for srgbClr or sysClr
+                        srgb = color_elem.find('.//a:srgbClr', ns)
+                        if srgb is not None:
+                            color_value = srgb.get('val', '')
+                            if color_value:
+                                self.theme_info[color_name] = f"#{color_value.upper()}"
                             
-        except Exception as e:
-            print(f"Warning: Could not extract theme colors: {e}")
+            except Exception as e:
+                print(f"Warning: Could not extract theme colors: {e}")
     
-    def _extract_master_styles(self, pptx_dir: Path):
+    def _extract_master_styles(self, pptx_package: Union[Path, PackageSource]):
         """Extract typography and styles from slide masters"""
-        masters_dir = pptx_dir / "ppt" / "slideMasters"
+        with self._package(pptx_package) as package:
+            usage = self._usage()
         
-        if not masters_dir.exists():
-            return
-            
-        for master_file in masters_dir.glob("*.xml"):
-            try:
-                tree = ET.parse(master_file)
-                root = tree.getroot()
+            for name in package.names_in("ppt/slideMasters", ('.xml',)):
+                try:
+                    root = package.parse(name)
                 
-                # Extract text styles
-                self._analyze_text_elements(root)
+                    # Extract text styles
+                    _collect_text_usage(root, usage, self.theme_info)
+                    _collect_image_refs(root, usage, 'master')
                 
-            except Exception as e:
-                print(f"Warning: Could not parse master {master_file}: {e}")
+                except Exception as e:
+                    print(f"Warning: Could not parse master {name}: {e}")
     
-    def _extract_content_analysis(self, pptx_dir: Path):
+    def _extract_content_analysis(self, pptx_package: Union[Path, PackageSource]):
         """Analyze actual slide content for usage patterns"""
-        slides_dir = pptx_dir / "ppt" / "slides"
+        with self._package(pptx_package) as package:
+            slide_names = package.names_in("ppt/slides", ('.xml',))
         
-        if not slides_dir.exists():
-            return
-            
-        for slide_file in slides_dir.glob("*.xml"):
-            try:
-                tree = ET.parse(slide_file)
-                root = tree.getroot()
-                
-                # Analyze colors, fonts, and sizes in actual use
-                self._analyze_text_elements(root)
-                self._analyze_shape_styles(root)
-                
-            except Exception as e:
-                print(f"Warning: Could not analyze slide {slide_file}: {e}")
+            # Per-slide results are merged in slide order, so ties rank the same either way
+            for usage in self._analyze_slides(package, slide_names):
+                self._merge_usage(usage)
+    
+    def _analyze_slides(self, package: PackageSource, slide_names: List[str]) -> List[TokenUsage]:
+        """Analyze slides serially or on a process pool, returning results in slide order"""
+        workers = min(self.max_workers or 1, len(slide_names))
+        if workers <= 1:
+            return [analyze_slide(package, name, self.theme_info) for name in slide_names]
+        
+        # Workers open the package themselves; only part names and results cross processes
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_slide_worker,
+            initargs=(str(package.location), dict(self.theme_info))
+        ) as executor:
+            chunksize = max(1, len(slide_names) // (workers * 4))
+            return list(executor.map(_analyze_slide_in_worker, slide_names, chunksize=chunksize))
     
     def _analyze_text_elements(self, root):
         """Analyze text elements for typography patterns"""
-        ns = {
-            'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-            'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'
-        }
-        
-        # Find all text properties
-        for text_elem in root.xpath('.//a:t', namespaces=ns):
-            # Look for parent paragraph and run properties
-            run_props = text_elem.xpath('ancestor::a:r/a:rPr', namespaces=ns)
-            para_props = text_elem.xpath('ancestor::a:p/a:pPr', namespaces=ns)
-            
-            if run_props:
-                rpr = run_props[0]
-                
-                # Extract font information
-                latin_font = rpr.find('.//a:latin', ns)
-                if latin_font is not None:
-                    font_name = latin_font.get('typeface', '')
-                    if font_name and font_name != '+mn-lt' and font_name != '+mj-lt':
-                        self.extracted_fonts[font_name] += 1
-                
-                # Extract font size
-                size_attr = rpr.get('sz')
-                if size_attr:
-                    # Convert from hundredths of a point to points
-                    size_pt = int(size_attr) / 100
-                    self.extracted_sizes[f"{size_pt}pt"] += 1
-                
-                # Extract colors
-                self._extract_color_from_props(rpr)
+        _collect_text_usage(root, self._usage(), self.theme_info)
     
     def _analyze_shape_styles(self, root):
         """Analyze shape styling for color usage"""
-        ns = {
-            'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-            'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'
-        }
-        
-        # Find shape properties
-        for shape_props in root.xpath('.//a:spPr', namespaces=ns):
-            self._extract_color_from_props(shape_props)
+        _collect_shape_usage(root, self._usage(), self.theme_info)
     
     def _extract_color_from_props(self, props_elem):
         """Extract color information from properties element"""
-        ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-        
-        # Look for sRGB colors
-        for srgb in props_elem.xpath('.//a:srgbClr', namespaces=ns):
-            color_val = srgb.get('val', '')
-            if color_val:
-                self.extracted_colors[f"#{color_val.upper()}"] += 1
-        
-        # Look for scheme colors (theme references)
-        for scheme_clr in props_elem.xpath('.//a:schemeClr', namespaces=ns):
-            scheme_val = scheme_clr.get('val', '')
-            if scheme_val in self.THEME_COLORS:
-                theme_name = self.THEME_COLORS[scheme_val]
-                if theme_name in self.theme_info:
-                    self.extracted_colors[self.theme_info[theme_name]] += 1
+        _collect_color_usage(props_elem, self._usage(), self.theme_info)
     
-    def _extract_layout_patterns(self, pptx_dir: Path):
+    def _extract_layout_patterns(self, pptx_package: Union[Path, PackageSource]):
         """Extract common layout and spacing patterns"""
-        layouts_dir = pptx_dir / "ppt" / "slideLayouts"
+        with self._package(pptx_package) as package:
+            usage = self._usage()
         
-        if not layouts_dir.exists():
-            return
-            
-        for layout_file in layouts_dir.glob("*.xml"):
-            try:
-                tree = ET.parse(layout_file)
-                root = tree.getroot()
+            for name in package.names_in("ppt/slideLayouts", ('.xml',)):
+                try:
+                    root = package.parse(name)
                 
-                # Analyze positioning and spacing
-                self._analyze_positioning(root)
+                    # Analyze positioning and spacing
+                    _collect_positions(root, usage)
+                    _collect_image_refs(root, usage, 'layout')
                 
-            except Exception as e:
-                print(f"Warning: Could not analyze layout {layout_file}: {e}")
+                except Exception as e:
+                    print(f"Warning: Could not analyze layout {name}: {e}")
     
     def _analyze_positioning(self, root):
         """Analyze object positioning for spacing patterns"""
-        ns = {
-            'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-            'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'
-        }
-        
-        positions = []
-        
-        # Find all positioned elements
-        for transform in root.xpath('.//a:xfrm', namespaces=ns):
-            off_elem = transform.find('a:off', ns)
-            ext_elem = transform.find('a:ext', ns)
-            
-            if off_elem is not None and ext_elem is not None:
-                x = int(off_elem.get('x', '0'))
-                y = int(off_elem.get('y', '0'))
-                w = int(ext_elem.get('cx', '0'))
-                h = int(ext_elem.get('cy', '0'))
-                
-                positions.append({
-                    'x': x, 'y': y, 'width': w, 'height': h
-                })
-        
-        if positions:
-            self.layout_patterns.extend(positions)
+        _collect_positions(root, self._usage())
     
     def _compile_tokens(self) -> Dict:
         """Compile extracted data into design tokens format"""
@@ -787,122 +1052,64 @@ class DesignTokenExtractor:
         
         return tokens
     
-    def _extract_logos_and_images(self, pptx_dir: Path):
+    def _extract_logos_and_images(self, pptx_package: Union[Path, PackageSource]):
         """Extract logos and brand images from OOXML package"""
-        media_dir = pptx_dir / "ppt" / "media"
+        with self._package(pptx_package) as package:
         
-        if not media_dir.exists():
-            return
-            
-        # Analyze image usage patterns
-        self._analyze_image_usage(pptx_dir)
-        
-        # Extract image files and metadata
-        for image_file in media_dir.iterdir():
-            if image_file.suffix.lower() in ['.png', '.jpg', '.jpeg', '.svg', '.gif']:
+            # Image usage is counted while masters, layouts and slides are parsed;
+            # only the media headers are read here
+            for name in package.names_in("ppt/media", IMAGE_EXTENSIONS):
                 try:
-                    image_info = self._analyze_image_file(image_file)
+                    image_info = self._analyze_package_image(package, name)
                     if image_info:
                         self.extracted_images.append(image_info)
                 except Exception as e:
-                    print(f"Warning: Could not analyze image {image_file}: {e}")
-    
-    def _analyze_image_usage(self, pptx_dir: Path):
-        """Analyze how images are used throughout the presentation"""
-        ns = {
-            'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-            'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
-            'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
-        }
-        
-        # Check slide masters for logo usage
-        masters_dir = pptx_dir / "ppt" / "slideMasters"
-        if masters_dir.exists():
-            for master_file in masters_dir.glob("*.xml"):
-                self._count_image_references(master_file, "master", ns)
-        
-        # Check slide layouts for logo usage  
-        layouts_dir = pptx_dir / "ppt" / "slideLayouts"
-        if layouts_dir.exists():
-            for layout_file in layouts_dir.glob("*.xml"):
-                self._count_image_references(layout_file, "layout", ns)
-        
-        # Check actual slides
-        slides_dir = pptx_dir / "ppt" / "slides"
-        if slides_dir.exists():
-            for slide_file in slides_dir.glob("*.xml"):
-                self._count_image_references(slide_file, "slide", ns)
+                    print(f"Warning: Could not analyze image {name}: {e}")
     
-    def _count_image_references(self, xml_file: Path, context: str, ns: dict):
-        """Count references to images in XML files"""
-        try:
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
-            
-            # Look for image references (blip elements)
-            for blip in root.xpath('.//a:blip', namespaces=ns):
-                embed_id = blip.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed')
-                if embed_id:
-                    # Weight master/layout usage higher (likely logos)
-                    weight = 3 if context == "master" else 2 if context == "layout" else 1
-                    self.image_usage[embed_id] += weight
-                    
-        except Exception as e:
-            print(f"Warning: Could not analyze {xml_file}: {e}")
+    def _analyze_package_image(self, package: PackageSource, name: str) -> Dict:
+        """Analyze an image part without reading more than its header"""
+        return self._describe_image(
+            Path(name).name, package.size(name), lambda: self._get_package_image_dimensions(package, name)
+        )
     
     def _analyze_image_file(self, image_file: Path) -> Dict:
         """Analyze individual image file for logo characteristics"""
-        file_size = image_file.stat().st_size
-        file_format = image_file.suffix.lower()[1:]  # Remove dot
-        file_name = image_file.stem
+        return self._describe_image(
+            image_file.name, image_file.stat().st_size, lambda: self._get_image_dimensions(image_file)
+        )
+    
+    def _describe_image(self, filename: str, size_bytes: int,
+                        get_dimensions: Callable[[], Optional[Dict]]) -> Dict:
+        file_name, file_format = Path(filename).stem, Path(filename).suffix.lower()[1:]  # Remove dot
         
         # Try to get image dimensions
-        dimensions = self._get_image_dimensions(image_file)
+        dimensions = get_dimensions()
         
         # Determine likely image type based on characteristics
-        image_type = self._classify_image_type(file_name, file_format, file_size, dimensions)
+        image_type = self._classify_image_type(file_name, file_format, size_bytes, dimensions)
         
         return {
-            'filename': image_file.name,
+            'filename': filename,
             'stem': file_name,
             'format': file_format,
-            'size_bytes': file_size,
+            'size_bytes': size_bytes,
             'dimensions': dimensions,
             'classification': image_type,
-            'relative_path': f"ppt/media/{image_file.name}"
+            'relative_path': f"ppt/media/{filename}"
         }
     
     def _get_image_dimensions(self, image_file: Path) -> Optional[Dict]:
         """Get image dimensions if possible"""
         try:
-            if image_file.suffix.lower() == '.svg':
-                # For SVG, try to parse viewBox or width/height
-                with open(image_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # Look for viewBox
-                    viewbox_match = re.search(r'viewBox=["\'][\d\s.]+\s+(\d+)\s+(\d+)["\']', content)
-                    if viewbox_match:
-                        return {
-                            'width': int(viewbox_match.group(1)),
-                            'height': int(viewbox_match.group(2)),
-                            'unit': 'svg_units'
-                        }
-                    
-                    # Look for width/height attributes
-                    width_match = re.search(r'width=["\'](\d+)', content)
-                    height_match = re.search(r'height=["\'](\d+)', content)
-                    if width_match and height_match:
-                        return {
-                            'width': int(width_match.group(1)),
-                            'height': int(height_match.group(1)),
-                            'unit': 'px'
-                        }
-            else:
-                # For raster images, would need PIL/Pillow
-                # For now, return None and let classification work without dimensions
-                return None
-                
+            with open(image_file, 'rb') as stream:
+                return probe_image_dimensions(stream, image_file.suffix)
+        except Exception:
+            return None
+    
+    def _get_package_image_dimensions(self, package: PackageSource, name: str) -> Optional[Dict]:
+        try:
+            with package.open(name) as stream:
+                return probe_image_dimensions(stream, Path(name).suffix)
         except Exception:
             return None
     
@@ -993,7 +1200,6 @@ class DesignTokenExtractor:
         if output_path:
             # Determine format from extension
             if output_path.suffix.lower() in ['.json', '.yml']:
-                import json
                 with open(output_path, 'w') as f:
                     json.dump(tokens, f, indent=2, default_flow_style=False)
             else:
@@ -1005,17 +1211,7 @@ class DesignTokenExtractor:
     
     def _extract_image_files(self, pptx_path: Path, assets_dir: Path, tokens: Dict):
         """Extract actual image files from OOXML package"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Extract PPTX again to get image files
-            with zipfile.ZipFile(pptx_path, 'r') as zip_file:
-                zip_file.extractall(temp_dir)
-            
-            temp_path = Path(temp_dir)
-            media_dir = temp_path / "ppt" / "media"
-            
-            if not media_dir.exists():
-                return
-            
+        with PackageSource(pptx_path) as package:
             extracted_count = 0
             brand_assets = tokens.get("stylestack", {}).get("tokens", {}).get("brand_assets", {})
             
@@ -1024,17 +1220,17 @@ class DesignTokenExtractor:
                 if category in brand_assets:
                     (assets_dir / category).mkdir(parents=True, exist_ok=True)
             
-            # Copy image files to appropriate directories
+            # Copy image parts to appropriate directories
             for category, images in brand_assets.items():
                 for stem, image_data in images.items():
-                    src_file = media_dir / image_data['filename']
-                    if src_file.exists():
+                    part_name = f"ppt/media/{image_data['filename']}"
+                    if package.exists(part_name):
                         # Create clean filename
                         clean_name = f"{stem}.{image_data['format']}"
                         dest_file = assets_dir / category / clean_name
                         
-                        import shutil
-                        shutil.copy2(src_file, dest_file)
+                        with package.open(part_name) as src, open(dest_file, 'wb') as dst:
+                            shutil.copyfileobj(src, dst)
                         
                         # Update token with extracted file path
                         image_data['extracted_path'] = str(dest_file.relative_to(assets_dir.parent))
@@ -1093,16 +1289,14 @@ class DesignTokenExtractor:
         
         return analysis
     
-    def _find_similar_colors(self, color_list: List[str]) -> List[Tuple[str, str]]:
-        """Find colors that are very similar (might indicate inconsistency)"""
-        similar_pairs = []
+    def _find_similar_colors(self, color_list: List[str],
+                             delta_e_threshold: float = DEFAULT_DELTA_E_THRESHOLD) -> List[Tuple[str, str]]:
+        """Find colors that are very similar (might indicate inconsistency)
         
-        for i, color1 in enumerate(color_list):
-            for color2 in color_list[i+1:]:
-                if self._color_similarity(color1, color2) > 0.9:
-                    similar_pairs.append((color1, color2))
-        
-        return similar_pairs
+        Compares colors in CIELAB space; spatial bucketing keeps this close to
+        linear for palettes with thousands of colors.
+        """
+        return find_similar_color_pairs(color_list, delta_e_threshold)
     
     def _color_similarity(self, color1: str, color2: str) -> float:
         """Calculate similarity between two hex colors"""
@@ -1143,12 +1337,14 @@ if __name__ == '__main__':
     parser.add_argument('--extract-assets', action='store_true',
                        help='Extract logo and image files')
     parser.add_argument('--assets-dir', help='Directory for extracted assets')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for slide analysis (default: serial)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
     
     # Create extractor
-    extractor = DesignTokenExtractor(output_format=args.format)
+    extractor = DesignTokenExtractor(output_format=args.format, max_workers=args.workers)
     
     # Extract tokens
     input_path = Path(args.input)
@@ -4,12 +4,27 @@ EMU Type System for Design Token Formula Evaluation
 
 Provides precise integer-based calculations for OOXML coordinates
 using English Metric Units (EMU) with type safety and unit conversions.
+
+Input is validated once, when a value enters the type system (EMUValue(...),
+unit conversion functions, EMUArray construction). Arithmetic between valid
+values skips input conversion and only range-checks results that can leave
+the safe range; values up to one inch are interned.
+EMUArray converts and snaps whole lists of positions in one call, using
+NumPy when it is installed.
 """
 
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 import math
 
+# Optional vectorized backend for EMUArray
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 
 # EMU Constants
 EMU_PER_INCH = 914400
@@ -22,6 +37,14 @@ EMU_PER_MM = 36000  # 1 mm = 36,000 EMU (25.4mm/inch × EMU_PER_INCH ÷ 25.4)
 MAX_EMU_VALUE = 2**50  # Very large but safe for multiplication
 MIN_EMU_VALUE = -2**50
 
+# EMUValues with a magnitude up to this are interned (at most
+# EMU_INTERN_TABLE_LIMIT of them), so repeated offsets share one object
+EMU_INTERN_LIMIT = EMU_PER_INCH
+EMU_INTERN_TABLE_LIMIT = 65536
+
+# Below this length the pure-Python EMUArray is faster than NumPy setup
+EMU_ARRAY_NUMPY_MIN_SIZE = 64
+
 
 class EMUOverflowError(OverflowError):
     """Raised when EMU calculations would result in overflow"""
@@ -33,6 +56,39 @@ class EMUConversionError(ValueError):
     pass
 
 
+def _validated_emu(value: Any) -> int:
+    """Truncate a numeric value to an EMU integer, enforcing the safe range"""
+    if type(value) is int:
+        int_value = value
+    else:
+        try:
+            # Strings and floats are parsed as float first, then truncated
+            int_value = int(float(value))
+        except (TypeError, ValueError) as e:
+            raise TypeError(f"Cannot convert {type(value).__name__} to EMUValue: {e}")
+
+    # Check for overflow
+    if int_value > MAX_EMU_VALUE or int_value < MIN_EMU_VALUE:
+        raise EMUOverflowError(
+            f"EMU value {int_value} exceeds safe range "
+            f"({MIN_EMU_VALUE} to {MAX_EMU_VALUE})"
+        )
+    return int_value
+
+
+def _checked_emu(value: int) -> int:
+    """Range check for results of valid EMU values that can leave the safe range"""
+    if value > MAX_EMU_VALUE or value < MIN_EMU_VALUE:
+        raise EMUOverflowError(
+            f"EMU value {value} exceeds safe range "
+            f"({MIN_EMU_VALUE} to {MAX_EMU_VALUE})"
+        )
+    return value
+
+
+_interned_values: Dict[int, 'EMUValue'] = {}
+
+
 class EMUValue:
     """
     Represents a precise EMU (English Metric Unit) value for OOXML calculations
@@ -45,9 +101,11 @@ class EMUValue:
     All operations maintain integer precision to ensure exact OOXML coordinates.
     """
     
-    def __init__(self, value: Union[int, float, str]):
+    __slots__ = ('_value',)
+
+    def __new__(cls, value: Union[int, float, str]):
         """
-        Initialize EMU value with automatic type conversion to integer
+        Create EMU value with automatic type conversion to integer
         
         Args:
             value: Numeric value to convert to EMU (truncated to integer)
@@ -56,27 +114,27 @@ class EMUValue:
             TypeError: If value cannot be converted to numeric type
             EMUOverflowError: If value exceeds safe EMU range
         """
-        try:
-            if isinstance(value, str):
-                # Try to parse as float first, then convert to int
-                numeric_value = float(value)
-            else:
-                numeric_value = float(value)
-                
-            # Convert to integer (truncate decimal part)
-            int_value = int(numeric_value)
-            
-            # Check for overflow
-            if int_value > MAX_EMU_VALUE or int_value < MIN_EMU_VALUE:
-                raise EMUOverflowError(
-                    f"EMU value {int_value} exceeds safe range "
-                    f"({MIN_EMU_VALUE} to {MAX_EMU_VALUE})"
-                )
-            
-            self._value = int_value
-            
-        except (TypeError, ValueError) as e:
-            raise TypeError(f"Cannot convert {type(value).__name__} to EMUValue: {e}")
+        return cls._from_int(_validated_emu(value))
+
+    @classmethod
+    def _from_int(cls, value: int) -> 'EMUValue':
+        """Unchecked constructor for ints that are already valid EMU values"""
+        if cls is EMUValue and -EMU_INTERN_LIMIT <= value <= EMU_INTERN_LIMIT:
+            interned = _interned_values.get(value)
+            if interned is not None:
+                return interned
+            instance = object.__new__(cls)
+            instance._value = value
+            if len(_interned_values) < EMU_INTERN_TABLE_LIMIT:
+                _interned_values[value] = instance
+            return instance
+
+        instance = object.__new__(cls)
+        instance._value = value
+        return instance
+
+    def __reduce__(self):
+        return (type(self), (self._value,))
     
     @property
     def value(self) -> int:
@@ -104,10 +162,13 @@ class EMUValue:
         return self._value / EMU_PER_MM
     
     # Arithmetic operators
+    # Results of two EMUValues skip input conversion but keep the range
+    # check wherever the result can leave the safe range (sums, differences,
+    # products, powers); plain numbers are validated as new values
     def __add__(self, other: Union['EMUValue', int, float]) -> 'EMUValue':
         """Addition with automatic type promotion"""
         if isinstance(other, EMUValue):
-            return EMUValue(self._value + other._value)
+            return EMUValue._from_int(_checked_emu(self._value + other._value))
         return EMUValue(self._value + int(other))
     
     def __radd__(self, other: Union[int, float]) -> 'EMUValue':
@@ -117,7 +178,7 @@ class EMUValue:
     def __sub__(self, other: Union['EMUValue', int, float]) -> 'EMUValue':
         """Subtraction with automatic type promotion"""
         if isinstance(other, EMUValue):
-            return EMUValue(self._value - other._value)
+            return EMUValue._from_int(_checked_emu(self._value - other._value))
         return EMUValue(self._value - int(other))
     
     def __rsub__(self, other: Union[int, float]) -> 'EMUValue':
@@ -139,7 +200,7 @@ class EMUValue:
         if isinstance(other, EMUValue):
             if other._value == 0:
                 raise ZeroDivisionError("Division by zero EMUValue")
-            return EMUValue(self._value // other._value)  # Integer division for precision
+            return EMUValue._from_int(self._value // other._value)  # Integer division for precision
         if other == 0:
             raise ZeroDivisionError("Division by zero")
         return EMUValue(int(self._value / other))
@@ -155,7 +216,7 @@ class EMUValue:
         if isinstance(other, EMUValue):
             if other._value == 0:
                 raise ZeroDivisionError("Division by zero EMUValue")
-            return EMUValue(self._value // other._value)
+            return EMUValue._from_int(self._value // other._value)
         if other == 0:
             raise ZeroDivisionError("Division by zero")
         return EMUValue(self._value // int(other))
@@ -165,7 +226,7 @@ class EMUValue:
         if isinstance(other, EMUValue):
             if other._value == 0:
                 raise ZeroDivisionError("Modulo by zero EMUValue")
-            return EMUValue(self._value % other._value)
+            return EMUValue._from_int(self._value % other._value)
         if other == 0:
             raise ZeroDivisionError("Modulo by zero")
         return EMUValue(self._value % int(other))
@@ -250,15 +311,15 @@ class EMUValue:
     # Unary operators
     def __neg__(self) -> 'EMUValue':
         """Negation"""
-        return EMUValue(-self._value)
+        return EMUValue._from_int(-self._value)
     
     def __pos__(self) -> 'EMUValue':
         """Positive (identity)"""
-        return EMUValue(self._value)
+        return EMUValue._from_int(self._value)
     
     def __abs__(self) -> 'EMUValue':
         """Absolute value"""
-        return EMUValue(abs(self._value))
+        return EMUValue._from_int(abs(self._value))
     
     # String representations
     def __str__(self) -> str:
@@ -284,6 +345,8 @@ class Point:
     Represents a 2D point in EMU coordinates for OOXML positioning
     """
     
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: Union[EMUValue, int, float], y: Union[EMUValue, int, float]):
         """
         Initialize point with EMU coordinates
@@ -346,6 +409,8 @@ class Rectangle:
     Represents a rectangle in EMU coordinates for OOXML shape positioning
     """
     
+    __slots__ = ('x', 'y', 'width', 'height')
+    
     def __init__(
         self, 
         x: Union[EMUValue, int, float], 
@@ -427,18 +492,21 @@ class Rectangle:
     
     def contains_point(self, point: Point) -> bool:
         """Check if point is inside rectangle (inclusive of edges)"""
+        x, y = self.x._value, self.y._value
         return (
-            self.left <= point.x <= self.right and
-            self.top <= point.y <= self.bottom
+            x <= point.x._value <= x + self.width._value and
+            y <= point.y._value <= y + self.height._value
         )
     
     def intersects(self, other: 'Rectangle') -> bool:
         """Check if this rectangle intersects with another rectangle"""
+        left, top = self.x._value, self.y._value
+        other_left, other_top = other.x._value, other.y._value
         return not (
-            self.right < other.left or
-            other.right < self.left or
-            self.bottom < other.top or
-            other.bottom < self.top
+            left + self.width._value < other_left or
+            other_left + other.width._value < left or
+            top + self.height._value < other_top or
+            other_top + other.height._value < top
         )
     
     def intersection(self, other: 'Rectangle') -> Optional['Rectangle']:
@@ -451,15 +519,17 @@ class Rectangle:
         if not self.intersects(other):
             return None
         
-        left = EMUValue(max(self.left.value, other.left.value))
-        top = EMUValue(max(self.top.value, other.top.value))
-        right = EMUValue(min(self.right.value, other.right.value))
-        bottom = EMUValue(min(self.bottom.value, other.bottom.value))
-        
-        width = right - left
-        height = bottom - top
+        left = max(self.x._value, other.x._value)
+        top = max(self.y._value, other.y._value)
+        right = min(self.x._value + self.width._value, other.x._value + other.width._value)
+        bottom = min(self.y._value + self.height._value, other.y._value + other.height._value)
         
-        return Rectangle(left, top, width, height)
+        return Rectangle(
+            EMUValue._from_int(left),
+            EMUValue._from_int(top),
+            EMUValue._from_int(right - left),
+            EMUValue._from_int(bottom - top)
+        )
     
     def scale(self, factor: float) -> 'Rectangle':
         """Scale rectangle uniformly (position unchanged, dimensions scaled)"""
@@ -654,6 +724,254 @@ def emu_to_pixels(emu: EMUValue, dpi: float = 96.0) -> float:
     return inches * dpi
 
 
+# Bulk conversions
+SNAP_MODES = ('nearest', 'floor', 'ceil')
+
+
+def _check_array_range(values) -> None:
+    """Range check for a list or NumPy array of EMU results"""
+    if not len(values):
+        return
+    if NUMPY_AVAILABLE and isinstance(values, np.ndarray):
+        high, low = values.max(), values.min()
+    else:
+        high, low = max(values), min(values)
+    if high > MAX_EMU_VALUE or low < MIN_EMU_VALUE:
+        raise EMUOverflowError(
+            f"EMU values exceed safe range ({MIN_EMU_VALUE} to {MAX_EMU_VALUE})"
+        )
+
+
+class EMUArray:
+    """
+    Sequence of EMU values that is converted, scaled and snapped in bulk
+
+    Values are validated once on the way in; results match the scalar
+    conversion functions exactly (float multiplication, truncated to int).
+    Stored as a list of ints, or an int64 NumPy array when NumPy is used.
+    """
+
+    __slots__ = ('_values', '_numpy')
+
+    def __init__(self, values: Iterable[Union[EMUValue, int, float, str]] = (),
+                 use_numpy: Optional[bool] = None):
+        """
+        Create an array from EMU values
+
+        Args:
+            values: EMUValues or numbers (truncated to integer EMUs)
+            use_numpy: Force (True) or disable (False) the NumPy backend;
+                       None uses it when installed and the array is large enough
+
+        Raises:
+            TypeError: If a value cannot be converted to numeric type
+            EMUOverflowError: If a value exceeds safe EMU range
+        """
+        ints = [value._value if isinstance(value, EMUValue) else _validated_emu(value) for value in values]
+        use_numpy = self._use_numpy(use_numpy, len(ints))
+        self._values = np.array(ints, dtype=np.int64) if use_numpy else ints
+        self._numpy = use_numpy
+
+    @staticmethod
+    def _use_numpy(use_numpy: Optional[bool], size: int) -> bool:
+        if use_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for use_numpy=True")
+        if use_numpy is None:
+            return NUMPY_AVAILABLE and size >= EMU_ARRAY_NUMPY_MIN_SIZE
+        return bool(use_numpy)
+
+    @classmethod
+    def _wrap(cls, values, use_numpy: bool) -> 'EMUArray':
+        """Unchecked constructor for already valid EMU ints (list or int64 array)"""
+        array = object.__new__(cls)
+        array._values = values
+        array._numpy = use_numpy
+        return array
+
+    @classmethod
+    def from_units(cls, values: Iterable[Union[int, float]], emu_per_unit: Union[int, float],
+                   divisor: Optional[float] = None, use_numpy: Optional[bool] = None) -> 'EMUArray':
+        """
+        Convert values in any unit to EMU
+
+        Args:
+            values: Values in the source unit
+            emu_per_unit: EMUs per source unit (e.g. EMU_PER_POINT)
+            divisor: Divide each value by this before scaling (e.g. DPI)
+            use_numpy: See EMUArray()
+
+        Raises:
+            EMUConversionError: If a value cannot be converted
+            EMUOverflowError: If a result exceeds safe EMU range
+        """
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        if divisor == 0:
+            raise EMUConversionError("Cannot convert to EMU: division by zero")
+        use_numpy = cls._use_numpy(use_numpy, len(values))
+
+        if use_numpy:
+            try:
+                units = np.asarray(values, dtype=np.float64)
+            except (TypeError, ValueError) as e:
+                raise EMUConversionError(f"Cannot convert values to EMU: {e}")
+            if divisor is not None:
+                units = units / divisor
+            emus = np.trunc(units * emu_per_unit)
+            if np.isnan(emus).any():
+                raise EMUConversionError("Cannot convert NaN to EMU")
+            _check_array_range(emus)
+            return cls._wrap(emus.astype(np.int64), True)
+
+        ints = []
+        for value in values:
+            try:
+                units = float(value) if divisor is None else float(value) / divisor
+                ints.append(_validated_emu(int(units * emu_per_unit)))
+            except (TypeError, ValueError) as e:
+                raise EMUConversionError(f"Cannot convert {value} to EMU: {e}")
+        return cls._wrap(ints, False)
+
+    @classmethod
+    def from_inches(cls, inches: Iterable[Union[int, float]], use_numpy: Optional[bool] = None) -> 'EMUArray':
+        """Convert inches to EMU"""
+        return cls.from_units(inches, EMU_PER_INCH, use_numpy=use_numpy)
+
+    @classmethod
+    def from_points(cls, points: Iterable[Union[int, float]], use_numpy: Optional[bool] = None) -> 'EMUArray':
+        """Convert points to EMU"""
+        return cls.from_units(points, EMU_PER_POINT, use_numpy=use_numpy)
+
+    @classmethod
+    def from_cm(cls, cm: Iterable[Union[int, float]], use_numpy: Optional[bool] = None) -> 'EMUArray':
+        """Convert centimeters to EMU"""
+        return cls.from_units(cm, EMU_PER_CM, use_numpy=use_numpy)
+
+    @classmethod
+    def from_mm(cls, mm: Iterable[Union[int, float]], use_numpy: Optional[bool] = None) -> 'EMUArray':
+        """Convert millimeters to EMU"""
+        return cls.from_units(mm, EMU_PER_MM, use_numpy=use_numpy)
+
+    @classmethod
+    def from_pixels(cls, pixels: Iterable[Union[int, float]], dpi: float = 96.0,
+                    use_numpy: Optional[bool] = None) -> 'EMUArray':
+        """Convert pixels to EMU with DPI awareness"""
+        return cls.from_units(pixels, EMU_PER_INCH, divisor=dpi, use_numpy=use_numpy)
+
+    def snap(self, grid: Union[EMUValue, int], mode: str = 'nearest') -> 'EMUArray':
+        """
+        Snap every value to a multiple of grid
+
+        Args:
+            grid: Grid size in EMU (must be positive)
+            mode: 'nearest' (round half to even, like round()), 'floor' or 'ceil'
+
+        Returns:
+            New EMUArray with snapped values
+        """
+        grid = grid._value if isinstance(grid, EMUValue) else _validated_emu(grid)
+        if grid <= 0:
+            raise ValueError(f"Snap grid must be positive, got {grid}")
+        if mode not in SNAP_MODES:
+            raise ValueError(f"Unknown snap mode: {mode!r} (expected one of {SNAP_MODES})")
+
+        values = self._values
+        if self._numpy:
+            if mode == 'nearest':
+                snapped = np.rint(values / grid).astype(np.int64) * grid
+            elif mode == 'floor':
+                snapped = values // grid * grid
+            else:
+                snapped = -(-values // grid) * grid
+        elif mode == 'nearest':
+            snapped = [round(value / grid) * grid for value in values]
+        elif mode == 'floor':
+            snapped = [value // grid * grid for value in values]
+        else:
+            snapped = [-(-value // grid) * grid for value in values]
+        _check_array_range(snapped)
+        return EMUArray._wrap(snapped, self._numpy)
+
+    def scale(self, factor: Union[int, float]) -> 'EMUArray':
+        """Multiply every value by factor (truncated like EMUValue * factor)"""
+        if self._numpy:
+            scaled = np.trunc(self._values * float(factor))
+            _check_array_range(scaled)
+            return EMUArray._wrap(scaled.astype(np.int64), True)
+        return EMUArray._wrap([_validated_emu(int(value * factor)) for value in self._values], False)
+
+    def _operand(self, other):
+        if isinstance(other, EMUArray):
+            if len(other) != len(self):
+                raise ValueError(f"EMUArray length mismatch: {len(self)} and {len(other)}")
+            return other._values if self._numpy else other.to_list()
+        return other._value if isinstance(other, EMUValue) else _validated_emu(other)
+
+    def __add__(self, other: Union['EMUArray', EMUValue, int, float]) -> 'EMUArray':
+        """Elementwise addition of an EMUArray or a single offset"""
+        operand = self._operand(other)
+        if self._numpy:
+            result = self._values + operand
+        elif isinstance(operand, list):
+            result = [a + b for a, b in zip(self._values, operand)]
+        else:
+            result = [value + operand for value in self._values]
+        _check_array_range(result)
+        return EMUArray._wrap(result, self._numpy)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union['EMUArray', EMUValue, int, float]) -> 'EMUArray':
+        """Elementwise subtraction of an EMUArray or a single offset"""
+        operand = self._operand(other)
+        if self._numpy:
+            result = self._values - operand
+        elif isinstance(operand, list):
+            result = [a - b for a, b in zip(self._values, operand)]
+        else:
+            result = [value - operand for value in self._values]
+        _check_array_range(result)
+        return EMUArray._wrap(result, self._numpy)
+
+    def to_list(self) -> List[int]:
+        """Integer EMU values"""
+        return self._values.tolist() if self._numpy else list(self._values)
+
+    def to_ooxml_attrs(self) -> List[str]:
+        """String values for OOXML attributes"""
+        return [str(value) for value in self.to_list()]
+
+    def to_inches(self) -> List[float]:
+        """Convert EMU to inches"""
+        return [value / EMU_PER_INCH for value in self.to_list()]
+
+    def to_points(self) -> List[float]:
+        """Convert EMU to points"""
+        return [value / EMU_PER_POINT for value in self.to_list()]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[EMUValue]:
+        return (EMUValue._from_int(value) for value in self.to_list())
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[EMUValue, 'EMUArray']:
+        if isinstance(index, slice):
+            return EMUArray._wrap(self._values[index], self._numpy)
+        return EMUValue._from_int(int(self._values[index]))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, EMUArray):
+            return self.to_list() == other.to_list()
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == [int(value) for value in other]
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"EMUArray({self.to_list()})"
+
+
 if __name__ == '__main__':
     # Simple test of the EMU type system
     print("EMU Type System Test")
@@ -4,14 +4,25 @@ Formula Parser Engine for Design Token Formula Evaluation System
 
 Parses mathematical expressions containing variables, functions, and operators
 into Abstract Syntax Trees for dependency analysis and evaluation.
+
+Formulas that are evaluated repeatedly are compiled once into nested Python
+closures with variables bound by slot index, and cached by expression text:
+
+    formula = FormulaParser().compile("SAFE_L + (col - 1) * (COL_W + GUT)")
+    x = formula({'SAFE_L': 457200, 'col': 2, 'COL_W': 685800, 'GUT': 91440})
 """
 
 
-from typing import Dict, List, Set, Any, Union, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Set, Any, Sequence, Tuple, Union, Optional
+import operator
 import re
+from collections import OrderedDict
 from enum import Enum
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from .emu_types import EMUValue
+
 
 class TokenType(Enum):
     """Token types for lexical analysis"""
@@ -127,6 +138,158 @@ class FunctionCallAST(ExpressionAST):
         return f"Call({self.name}({args}))"
 
 
+# Compiled formulas
+DEFAULT_CACHE_SIZE = 4096
+
+_ARITHMETIC_OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '**': operator.pow,
+}
+
+# Placeholder for variables missing from the evaluation context
+_MISSING = object()
+
+
+class CompiledFormula:
+    """
+    Formula compiled into a single callable
+
+    Variables are bound by slot index: ``variables[i]`` is read from
+    ``values[i]``. Errors match FormulaParser.evaluate().
+    """
+
+    __slots__ = ('expression', 'ast', 'variables', '_function')
+
+    def __init__(self, ast: ExpressionAST, expression: Optional[str] = None):
+        slots: Dict[str, int] = {}
+        self.expression = expression
+        self.ast = ast
+        self._function = _compile_node(ast, slots)
+        self.variables: Tuple[str, ...] = tuple(slots)
+
+    def __call__(self, context: Optional[Dict[str, Any]] = None) -> Union[int, float, 'EMUValue']:
+        """Evaluate with variables looked up by name"""
+        if context is None:
+            context = {}
+        return self._function([context.get(name, _MISSING) for name in self.variables])
+
+    def evaluate_values(self, values: Sequence[Any]) -> Union[int, float, 'EMUValue']:
+        """Evaluate with variable values given in slot order"""
+        return self._function(values)
+
+    def __repr__(self) -> str:
+        return f"CompiledFormula({self.expression or self.ast!s})"
+
+
+def binary_operator(symbol: str) -> Callable[[Any, Any], Any]:
+    """Two-argument function applying a binary operator as FormulaParser.evaluate() does"""
+    if symbol in ('/', '%'):
+        divide = operator.truediv if symbol == '/' else operator.mod
+        message = "Division by zero" if symbol == '/' else "Modulo by zero"
+
+        def divide_op(left_val, right_val):
+            if right_val == 0:
+                raise EvaluationError(message)
+            try:
+                return divide(left_val, right_val)
+            except (ZeroDivisionError, OverflowError) as e:
+                raise EvaluationError(str(e))
+        return divide_op
+
+    arithmetic = _ARITHMETIC_OPERATORS.get(symbol)
+    if arithmetic is None:
+        def unknown_op(left_val, right_val):
+            raise EvaluationError(f"Unknown binary operator '{symbol}'")
+        return unknown_op
+
+    def binary_op(left_val, right_val):
+        try:
+            return arithmetic(left_val, right_val)
+        except (ZeroDivisionError, OverflowError) as e:
+            raise EvaluationError(str(e))
+    return binary_op
+
+
+def _compile_node(node: ExpressionAST, slots: Dict[str, int]) -> Callable[[Sequence[Any]], Any]:
+    """Closure evaluating node against slot-ordered variable values"""
+    if isinstance(node, NumberAST):
+        value = node.value
+        return lambda values: value
+
+    if isinstance(node, VariableAST):
+        name = node.name
+        index = slots.setdefault(name, len(slots))
+
+        def load(values):
+            value = values[index]
+            if value is _MISSING:
+                raise EvaluationError(f"Undefined variable '{name}'")
+            return value
+        return load
+
+    if isinstance(node, BinaryOpAST):
+        left = _compile_node(node.left, slots)
+        right = _compile_node(node.right, slots)
+        apply = binary_operator(node.operator)
+        return lambda values: apply(left(values), right(values))
+
+    if isinstance(node, UnaryOpAST):
+        operand = _compile_node(node.operand, slots)
+        symbol = node.operator
+        if symbol == '+':
+            return operand
+        if symbol == '-':
+            return lambda values: -operand(values)
+
+        def unknown_unary(values):
+            operand(values)
+            raise EvaluationError(f"Unknown unary operator '{symbol}'")
+        return unknown_unary
+
+    if isinstance(node, FunctionCallAST):
+        # Arguments are never evaluated, but their variables are still dependencies
+        for argument in node.arguments:
+            _compile_node(argument, slots)
+        message = f"Function '{node.name}' not implemented"
+
+        def call(values):
+            raise EvaluationError(message)
+        return call
+
+    message = f"Unknown AST node type {type(node)}"
+
+    def unknown_node(values):
+        raise EvaluationError(message)
+    return unknown_node
+
+
+def compile_ast(ast: ExpressionAST, expression: Optional[str] = None) -> CompiledFormula:
+    """Compile an AST without caching"""
+    return CompiledFormula(ast, expression)
+
+
+_compiled_cache: 'OrderedDict[str, CompiledFormula]' = OrderedDict()
+_cache_size = DEFAULT_CACHE_SIZE
+
+
+def set_cache_size(size: int) -> None:
+    """Bound the number of cached compiled formulas (0 disables caching)"""
+    global _cache_size
+    _cache_size = max(0, size)
+    while len(_compiled_cache) > _cache_size:
+        _compiled_cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    _compiled_cache.clear()
+
+
+def cache_info() -> Dict[str, int]:
+    return {'size': len(_compiled_cache), 'max_size': _cache_size}
+
+
 class FormulaParser:
     """Main parser class for mathematical formulas"""
     
@@ -445,10 +608,7 @@ class FormulaParser:
             Set of variable names that the expression depends on
         """
         try:
-            ast = self.parse(expression)
-            dependencies = set()
-            self._extract_dependencies_from_ast(ast, dependencies)
-            return dependencies
+            return set(self.compile(expression).variables)
         except Exception:
             # If parsing fails, return empty set
             return set()
@@ -488,6 +648,35 @@ class FormulaParser:
         
         return errors
     
+    def compile(self, expression: str) -> CompiledFormula:
+        """
+        Parse and compile an expression, reusing the cached result for the same text
+        
+        Args:
+            expression: Mathematical expression to compile
+            
+        Returns:
+            CompiledFormula that evaluates the expression in a single call
+            
+        Raises:
+            SyntaxError: If expression is malformed
+        """
+        compiled = _compiled_cache.get(expression)
+        if compiled is not None:
+            _compiled_cache.move_to_end(expression)
+            return compiled
+        
+        compiled = CompiledFormula(self.parse(expression), expression)
+        if _cache_size:
+            _compiled_cache[expression] = compiled
+            while len(_compiled_cache) > _cache_size:
+                _compiled_cache.popitem(last=False)
+        return compiled
+    
+    def evaluate_expression(self, expression: str, context: Dict[str, Any]) -> Union[int, float, 'EMUValue']:
+        """Evaluate expression text with variable context (compiled and cached)"""
+        return self.compile(expression)(context)
+    
     def evaluate(self, ast: ExpressionAST, context: Dict[str, Any]) -> Union[int, float, 'EMUValue']:
         """
         Evaluate an AST with variable context
@@ -4,15 +4,27 @@ Formula-based Variable Resolution System for StyleStack Design Tokens
 This module provides dependency graph analysis, topological sorting, 
 and hierarchical variable resolution specifically for design token formulas
 that integrate with the Formula Parser Engine and EMU Type System.
+
+For repeated evaluation (every aspect ratio, every org) the resolver can be
+optimized into a FormulaProgram: constants are folded, identical
+subexpressions are shared as synthetic variables, and only the work that
+depends on the runtime inputs is left:
+
+    program = resolver.optimize(inputs=['slide.w_in', 'slide.h_in'])
+    for ratio in ratios:
+        values = program.evaluate({'slide.w_in': ratio.w, 'slide.h_in': ratio.h})
 """
 
 
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 import copy
 
-from .formula_parser import FormulaParser
+from .formula_parser import (
+    BinaryOpAST, EvaluationError, ExpressionAST, FormulaParser, FunctionCallAST,
+    NumberAST, UnaryOpAST, VariableAST, binary_operator
+)
 from .emu_types import EMUValue
 
 
@@ -127,6 +139,229 @@ class DependencyGraph:
         return result[::-1]
 
 
+# Optimized formula programs
+# Node tuples: ('const', value), ('input', name), ('binary', symbol, a, b), ('neg', a)
+
+def _negate(operand: Any, _unused: Any) -> Any:
+    return -operand
+
+
+class _ProgramBuilder:
+    """Hash-consed expression DAG: equal subexpressions get one node, constant operands are folded"""
+
+    def __init__(self):
+        self.nodes: List[tuple] = []
+        self._index: Dict[Any, int] = {}
+
+    def _add(self, key: Any, node: tuple) -> int:
+        existing = self._index.get(key)
+        if existing is not None:
+            return existing
+        self.nodes.append(node)
+        self._index[key] = len(self.nodes) - 1
+        return len(self.nodes) - 1
+
+    def constant(self, value: Any) -> int:
+        # Type and float bits are part of the key so 1, 1.0 and -0.0 stay distinct
+        try:
+            key = ('const', type(value), value.hex() if type(value) is float else value)
+            hash(key)
+        except TypeError:
+            key = ('const', id(value))
+        return self._add(key, ('const', value))
+
+    def input(self, name: str) -> int:
+        return self._add(('input', name), ('input', name))
+
+    def binary(self, symbol: str, left: int, right: int) -> int:
+        left_node, right_node = self.nodes[left], self.nodes[right]
+        if left_node[0] == 'const' and right_node[0] == 'const':
+            return self.constant(binary_operator(symbol)(left_node[1], right_node[1]))
+        return self._add(('binary', symbol, left, right), ('binary', symbol, left, right))
+
+    def negate(self, operand: int) -> int:
+        node = self.nodes[operand]
+        if node[0] == 'const':
+            return self.constant(-node[1])
+        return self._add(('neg', operand), ('neg', operand))
+
+    def from_ast(self, ast: ExpressionAST, resolve_name: Callable[[str], int]) -> int:
+        """Add an expression; variable references are mapped to nodes by resolve_name"""
+        if isinstance(ast, NumberAST):
+            return self.constant(ast.value)
+        if isinstance(ast, VariableAST):
+            return resolve_name(ast.name)
+        if isinstance(ast, BinaryOpAST):
+            left = self.from_ast(ast.left, resolve_name)
+            return self.binary(ast.operator, left, self.from_ast(ast.right, resolve_name))
+        if isinstance(ast, UnaryOpAST):
+            operand = self.from_ast(ast.operand, resolve_name)
+            if ast.operator == '+':
+                return operand
+            if ast.operator == '-':
+                return self.negate(operand)
+            raise EvaluationError(f"Unknown unary operator '{ast.operator}'")
+        if isinstance(ast, FunctionCallAST):
+            raise EvaluationError(f"Function '{ast.name}' not implemented")
+        raise EvaluationError(f"Unknown AST node type {type(ast)}")
+
+
+class FormulaProgram:
+    """
+    Variables compiled into straight-line steps over their runtime inputs
+
+    Each step applies one operator to earlier slots. Constant operands are
+    folded when the program is built, and a subexpression shared by several
+    formulas is computed once (exposed as a synthetic ``_cseN`` variable).
+    Results match FormulaVariableResolver.resolve_all() with the same inputs
+    in its context.
+    """
+
+    def __init__(self, nodes: List[tuple], outputs: Dict[str, int]):
+        self._nodes = nodes
+        self._outputs = outputs
+
+        reachable: Set[int] = set()
+        stack = list(outputs.values())
+        while stack:
+            index = stack.pop()
+            if index not in reachable:
+                reachable.add(index)
+                node = nodes[index]
+                if node[0] == 'binary':
+                    stack.extend(node[2:])
+                elif node[0] == 'neg':
+                    stack.append(node[1])
+        order = sorted(reachable)  # Children are always created before their parents
+        self._order = order
+
+        self.inputs: Tuple[str, ...] = tuple(nodes[i][1] for i in order if nodes[i][0] == 'input')
+        constant_nodes = [i for i in order if nodes[i][0] == 'const']
+        step_nodes = [i for i in order if nodes[i][0] in ('binary', 'neg')]
+
+        slots = {index: slot for slot, index in enumerate(
+            [i for i in order if nodes[i][0] == 'input'] + constant_nodes + step_nodes
+        )}
+        self._constants = [nodes[i][1] for i in constant_nodes]
+        self._steps: List[Tuple[Callable[[Any, Any], Any], int, int]] = []
+        for index in step_nodes:
+            node = nodes[index]
+            if node[0] == 'binary':
+                self._steps.append((binary_operator(node[1]), slots[node[2]], slots[node[3]]))
+            else:
+                self._steps.append((_negate, slots[node[1]], slots[node[1]]))
+        self._output_slots = [(name, slots[index]) for name, index in outputs.items()]
+
+        # Shared intermediate results that no variable names get a synthetic name
+        uses: Dict[int, int] = defaultdict(int)
+        for index in step_nodes:
+            for child in (nodes[index][2:] if nodes[index][0] == 'binary' else nodes[index][1:]):
+                uses[child] += 1
+        self._names: Dict[int, str] = {}
+        for name, index in outputs.items():
+            self._names.setdefault(index, name)
+        self._synthetic: List[int] = []
+        for index in step_nodes:
+            if uses[index] > 1 and index not in self._names:
+                self._names[index] = f"_cse{len(self._synthetic)}"
+                self._synthetic.append(index)
+
+    @property
+    def variables(self) -> Tuple[str, ...]:
+        """Variable names in resolution order"""
+        return tuple(self._outputs)
+
+    @property
+    def step_count(self) -> int:
+        """Operations performed per evaluation"""
+        return len(self._steps)
+
+    @property
+    def constants(self) -> Dict[str, Any]:
+        """Variables that were folded to a constant"""
+        return {name: self._nodes[index][1] for name, index in self._outputs.items()
+                if self._nodes[index][0] == 'const'}
+
+    @property
+    def subexpressions(self) -> Dict[str, str]:
+        """Synthetic variables for shared subexpressions and their formulas"""
+        return {self._names[index]: self._render(index, top=True) for index in self._synthetic}
+
+    def formula(self, name: str) -> str:
+        """Optimized formula of a variable, in terms of inputs and synthetic variables"""
+        return self._render(self._outputs[name], top=True)
+
+    def _render(self, index: int, top: bool = False) -> str:
+        node = self._nodes[index]
+        if node[0] == 'const':
+            return repr(node[1])
+        if node[0] == 'input':
+            return node[1]
+        if not top and index in self._names:
+            return self._names[index]
+        if node[0] == 'neg':
+            return f"-{self._render(node[1])}"
+        return f"({self._render(node[2])} {node[1]} {self._render(node[3])})"
+
+    def evaluate(self, context: Optional[Dict[str, Any]] = None) -> Dict[str, Union[int, float, EMUValue]]:
+        """
+        Evaluate every variable for one set of inputs
+
+        Args:
+            context: Values for the program inputs
+
+        Returns:
+            Dictionary mapping variable names to resolved values
+
+        Raises:
+            VariableNotFoundError: If an input is missing from context
+            EvaluationError: If an operation fails (e.g. division by zero)
+        """
+        context = context or {}
+        try:
+            values = [context[name] for name in self.inputs]
+        except KeyError as e:
+            raise VariableNotFoundError(f"Variable {e} not found in any layer or context") from None
+        values.extend(self._constants)
+
+        append = values.append
+        for operation, left, right in self._steps:
+            append(operation(values[left], values[right]))
+        return {name: values[slot] for name, slot in self._output_slots}
+
+    def evaluate_many(self, contexts: Iterable[Dict[str, Any]]) -> List[Dict[str, Union[int, float, EMUValue]]]:
+        """Evaluate the program for each context"""
+        return [self.evaluate(context) for context in contexts]
+
+    def fold(self, values: Dict[str, Any]) -> 'FormulaProgram':
+        """
+        Bind some inputs to fixed values and fold again
+
+        Used to stage evaluation by layer: fold the values an org fixes once,
+        then evaluate the smaller program for every aspect ratio.
+
+        Raises:
+            EvaluationError: If an operation fails on the bound values
+        """
+        builder = _ProgramBuilder()
+        mapping: Dict[int, int] = {}
+        for index in self._order:
+            node = self._nodes[index]
+            if node[0] == 'const':
+                mapping[index] = builder.constant(node[1])
+            elif node[0] == 'input':
+                mapping[index] = builder.constant(values[node[1]]) if node[1] in values else builder.input(node[1])
+            elif node[0] == 'binary':
+                mapping[index] = builder.binary(node[1], mapping[node[2]], mapping[node[3]])
+            else:
+                mapping[index] = builder.negate(mapping[node[1]])
+        return FormulaProgram(builder.nodes, {name: mapping[index] for name, index in self._outputs.items()})
+
+    def __repr__(self) -> str:
+        return (f"FormulaProgram(variables={len(self._outputs)}, inputs={len(self.inputs)}, "
+                f"steps={len(self._steps)}, subexpressions={len(self._synthetic)})")
+
+
 class FormulaVariableResolver:
     """
     Formula-based variable resolver with dependency tracking and caching.
@@ -144,6 +379,7 @@ class FormulaVariableResolver:
         self.layer_priority = ['core', 'org', 'channel', 'user']  # lowest to highest priority
         self.resolved_cache: Dict[str, Union[int, float, EMUValue]] = {}
         self.resolution_in_progress: Set[str] = set()
+        self._programs: Dict[FrozenSet[str], FormulaProgram] = {}
     
     def add_layer(self, layer: str, variables: Dict[str, Union[str, int, float]], source_file: Optional[str] = None):
         """Add variables from a specific layer."""
@@ -183,6 +419,7 @@ class FormulaVariableResolver:
         
         # Clear cache when variables are modified
         self.resolved_cache.clear()
+        self._programs.clear()
     
     def get_variable_definition(self, name: str) -> Optional[VariableDefinition]:
         """Get the highest-priority definition of a variable."""
@@ -250,7 +487,7 @@ class FormulaVariableResolver:
                 if var_def.dependencies:
                     # Has dependencies, try to parse and evaluate as formula
                     try:
-                        ast = self.parser.parse(value)
+                        formula = self.parser.compile(value)
                         
                         # Build evaluation context with resolved dependencies
                         eval_context = {}
@@ -262,7 +499,7 @@ class FormulaVariableResolver:
                         if context:
                             eval_context.update(context)
                         
-                        result = self.parser.evaluate(ast, eval_context)
+                        result = formula(eval_context)
                     except CircularDependencyError:
                         # Re-raise circular dependency errors without wrapping
                         raise
@@ -312,6 +549,59 @@ class FormulaVariableResolver:
         
         return results
     
+    def optimize(self, inputs: Iterable[str] = ()) -> FormulaProgram:
+        """
+        Compile all variables into a FormulaProgram for repeated evaluation.
+        
+        Args:
+            inputs: Names supplied per evaluation; formulas read these from the
+                    context even when a layer defines them. Names no layer
+                    defines are inputs as well.
+        
+        Returns:
+            Optimized program (cached until variables change)
+        
+        Raises:
+            CircularDependencyError: If variables depend on each other
+            ValueError: If a formula fails regardless of the inputs
+        """
+        input_names = frozenset(inputs)
+        program = self._programs.get(input_names)
+        if program is not None:
+            return program
+        
+        builder = _ProgramBuilder()
+        outputs: Dict[str, int] = {}
+        
+        def resolve_name(dep_name: str) -> int:
+            if dep_name in input_names or dep_name not in outputs:
+                return builder.input(dep_name)
+            return outputs[dep_name]
+        
+        for name in self.build_dependency_graph().topological_sort():
+            var_def = self.variables.get(name)
+            if var_def is None:
+                continue
+            
+            value = var_def.value
+            if isinstance(value, (int, float, EMUValue)):
+                outputs[name] = builder.constant(value)
+            elif isinstance(value, str):
+                if not var_def.dependencies:
+                    # Literal string value
+                    outputs[name] = builder.constant(value)
+                    continue
+                try:
+                    outputs[name] = builder.from_ast(self.parser.compile(value).ast, resolve_name)
+                except Exception as e:
+                    raise ValueError(f"Failed to evaluate formula for variable '{name}': {value}. Error: {e}")
+            else:
+                raise ValueError(f"Unsupported value type for variable '{name}': {type(value)}")
+        
+        program = FormulaProgram(builder.nodes, outputs)
+        self._programs[input_names] = program
+        return program
+    
     def invalidate_cache(self, variable_names: Optional[Set[str]] = None):
         """
         Invalidate cached values for specific variables or all variables.
@@ -319,6 +609,7 @@ class FormulaVariableResolver:
         Args:
             variable_names: Set of variable names to invalidate, or None for all
         """
+        self._programs.clear()
         if variable_names is None:
             # Clear entire cache
             self.resolved_cache.clear()
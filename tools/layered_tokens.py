@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+StyleStack Layered Token Maps
+
+Persistent, structurally shared view over a stack of token layers
+(Core → Fork → Org → Group → Personal → Channel, or a token tree plus an
+aspect-ratio overlay). Lookups search the layers from the top down with the
+same semantics as a recursive deep merge:
+
+- when the top-most value for a key is a mapping, it is merged with the
+  mappings below it until a layer holds a non-mapping value for that key
+- any other value replaces whatever the lower layers hold
+
+Adding a layer never copies the layers below it, so a variant costs memory
+proportional to the paths it overrides. ``to_dict()`` materializes the merged
+tree copy-on-write: only nodes that several layers contribute to are
+allocated, untouched subtrees are shared with the source layers exactly as
+``deep_merge`` shares them.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple
+
+_MISSING = object()
+
+
+class _OverrideLayer(dict):
+    """Nested dict built from dot-path overrides (may hold _Replace leaves)"""
+
+
+class _Replace:
+    """Mapping set through a path override: replaces lower layers instead of merging"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Mapping):
+        self.value = value
+
+
+class LayeredTokenMap(Mapping):
+    """Read-only deep-merge view over token layers, lowest precedence first"""
+
+    __slots__ = ('_layers',)
+
+    def __init__(self, *layers: Mapping):
+        # Stored highest precedence first; nested layered maps are spliced in
+        stacked = []
+        for layer in reversed(layers):
+            if isinstance(layer, LayeredTokenMap):
+                stacked.extend(layer._layers)
+            elif layer:
+                stacked.append(layer)
+        self._layers: Tuple[Mapping, ...] = tuple(stacked)
+
+    @classmethod
+    def _from_stack(cls, stack: Tuple[Mapping, ...]) -> 'LayeredTokenMap':
+        layered = cls.__new__(cls)
+        layered._layers = stack
+        return layered
+
+    @property
+    def depth(self) -> int:
+        """Number of layers contributing to this view"""
+        return len(self._layers)
+
+    def new_child(self, layer: Mapping) -> 'LayeredTokenMap':
+        """New view with a nested-dict layer on top; this view is unchanged"""
+        if not layer:
+            return self
+        return LayeredTokenMap._from_stack((layer,) + self._layers)
+
+    def with_overrides(self, overrides: Mapping) -> 'LayeredTokenMap':
+        """New view with dot-path overrides (e.g. ``{"colors.primary": "#0066CC"}``) on top
+
+        A path override replaces the value at its path outright, even when
+        both the override and the current value are mappings.
+        """
+        layer = _OverrideLayer()
+        for dot_path, value in overrides.items():
+            *parents, leaf = dot_path.split('.')
+            node = layer
+            for key in parents:
+                child = node.get(key)
+                if not isinstance(child, _OverrideLayer):
+                    child = node[key] = _OverrideLayer()
+                node = child
+            node[leaf] = _Replace(value) if isinstance(value, Mapping) else value
+        return self.new_child(layer)
+
+    def __getitem__(self, key: str) -> Any:
+        found = []
+        for layer in self._layers:
+            value = layer.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            if isinstance(value, _Replace):
+                found.append(value.value)
+                break
+            if not isinstance(value, Mapping):
+                if found:
+                    break
+                return value
+            found.append(value)
+
+        if not found:
+            raise KeyError(key)
+        if len(found) == 1 and not isinstance(found[0], _OverrideLayer):
+            return found[0]
+        return LayeredTokenMap._from_stack(tuple(found))
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self) -> Iterator[str]:
+        # Same key order as successive dict merges: base keys, then new keys per layer
+        seen = set()
+        for layer in reversed(self._layers):
+            for key in layer:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def get_path(self, dot_path: str, default: Any = None) -> Any:
+        """Look up a dot-notation path (e.g. ``colors.primary.500``)"""
+        current: Any = self
+        for key in dot_path.split('.'):
+            if not isinstance(current, Mapping) or key not in current:
+                return default
+            current = current[key]
+        return current
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the merged tree, sharing subtrees only one layer provides"""
+        result = {}
+        for key in self:
+            value = self[key]
+            result[key] = value.to_dict() if isinstance(value, LayeredTokenMap) else value
+        return result
+
+    def __repr__(self) -> str:
+        return f"LayeredTokenMap(depth={self.depth}, keys={len(self)})"
+
+
+def layered_merge(base: Mapping, *overrides: Mapping) -> Dict[str, Any]:
+    """Deep-merge token layers into a plain dict without copying untouched subtrees"""
+    return LayeredTokenMap(base, *overrides).to_dict()
+
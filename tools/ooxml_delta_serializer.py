@@ -11,18 +11,36 @@ Features:
 - OOXML property filtering to exclude inherited values
 - Cross-platform property mapping (Word, PowerPoint, Excel)
 - Property validation and conflict resolution
+- Batch style sheet serialization (Word styles.xml, PowerPoint txStyles) as one lxml tree
 """
 
+import copy
 import logging
 import math
-from typing import Dict, Any, List, Optional, Set, Tuple, Union
+from typing import Dict, Any, BinaryIO, Callable, Iterable, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
-from tools.style_inheritance_core import InheritedTypographyToken, BaseStyleDefinition
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    LXML_AVAILABLE = False
+
+from tools.style_inheritance_core import InheritedTypographyToken, BaseStyleDefinition, TOKEN_STYLE_PROPERTIES
 
 logger = logging.getLogger(__name__)
 
+# Namespaces of the style sheets built by OOXMLStyleSheetSerializer
+STYLE_SHEET_NAMESPACES = {
+    "word": {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"},
+    "powerpoint": {
+        "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+        "a": "http://schemas.openxmlformats.org/drawingml/2006/main"
+    }
+}
+
 
 class PropertyType(Enum):
     """Types of typography properties for serialization"""
@@ -483,9 +501,199 @@ class OOXMLDeltaSerializer:
         return report
 
 
+@dataclass
+class _ElementTemplate:
+    """Pre-built element for one property mapping"""
+    target: OOXMLPropertyTarget
+    element: Any
+    value_attributes: List[Tuple[str, str]]
+    value_converter: Optional[Callable[[Any], Any]]
+    is_flag: bool
+    order: int
+
+
+class OOXMLStyleSheetSerializer:
+    """
+    Batch serializer for complete style sheets
+
+    Builds a Word styles.xml or a slide master txStyles from resolved tokens as
+    a single lxml tree. The element for every property mapping is built once
+    and copied per style, so nothing is formatted as strings or parsed back.
+    """
+
+    # Property containers per platform, in schema order
+    CONTAINERS = {
+        "word": [
+            (OOXMLPropertyTarget.PARAGRAPH_PROPERTIES, "w:pPr"),
+            (OOXMLPropertyTarget.RUN_PROPERTIES, "w:rPr")
+        ],
+        "powerpoint": [
+            (OOXMLPropertyTarget.TEXT_PROPERTIES, "a:defRPr")
+        ]
+    }
+
+    ROOT_ELEMENTS = {
+        "word": "w:styles",
+        "powerpoint": "p:txStyles"
+    }
+
+    # Child order inside w:rPr (CT_RPr sequence); other children keep mapping order
+    WORD_RUN_PROPERTY_ORDER = ["rFonts", "b", "i", "spacing", "sz"]
+
+    def __init__(self, delta_serializer: Optional[OOXMLDeltaSerializer] = None,
+                 style_id_sanitizer: Optional[Callable[[str], str]] = None):
+        """Initialize batch serializer
+
+        Args:
+            delta_serializer: Source of the property mappings (default: new OOXMLDeltaSerializer)
+            style_id_sanitizer: Maps token ids to OOXML style ids (default: unchanged)
+        """
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml is required for batch style sheet serialization")
+
+        self.delta_serializer = delta_serializer or OOXMLDeltaSerializer()
+        self.style_id_sanitizer = style_id_sanitizer or (lambda style_id: style_id)
+        self._templates = {platform: self._build_templates(platform) for platform in STYLE_SHEET_NAMESPACES}
+
+    def _qualify(self, name: str, platform: str) -> str:
+        """Clark notation for a prefixed OOXML name"""
+        prefix, _, local_name = name.rpartition(":")
+        if not prefix:
+            return local_name
+        return f"{{{STYLE_SHEET_NAMESPACES[platform][prefix]}}}{local_name}"
+
+    def _build_templates(self, platform: str) -> Dict[str, List[_ElementTemplate]]:
+        """Pre-build one element per property mapping of the platform"""
+        templates = {}
+        for property_type, mappings in self.delta_serializer.property_mappings.items():
+            for mapping in mappings:
+                if platform not in mapping.platforms:
+                    continue
+
+                local_name = mapping.ooxml_element.rpartition(":")[2]
+                order = (self.WORD_RUN_PROPERTY_ORDER.index(local_name)
+                         if platform == "word" and local_name in self.WORD_RUN_PROPERTY_ORDER
+                         else len(self.WORD_RUN_PROPERTY_ORDER))
+
+                element = etree.Element(self._qualify(mapping.ooxml_element, platform))
+                value_attributes = []
+                for attr_name, attr_template in mapping.attributes.items():
+                    if "{value}" in attr_template:
+                        value_attributes.append((self._qualify(attr_name, platform), attr_template))
+                    else:
+                        element.set(self._qualify(attr_name, platform), attr_template)
+
+                templates.setdefault(property_type.value, []).append(_ElementTemplate(
+                    target=mapping.target,
+                    element=element,
+                    value_attributes=value_attributes,
+                    value_converter=mapping.value_converter,
+                    is_flag=not mapping.attributes,
+                    order=order
+                ))
+        return templates
+
+    def _render(self, template: _ElementTemplate, prop: str, value: Any) -> Optional[Any]:
+        """Copy of the template element for a property value, or None if it is not emitted"""
+        converted_value = value
+        if template.value_converter:
+            try:
+                converted_value = template.value_converter(value)
+            except Exception as e:
+                logger.warning(f"Value conversion failed for {prop}: {e}")
+                return None
+
+        # Flags (<w:b/>) are only suppressed by an explicit False
+        if converted_value is False or (converted_value is None and not template.is_flag):
+            return None
+
+        element = copy.deepcopy(template.element)
+        for attr_name, attr_template in template.value_attributes:
+            element.set(attr_name, attr_template.format(value=converted_value))
+        return element
+
+    def style_properties(self, token: InheritedTypographyToken) -> Tuple[bool, Dict[str, Any]]:
+        """Whether the token is serialized as a delta style, and the properties to serialize"""
+        if token.should_generate_delta() and token.base_style:
+            return True, {prop: value for prop, value in token.delta_properties.items() if prop != "emu"}
+
+        properties = {}
+        for token_attr, style_prop in TOKEN_STYLE_PROPERTIES.items():
+            value = getattr(token, token_attr)
+            if value is not None:
+                properties[style_prop] = value
+        return False, properties
+
+    def build_style_sheet(self, tokens: Iterable[InheritedTypographyToken], platform: str = "word"):
+        """Build the style sheet root element for all tokens in one pass
+
+        Args:
+            tokens: Resolved tokens, in output order
+            platform: 'word' (w:styles) or 'powerpoint' (p:txStyles)
+
+        Returns:
+            lxml root element
+        """
+        platform = platform.lower()
+        if platform not in STYLE_SHEET_NAMESPACES:
+            raise ValueError(f"Unsupported platform for batch style sheets: {platform}")
+
+        root = etree.Element(self._qualify(self.ROOT_ELEMENTS[platform], platform),
+                             nsmap=STYLE_SHEET_NAMESPACES[platform])
+        for token in tokens:
+            self._append_style(root, token, platform)
+        return root
+
+    def write_style_sheet(self, tokens: Iterable[InheritedTypographyToken], output: BinaryIO,
+                          platform: str = "word") -> None:
+        """Serialize the style sheet straight to a binary stream or file path"""
+        root = self.build_style_sheet(tokens, platform)
+        etree.ElementTree(root).write(output, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+    def _append_style(self, parent, token: InheritedTypographyToken, platform: str) -> None:
+        is_delta, properties = self.style_properties(token)
+        style_name = token.id.replace('_', ' ').title()
+
+        if platform == "word":
+            style = etree.SubElement(parent, self._qualify("w:style", platform), {
+                self._qualify("w:type", platform): "paragraph",
+                self._qualify("w:styleId", platform): self.style_id_sanitizer(token.id)
+            })
+            etree.SubElement(style, self._qualify("w:name", platform)).set(self._qualify("w:val", platform), style_name)
+            if is_delta:
+                etree.SubElement(style, self._qualify("w:basedOn", platform)).set(
+                    self._qualify("w:val", platform), self.style_id_sanitizer(token.base_style)
+                )
+        else:
+            style = etree.SubElement(parent, self._qualify("a:lvl1pPr", platform))
+            if is_delta:
+                style.append(etree.Comment(f" PowerPoint style: {style_name} based on "
+                                           f"{self.style_id_sanitizer(token.base_style)} "))
+            else:
+                style.append(etree.Comment(f" PowerPoint complete style: {style_name} "))
+
+        rendered = {target: [] for target, _ in self.CONTAINERS[platform]}
+        templates = self._templates[platform]
+        for prop, value in properties.items():
+            for template in templates.get(prop, ()):
+                element = self._render(template, prop, value)
+                if element is not None:
+                    rendered[template.target].append((template.order, element))
+
+        for target, container_name in self.CONTAINERS[platform]:
+            children = rendered[target]
+            # PowerPoint text styles always carry their run properties element
+            if not children and platform == "word":
+                continue
+            container = etree.SubElement(style, self._qualify(container_name, platform))
+            for _, element in sorted(children, key=lambda item: item[0]):
+                container.append(element)
+
+
 # Export main classes
 __all__ = [
     'OOXMLDeltaSerializer',
+    'OOXMLStyleSheetSerializer',
     'PropertyDelta',
     'PropertyType',
     'OOXMLPropertyTarget',
@@ -11,12 +11,13 @@ Features:
 - Multi-platform support (PowerPoint, Word, Excel)
 - OOXML namespace handling and XML well-formedness validation
 - Style ID sanitization for OOXML compatibility
+- Single-pass style sheet generation written straight to an output stream
 - Integration with StyleStack inheritance resolution system
 """
 
 import logging
 import re
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, BinaryIO, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -28,7 +29,9 @@ except ImportError:
     LXML_AVAILABLE = False
 
 from tools.style_inheritance_core import InheritedTypographyToken, InheritanceMode
-from tools.ooxml_delta_serializer import OOXMLDeltaSerializer, OOXMLPropertyTarget
+from tools.ooxml_delta_serializer import (
+    OOXMLDeltaSerializer, OOXMLPropertyTarget, OOXMLStyleSheetSerializer, STYLE_SHEET_NAMESPACES
+)
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +104,7 @@ class OOXMLInheritanceGenerator:
         self.use_lxml = use_lxml if use_lxml is not None else LXML_AVAILABLE
         self.namespaces = OOXMLNamespaces.get_default_namespaces()
         self.delta_serializer = OOXMLDeltaSerializer()
+        self._style_sheet_serializer = None
 
         # EMU conversion constants
         self.EMU_PER_POINT = 12700
@@ -481,14 +485,27 @@ class OOXMLInheritanceGenerator:
             "validation_errors": validation_errors
         }
 
+    @property
+    def style_sheet_serializer(self) -> OOXMLStyleSheetSerializer:
+        """Batch serializer sharing this generator's property mappings"""
+        if self._style_sheet_serializer is None:
+            self._style_sheet_serializer = OOXMLStyleSheetSerializer(self.delta_serializer, self._sanitize_style_id)
+        return self._style_sheet_serializer
+
+    def _uses_batch_serializer(self, platform: str) -> bool:
+        return self.use_lxml and LXML_AVAILABLE and platform.lower() in STYLE_SHEET_NAMESPACES
+
     def generate_style_sheet_with_inheritance(self, tokens: List[InheritedTypographyToken],
                                             platform: str = "word") -> str:
         """Generate complete OOXML style sheet with inheritance hierarchy"""
-        style_xmls = []
-
         # Sort tokens by inheritance depth to ensure proper ordering
         sorted_tokens = sorted(tokens, key=lambda t: t.inheritance_depth or 0)
 
+        if self._uses_batch_serializer(platform):
+            root = self.style_sheet_serializer.build_style_sheet(sorted_tokens, platform)
+            return etree.tostring(root, encoding='unicode')
+
+        style_xmls = []
         for token in sorted_tokens:
             result = self.generate_style_xml_with_inheritance(token, platform)
             if result.is_valid:
@@ -499,6 +516,22 @@ class OOXMLInheritanceGenerator:
         # Wrap in appropriate platform-specific container
         return self._wrap_styles_in_container(style_xmls, platform)
 
+    def write_style_sheet_with_inheritance(self, tokens: List[InheritedTypographyToken], output: BinaryIO,
+                                           platform: str = "word") -> None:
+        """Write a complete OOXML style sheet (with XML declaration) to a binary stream
+
+        Word styles.xml and PowerPoint txStyles are serialized from a single
+        lxml tree without building intermediate strings.
+        """
+        if self._uses_batch_serializer(platform):
+            sorted_tokens = sorted(tokens, key=lambda t: t.inheritance_depth or 0)
+            self.style_sheet_serializer.write_style_sheet(sorted_tokens, output, platform)
+            return
+
+        xml_content = self.generate_style_sheet_with_inheritance(tokens, platform)
+        output.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+        output.write(xml_content.encode('utf-8'))
+
     def _wrap_styles_in_container(self, style_xmls: List[str], platform: str) -> str:
         """Wrap individual style XMLs in platform-specific container"""
         styles_content = '\n'.join(style_xmls)
@@ -11,10 +11,18 @@ Features:
 - Cross-platform compatibility and consistent behavior
 - Platform-specific XML structure generation
 - Namespace management for each Office application
+- Single-pass generation for all platforms from one platform-neutral style form
+
+Usage:
+    generator = MultiPlatformOOXMLGenerator()
+    outputs = generator.generate_all_platforms(resolved_tokens, max_workers=3)
+    styles_xml = outputs["word"]
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Set, Tuple, Union
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Type, Union
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -33,6 +41,124 @@ from tools.ooxml_delta_serializer import OOXMLDeltaSerializer, PropertyDelta
 logger = logging.getLogger(__name__)
 
 
+def _extract_points(size_value: Any) -> Optional[float]:
+    """Extract numeric points from size value"""
+    if isinstance(size_value, str) and size_value.endswith('pt'):
+        try:
+            return float(size_value[:-2])
+        except ValueError:
+            return None
+    elif isinstance(size_value, (int, float)):
+        return float(size_value)
+    return None
+
+
+def _is_bold_weight(weight: Any) -> bool:
+    """Check if weight represents bold"""
+    if isinstance(weight, int):
+        return weight >= 600
+    elif isinstance(weight, str):
+        return weight.lower() in ["bold", "semibold", "extrabold"]
+    return False
+
+
+def _extract_color_hex(color_value: Any) -> Optional[str]:
+    """Extract hex color value"""
+    if isinstance(color_value, str):
+        if color_value.startswith('#'):
+            return color_value[1:]
+        elif len(color_value) == 6 and all(c in '0123456789ABCDEFabcdef' for c in color_value):
+            return color_value.upper()
+    return None
+
+
+def _em_to_twentieths(spacing_value: Any) -> Optional[int]:
+    """Convert em spacing to twentieths of a point"""
+    if isinstance(spacing_value, str) and spacing_value.endswith('em'):
+        try:
+            em_value = float(spacing_value[:-2])
+            # Rough conversion: 1em ≈ 12pt
+            return int(em_value * 12 * 20)
+        except ValueError:
+            return None
+    return None
+
+
+def _line_height_to_emu(line_height: Any, font_size: Any = None) -> Optional[int]:
+    """Convert line height to EMU format"""
+    if isinstance(line_height, str) and line_height.endswith('pt'):
+        try:
+            points = float(line_height[:-2])
+            return int(points * 12700)  # EMU per point
+        except ValueError:
+            return None
+    elif isinstance(line_height, (int, float)) and font_size:
+        # Relative line height
+        font_points = _extract_points(font_size) or 12
+        return int(line_height * font_points * 12700)
+    return None
+
+
+@dataclass
+class NeutralPropertySet:
+    """Typography properties with every platform unit conversion done once"""
+    properties: Dict[str, Any]
+    font_size_points: Optional[float] = None
+    is_bold: bool = False
+    is_italic: bool = False
+    color_hex: Optional[str] = None
+    letter_spacing_twentieths: Optional[int] = None
+    line_height_emu: Optional[int] = None
+
+    @classmethod
+    def from_properties(cls, properties: Dict[str, Any], font_size: Any = None) -> 'NeutralPropertySet':
+        """Convert properties (in token order); font_size resolves relative line heights"""
+        return cls(
+            properties=properties,
+            font_size_points=_extract_points(properties.get("fontSize")),
+            is_bold=_is_bold_weight(properties.get("fontWeight")),
+            is_italic=properties.get("fontStyle") == "italic",
+            color_hex=_extract_color_hex(properties.get("color")),
+            letter_spacing_twentieths=_em_to_twentieths(properties.get("letterSpacing")),
+            line_height_emu=_line_height_to_emu(properties.get("lineHeight"), font_size)
+        )
+
+
+@dataclass
+class PlatformNeutralStyle:
+    """Resolved token in the form every platform handler emits its XML from"""
+    token_id: str
+    base_style: Optional[str]
+    generates_delta: bool
+    inheritance_depth: int
+    is_paragraph: bool
+    delta: NeutralPropertySet
+    complete: NeutralPropertySet
+
+    @property
+    def uses_inheritance(self) -> bool:
+        """Whether the style is emitted as a delta on its base style"""
+        return self.generates_delta and bool(self.base_style)
+
+    @classmethod
+    def from_token(cls, token: InheritedTypographyToken) -> 'PlatformNeutralStyle':
+        delta_properties = {prop: value for prop, value in (token.delta_properties or {}).items() if prop != "emu"}
+        return cls(
+            token_id=token.id,
+            base_style=token.base_style,
+            generates_delta=token.should_generate_delta(),
+            inheritance_depth=token.inheritance_depth or 0,
+            is_paragraph=bool(token.line_height),
+            delta=NeutralPropertySet.from_properties(delta_properties, token.font_size),
+            complete=NeutralPropertySet.from_properties({
+                "fontFamily": token.font_family,
+                "fontSize": token.font_size,
+                "fontWeight": token.font_weight,
+                "fontStyle": token.font_style
+            }, token.font_size)
+        )
+
+
 @dataclass
 class PlatformSpecification:
     """Platform-specific OOXML specifications"""
@@ -59,14 +185,13 @@ class OOXMLPlatformHandler(ABC):
         pass
 
     @abstractmethod
-    def generate_inheritance_xml(self, token: InheritedTypographyToken,
-                               base_style_id: str) -> str:
-        """Generate platform-specific inheritance XML"""
+    def render_inheritance_style(self, style: PlatformNeutralStyle, base_style_id: str) -> str:
+        """Generate platform-specific inheritance XML from a platform-neutral style"""
         pass
 
     @abstractmethod
-    def generate_complete_xml(self, token: InheritedTypographyToken) -> str:
-        """Generate platform-specific complete style XML"""
+    def render_complete_style(self, style: PlatformNeutralStyle) -> str:
+        """Generate platform-specific complete style XML from a platform-neutral style"""
         pass
 
     @abstractmethod
@@ -74,20 +199,39 @@ class OOXMLPlatformHandler(ABC):
         """Wrap individual styles in platform-specific container"""
         pass
 
-    def validate_platform_compatibility(self, token: InheritedTypographyToken) -> List[str]:
-        """Validate token compatibility with platform"""
+    def render_style(self, style: PlatformNeutralStyle) -> str:
+        """Generate inheritance or complete XML, whichever the style calls for"""
+        if style.uses_inheritance:
+            return self.render_inheritance_style(style, style.base_style)
+        return self.render_complete_style(style)
+
+    def generate_inheritance_xml(self, token: InheritedTypographyToken,
+                               base_style_id: str) -> str:
+        """Generate platform-specific inheritance XML"""
+        return self.render_inheritance_style(PlatformNeutralStyle.from_token(token), base_style_id)
+
+    def generate_complete_xml(self, token: InheritedTypographyToken) -> str:
+        """Generate platform-specific complete style XML"""
+        return self.render_complete_style(PlatformNeutralStyle.from_token(token))
+
+    def validate_style_compatibility(self, style: PlatformNeutralStyle) -> List[str]:
+        """Validate style compatibility with platform"""
         issues = []
 
-        if not self.platform_spec.supported_inheritance and token.should_generate_delta():
+        if not self.platform_spec.supported_inheritance and style.generates_delta:
             issues.append(f"Platform {self.platform_spec.platform_name} does not support inheritance")
 
         if (self.platform_spec.max_inheritance_depth and
-            token.inheritance_depth and
-            token.inheritance_depth > self.platform_spec.max_inheritance_depth):
-            issues.append(f"Inheritance depth {token.inheritance_depth} exceeds platform limit")
+            style.inheritance_depth and
+            style.inheritance_depth > self.platform_spec.max_inheritance_depth):
+            issues.append(f"Inheritance depth {style.inheritance_depth} exceeds platform limit")
 
         return issues
 
+    def validate_platform_compatibility(self, token: InheritedTypographyToken) -> List[str]:
+        """Validate token compatibility with platform"""
+        return self.validate_style_compatibility(PlatformNeutralStyle.from_token(token))
+
 
 class PowerPointOOXMLHandler(OOXMLPlatformHandler):
     """PowerPoint-specific OOXML inheritance handler"""
@@ -104,11 +248,10 @@ class PowerPointOOXMLHandler(OOXMLPlatformHandler):
             max_inheritance_depth=5
         )
 
-    def generate_inheritance_xml(self, token: InheritedTypographyToken,
-                               base_style_id: str) -> str:
+    def render_inheritance_style(self, style: PlatformNeutralStyle, base_style_id: str) -> str:
         """Generate PowerPoint text style with inheritance"""
-        style_level = self._determine_style_level(token)
-        delta_props = self._build_powerpoint_delta_properties(token)
+        style_level = self._determine_style_level(style)
+        delta_props = self._build_powerpoint_properties(style.delta)
 
         return f"""<a:lvl{style_level}pPr xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
     <!-- Inherits from: {base_style_id} -->
@@ -117,10 +260,10 @@ class PowerPointOOXMLHandler(OOXMLPlatformHandler):
     </a:defRPr>
 </a:lvl{style_level}pPr>"""
 
-    def generate_complete_xml(self, token: InheritedTypographyToken) -> str:
+    def render_complete_style(self, style: PlatformNeutralStyle) -> str:
         """Generate complete PowerPoint text style"""
-        style_level = self._determine_style_level(token)
-        complete_props = self._build_powerpoint_complete_properties(token)
+        style_level = self._determine_style_level(style)
+        complete_props = self._build_powerpoint_properties(style.complete)
 
         return f"""<a:lvl{style_level}pPr xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
     <a:defRPr>
@@ -177,99 +320,42 @@ class PowerPointOOXMLHandler(OOXMLPlatformHandler):
     </p:txStyles>
 </p:sldMaster>"""
 
-    def _determine_style_level(self, token: InheritedTypographyToken) -> int:
-        """Determine PowerPoint style level (1-9) from token"""
+    def _determine_style_level(self, style: PlatformNeutralStyle) -> int:
+        """Determine PowerPoint style level (1-9) from style"""
         # Use inheritance depth or analyze token properties
-        if token.inheritance_depth:
-            return min(token.inheritance_depth + 1, 9)
+        if style.inheritance_depth:
+            return min(style.inheritance_depth + 1, 9)
         else:
             return 1  # Default to level 1
 
-    def _build_powerpoint_delta_properties(self, token: InheritedTypographyToken) -> str:
-        """Build PowerPoint-specific delta properties"""
+    def _build_powerpoint_properties(self, property_set: NeutralPropertySet) -> str:
+        """Build PowerPoint-specific properties in property order"""
         props = []
 
-        if token.delta_properties:
-            for prop, value in token.delta_properties.items():
-                if prop == "fontSize" and value:
-                    # PowerPoint uses hundredths of a point
-                    points = self._extract_points(value)
-                    if points:
-                        props.append(f'        <a:sz val="{int(points * 100)}"/>')
-
-                elif prop == "fontFamily" and value:
-                    props.append(f'        <a:latin typeface="{value}"/>')
-                    props.append(f'        <a:ea typeface="{value}"/>')
-                    props.append(f'        <a:cs typeface="{value}"/>')
-
-                elif prop == "fontWeight" and value:
-                    if self._is_bold_weight(value):
-                        props.append('        <a:b val="1"/>')
-
-                elif prop == "fontStyle" and value == "italic":
-                    props.append('        <a:i val="1"/>')
-
-                elif prop == "color" and value:
-                    color_hex = self._extract_color_hex(value)
-                    if color_hex:
-                        props.append(f'        <a:solidFill><a:srgbClr val="{color_hex}"/></a:solidFill>')
-
-        return '\n'.join(props)
-
-    def _build_powerpoint_complete_properties(self, token: InheritedTypographyToken) -> str:
-        """Build PowerPoint-specific complete properties"""
-        props = []
+        for prop, value in property_set.properties.items():
+            if prop == "fontSize" and value:
+                # PowerPoint uses hundredths of a point
+                if property_set.font_size_points:
+                    props.append(f'        <a:sz val="{int(property_set.font_size_points * 100)}"/>')
 
-        # Font family
-        if token.font_family:
-            props.append(f'        <a:latin typeface="{token.font_family}"/>')
-            props.append(f'        <a:ea typeface="{token.font_family}"/>')
-            props.append(f'        <a:cs typeface="{token.font_family}"/>')
+            elif prop == "fontFamily" and value:
+                props.append(f'        <a:latin typeface="{value}"/>')
+                props.append(f'        <a:ea typeface="{value}"/>')
+                props.append(f'        <a:cs typeface="{value}"/>')
 
-        # Font size
-        if token.font_size:
-            points = self._extract_points(token.font_size)
-            if points:
-                props.append(f'        <a:sz val="{int(points * 100)}"/>')
+            elif prop == "fontWeight" and value:
+                if property_set.is_bold:
+                    props.append('        <a:b val="1"/>')
 
-        # Font weight
-        if token.font_weight and self._is_bold_weight(token.font_weight):
-            props.append('        <a:b val="1"/>')
+            elif prop == "fontStyle" and property_set.is_italic:
+                props.append('        <a:i val="1"/>')
 
-        # Font style
-        if token.font_style == "italic":
-            props.append('        <a:i val="1"/>')
+            elif prop == "color" and value:
+                if property_set.color_hex:
+                    props.append(f'        <a:solidFill><a:srgbClr val="{property_set.color_hex}"/></a:solidFill>')
 
         return '\n'.join(props)
 
-    def _extract_points(self, size_value: Any) -> Optional[float]:
-        """Extract numeric points from size value"""
-        if isinstance(size_value, str) and size_value.endswith('pt'):
-            try:
-                return float(size_value[:-2])
-            except ValueError:
-                return None
-        elif isinstance(size_value, (int, float)):
-            return float(size_value)
-        return None
-
-    def _is_bold_weight(self, weight: Any) -> bool:
-        """Check if weight represents bold"""
-        if isinstance(weight, int):
-            return weight >= 600
-        elif isinstance(weight, str):
-            return weight.lower() in ["bold", "semibold", "extrabold"]
-        return False
-
-    def _extract_color_hex(self, color_value: Any) -> Optional[str]:
-        """Extract hex color value"""
-        if isinstance(color_value, str):
-            if color_value.startswith('#'):
-                return color_value[1:]
-            elif len(color_value) == 6 and all(c in '0123456789ABCDEFabcdef' for c in color_value):
-                return color_value.upper()
-        return None
-
 
 class WordOOXMLHandler(OOXMLPlatformHandler):
     """Word-specific OOXML inheritance handler"""
@@ -286,14 +372,13 @@ class WordOOXMLHandler(OOXMLPlatformHandler):
             max_inheritance_depth=10
         )
 
-    def generate_inheritance_xml(self, token: InheritedTypographyToken,
-                               base_style_id: str) -> str:
+    def render_inheritance_style(self, style: PlatformNeutralStyle, base_style_id: str) -> str:
         """Generate Word paragraph style with inheritance"""
-        style_id = self._sanitize_style_id(token.id)
-        style_name = token.id.replace('_', ' ').title()
-        style_type = self._determine_word_style_type(token)
+        style_id = self._sanitize_style_id(style.token_id)
+        style_name = style.token_id.replace('_', ' ').title()
+        style_type = self._determine_word_style_type(style)
 
-        delta_props = self._build_word_delta_properties(token)
+        delta_props = self._build_word_properties(style.delta)
 
         return f"""<w:style w:type="{style_type}" w:styleId="{style_id}">
     <w:name w:val="{style_name}"/>
@@ -301,13 +386,14 @@ class WordOOXMLHandler(OOXMLPlatformHandler):
 {delta_props}
 </w:style>"""
 
-    def generate_complete_xml(self, token: InheritedTypographyToken) -> str:
+    def render_complete_style(self, style: PlatformNeutralStyle) -> str:
         """Generate complete Word style"""
-        style_id = self._sanitize_style_id(token.id)
-        style_name = token.id.replace('_', ' ').title()
-        style_type = self._determine_word_style_type(token)
+        style_id = self._sanitize_style_id(style.token_id)
+        style_name = style.token_id.replace('_', ' ').title()
+        style_type = self._determine_word_style_type(style)
 
-        complete_props = self._build_word_complete_properties(token)
+        # Similar to delta properties but include all properties
+        complete_props = self._build_word_properties(style.delta)  # Simplified for now
 
         return f"""<w:style w:type="{style_type}" w:styleId="{style_id}">
     <w:name w:val="{style_name}"/>
@@ -322,124 +408,62 @@ class WordOOXMLHandler(OOXMLPlatformHandler):
 {styles_content}
 </w:styles>"""
 
-    def _determine_word_style_type(self, token: InheritedTypographyToken) -> str:
+    def _determine_word_style_type(self, style: PlatformNeutralStyle) -> str:
         """Determine Word style type (paragraph, character, table, numbering)"""
         # Analyze token properties to determine appropriate type
-        if hasattr(token, 'line_height') and token.line_height:
+        if style.is_paragraph:
             return "paragraph"
         else:
             return "character"
 
-    def _build_word_delta_properties(self, token: InheritedTypographyToken) -> str:
-        """Build Word-specific delta properties"""
+    def _build_word_properties(self, property_set: NeutralPropertySet) -> str:
+        """Build Word-specific properties"""
         rpr_props = []
         ppr_props = []
 
-        if token.delta_properties:
-            for prop, value in token.delta_properties.items():
-                # Run properties (rPr)
-                if prop == "fontFamily" and value:
-                    rpr_props.append(f'        <w:rFonts w:ascii="{value}" w:hAnsi="{value}"/>')
+        for prop, value in property_set.properties.items():
+            # Run properties (rPr)
+            if prop == "fontFamily" and value:
+                rpr_props.append(f'        <w:rFonts w:ascii="{value}" w:hAnsi="{value}"/>')
 
-                elif prop == "fontSize" and value:
-                    half_points = self._points_to_half_points(value)
-                    if half_points:
-                        rpr_props.append(f'        <w:sz w:val="{half_points}"/>')
+            elif prop == "fontSize" and value:
+                if property_set.font_size_points:
+                    rpr_props.append(f'        <w:sz w:val="{int(property_set.font_size_points * 2)}"/>')
 
-                elif prop == "fontWeight" and value:
-                    if self._is_bold_weight(value):
-                        rpr_props.append('        <w:b/>')
+            elif prop == "fontWeight" and value:
+                if property_set.is_bold:
+                    rpr_props.append('        <w:b/>')
 
-                elif prop == "fontStyle" and value == "italic":
-                    rpr_props.append('        <w:i/>')
+            elif prop == "fontStyle" and property_set.is_italic:
+                rpr_props.append('        <w:i/>')
 
-                elif prop == "letterSpacing" and value:
-                    twentieths = self._em_to_twentieths(value)
-                    if twentieths:
-                        rpr_props.append(f'        <w:spacing w:val="{twentieths}"/>')
+            elif prop == "letterSpacing" and value:
+                if property_set.letter_spacing_twentieths:
+                    rpr_props.append(f'        <w:spacing w:val="{property_set.letter_spacing_twentieths}"/>')
 
-                # Paragraph properties (pPr)
-                elif prop == "lineHeight" and value:
-                    emu_value = self._line_height_to_emu(value, token.font_size)
-                    if emu_value:
-                        ppr_props.append(f'        <w:spacing w:line="{emu_value}" w:lineRule="exact"/>')
+            # Paragraph properties (pPr)
+            elif prop == "lineHeight" and value:
+                if property_set.line_height_emu:
+                    ppr_props.append(f'        <w:spacing w:line="{property_set.line_height_emu}" w:lineRule="exact"/>')
 
         # Build properties sections
         props_sections = []
         if rpr_props:
-            props_sections.append(f"    <w:rPr>\n{''.join('\n' + prop for prop in rpr_props)}\n    </w:rPr>")
+            rpr_content = ''.join('\n' + prop for prop in rpr_props)
+            props_sections.append(f"    <w:rPr>\n{rpr_content}\n    </w:rPr>")
         if ppr_props:
-            props_sections.append(f"    <w:pPr>\n{''.join('\n' + prop for prop in ppr_props)}\n    </w:pPr>")
+            ppr_content = ''.join('\n' + prop for prop in ppr_props)
+            props_sections.append(f"    <w:pPr>\n{ppr_content}\n    </w:pPr>")
 
         return '\n'.join(props_sections)
 
-    def _build_word_complete_properties(self, token: InheritedTypographyToken) -> str:
-        """Build Word-specific complete properties"""
-        # Similar to delta properties but include all properties
-        return self._build_word_delta_properties(token)  # Simplified for now
-
     def _sanitize_style_id(self, style_id: str) -> str:
         """Sanitize style ID for Word compatibility"""
-        import re
         sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', style_id)
         if sanitized and not (sanitized[0].isalpha() or sanitized[0] == '_'):
             sanitized = f"style_{sanitized}"
         return sanitized or "default_style"
 
-    def _points_to_half_points(self, size_value: Any) -> Optional[int]:
-        """Convert points to Word half-points format"""
-        if isinstance(size_value, str) and size_value.endswith('pt'):
-            try:
-                points = float(size_value[:-2])
-                return int(points * 2)
-            except ValueError:
-                return None
-        return None
-
-    def _em_to_twentieths(self, spacing_value: Any) -> Optional[int]:
-        """Convert em spacing to twentieths of a point"""
-        if isinstance(spacing_value, str) and spacing_value.endswith('em'):
-            try:
-                em_value = float(spacing_value[:-2])
-                # Rough conversion: 1em ≈ 12pt
-                return int(em_value * 12 * 20)
-            except ValueError:
-                return None
-        return None
-
-    def _line_height_to_emu(self, line_height: Any, font_size: Any = None) -> Optional[int]:
-        """Convert line height to EMU format"""
-        if isinstance(line_height, str) and line_height.endswith('pt'):
-            try:
-                points = float(line_height[:-2])
-                return int(points * 12700)  # EMU per point
-            except ValueError:
-                return None
-        elif isinstance(line_height, (int, float)) and font_size:
-            # Relative line height
-            font_points = self._extract_points(font_size) or 12
-            return int(line_height * font_points * 12700)
-        return None
-
-    def _is_bold_weight(self, weight: Any) -> bool:
-        """Check if weight represents bold"""
-        if isinstance(weight, int):
-            return weight >= 600
-        elif isinstance(weight, str):
-            return weight.lower() in ["bold", "semibold", "extrabold"]
-        return False
-
-    def _extract_points(self, size_value: Any) -> Optional[float]:
-        """Extract numeric points from size value"""
-        if isinstance(size_value, str) and size_value.endswith('pt'):
-            try:
-                return float(size_value[:-2])
-            except ValueError:
-                return None
-        elif isinstance(size_value, (int, float)):
-            return float(size_value)
-        return None
-
 
 class ExcelOOXMLHandler(OOXMLPlatformHandler):
     """Excel-specific OOXML inheritance handler"""
@@ -456,20 +480,19 @@ class ExcelOOXMLHandler(OOXMLPlatformHandler):
             max_inheritance_depth=1
         )
 
-    def generate_inheritance_xml(self, token: InheritedTypographyToken,
-                               base_style_id: str) -> str:
+    def render_inheritance_style(self, style: PlatformNeutralStyle, base_style_id: str) -> str:
         """Generate Excel cell style with reference to base style"""
         # Excel uses style references rather than true inheritance
-        delta_props = self._build_excel_delta_properties(token)
+        delta_props = self._build_excel_delta_properties(style.delta)
 
         return f"""<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0">
     <!-- Based on: {base_style_id} -->
 {delta_props}
 </xf>"""
 
-    def generate_complete_xml(self, token: InheritedTypographyToken) -> str:
+    def render_complete_style(self, style: PlatformNeutralStyle) -> str:
         """Generate complete Excel cell style"""
-        complete_props = self._build_excel_complete_properties(token)
+        complete_props = self._build_excel_complete_properties(style.complete)
 
         return f"""<xf numFmtId="0" fontId="0" fillId="0" borderId="0">
 {complete_props}
@@ -488,28 +511,51 @@ class ExcelOOXMLHandler(OOXMLPlatformHandler):
     </cellXfs>
 </styleSheet>"""
 
-    def _build_excel_delta_properties(self, token: InheritedTypographyToken) -> str:
+    def _build_excel_delta_properties(self, property_set: NeutralPropertySet) -> str:
         """Build Excel-specific delta properties"""
         props = []
 
-        if token.delta_properties:
-            # Excel properties are more limited
-            if any(prop in token.delta_properties for prop in ["fontWeight", "fontStyle"]):
-                props.append('    <applyFont val="1"/>')
+        # Excel properties are more limited
+        if any(prop in property_set.properties for prop in ["fontWeight", "fontStyle"]):
+            props.append('    <applyFont val="1"/>')
 
         return '\n'.join(props)
 
-    def _build_excel_complete_properties(self, token: InheritedTypographyToken) -> str:
+    def _build_excel_complete_properties(self, property_set: NeutralPropertySet) -> str:
         """Build Excel-specific complete properties"""
         props = []
 
         # Excel cell formatting is primarily handled through separate font, fill, and border definitions
-        if any([token.font_family, token.font_size, token.font_weight, token.font_style]):
+        if any(property_set.properties.values()):
             props.append('    <applyFont val="1"/>')
 
         return '\n'.join(props)
 
 
+def _emit_platform_styles(handler: OOXMLPlatformHandler, styles: List[PlatformNeutralStyle]) -> str:
+    """Platform XML for styles that were resolved once for all platforms"""
+    style_xmls = []
+
+    for style in styles:
+        # Validate platform compatibility
+        issues = handler.validate_style_compatibility(style)
+        if issues:
+            logger.warning(f"Platform compatibility issues for {style.token_id}: {issues}")
+
+        style_xmls.append(handler.render_style(style))
+
+    return handler.wrap_styles_in_container(style_xmls)
+
+
+def _emit_platform_or_report(platform_name: str, handler: OOXMLPlatformHandler,
+                             styles: List[PlatformNeutralStyle]) -> str:
+    try:
+        return _emit_platform_styles(handler, styles)
+    except Exception as e:
+        logger.error(f"Failed to generate OOXML for {platform_name}: {e}")
+        return f"<!-- Error generating {platform_name} OOXML: {e} -->"
+
+
 class MultiPlatformOOXMLGenerator:
     """Multi-platform OOXML inheritance generator"""
 
@@ -524,43 +570,59 @@ class MultiPlatformOOXMLGenerator:
 
         logger.info("🎨 Initialized Multi-Platform OOXML Generator")
 
+    def resolve_styles(self, tokens: Iterable[InheritedTypographyToken]) -> List[PlatformNeutralStyle]:
+        """Resolve tokens once into the platform-neutral form shared by all handlers"""
+        return [PlatformNeutralStyle.from_token(token) for token in tokens]
+
     def generate_for_platform(self, tokens: List[InheritedTypographyToken],
                             platform: str) -> str:
         """Generate OOXML for specific platform"""
         if platform not in self.handlers:
             raise ValueError(f"Unsupported platform: {platform}")
 
-        handler = self.handlers[platform]
-        style_xmls = []
+        return _emit_platform_styles(self.handlers[platform], self.resolve_styles(tokens))
 
-        for token in tokens:
-            # Validate platform compatibility
-            issues = handler.validate_platform_compatibility(token)
-            if issues:
-                logger.warning(f"Platform compatibility issues for {token.id}: {issues}")
-
-            # Generate appropriate XML
-            if token.should_generate_delta() and token.base_style:
-                xml = handler.generate_inheritance_xml(token, token.base_style)
-            else:
-                xml = handler.generate_complete_xml(token)
+    def generate_all_platforms(self, tokens: List[InheritedTypographyToken],
+                               platforms: Optional[List[str]] = None,
+                               max_workers: Optional[int] = None) -> Dict[str, str]:
+        """Generate OOXML for several platforms from a single resolution pass
 
-            style_xmls.append(xml)
+        Inheritance decisions and unit conversions are computed once per token;
+        each handler then only emits its own XML.
 
-        return handler.wrap_styles_in_container(style_xmls)
+        Args:
+            tokens: Resolved typography tokens
+            platforms: Platform names (default: all registered handlers)
+            max_workers: Emit platforms in a process pool of this size (None or 1 emits serially)
 
-    def generate_for_all_platforms(self, tokens: List[InheritedTypographyToken]) -> Dict[str, str]:
-        """Generate OOXML for all supported platforms"""
-        results = {}
+        Returns:
+            Platform name -> OOXML; a platform that fails yields an XML comment with the error
+        """
+        platforms = list(platforms) if platforms is not None else list(self.handlers)
+        unsupported = [platform for platform in platforms if platform not in self.handlers]
+        if unsupported:
+            raise ValueError(f"Unsupported platform: {', '.join(unsupported)}")
 
-        for platform_name in self.handlers.keys():
-            try:
-                results[platform_name] = self.generate_for_platform(tokens, platform_name)
-            except Exception as e:
-                logger.error(f"Failed to generate OOXML for {platform_name}: {e}")
-                results[platform_name] = f"<!-- Error generating {platform_name} OOXML: {e} -->"
+        styles = self.resolve_styles(tokens)
 
-        return results
+        workers = min(max_workers or 1, len(platforms))
+        if workers <= 1:
+            outputs = [_emit_platform_or_report(platform, self.handlers[platform], styles)
+                       for platform in platforms]
+        else:
+            handler_types = {platform: type(self.handlers[platform]) for platform in platforms}
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_platform_worker,
+                initargs=(handler_types, styles)
+            ) as executor:
+                outputs = list(executor.map(_emit_platform_in_worker, platforms))
+
+        return dict(zip(platforms, outputs))
+
+    def generate_for_all_platforms(self, tokens: List[InheritedTypographyToken]) -> Dict[str, str]:
+        """Generate OOXML for all supported platforms"""
+        return self.generate_all_platforms(tokens)
 
     def get_platform_capabilities(self) -> Dict[str, Dict[str, Any]]:
         """Get capabilities summary for all platforms"""
@@ -579,6 +641,25 @@ class MultiPlatformOOXMLGenerator:
         return capabilities
 
 
+# Process-pool workers: each worker receives the resolved styles once through
+# the pool initializer and builds its own handlers
+
+_worker_handlers: Dict[str, OOXMLPlatformHandler] = {}
+_worker_styles: List[PlatformNeutralStyle] = []
+
+
+def _init_platform_worker(handler_types: Dict[str, Type[OOXMLPlatformHandler]],
+                          styles: List[PlatformNeutralStyle]) -> None:
+    global _worker_handlers, _worker_styles
+    delta_serializer = OOXMLDeltaSerializer()
+    _worker_handlers = {platform: handler_type(delta_serializer) for platform, handler_type in handler_types.items()}
+    _worker_styles = styles
+
+
+def _emit_platform_in_worker(platform: str) -> str:
+    return _emit_platform_or_report(platform, _worker_handlers[platform], _worker_styles)
+
+
 # Export main classes
 __all__ = [
     'MultiPlatformOOXMLGenerator',
@@ -586,5 +667,7 @@ __all__ = [
     'WordOOXMLHandler',
     'ExcelOOXMLHandler',
     'OOXMLPlatformHandler',
-    'PlatformSpecification'
-]
\ No newline at end of file
+    'PlatformSpecification',
+    'PlatformNeutralStyle',
+    'NeutralPropertySet'
+]
@@ -9,7 +9,9 @@ Features:
 - Namespace-aware XML processing 
 - Document structure preservation
 - Safe manipulation without corruption
+- In-memory integrity checks (full re-parse only in paranoid mode)
 - Performance optimization for large documents
+- Streaming serialization of parts directly into the output package
 - Integration with variable resolution engine
 
 Usage:
@@ -24,11 +26,12 @@ Usage:
 
 from typing import Dict, List, Any, Optional, Union, Tuple
 import xml.etree.ElementTree as ET
-from tools.xml_utils import indent_xml
+from tools.xml_utils import indent_xml, write_xml_to_zip
 import zipfile
 from pathlib import Path
 from dataclasses import dataclass
 import logging
+import re
 import time
 
 # Optional lxml import for advanced XPath
@@ -196,6 +199,26 @@ class XPathLibrary:
         }
 
 
+# Expected root element local name per package part. Local names are used so
+# Transitional and Strict namespaces are both accepted.
+PART_ROOT_ELEMENTS = [
+    (re.compile(r"^\[Content_Types\]\.xml$"), "Types"),
+    (re.compile(r"\.rels$"), "Relationships"),
+    (re.compile(r"^ppt/presentation\.xml$"), "presentation"),
+    (re.compile(r"^ppt/slides/slide\d+\.xml$"), "sld"),
+    (re.compile(r"^ppt/slideLayouts/slideLayout\d+\.xml$"), "sldLayout"),
+    (re.compile(r"^ppt/slideMasters/slideMaster\d+\.xml$"), "sldMaster"),
+    (re.compile(r"(^|/)theme/theme\d+\.xml$"), "theme"),
+    (re.compile(r"^word/document\.xml$"), "document"),
+    (re.compile(r"^word/styles\.xml$"), "styles"),
+    (re.compile(r"^xl/workbook\.xml$"), "workbook"),
+    (re.compile(r"^xl/styles\.xml$"), "styleSheet"),
+]
+
+# Characters that are not allowed anywhere in an XML 1.0 document
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
 class OOXMLProcessor:
     """
     Advanced OOXML document processor with XPath targeting and safe manipulation.
@@ -208,16 +231,21 @@ class OOXMLProcessor:
     - Error recovery and validation
     """
     
-    def __init__(self, use_lxml: bool = None, preserve_formatting: bool = True):
+    def __init__(self, use_lxml: bool = None, preserve_formatting: bool = False,
+                 paranoid_validation: bool = False):
         """
         Initialize OOXML processor.
         
         Args:
             use_lxml: Use lxml for advanced XPath (auto-detect if None)
-            preserve_formatting: Preserve XML formatting and whitespace
+            preserve_formatting: Pretty-print serialized XML. Off by default since
+                indentation inflates part sizes and deflate time.
+            paranoid_validation: Additionally re-parse serialized output to check
+                well-formedness (doubles parse cost)
         """
         self.use_lxml = use_lxml if use_lxml is not None else LXML_AVAILABLE
         self.preserve_formatting = preserve_formatting
+        self.paranoid_validation = paranoid_validation
         self.xpath_library = XPathLibrary()
         
         # Processing statistics
@@ -258,19 +286,25 @@ class OOXMLProcessor:
         
         try:
             # Parse XML
+            root = self._parse_xml_string(xml_content)
+            baseline = self._capture_tree_baseline(root) if validate_result else None
+            
             if self.use_lxml:
-                updated_xml, lxml_result = self._apply_variables_lxml(xml_content, variables)
-                result.elements_processed = lxml_result.elements_processed
-                result.elements_modified = lxml_result.elements_modified
+                tree_result = self._apply_variables_to_tree_lxml(root, variables)
             else:
-                updated_xml, et_result = self._apply_variables_elementtree(xml_content, variables)
-                result.elements_processed = et_result.elements_processed  
-                result.elements_modified = et_result.elements_modified
+                tree_result = self._apply_variables_to_tree_elementtree(root, variables)
+            result.elements_processed = tree_result.elements_processed
+            result.elements_modified = tree_result.elements_modified
             
-            # Validate result if requested
+            # Cheap in-memory checks run on the tree before it is serialized
             if validate_result:
-                validation_errors = self._validate_xml_integrity(xml_content, updated_xml)
-                result.errors.extend(validation_errors)
+                result.errors.extend(self._validate_tree_integrity(root, baseline=baseline))
+            
+            updated_xml = self._serialize_tree(root)
+            
+            # Full re-parse of the serialized output only in paranoid mode
+            if validate_result and self.paranoid_validation:
+                result.errors.extend(self._validate_xml_integrity(xml_content, updated_xml))
             
             result.success = len(result.errors) == 0
             result.processing_time = time.time() - start_time
@@ -290,12 +324,24 @@ class OOXMLProcessor:
             logger.error(f"OOXML processing failed: {e}")
             return xml_content, result  # Return original on error
     
-    def _apply_variables_lxml(self, xml_content: str, 
-                             variables: Dict[str, Any]) -> Tuple[str, ProcessingResult]:
-        """Apply variables using lxml for advanced XPath support"""
-        parser = etree.XMLParser(ns_clean=True, recover=True)
-        root = etree.fromstring(xml_content.encode("utf-8"), parser)
+    def _parse_xml_string(self, xml_content: str):
+        """Parse XML text with the configured backend"""
+        if self.use_lxml:
+            parser = etree.XMLParser(ns_clean=True, recover=True)
+            return etree.fromstring(xml_content.encode("utf-8"), parser)
+        return ET.fromstring(xml_content)
+    
+    def _serialize_tree(self, root) -> str:
+        """Serialize a tree back to XML text with the configured backend"""
+        if self.use_lxml:
+            return etree.tostring(root, encoding="unicode", pretty_print=self.preserve_formatting)
         
+        if self.preserve_formatting:
+            indent_xml(root)
+        return ET.tostring(root, encoding="unicode")
+    
+    def _apply_variables_to_tree_lxml(self, root, variables: Dict[str, Any]) -> ProcessingResult:
+        """Apply variables in place to a parsed lxml tree"""
         result = ProcessingResult(
             success=True,
             elements_processed=0,
@@ -325,15 +371,11 @@ class OOXMLProcessor:
                 result.errors.append(f"Error processing variable {var_id}: {e}")
                 continue
         
-        # Serialize result
-        updated_xml = etree.tostring(root, encoding="unicode", pretty_print=self.preserve_formatting)
-        return updated_xml, result
+        return result
     
-    def _apply_variables_elementtree(self, xml_content: str,
-                                   variables: Dict[str, Any]) -> Tuple[str, ProcessingResult]:
-        """Apply variables using ElementTree with simplified XPath"""
-        root = ET.fromstring(xml_content)
-        
+    def _apply_variables_to_tree_elementtree(self, root: ET.Element,
+                                            variables: Dict[str, Any]) -> ProcessingResult:
+        """Apply variables in place to a parsed ElementTree tree"""
         result = ProcessingResult(
             success=True,
             elements_processed=0,
@@ -355,12 +397,7 @@ class OOXMLProcessor:
                 result.errors.append(f"Error processing variable {var_id}: {e}")
                 continue
         
-        # Serialize result
-        if self.preserve_formatting:
-            indent_xml(root)
-        
-        updated_xml = ET.tostring(root, encoding="unicode")
-        return updated_xml, result
+        return result
     
     def _get_xpath_for_variable(self, variable: Dict[str, Any]) -> Optional[XPathExpression]:
         """Get XPath expression for variable"""
@@ -516,8 +553,81 @@ class OOXMLProcessor:
                 
         return modified_count
     
+    def _capture_tree_baseline(self, root) -> Dict[str, Any]:
+        """Record root tag and element count before substitution"""
+        return {
+            "root_tag": root.tag,
+            "element_count": sum(1 for node in root.iter() if isinstance(node.tag, str))
+        }
+    
+    def _validate_tree_integrity(self, root, part_name: Optional[str] = None,
+                                 baseline: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Validate integrity of an in-memory tree without serializing or re-parsing it.
+        
+        Checks namespace sanity, the required root element for known part types,
+        forbidden constructs (DOCTYPE, entity references, invalid characters) and,
+        when a baseline is given, that the structure was not changed.
+        
+        Args:
+            root: Root element of the processed tree (lxml or ElementTree)
+            part_name: Package part name used to look up the expected root element
+            baseline: Result of _capture_tree_baseline taken before substitution
+            
+        Returns:
+            List of integrity errors (empty if the tree is sound)
+        """
+        errors = []
+        is_lxml = LXML_AVAILABLE and isinstance(root, etree._Element)
+        
+        if is_lxml:
+            if root.getroottree().docinfo.doctype:
+                errors.append("Forbidden construct: DOCTYPE declaration")
+            for prefix, uri in root.nsmap.items():
+                if not uri:
+                    errors.append(f"Empty namespace URI for prefix '{prefix}'")
+        
+        element_count = 0
+        for node in root.iter():
+            tag = node.tag
+            if not isinstance(tag, str):
+                if is_lxml and isinstance(node, etree._Entity):
+                    errors.append(f"Forbidden construct: entity reference &{node.name};")
+                continue
+            
+            element_count += 1
+            if ":" in tag.rsplit("}", 1)[-1]:
+                errors.append(f"Unbound namespace prefix in element <{tag}>")
+            
+            for name, value in node.attrib.items():
+                if ":" in name.rsplit("}", 1)[-1]:
+                    errors.append(f"Unbound namespace prefix in attribute {name} of <{tag}>")
+                if INVALID_XML_CHARS.search(value):
+                    errors.append(f"Invalid XML character in attribute {name} of <{tag}>")
+            
+            if node.text and INVALID_XML_CHARS.search(node.text):
+                errors.append(f"Invalid XML character in text of <{tag}>")
+        
+        if part_name:
+            for pattern, local_name in PART_ROOT_ELEMENTS:
+                if pattern.search(part_name):
+                    if not root.tag.startswith("{"):
+                        errors.append(f"Root element <{root.tag}> of {part_name} has no namespace")
+                    elif root.tag.rsplit("}", 1)[-1] != local_name:
+                        errors.append(f"Unexpected root element for {part_name}: "
+                                      f"expected {local_name}, found {root.tag}")
+                    break
+        
+        if baseline:
+            if baseline["element_count"] != element_count:
+                errors.append(f"Element count changed: {baseline['element_count']} -> {element_count}")
+            if baseline["root_tag"] != root.tag:
+                errors.append(f"Root element changed: {baseline['root_tag']} -> {root.tag}")
+        
+        return errors
+    
     def _validate_xml_integrity(self, original_xml: str, updated_xml: str) -> List[str]:
-        """Validate XML integrity after processing"""
+        """Validate XML integrity after processing by re-parsing both documents (paranoid mode)"""
         errors = []
         
         try:
@@ -547,15 +657,21 @@ class OOXMLProcessor:
     def process_ooxml_file(self, input_path: Union[str, Path],
                           variables: Dict[str, Any],
                           output_path: Union[str, Path],
-                          target_files: Optional[List[str]] = None) -> ProcessingResult:
+                          target_files: Optional[List[str]] = None,
+                          validate_result: bool = True) -> ProcessingResult:
         """
         Process complete OOXML file with variable substitution.
         
+        Integrity checks run on each in-memory tree right before it is streamed
+        into the output package; written parts are only read back and re-parsed
+        when paranoid validation is enabled.
+        
         Args:
             input_path: Input OOXML file path
             variables: Variables to apply
             output_path: Output file path
             target_files: Specific files to process within OOXML (None = all XML files)
+            validate_result: Run integrity checks on processed parts
             
         Returns:
             ProcessingResult with overall statistics
@@ -568,6 +684,8 @@ class OOXMLProcessor:
             processing_time=0.0
         )
         
+        processed_parts = []
+        
         try:
             with zipfile.ZipFile(input_path, "r") as input_zip:
                 with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as output_zip:
@@ -580,32 +698,53 @@ class OOXMLProcessor:
                             (target_files is None or file_info.filename in target_files)):
                             
                             try:
-                                xml_content = file_data.decode("utf-8")
-                                updated_xml, file_result = self.apply_variables_to_xml(
-                                    xml_content, variables, validate_result=False
+                                root = self._parse_part(file_data)
+                            except Exception as e:
+                                overall_result.errors.append(
+                                    f"Processing failed for {file_info.filename}: {e}"
                                 )
-                                
-                                # Update overall statistics
-                                overall_result.elements_processed += file_result.elements_processed
-                                overall_result.elements_modified += file_result.elements_modified
-                                overall_result.errors.extend(file_result.errors)
-                                overall_result.warnings.extend(file_result.warnings)
-                                
-                                # Write updated content
-                                output_zip.writestr(file_info, updated_xml.encode("utf-8"))
-                                
-                                if file_result.elements_modified > 0:
-                                    logger.info(f"Processed {file_info.filename}: "
-                                             f"{file_result.elements_modified} modifications")
-                                
-                            except UnicodeDecodeError:
-                                # Not a text XML file, copy as-is
+                                root = None
+                            
+                            if root is None:
+                                # Not parseable XML, copy as-is
                                 output_zip.writestr(file_info, file_data)
+                                continue
+                            
+                            # Drop the raw bytes before the tree is mutated and written
+                            del file_data
+                            baseline = self._capture_tree_baseline(root) if validate_result else None
+                            file_result = self._apply_variables_to_part(root, variables)
+                            
+                            if validate_result:
+                                overall_result.errors.extend(
+                                    f"{file_info.filename}: {error}"
+                                    for error in self._validate_tree_integrity(
+                                        root, part_name=file_info.filename, baseline=baseline
+                                    )
+                                )
+                            
+                            # Update overall statistics
+                            overall_result.elements_processed += file_result.elements_processed
+                            overall_result.elements_modified += file_result.elements_modified
+                            overall_result.errors.extend(file_result.errors)
+                            overall_result.warnings.extend(file_result.warnings)
+                            
+                            # Stream the tree straight into the output entry
+                            write_xml_to_zip(output_zip, self._copy_zip_info(file_info), root,
+                                             pretty_print=self.preserve_formatting)
+                            processed_parts.append(file_info.filename)
+                            
+                            if file_result.elements_modified > 0:
+                                logger.info(f"Processed {file_info.filename}: "
+                                         f"{file_result.elements_modified} modifications")
                                 
                         else:
                             # Copy non-XML files as-is
                             output_zip.writestr(file_info, file_data)
             
+            if validate_result and self.paranoid_validation:
+                overall_result.errors.extend(self._reparse_written_parts(output_path, processed_parts))
+            
             overall_result.success = len(overall_result.errors) == 0
             overall_result.processing_time = time.time() - start_time
             
@@ -620,6 +759,50 @@ class OOXMLProcessor:
         
         return overall_result
     
+    def _parse_part(self, data: bytes):
+        """Parse raw part bytes into a tree root (None if the part is empty)"""
+        if self.use_lxml:
+            parser = etree.XMLParser(ns_clean=True, recover=True)
+            return etree.fromstring(data, parser)
+        return ET.fromstring(data)
+    
+    def _apply_variables_to_part(self, root, variables: Dict[str, Any]) -> ProcessingResult:
+        """Apply variables to a parsed package part and update statistics"""
+        start_time = time.time()
+        if self.use_lxml:
+            result = self._apply_variables_to_tree_lxml(root, variables)
+        else:
+            result = self._apply_variables_to_tree_elementtree(root, variables)
+        
+        result.success = len(result.errors) == 0
+        result.processing_time = time.time() - start_time
+        
+        self.stats["documents_processed"] += 1
+        self.stats["elements_modified"] += result.elements_modified
+        self.stats["total_processing_time"] += result.processing_time
+        return result
+    
+    def _reparse_written_parts(self, output_path: Union[str, Path],
+                               part_names: List[str]) -> List[str]:
+        """Read processed parts back from the output package and check well-formedness"""
+        errors = []
+        with zipfile.ZipFile(output_path, "r") as output_zip:
+            for part_name in part_names:
+                try:
+                    with output_zip.open(part_name) as stream:
+                        ET.parse(stream)
+                except ET.ParseError as e:
+                    errors.append(f"{part_name}: Updated XML is not valid: {e}")
+        return errors
+    
+    @staticmethod
+    def _copy_zip_info(file_info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+        """Create a fresh ZipInfo for writing that keeps name, timestamp and compression"""
+        out_info = zipfile.ZipInfo(file_info.filename, file_info.date_time)
+        out_info.compress_type = file_info.compress_type
+        out_info.external_attr = file_info.external_attr
+        return out_info
+    
     def get_processing_statistics(self) -> Dict[str, Any]:
         """Get processing statistics"""
         return {
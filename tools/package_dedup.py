@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+StyleStack OOXML Package Part Deduplication
+
+Content-addressed packaging stage for generated OOXML packages that carry
+media, fonts or embedded objects. Every part is hashed; when several parts carry
+byte-identical payloads, the first one becomes canonical, the copies are
+dropped, and the relationships that targeted a copy are redirected to the
+canonical part. OPC relationships may target any part of the same package,
+so the package stays valid.
+
+A part is only shared when doing so cannot change how the package is read:
+
+- only payload parts are shared: media, fonts and embeddings. Structural
+  parts (slide masters and layouts, themes, presentations) stay with their
+  owner, since e.g. PresentationML requires each layout to belong to exactly
+  one master
+- relationship parts (``_rels/*.rels``) and ``[Content_Types].xml`` are kept
+- parts named by a content-type Override are kept
+- parts that have relationships of their own are kept (their targets resolve
+  relative to their own location)
+- parts no relationship points at are kept (nothing could be redirected)
+- a copy is kept if any relationship targeting it cannot be rewritten
+- callers can pin further parts, e.g. per-variant parts
+
+Superthemes generated by SuperThemeGenerator hold only theme, master and
+layout parts, none of which can be shared, so the generator leaves this
+stage off unless dedupe_parts=True is passed.
+
+Usage:
+    parts, report = deduplicate_parts(parts, pinned=is_variant_owned_part)
+    print(f"Saved {report.bytes_saved} bytes")
+"""
+
+import hashlib
+import logging
+import posixpath
+import re
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES_PART = '[Content_Types].xml'
+
+# Package folders whose parts are plain payloads that any owner may reference
+SHAREABLE_PART_FOLDERS = frozenset({'media', 'fonts', 'embeddings'})
+
+# (part name, payload) in package order
+Part = Tuple[str, bytes]
+
+
+@dataclass
+class DedupReport:
+    """Outcome of a deduplication pass"""
+    parts_in: int = 0
+    parts_out: int = 0
+    duplicate_parts: int = 0
+    bytes_in: int = 0
+    bytes_saved: int = 0
+    redirected_relationships: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            'parts_in': self.parts_in,
+            'parts_out': self.parts_out,
+            'duplicate_parts': self.duplicate_parts,
+            'bytes_in': self.bytes_in,
+            'bytes_saved': self.bytes_saved,
+            'redirected_relationships': self.redirected_relationships,
+        }
+
+
+def is_relationship_part(part_name: str) -> bool:
+    return part_name.endswith('.rels') and '_rels/' in f"/{part_name}"
+
+
+def is_shareable_part(part_name: str) -> bool:
+    """Media, font and embedded-object parts; structural parts are never shared"""
+    return any(folder in SHAREABLE_PART_FOLDERS for folder in part_name.split('/')[:-1])
+
+
+def source_part_of(rels_name: str) -> str:
+    """Part a relationship part belongs to ('' for the package-level _rels/.rels)"""
+    directory, rels_file = posixpath.split(rels_name)
+    return posixpath.join(posixpath.dirname(directory), rels_file[:-len('.rels')]).lstrip('/')
+
+
+def rels_part_for(part_name: str) -> str:
+    directory, file_name = posixpath.split(part_name)
+    return posixpath.join(directory, '_rels', f"{file_name}.rels")
+
+
+def resolve_target(source_part: str, target: str) -> str:
+    """Package part name a relationship Target points at"""
+    if target.startswith('/'):
+        return posixpath.normpath(target).lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _relationship_targets(payload: bytes) -> List[str]:
+    # Matched by local name: some generators write the officeDocument namespace here
+    root = ET.fromstring(payload)
+    return [
+        rel.get('Target')
+        for rel in root.iter()
+        if _local_name(rel.tag) == 'Relationship'
+        and rel.get('Target') and rel.get('TargetMode') != 'External'
+    ]
+
+
+def _target_attribute_pattern(target: str) -> 're.Pattern':
+    """Target attribute holding target, single- or double-quoted, raw or XML-escaped"""
+    spellings = {target, escape(target), escape(target, {'"': '&quot;', "'": '&apos;'})}
+    alternatives = '|'.join(re.escape(spelling) for spelling in sorted(spellings))
+    return re.compile(rf"""\bTarget\s*=\s*(["'])(?:{alternatives})\1""")
+
+
+def _override_part_names(payload: bytes) -> Set[str]:
+    root = ET.fromstring(payload)
+    return {
+        override.get('PartName', '').lstrip('/')
+        for override in root.iter()
+        if _local_name(override.tag) == 'Override'
+    }
+
+
+def deduplicate_parts(parts: List[Part],
+                      pinned: Optional[Callable[[str], bool]] = None) -> Tuple[List[Part], DedupReport]:
+    """
+    Drop byte-identical duplicate parts and redirect relationships to the canonical copy
+
+    Args:
+        parts: Package parts in write order (the first copy of a payload is canonical)
+        pinned: Predicate for parts that must stay at their own location
+
+    Returns:
+        (parts to write, in the original order, DedupReport)
+    """
+    report = DedupReport(parts_in=len(parts), bytes_in=sum(len(payload) for _, payload in parts))
+    payloads = dict(parts)
+    names = payloads.keys()
+
+    # Who points at what
+    referenced: Set[str] = set()
+    rels_targets: Dict[str, List[Tuple[str, str]]] = {}
+    kept: Set[str] = set()
+    for name, payload in parts:
+        if name == CONTENT_TYPES_PART:
+            kept |= _override_part_names(payload)
+        elif is_relationship_part(name):
+            source = source_part_of(name)
+            try:
+                targets = _relationship_targets(payload)
+            except ET.ParseError:
+                # Its targets are unknown, so no part can safely be dropped
+                logger.warning(f"Unparseable relationship part {name}; skipping deduplication")
+                report.parts_out = len(parts)
+                return list(parts), report
+            rels_targets[name] = [(target, resolve_target(source, target)) for target in targets]
+            referenced.update(resolved for _, resolved in rels_targets[name])
+
+    def shareable(name: str) -> bool:
+        return (
+            is_shareable_part(name)
+            and not is_relationship_part(name)
+            and name in referenced
+            and name not in kept
+            and rels_part_for(name) not in names
+            and not (pinned and pinned(name))
+        )
+
+    # First copy of each payload is canonical
+    canonical_by_digest: Dict[str, str] = {}
+    canonical: Dict[str, str] = {}
+    for name, payload in parts:
+        if not shareable(name):
+            continue
+        digest = hashlib.sha256(payload).hexdigest()
+        first = canonical_by_digest.setdefault(digest, name)
+        if first != name:
+            canonical[name] = first
+
+    if not canonical:
+        report.parts_out = len(parts)
+        return list(parts), report
+
+    # Redirect relationships, then drop the copies
+    rewritten: Dict[str, bytes] = {}
+    unredirected: Set[str] = set()
+    redirected = 0
+    for rels_name, targets in rels_targets.items():
+        source = source_part_of(rels_name)
+        text = None
+        for target, resolved in dict.fromkeys(targets):
+            if resolved not in canonical:
+                continue
+            if text is None:
+                text = payloads[rels_name].decode('utf-8')
+            new_target = posixpath.relpath(canonical[resolved], posixpath.dirname(source) or '.')
+            text, count = _target_attribute_pattern(target).subn(f'Target="{escape(new_target)}"', text)
+            if count:
+                redirected += count
+            else:
+                # The copy stays, so this relationship still resolves
+                logger.warning(f"Could not redirect {target} in {rels_name}; keeping {resolved}")
+                unredirected.add(resolved)
+        if text is not None:
+            rewritten[rels_name] = text.encode('utf-8')
+            # Longer relative targets eat into the savings
+            report.bytes_saved -= len(rewritten[rels_name]) - len(payloads[rels_name])
+    report.redirected_relationships = redirected
+    for name in unredirected:
+        del canonical[name]
+
+    output = []
+    for name, payload in parts:
+        if name in canonical:
+            report.duplicate_parts += 1
+            report.bytes_saved += len(payload)
+            continue
+        output.append((name, rewritten.get(name, payload)))
+
+    report.parts_out = len(output)
+    return output, report
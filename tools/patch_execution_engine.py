@@ -21,6 +21,7 @@ from lxml import etree
 from .json_patch_parser import JSONPatchParser, ParsedPatch, ValidationLevel, PatchTarget
 from .core.types import PatchResult
 from .ooxml_processor import OOXMLProcessor as PatchProcessor
+from .reference_scanner import substitute
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -474,22 +475,16 @@ class PatchExecutionEngine:
             return targets
         
         try:
-            import re
-            
             # Variable substitution pattern: ${variable_name}
-            var_pattern = re.compile(r'\$\{([^}]+)\}')
+            def resolve_variable(var_name: str) -> Optional[str]:
+                if var_name in context.variables:
+                    return str(context.variables[var_name])
+                # Keep original if not found in context
+                return None
             
             def substitute_value(value: Any) -> Any:
                 if isinstance(value, str):
-                    def replace_var(match):
-                        var_name = match.group(1)
-                        if var_name in context.variables:
-                            return str(context.variables[var_name])
-                        else:
-                            # Keep original if not found in context
-                            return match.group(0)
-                    
-                    return var_pattern.sub(replace_var, value)
+                    return substitute(value, resolve_variable=resolve_variable)
                 elif isinstance(value, dict):
                     return {k: substitute_value(v) for k, v in value.items()}
                 elif isinstance(value, list):
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+StyleStack Colour Clustering Benchmark
+
+Compares grid-bucketed CIELAB clustering against the pairwise scan it
+replaced in DesignTokenExtractor, on synthetic palettes shaped like the ones
+extracted from legacy decks: a handful of brand colours plus long gradient
+ramps and chart series with small random jitter. The pairwise baseline is
+O(n²), so it is only run up to --max-pairwise colours.
+
+Usage:
+    python tools/performance/color_clustering_benchmark.py [--sizes 1000 5000 10000] [--seed 7]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.color_clustering import (
+    DEFAULT_DELTA_E_THRESHOLD, cluster_colors, delta_e, find_similar_color_pairs, parse_hex_color, rgb_to_lab
+)
+
+
+def synthetic_palette(size: int, seed: int = 7) -> List[str]:
+    """Brand colours, gradient ramps and jittered chart colours"""
+    rng = random.Random(seed)
+    palette = []
+    while len(palette) < size:
+        kind = rng.random()
+        start = [rng.randrange(256) for _ in range(3)]
+        if kind < 0.5:
+            # Gradient between two random colours
+            end = [rng.randrange(256) for _ in range(3)]
+            steps = rng.randint(8, 64)
+            for step in range(steps):
+                t = step / (steps - 1)
+                palette.append('#%02X%02X%02X' % tuple(round(a + (b - a) * t) for a, b in zip(start, end)))
+        else:
+            # Chart series re-coloured with slight variations
+            for _ in range(rng.randint(1, 12)):
+                palette.append('#%02X%02X%02X' % tuple(min(255, max(0, c + rng.randint(-6, 6))) for c in start))
+    return palette[:size]
+
+
+def pairwise_similar_pairs(colors: List[str], threshold: float) -> list:
+    labs = [rgb_to_lab(parse_hex_color(color)) for color in colors]
+    return [
+        (colors[i], colors[j])
+        for i in range(len(colors))
+        for j in range(i + 1, len(colors))
+        if delta_e(labs[i], labs[j]) < threshold
+    ]
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 10000])
+    parser.add_argument('--threshold', type=float, default=DEFAULT_DELTA_E_THRESHOLD)
+    parser.add_argument('--max-pairwise', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"📊 Colour clustering, ΔE < {args.threshold}")
+    for size in args.sizes:
+        palette = synthetic_palette(size, args.seed)
+        pairs, bucketed = _timed(lambda: find_similar_color_pairs(palette, args.threshold))
+        clusters, clustered = _timed(lambda: cluster_colors(palette, args.threshold))
+        line = (f"   {size:>6} colours  bucketed {bucketed * 1000:8.1f}ms  "
+                f"clusters {clustered * 1000:8.1f}ms  {len(pairs)} pairs, {len(clusters)} clusters")
+
+        if size <= args.max_pairwise:
+            expected, pairwise = _timed(lambda: pairwise_similar_pairs(palette, args.threshold))
+            if expected != pairs:
+                print(f"❌ Bucketed pairs differ from pairwise scan at {size} colours")
+                return 1
+            line += f"  | pairwise {pairwise * 1000:9.1f}ms ({pairwise / bucketed:.1f}x)"
+        print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+StyleStack Reference Scanner Benchmark
+
+Compares the shared reference scanner against the per-module regexes it
+replaced, over the string values of real token files. Each resolver and
+validator used to run its own pattern over every value; the scanner tokenizes
+a value once and every consumer reuses that scan. Bare extraction from short
+strings is slightly slower than a single C-level findall (one cache lookup per
+call); substitution, where the resolvers spend their time, is faster because
+the segments are already split.
+
+Usage:
+    python tools/performance/reference_scanner_benchmark.py [tokens/core] [--rounds 50]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.reference_scanner import clear_scan_cache, scan, scan_cache_info, substitute
+
+# Patterns previously compiled separately by each consumer
+LEGACY_PATTERNS = {
+    'token_resolver': re.compile(r'\{([^}]+)\}'),
+    'variable_resolver': re.compile(r'\{([^}]+)\}'),
+    'bulk_token_resolver': re.compile(r'\{([^}]+)\}'),
+    'w3c_dtcg_validator': re.compile(r'\{([a-zA-Z][a-zA-Z0-9._]*)\}'),
+    'patch_execution_engine': re.compile(r'\$\{([^}]+)\}'),
+}
+
+
+def iter_string_values(node) -> Iterator[str]:
+    if isinstance(node, str):
+        yield node
+    elif isinstance(node, dict):
+        for value in node.values():
+            yield from iter_string_values(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from iter_string_values(value)
+
+
+def load_token_strings(token_dir: Path) -> List[str]:
+    strings = []
+    for path in sorted(token_dir.rglob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            strings.extend(iter_string_values(json.load(f)))
+    return strings
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_benchmark(strings: List[str], rounds: int) -> Dict[str, float]:
+    """Time reference extraction and substitution, legacy regexes vs shared scans"""
+    resolved = {name: '#000000' for value in strings for name in scan(value).references}
+    lookup = resolved.get
+
+    def legacy_extract():
+        for _ in range(rounds):
+            for value in strings:
+                for pattern in LEGACY_PATTERNS.values():
+                    pattern.findall(value)
+
+    def shared_extract():
+        for _ in range(rounds):
+            for value in strings:
+                for _consumer in LEGACY_PATTERNS:
+                    scan(value).references
+
+    def legacy_substitute():
+        replace = lambda match: lookup(match.group(1), match.group(0))
+        for _ in range(rounds):
+            for value in strings:
+                for pattern in LEGACY_PATTERNS.values():
+                    pattern.sub(replace, value)
+
+    def shared_substitute():
+        for _ in range(rounds):
+            for value in strings:
+                for _consumer in LEGACY_PATTERNS:
+                    substitute(value, lookup, lookup)
+
+    clear_scan_cache()
+    return {
+        'legacy_extract': _timed(legacy_extract),
+        'shared_extract': _timed(shared_extract),
+        'legacy_substitute': _timed(legacy_substitute),
+        'shared_substitute': _timed(shared_substitute),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('token_dir', nargs='?', default=str(project_root / 'tokens' / 'core'))
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    strings = load_token_strings(Path(args.token_dir))
+    if not strings:
+        print(f"❌ No token strings found in {args.token_dir}")
+        return 1
+
+    timings = run_benchmark(strings, args.rounds)
+    info = scan_cache_info()
+
+    print(f"📊 {len(strings)} token strings x {args.rounds} rounds x {len(LEGACY_PATTERNS)} consumers")
+    for step in ('extract', 'substitute'):
+        legacy, shared = timings[f'legacy_{step}'], timings[f'shared_{step}']
+        print(f"   {step:<10} per-module regexes {legacy * 1000:7.1f}ms | "
+              f"shared scanner {shared * 1000:7.1f}ms | {legacy / shared:.2f}x")
+    print(f"   Scan cache:         {info.hits} hits, {info.misses} misses, {info.currsize} entries")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
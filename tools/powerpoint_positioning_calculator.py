@@ -10,9 +10,11 @@ import re
 import json
 from typing import Dict, Any, Union, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from tools.variable_resolver import VariableResolver
+from tools.emu_types import EMUArray
 from tools.core.types import ProcessingResult
 
 
@@ -45,6 +47,13 @@ class AspectRatioMultiplier:
             raise ValueError(f"Unsupported aspect ratio: {aspect_ratio}")
 
 
+@lru_cache(maxsize=None)
+def _slide_dimensions(aspect_ratio: str) -> Tuple[int, int]:
+    """Slide width and height in EMU, computed once per aspect ratio"""
+    multiplier = AspectRatioMultiplier(aspect_ratio)
+    return multiplier.slide_width_emu, multiplier.slide_height_emu
+
+
 @dataclass
 class ParameterizedPosition:
     """Represents a position with design token variables"""
@@ -92,14 +101,14 @@ class EMUCalculator:
     @staticmethod
     def percentage_to_emu_width(percentage: float, aspect_ratio: str) -> int:
         """Convert percentage to EMU width based on slide dimensions"""
-        multiplier = AspectRatioMultiplier(aspect_ratio)
-        return int(multiplier.slide_width_emu * percentage / 100.0)
+        slide_width_emu, _ = _slide_dimensions(aspect_ratio)
+        return int(slide_width_emu * percentage / 100.0)
     
     @staticmethod
     def percentage_to_emu_height(percentage: float, aspect_ratio: str) -> int:
         """Convert percentage to EMU height based on slide dimensions"""
-        multiplier = AspectRatioMultiplier(aspect_ratio)
-        return int(multiplier.slide_height_emu * percentage / 100.0)
+        _, slide_height_emu = _slide_dimensions(aspect_ratio)
+        return int(slide_height_emu * percentage / 100.0)
     
     @staticmethod
     def inches_to_emu(inches: float) -> int:
@@ -259,6 +268,16 @@ class PositioningCalculator:
             'height': int(base_position['height'] * self.multiplier.height_multiplier)
         }
     
+    def calculate_responsive_positions(self, base_positions: List[Dict[str, int]]) -> List[Dict[str, int]]:
+        """Calculate responsive positions for a whole layout library in one pass"""
+        height_multiplier = self.multiplier.height_multiplier
+        ys = EMUArray([position['y'] for position in base_positions]).scale(height_multiplier).to_list()
+        heights = EMUArray([position['height'] for position in base_positions]).scale(height_multiplier).to_list()
+        return [
+            {'x': position['x'], 'y': y, 'width': position['width'], 'height': height}
+            for position, y, height in zip(base_positions, ys, heights)
+        ]
+    
     def resolve_parameterized_layout(self, layout_data: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve complete parameterized layout to EMU values"""
         resolved_layout = layout_data.copy()
@@ -14,6 +14,7 @@ from tools.powerpoint_layout_engine import PowerPointLayoutEngine, create_powerp
 from tools.powerpoint_token_transformer import PowerPointTokenTransformer, create_powerpoint_token_transformer
 from tools.powerpoint_positioning_calculator import PositioningCalculator
 from tools.core.types import ProcessingResult
+from tools.layered_tokens import LayeredTokenMap, layered_merge
 
 # Import existing StyleStack components
 try:
@@ -50,7 +51,7 @@ class HierarchicalTokenResolver:
                                   template_context: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """Resolve design tokens through hierarchical layers"""
         try:
-            resolved_tokens = {}
+            layers = LayeredTokenMap()
             resolution_path = []
             
             # Build resolution context
@@ -63,7 +64,7 @@ class HierarchicalTokenResolver:
             # Layer 1: Global tokens (foundation)
             if "global" in design_tokens:
                 global_tokens = design_tokens["global"]
-                resolved_tokens.update(global_tokens)
+                layers = layers.new_child(global_tokens)
                 resolution_path.append("global")
                 if self.verbose:
                     print(f"✅ Applied global tokens: {len(global_tokens)} keys")
@@ -71,7 +72,7 @@ class HierarchicalTokenResolver:
             # Layer 2: Corporate tokens (brand-specific overrides)
             if "corporate" in design_tokens and org in design_tokens["corporate"]:
                 corporate_tokens = design_tokens["corporate"][org]
-                resolved_tokens = self._merge_token_layers(resolved_tokens, corporate_tokens)
+                layers = layers.new_child(corporate_tokens)
                 resolution_path.append(f"corporate.{org}")
                 if self.verbose:
                     print(f"✅ Applied corporate tokens for {org}: {len(corporate_tokens)} keys")
@@ -79,7 +80,7 @@ class HierarchicalTokenResolver:
             # Layer 3: Channel tokens (use-case specific)
             if "channel" in design_tokens and channel in design_tokens["channel"]:
                 channel_tokens = design_tokens["channel"][channel]
-                resolved_tokens = self._merge_token_layers(resolved_tokens, channel_tokens)
+                layers = layers.new_child(channel_tokens)
                 resolution_path.append(f"channel.{channel}")
                 if self.verbose:
                     print(f"✅ Applied channel tokens for {channel}: {len(channel_tokens)} keys")
@@ -89,11 +90,14 @@ class HierarchicalTokenResolver:
                 template_type = template_context.get("type", "presentation")
                 if template_type in design_tokens["template"]:
                     template_tokens = design_tokens["template"][template_type]
-                    resolved_tokens = self._merge_token_layers(resolved_tokens, template_tokens)
+                    layers = layers.new_child(template_tokens)
                     resolution_path.append(f"template.{template_type}")
                     if self.verbose:
                         print(f"✅ Applied template tokens for {template_type}: {len(template_tokens)} keys")
             
+            # Materialize once; subtrees a single layer provides are shared, not copied
+            resolved_tokens = layers.to_dict()
+            
             # Resolve token references using variable resolver
             if self.variable_resolver:
                 try:
@@ -130,22 +134,7 @@ class HierarchicalTokenResolver:
     
     def _merge_token_layers(self, base_tokens: Dict[str, Any], override_tokens: Dict[str, Any]) -> Dict[str, Any]:
         """Merge token layers with deep merging for nested structures"""
-        merged = base_tokens.copy()
-        
-        def deep_merge(base_dict: Dict[str, Any], override_dict: Dict[str, Any]) -> Dict[str, Any]:
-            result = base_dict.copy()
-            
-            for key, value in override_dict.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    # Deep merge nested dictionaries
-                    result[key] = deep_merge(result[key], value)
-                else:
-                    # Override value
-                    result[key] = value
-            
-            return result
-        
-        return deep_merge(merged, override_tokens)
+        return layered_merge(base_tokens, override_tokens)
 
 
 class PowerPointSuperThemeLayoutEngine:
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+StyleStack Token Reference Scanner
+
+Single tokenizer for the two reference syntaxes used across StyleStack:
+
+- ``{token.path}``  design-token references (resolvers, validators)
+- ``${variable}``   execution-context variables (patch engine)
+
+A string is scanned once into literal / reference / variable segments and the
+result is cached by string, so resolvers, validators and the patch engine all
+share one scan of each token value. Braces match innermost-first: in the
+nested form ``{base.{dynamic}.property}`` the segment is ``{dynamic}``.
+
+Usage:
+    scanned = scan("1px solid {colors.border}")
+    scanned.references            # ('colors.border',)
+    scanned.render(lambda path: resolved.get(path))
+"""
+
+import re
+import sys
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional, Tuple
+
+LITERAL = 'literal'
+REFERENCE = 'reference'
+VARIABLE = 'variable'
+
+SCAN_PATTERN = re.compile(r'\$\{([^{}]+)\}|\{([^{}]+)\}')
+# Dotted identifier path, e.g. colors.primary.500 (as the W3C validator requires)
+PATH_PATTERN = re.compile(r'[a-zA-Z][a-zA-Z0-9._]*')
+
+# Longer strings (whole XML parts, documents) are scanned but not cached
+MAX_CACHED_LENGTH = 1024
+SCAN_CACHE_SIZE = 65536
+
+Resolver = Callable[[str], Optional[object]]
+
+
+class Segment(NamedTuple):
+    """One piece of a scanned string"""
+    kind: str    # LITERAL, REFERENCE or VARIABLE
+    text: str    # Source text, including braces for references
+    name: str    # Reference path or variable name ('' for literals)
+    start: int   # Offset of the segment in the scanned string
+
+
+class ScannedText:
+    """Segments of a scanned string plus the reference names they contain"""
+
+    __slots__ = ('text', 'segments', 'references', 'paths', 'variables')
+
+    def __init__(self, text: str, segments: Tuple[Segment, ...]):
+        self.text = text
+        self.segments = segments
+        self.references: Tuple[str, ...] = tuple(
+            segment.name for segment in segments if segment.kind == REFERENCE
+        )
+        self.paths: Tuple[str, ...] = tuple(
+            name for name in self.references if PATH_PATTERN.fullmatch(name)
+        )
+        self.variables: Tuple[str, ...] = tuple(
+            segment.name for segment in segments if segment.kind == VARIABLE
+        )
+
+    @classmethod
+    def literal(cls, text: str) -> 'ScannedText':
+        """Scan result for a string without braces (skips segment analysis)"""
+        scanned = cls.__new__(cls)
+        scanned.text = text
+        scanned.segments = (Segment(LITERAL, text, '', 0),) if text else ()
+        scanned.references = scanned.paths = scanned.variables = ()
+        return scanned
+
+    @property
+    def has_references(self) -> bool:
+        return bool(self.references or self.variables)
+
+    def render(self, resolve_reference: Optional[Resolver] = None,
+               resolve_variable: Optional[Resolver] = None) -> str:
+        """Rebuild the string, substituting what the resolvers return
+
+        A resolver returning None leaves that segment's source text in place.
+        """
+        if not self.has_references:
+            return self.text
+
+        parts = []
+        for segment in self.segments:
+            resolver = None
+            if segment.kind == REFERENCE:
+                resolver = resolve_reference
+            elif segment.kind == VARIABLE:
+                resolver = resolve_variable
+
+            replacement = resolver(segment.name) if resolver is not None else None
+            parts.append(segment.text if replacement is None else str(replacement))
+        return ''.join(parts)
+
+    def __repr__(self) -> str:
+        return f"ScannedText({self.text!r}, references={self.references}, variables={self.variables})"
+
+
+def _scan(text: str) -> ScannedText:
+    if '{' not in text:
+        return ScannedText.literal(text)
+    segments = []
+    position = 0
+    for match in SCAN_PATTERN.finditer(text):
+        start = match.start()
+        if start > position:
+            segments.append(Segment(LITERAL, text[position:start], '', position))
+        variable_name, reference_name = match.groups()
+        if variable_name is not None:
+            segments.append(Segment(VARIABLE, match.group(0), sys.intern(variable_name), start))
+        else:
+            segments.append(Segment(REFERENCE, match.group(0), sys.intern(reference_name), start))
+        position = match.end()
+    if position < len(text):
+        segments.append(Segment(LITERAL, text[position:], '', position))
+    return ScannedText(text, tuple(segments))
+
+
+_scan_cached = lru_cache(maxsize=SCAN_CACHE_SIZE)(_scan)
+
+
+def scan(text: str) -> ScannedText:
+    """Tokenize a string into literal/reference/variable segments (cached)"""
+    if len(text) > MAX_CACHED_LENGTH:
+        return _scan(text)
+    return _scan_cached(text)
+
+
+def has_references(text: str) -> bool:
+    """Whether a string contains any {reference} or ${variable}"""
+    return '{' in text and scan(text).has_references
+
+
+def substitute(text: str, resolve_reference: Optional[Resolver] = None,
+               resolve_variable: Optional[Resolver] = None) -> str:
+    """Substitute references/variables in a string; unresolved ones stay verbatim"""
+    if '{' not in text:
+        return text
+    return scan(text).render(resolve_reference, resolve_variable)
+
+
+def clear_scan_cache() -> None:
+    _scan_cached.cache_clear()
+
+
+def scan_cache_info():
+    """functools cache statistics for the shared scan cache"""
+    return _scan_cached.cache_info()
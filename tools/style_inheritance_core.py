@@ -9,6 +9,7 @@ Features:
 - OOXML-style inheritance with basedOn references
 - Delta-only style generation for efficiency
 - Circular dependency detection and prevention
+- Whole-hierarchy resolution in one topological pass (resolve_hierarchy)
 - EMU precision maintenance through inheritance chains
 - Manual override support for complete style definitions
 """
@@ -20,6 +21,8 @@ from pathlib import Path
 from enum import Enum
 import json
 
+from tools.core.imports import DATACLASS_SLOTS
+
 # Import existing typography system for integration
 from tools.typography_token_system import (
     TypographyToken, EMUConversionEngine, BaselineGridEngine,
@@ -28,6 +31,25 @@ from tools.typography_token_system import (
 
 logger = logging.getLogger(__name__)
 
+# Token attribute -> OOXML style property
+TOKEN_STYLE_PROPERTIES = {
+    'font_family': 'fontFamily',
+    'font_size': 'fontSize',
+    'font_weight': 'fontWeight',
+    'line_height': 'lineHeight',
+    'letter_spacing': 'letterSpacing',
+    'font_style': 'fontStyle',
+    'text_decoration': 'textDecoration',
+    'text_transform': 'textTransform'
+}
+
+# Token EMU attribute -> OOXML style property
+TOKEN_EMU_PROPERTIES = {
+    'font_size_emu': 'fontSize',
+    'line_height_emu': 'lineHeight',
+    'letter_spacing_emu': 'letterSpacing'
+}
+
 
 class InheritanceMode(Enum):
     """Inheritance modes for typography tokens"""
@@ -71,7 +93,7 @@ class BaseStyleDefinition:
         return self.emu_calculated_properties.get(key)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InheritedTypographyToken(TypographyToken):
     """Enhanced typography token with inheritance support"""
     base_style: Optional[str] = None
@@ -271,20 +293,8 @@ class DeltaStyleGenerator:
         """Calculate property delta between token and base style"""
         delta = {}
 
-        # Property mapping for comparison
-        property_mapping = {
-            'font_family': 'fontFamily',
-            'font_size': 'fontSize',
-            'font_weight': 'fontWeight',
-            'line_height': 'lineHeight',
-            'letter_spacing': 'letterSpacing',
-            'font_style': 'fontStyle',
-            'text_decoration': 'textDecoration',
-            'text_transform': 'textTransform'
-        }
-
         # Compare each property
-        for token_attr, style_prop in property_mapping.items():
+        for token_attr, style_prop in TOKEN_STYLE_PROPERTIES.items():
             token_value = getattr(token, token_attr)
             base_value = base_style.get_property(style_prop)
 
@@ -414,6 +424,157 @@ class InheritanceResolver:
             logger.error(f"Missing base style for token {inherited_token.id}: {e}")
             return self._create_fallback_token(inherited_token)
 
+    def resolve_hierarchy(self, tokens: Dict[str, TypographyToken],
+                          inheritance_configs: Optional[Dict[str, Dict[str, Any]]] = None
+                          ) -> Dict[str, InheritedTypographyToken]:
+        """
+        Resolve inheritance for a whole token hierarchy in one pass
+
+        Tokens are visited in topological order (bases first), so each token's
+        effective style is computed once from its base's already resolved style
+        and cycles are found during the same walk. Unlike resolve_inheritance,
+        a token may inherit from another token of the set; its delta is then
+        taken against that token's effective style.
+
+        Args:
+            tokens: All tokens of the hierarchy by id
+            inheritance_configs: Optional inheritance configuration per token id
+
+        Returns:
+            Resolved tokens by id in input order; computed_full_style holds each
+            token's effective properties (EMU values under 'emu'). Tokens in a
+            cycle, with a missing base, past max_inheritance_depth or failing to
+            resolve fall back to a complete style on their own
+        """
+        inheritance_configs = inheritance_configs or {}
+
+        hierarchy: Dict[str, InheritedTypographyToken] = {}
+        for token_id, token in tokens.items():
+            config = inheritance_configs.get(token_id)
+            if isinstance(token, InheritedTypographyToken):
+                inherited_token = token
+            else:
+                inherited_token = self._convert_to_inherited_token(token, config)
+            self._analyze_inheritance_configuration(inherited_token, config)
+            hierarchy[token_id] = inherited_token
+
+        resolved: Dict[str, InheritedTypographyToken] = {}
+        # Tokens cut at max_inheritance_depth; tokens below them are cut as well
+        cut: Set[str] = set()
+        for token_id in hierarchy:
+            # Walk up until a resolved token, a registry style or a cycle; every
+            # token is walked once over the whole loop
+            path: List[str] = []
+            position: Dict[str, int] = {}
+            current = token_id
+            while current in hierarchy and current not in resolved and current not in position:
+                position[current] = len(path)
+                path.append(current)
+                current = self._hierarchy_base(hierarchy[current], hierarchy)
+
+            if current in position:
+                error = CircularInheritanceError(path[position[current]:] + [current])
+            elif current in resolved and resolved[current].has_circular_reference:
+                error = CircularInheritanceError(path + [current])
+            else:
+                error = None
+
+            if error:
+                # Tokens below a cycle never reach a base style either
+                for member in path:
+                    logger.error(f"Circular inheritance detected for token {member}: {error}")
+                    hierarchy[member].has_circular_reference = True
+                    resolved[member] = self._create_fallback_token(hierarchy[member])
+                    resolved[member].computed_full_style = self._effective_style(resolved[member], {}, {})
+                continue
+
+            for member in reversed(path):
+                try:
+                    resolved[member] = self._resolve_hierarchy_token(hierarchy[member], resolved, cut)
+                except Exception as e:
+                    # One bad token must not cost the others their inheritance
+                    logger.warning(f"Failed to resolve inheritance for token {member}: {e}")
+                    resolved[member] = self._create_fallback_token(hierarchy[member])
+                    resolved[member].computed_full_style = self._effective_style(resolved[member], {}, {})
+
+        return {token_id: resolved[token_id] for token_id in hierarchy}
+
+    def _hierarchy_base(self, token: InheritedTypographyToken,
+                        hierarchy: Dict[str, InheritedTypographyToken]) -> Optional[str]:
+        """Id of the token this token inherits from, if it inherits from a token"""
+        if token.is_complete_override() or token.base_style not in hierarchy:
+            return None
+        return token.base_style
+
+    def _resolve_hierarchy_token(self, token: InheritedTypographyToken,
+                                 resolved: Dict[str, InheritedTypographyToken],
+                                 cut: Set[str]) -> InheritedTypographyToken:
+        """Resolve one token whose base token (if any) is already resolved"""
+        if token.is_complete_override():
+            token = self._create_complete_style_token(token)
+            token.computed_full_style = self._effective_style(token, {}, {})
+            return token
+
+        if token.base_style in resolved:
+            base_token = resolved[token.base_style]
+            base_style = dict(base_token.computed_full_style or {})
+            base_definition = BaseStyleDefinition(
+                style_id=base_token.id,
+                style_type='paragraph',
+                default_properties=base_style,
+                emu_calculated_properties=base_style.pop('emu', {})
+            )
+            inheritance_chain = [token.id] + base_token.inheritance_chain
+        elif self.base_registry.has_style(token.base_style):
+            base_definition = self.base_registry.get_style(token.base_style)
+            inheritance_chain = [token.id]
+        else:
+            logger.error(f"Missing base style for token {token.id}: "
+                         f"{MissingBaseStyleError(token.id, token.base_style)}")
+            token = self._create_fallback_token(token)
+            token.computed_full_style = self._effective_style(token, {}, {})
+            return token
+
+        if len(inheritance_chain) > self.max_inheritance_depth or token.base_style in cut:
+            # The chain is cut at the limit: this token and every token below it stop inheriting
+            cut.add(token.id)
+            logger.warning(f"Inheritance depth limit exceeded for token {token.id}")
+            token = self._create_fallback_token(token)
+            token.computed_full_style = self._effective_style(token, {}, {})
+            return token
+
+        token.inheritance_chain = inheritance_chain
+        token.inheritance_depth = len(inheritance_chain)
+        token.resolved_base_properties = base_definition.default_properties.copy()
+
+        delta = self.delta_generator.calculate_delta(token, base_definition)
+        emu_delta = self.delta_generator.calculate_emu_delta(token, base_definition)
+        if emu_delta:
+            delta['emu'] = emu_delta
+        token.delta_properties = delta
+
+        token.computed_full_style = self._effective_style(
+            token, base_definition.default_properties, base_definition.emu_calculated_properties
+        )
+        return token
+
+    def _effective_style(self, token: InheritedTypographyToken, base_properties: Dict[str, Any],
+                         base_emu: Dict[str, int]) -> Dict[str, Any]:
+        """Base properties overlaid with the token's own values"""
+        style = dict(base_properties)
+        for token_attr, style_prop in TOKEN_STYLE_PROPERTIES.items():
+            value = getattr(token, token_attr)
+            if value is not None:
+                style[style_prop] = value
+
+        emu = dict(base_emu)
+        for token_attr, style_prop in TOKEN_EMU_PROPERTIES.items():
+            value = getattr(token, token_attr)
+            if value:
+                emu[style_prop] = value
+        style['emu'] = emu
+        return style
+
     def _convert_to_inherited_token(self, token: TypographyToken,
                                   inheritance_config: Optional[Dict[str, Any]]) -> InheritedTypographyToken:
         """Convert regular TypographyToken to InheritedTypographyToken"""
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+StyleStack SuperTheme Build Cache
+
+Incremental rebuilds for ``build.py --supertheme``. A manifest records, per
+design × aspect ratio variant, the hash of everything the variant was
+generated from (design tokens, aspect ratio definition, generator version)
+and the digests of the package parts it produced. Part payloads are stored
+content-addressed next to the manifest, so a rebuild only regenerates
+variants whose inputs changed and re-assembles the package from cached parts.
+
+Cache layout:
+
+- ``manifest.json``: format version and one entry per variant
+- ``parts/<2 hex>/<sha256>``: part payloads, shared between variants
+
+Usage:
+    cache = SuperThemeBuildCache(Path('.stylestack-cache/supertheme'))
+    package = SuperThemeGenerator().generate_supertheme(designs, ratios, build_cache=cache)
+    print(f"Reused {cache.stats.reused} variants")
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+BUILD_CACHE_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+# (part name relative to the variant directory, payload)
+VariantPart = Tuple[str, bytes]
+
+
+def _canonical_json(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def variant_input_hash(design_tokens: Dict[str, Any],
+                       aspect_ratio_definition: Any,
+                       design_name: str,
+                       aspect_ratio_token: str,
+                       generator_version: str) -> str:
+    """Hash of every input a supertheme variant is generated from"""
+    digest = hashlib.sha256(f"stylestack-supertheme-variant:{BUILD_CACHE_VERSION}".encode())
+    for component in (
+        generator_version.encode('utf-8'),
+        design_name.encode('utf-8'),
+        aspect_ratio_token.encode('utf-8'),
+        _canonical_json(aspect_ratio_definition),
+        _canonical_json(design_tokens),
+    ):
+        digest.update(len(component).to_bytes(8, 'little'))
+        digest.update(component)
+    return digest.hexdigest()
+
+
+@dataclass
+class CachedVariant:
+    """A variant restored from the build cache"""
+    name: str
+    guid: str
+    design_name: str
+    aspect_ratio_token: str
+    parts: List[VariantPart]
+
+
+@dataclass
+class BuildCacheStats:
+    """Cache activity since the cache was opened"""
+    reused: int = 0
+    regenerated: int = 0
+    parts_written: int = 0
+    parts_removed: int = 0
+    regenerated_variants: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'reused': self.reused,
+            'regenerated': self.regenerated,
+            'parts_written': self.parts_written,
+            'parts_removed': self.parts_removed,
+            'regenerated_variants': list(self.regenerated_variants),
+        }
+
+
+class SuperThemeBuildCache:
+    """Manifest plus content-addressed part store for one supertheme build"""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / MANIFEST_NAME
+        self.parts_dir = self.cache_dir / 'parts'
+        self.stats = BuildCacheStats()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @staticmethod
+    def variant_key(design_name: str, aspect_ratio_token: str) -> str:
+        return f"{design_name}::{aspect_ratio_token}"
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._load_manifest()
+        return self._entries
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable supertheme build manifest {self.manifest_path}: {e}")
+            return {}
+        if manifest.get('version') != BUILD_CACHE_VERSION:
+            logger.info(f"Supertheme build manifest is format {manifest.get('version')}; rebuilding all variants")
+            return {}
+        return manifest.get('variants', {})
+
+    def _part_path(self, digest: str) -> Path:
+        return self.parts_dir / digest[:2] / digest
+
+    def lookup(self, design_name: str, aspect_ratio_token: str, input_hash: str) -> Optional[CachedVariant]:
+        """Cached variant for these inputs, or None if it must be regenerated"""
+        entry = self.entries.get(self.variant_key(design_name, aspect_ratio_token))
+        if not entry or entry.get('input_hash') != input_hash:
+            return None
+
+        parts = []
+        for part_name, digest in entry['parts']:
+            try:
+                payload = self._part_path(digest).read_bytes()
+            except OSError:
+                return None
+            if hashlib.sha256(payload).hexdigest() != digest:
+                logger.warning(f"Cached part {digest} is corrupt; regenerating {entry['name']}")
+                return None
+            parts.append((part_name, payload))
+
+        return CachedVariant(
+            name=entry['name'],
+            guid=entry['guid'],
+            design_name=design_name,
+            aspect_ratio_token=aspect_ratio_token,
+            parts=parts
+        )
+
+    def store(self, design_name: str, aspect_ratio_token: str, input_hash: str,
+              name: str, guid: str, parts: Iterable[VariantPart]) -> None:
+        """Record a freshly generated variant and its part payloads"""
+        part_digests = []
+        for part_name, payload in parts:
+            digest = hashlib.sha256(payload).hexdigest()
+            part_path = self._part_path(digest)
+            if not part_path.exists():
+                self._write_atomic(part_path, payload)
+                self.stats.parts_written += 1
+            part_digests.append([part_name, digest])
+
+        self.entries[self.variant_key(design_name, aspect_ratio_token)] = {
+            'input_hash': input_hash,
+            'name': name,
+            'guid': guid,
+            'design_name': design_name,
+            'aspect_ratio_token': aspect_ratio_token,
+            'parts': part_digests,
+        }
+
+    def save(self, keep: Optional[Iterable[Tuple[str, str]]] = None) -> None:
+        """
+        Write the manifest and drop part payloads nothing references anymore
+
+        Args:
+            keep: (design name, aspect ratio token) pairs of the current build;
+                  entries for other variants are forgotten. None keeps all entries.
+        """
+        entries = self.entries
+        if keep is not None:
+            keep_keys = {self.variant_key(design_name, token) for design_name, token in keep}
+            for key in [key for key in entries if key not in keep_keys]:
+                del entries[key]
+
+        manifest = {'version': BUILD_CACHE_VERSION, 'variants': entries}
+        self._write_atomic(self.manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+        self._collect_garbage({digest for entry in entries.values() for _, digest in entry['parts']})
+
+    def _collect_garbage(self, referenced: Set[str]) -> None:
+        if not self.parts_dir.exists():
+            return
+        for part_path in self.parts_dir.glob('*/*'):
+            if part_path.name not in referenced:
+                part_path.unlink()
+                self.stats.parts_removed += 1
+
+    def _write_atomic(self, path: Path, payload: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
@@ -13,6 +13,8 @@ Features:
 - GUID management for design variant groups
 - EMU-precise dimensions for all aspect ratios
 - Performance optimization with caching
+- Optional process-pool variant generation with deterministic assembly
+- Incremental rebuilds from a build cache (see tools.supertheme_build_cache)
 
 Usage:
     generator = SuperThemeGenerator()
@@ -36,12 +38,14 @@ import zipfile
 import io
 import tempfile
 from uuid import uuid4
+import ast
 import hashlib
 import json
 import time
 import logging
 from pathlib import Path
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 
 # Import existing StyleStack components
 from tools.aspect_ratio_resolver import AspectRatioResolver, AspectRatioToken, create_standard_aspect_ratios
@@ -49,20 +53,91 @@ from tools.theme_resolver import ThemeResolver, Theme
 from tools.variable_resolver import VariableResolver
 from tools.emu_types import EMUValue
 from tools.xml_utils import indent_xml
+from tools.package_dedup import DedupReport, deduplicate_parts
+from tools.supertheme_build_cache import SuperThemeBuildCache, variant_input_hash
 
 logger = logging.getLogger(__name__)
 
+# ZIP entry timestamp for package parts (earliest the ZIP format allows)
+PACKAGE_PART_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+# Bump when variant output changes in ways the source digest below cannot see
+SUPERTHEME_GENERATOR_VERSION = "1"
+
+# Root of the import graph whose sources are part of every cached variant's input hash
+_TOOLS_DIR = Path(__file__).resolve().parent
+_generator_version: Optional[str] = None
+
+
+def _module_source(module_name: str) -> Optional[Path]:
+    """Source file of a module in the tools package ('tools.x', 'x' or 'core.x'), if any"""
+    parts = module_name.split('.')
+    if parts[0] == 'tools':
+        parts = parts[1:]
+    if not parts:
+        return None
+    base = _TOOLS_DIR.joinpath(*parts)
+    for candidate in (base.with_suffix('.py'), base / '__init__.py'):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def variant_source_files() -> List[Path]:
+    """This module and every tools module it imports, directly or transitively"""
+    seen: Dict[Path, None] = {}
+    pending = [Path(__file__).resolve()]
+    while pending:
+        source_file = pending.pop()
+        if source_file in seen:
+            continue
+        seen[source_file] = None
+        package = source_file.parent.relative_to(_TOOLS_DIR).parts
+        for node in ast.walk(ast.parse(source_file.read_text(encoding='utf-8'))):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    # Relative import: resolve against the importing module's package
+                    anchor = package[:len(package) - (node.level - 1)] if node.level > 1 else package
+                    prefix = '.'.join(anchor + tuple(filter(None, [node.module])))
+                else:
+                    prefix = node.module or ''
+                # 'from tools import x' and 'from .pkg import module' name modules too
+                names = [prefix] + [f"{prefix}.{alias.name}" if prefix else alias.name for alias in node.names]
+            else:
+                continue
+            for name in names:
+                module_file = _module_source(name) if name else None
+                if module_file is not None and module_file not in seen:
+                    pending.append(module_file)
+    return sorted(seen)
+
+
+def generator_version() -> str:
+    """Version string identifying the code that renders supertheme variants"""
+    global _generator_version
+    if _generator_version is None:
+        digest = hashlib.sha256()
+        for source_file in variant_source_files():
+            digest.update(source_file.relative_to(_TOOLS_DIR).as_posix().encode('utf-8'))
+            digest.update(source_file.read_bytes())
+        _generator_version = f"{SUPERTHEME_GENERATOR_VERSION}+{digest.hexdigest()[:16]}"
+    return _generator_version
+
 
 @dataclass
 class SuperThemeVariant:
     """Represents a single SuperTheme variant with all its components"""
     name: str
-    theme: Theme
+    theme: Optional[Theme]
     presentation_xml: str
     aspect_ratio_token: str
     design_name: str
     variant_id: int
     guid: str
+    # Pre-rendered package parts (relative to the variant directory) when restored from a build cache
+    parts: Optional[List[Tuple[str, bytes]]] = None
     
     @property
     def aspect_ratio_name(self) -> str:
@@ -70,6 +145,55 @@ class SuperThemeVariant:
         return self.aspect_ratio_token.split('.')[-1] if '.' in self.aspect_ratio_token else self.aspect_ratio_token
 
 
+@dataclass
+class VariantTiming:
+    """Generation time of one design × aspect ratio variant"""
+    design_name: str
+    aspect_ratio_token: str
+    seconds: float
+    error: Optional[str] = None
+    # Restored from the build cache instead of generated
+    cached: bool = False
+
+
+@dataclass
+class SuperThemeGenerationReport:
+    """Timing report for the most recent variant generation"""
+    workers: int
+    total_seconds: float = 0.0
+    variant_timings: List[VariantTiming] = field(default_factory=list)
+    package_dedup: Optional[DedupReport] = None
+    
+    @property
+    def failed_variants(self) -> List[VariantTiming]:
+        return [timing for timing in self.variant_timings if timing.error]
+    
+    @property
+    def cached_variants(self) -> List[VariantTiming]:
+        return [timing for timing in self.variant_timings if timing.cached]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "total_seconds": self.total_seconds,
+            "variants": [
+                {
+                    "design": timing.design_name,
+                    "aspect_ratio": timing.aspect_ratio_token,
+                    "seconds": timing.seconds,
+                    "error": timing.error,
+                    "cached": timing.cached
+                }
+                for timing in self.variant_timings
+            ],
+            "package_dedup": self.package_dedup.to_dict() if self.package_dedup else None
+        }
+
+
+# (variant or None, seconds, error message) for one generated variant
+VariantResult = Tuple[Optional[SuperThemeVariant], float, Optional[str]]
+
+
 class SuperThemeError(Exception):
     """Exception raised for SuperTheme generation errors"""
     pass
@@ -83,9 +207,17 @@ class SuperThemeGenerator:
     creating fully compliant .thmx packages that work across Office 2016-365.
     """
     
-    def __init__(self, verbose: bool = False, enable_cache: bool = True):
+    def __init__(self, verbose: bool = False, enable_cache: bool = True,
+                 max_workers: Optional[int] = None, dedupe_parts: bool = False):
         self.verbose = verbose
         self.enable_cache = enable_cache
+        # Worker processes for variant generation (None or 1 generates serially)
+        self.max_workers = max_workers
+        # Store byte-identical media/font/embedding parts once (see tools.package_dedup).
+        # Generated superthemes carry none, and their theme, master and layout parts
+        # must stay per variant, so this only pays off for packages with such payloads
+        self.dedupe_parts = dedupe_parts
+        self.last_generation_report: Optional[SuperThemeGenerationReport] = None
         
         # Initialize component resolvers
         self.aspect_resolver = AspectRatioResolver(verbose=verbose, enable_cache=enable_cache)
@@ -109,7 +241,8 @@ class SuperThemeGenerator:
     def generate_supertheme(self, 
                           design_variants: Dict[str, Dict[str, Any]],
                           aspect_ratios: Optional[List[str]] = None,
-                          base_template: Optional[str] = None) -> bytes:
+                          base_template: Optional[str] = None,
+                          build_cache: Optional[SuperThemeBuildCache] = None) -> bytes:
         """
         Generate complete SuperTheme .thmx package from design token variants.
         
@@ -117,6 +250,7 @@ class SuperThemeGenerator:
             design_variants: Dictionary of design variant names to token structures
             aspect_ratios: List of aspect ratio token paths to generate
             base_template: Optional base .potx template to extend
+            build_cache: Optional build cache; only variants whose inputs changed are regenerated
             
         Returns:
             Complete SuperTheme package as ZIP bytes
@@ -144,7 +278,7 @@ class SuperThemeGenerator:
         # Generate all theme variant combinations
         start_time = time.time()
         theme_variants = self._generate_all_theme_variants(
-            design_variants, aspect_ratios, standard_aspect_ratios
+            design_variants, aspect_ratios, standard_aspect_ratios, build_cache
         )
         
         if self.verbose:
@@ -190,62 +324,203 @@ class SuperThemeGenerator:
     def _generate_all_theme_variants(self, 
                                    design_variants: Dict[str, Dict[str, Any]], 
                                    aspect_ratios: List[str],
-                                   standard_aspect_ratios: Dict[str, Any]) -> List[SuperThemeVariant]:
+                                   standard_aspect_ratios: Dict[str, Any],
+                                   build_cache: Optional[SuperThemeBuildCache] = None) -> List[SuperThemeVariant]:
         """Generate all theme variant combinations (design × aspect ratio)"""
-        theme_variants = []
-        variant_id = 1
+        report = SuperThemeGenerationReport(workers=1)
+        start_time = time.perf_counter()
+        
+        variant_jobs = [(design_name, aspect_ratio_token)
+                        for design_name in design_variants
+                        for aspect_ratio_token in aspect_ratios]
+        
+        # Variants whose inputs are unchanged come back from the build cache
+        input_hashes: Dict[Tuple[str, str], str] = {}
+        cached: Dict[Tuple[str, str], SuperThemeVariant] = {}
+        if build_cache is not None:
+            input_hashes, cached = self._restore_cached_variants(
+                build_cache, design_variants, variant_jobs, standard_aspect_ratios
+            )
+        pending_jobs = [job for job in variant_jobs if job not in cached]
+        
+        workers = min(self.max_workers or 1, len(pending_jobs))
+        if workers > 1:
+            report.workers = workers
+            results = self._generate_variants_parallel(
+                design_variants, pending_jobs, standard_aspect_ratios, workers
+            )
+        else:
+            results = self._generate_variants_serial(design_variants, pending_jobs, standard_aspect_ratios)
+        generated = dict(zip(pending_jobs, results))
         
-        for design_name, design_tokens in design_variants.items():
-            # Get or generate GUID for this design group
-            design_guid = self._get_design_guid(design_name)
-            
-            for aspect_ratio_token in aspect_ratios:
-                try:
-                    # Resolve tokens for this specific aspect ratio
-                    resolved_tokens = self._resolve_tokens_for_aspect_ratio(
-                        design_tokens, aspect_ratio_token, standard_aspect_ratios
-                    )
-                    
-                    # Generate theme object
-                    variant_name = f"{design_name} {self._format_aspect_ratio_name(aspect_ratio_token)}"
-                    theme = self._generate_theme_from_tokens(resolved_tokens, variant_name)
-                    
-                    # Generate presentation XML with correct dimensions
-                    presentation_xml = self._generate_presentation_xml(aspect_ratio_token, standard_aspect_ratios)
-                    
-                    # Create variant object
-                    variant = SuperThemeVariant(
-                        name=variant_name,
-                        theme=theme,
-                        presentation_xml=presentation_xml,
-                        aspect_ratio_token=aspect_ratio_token,
-                        design_name=design_name,
-                        variant_id=variant_id,
-                        guid=design_guid
-                    )
-                    
-                    theme_variants.append(variant)
-                    variant_id += 1
-                    
-                except Exception as e:
+        # Assemble in (design, aspect ratio) order so ids and package bytes match serial output
+        theme_variants = []
+        for job in variant_jobs:
+            design_name, aspect_ratio_token = job
+            if job in cached:
+                variant = cached[job]
+                report.variant_timings.append(VariantTiming(design_name, aspect_ratio_token, 0.0, cached=True))
+            else:
+                variant, elapsed, error = generated[job]
+                report.variant_timings.append(VariantTiming(design_name, aspect_ratio_token, elapsed, error))
+                if variant is None:
                     if self.verbose:
-                        logger.warning(f"Skipping variant {design_name} × {aspect_ratio_token}: {e}")
+                        logger.warning(f"Skipping variant {design_name} × {aspect_ratio_token}: {error}")
                     continue
+                if build_cache is not None:
+                    # Render once here; packaging reuses the same parts
+                    variant.parts = self._variant_parts(variant)
+                    build_cache.store(design_name, aspect_ratio_token, input_hashes[job],
+                                      variant.name, variant.guid, variant.parts)
+                    build_cache.stats.regenerated += 1
+                    build_cache.stats.regenerated_variants.append(variant.name)
+            variant.variant_id = len(theme_variants) + 1
+            theme_variants.append(variant)
+        
+        report.total_seconds = time.perf_counter() - start_time
+        self.last_generation_report = report
+        
+        if build_cache is not None:
+            build_cache.save(keep=variant_jobs)
+            if self.verbose:
+                logger.info(f"   Reused {build_cache.stats.reused} cached variants, "
+                            f"regenerated {build_cache.stats.regenerated}")
         
         if not theme_variants:
             raise SuperThemeError("No valid theme variants could be generated")
         
         return theme_variants
     
-    def _resolve_tokens_for_aspect_ratio(self, 
-                                       design_tokens: Dict[str, Any], 
-                                       aspect_ratio_token: str,
-                                       standard_aspect_ratios: Dict[str, Any]) -> Dict[str, Any]:
-        """Resolve design tokens for specific aspect ratio"""
-        # Combine design tokens with aspect ratio definitions
+    def _restore_cached_variants(self,
+                                 build_cache: SuperThemeBuildCache,
+                                 design_variants: Dict[str, Dict[str, Any]],
+                                 variant_jobs: List[Tuple[str, str]],
+                                 standard_aspect_ratios: Dict[str, Any]
+                                 ) -> Tuple[Dict[Tuple[str, str], str], Dict[Tuple[str, str], SuperThemeVariant]]:
+        """Hash every job's inputs and restore the variants the cache already holds"""
+        version = generator_version()
+        input_hashes = {}
+        cached = {}
+        for job in variant_jobs:
+            design_name, aspect_ratio_token = job
+            input_hashes[job] = variant_input_hash(
+                design_variants[design_name],
+                self._aspect_ratio_definition(standard_aspect_ratios, aspect_ratio_token),
+                design_name, aspect_ratio_token, version
+            )
+            entry = build_cache.lookup(design_name, aspect_ratio_token, input_hashes[job])
+            if entry is None:
+                continue
+            cached[job] = SuperThemeVariant(
+                name=entry.name,
+                theme=None,
+                presentation_xml=dict(entry.parts)['theme/presentation.xml'].decode('utf-8'),
+                aspect_ratio_token=aspect_ratio_token,
+                design_name=design_name,
+                variant_id=0,
+                guid=entry.guid,
+                parts=entry.parts
+            )
+            build_cache.stats.reused += 1
+        return input_hashes, cached
+    
+    def _aspect_ratio_definition(self, standard_aspect_ratios: Dict[str, Any], aspect_ratio_token: str) -> Any:
+        """Token subtree defining one aspect ratio (None if the path does not exist)"""
+        node: Any = standard_aspect_ratios
+        for key in aspect_ratio_token.split('.'):
+            if not isinstance(node, dict) or key not in node:
+                return None
+            node = node[key]
+        return node
+    
+    def _generate_variants_serial(self,
+                                  design_variants: Dict[str, Dict[str, Any]],
+                                  variant_jobs: List[Tuple[str, str]],
+                                  standard_aspect_ratios: Dict[str, Any]) -> List[VariantResult]:
+        """Generate variants in this process, one combined token tree per design"""
+        complete_trees: Dict[str, Dict[str, Any]] = {}
+        results = []
+        for design_name, aspect_ratio_token in variant_jobs:
+            if design_name not in complete_trees:
+                # One combined tree per design, so the resolver indexes it once for all ratios
+                complete_trees[design_name] = self._combine_design_tokens(
+                    design_variants[design_name], standard_aspect_ratios
+                )
+            results.append(self._timed_variant(
+                design_name, complete_trees[design_name], aspect_ratio_token, standard_aspect_ratios
+            ))
+        return results
+    
+    def _generate_variants_parallel(self,
+                                    design_variants: Dict[str, Dict[str, Any]],
+                                    variant_jobs: List[Tuple[str, str]],
+                                    standard_aspect_ratios: Dict[str, Any],
+                                    workers: int) -> List[VariantResult]:
+        """Fan variants out over a process pool; token trees are shipped once per worker"""
+        if self.verbose:
+            logger.info(f"   Generating {len(variant_jobs)} variants on {workers} worker processes")
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_variant_worker,
+            initargs=(design_variants, standard_aspect_ratios, self.verbose, self.enable_cache)
+        ) as executor:
+            # map() yields results in submission order
+            return list(executor.map(_generate_variant_in_worker, variant_jobs))
+    
+    def _timed_variant(self,
+                       design_name: str,
+                       complete_tokens: Dict[str, Any],
+                       aspect_ratio_token: str,
+                       standard_aspect_ratios: Dict[str, Any]) -> VariantResult:
+        """Generate one variant, returning (variant or None, seconds, error message)"""
+        start_time = time.perf_counter()
+        try:
+            variant = self._generate_variant(
+                design_name, complete_tokens, aspect_ratio_token, standard_aspect_ratios
+            )
+            return variant, time.perf_counter() - start_time, None
+        except Exception as e:
+            return None, time.perf_counter() - start_time, str(e)
+    
+    def _generate_variant(self,
+                          design_name: str,
+                          complete_tokens: Dict[str, Any],
+                          aspect_ratio_token: str,
+                          standard_aspect_ratios: Dict[str, Any]) -> SuperThemeVariant:
+        """Generate a single design × aspect ratio variant (variant_id is assigned on assembly)"""
+        # Resolve tokens for this specific aspect ratio
+        resolved_tokens = self._resolve_tokens_for_aspect_ratio(complete_tokens, aspect_ratio_token)
+        
+        # Generate theme object
+        variant_name = f"{design_name} {self._format_aspect_ratio_name(aspect_ratio_token)}"
+        theme = self._generate_theme_from_tokens(resolved_tokens, variant_name)
+        
+        # Generate presentation XML with correct dimensions
+        presentation_xml = self._generate_presentation_xml(aspect_ratio_token, standard_aspect_ratios)
+        
+        return SuperThemeVariant(
+            name=variant_name,
+            theme=theme,
+            presentation_xml=presentation_xml,
+            aspect_ratio_token=aspect_ratio_token,
+            design_name=design_name,
+            variant_id=0,
+            guid=self._get_design_guid(design_name)
+        )
+    
+    def _combine_design_tokens(self,
+                               design_tokens: Dict[str, Any],
+                               standard_aspect_ratios: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine design tokens with aspect ratio definitions"""
         complete_tokens = standard_aspect_ratios.copy()
         complete_tokens.update(design_tokens)
-        
+        return complete_tokens
+    
+    def _resolve_tokens_for_aspect_ratio(self, 
+                                       complete_tokens: Dict[str, Any], 
+                                       aspect_ratio_token: str) -> Dict[str, Any]:
+        """Resolve combined design tokens for specific aspect ratio"""
         # Use aspect ratio resolver to resolve conditional tokens
         try:
             resolved = self.aspect_resolver.resolve_aspect_ratio_tokens(complete_tokens, aspect_ratio_token)
@@ -473,88 +748,125 @@ class SuperThemeGenerator:
         if self.verbose:
             logger.info(f"📦 Packaging SuperTheme with {len(theme_variants)} variants")
         
+        parts: List[Tuple[str, bytes]] = []
+        
+        # Core SuperTheme files
+        self._add_core_files(parts, variant_manager_xml, relationships)
+        
+        # Individual theme variants
+        self._add_all_variants(parts, theme_variants)
+        
+        # Main theme (first variant as default)
+        if theme_variants:
+            self._add_main_theme(parts, theme_variants[0])
+        
+        # Content-addressed dedup: identical parts are stored once
+        if self.dedupe_parts:
+            parts, dedup_report = deduplicate_parts(parts, pinned=self._is_variant_owned_part)
+            if self.last_generation_report is not None:
+                self.last_generation_report.package_dedup = dedup_report
+            if self.verbose:
+                logger.info(f"   Deduplicated {dedup_report.duplicate_parts} parts, "
+                            f"saved {dedup_report.bytes_saved} bytes")
+        
         # Create in-memory ZIP
         zip_buffer = io.BytesIO()
         
         with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # Core SuperTheme files
-            self._add_core_files(zf, variant_manager_xml, relationships)
-            
-            # Individual theme variants
-            self._add_all_variants(zf, theme_variants)
-            
-            # Main theme (first variant as default)
-            if theme_variants:
-                self._add_main_theme(zf, theme_variants[0])
+            for part_name, payload in parts:
+                # Fixed timestamps so identical inputs give identical bytes
+                part_info = zipfile.ZipInfo(part_name, date_time=PACKAGE_PART_TIMESTAMP)
+                part_info.compress_type = zipfile.ZIP_DEFLATED
+                part_info.external_attr = 0o600 << 16
+                zf.writestr(part_info, payload)
         
         zip_buffer.seek(0)
         return zip_buffer.read()
     
-    def _add_core_files(self, zf: zipfile.ZipFile, variant_manager_xml: str, 
+    def _write_part(self, parts: List[Tuple[str, bytes]], part_name: str, content: str) -> None:
+        """Append a UTF-8 encoded part to the list of parts to package"""
+        parts.append((part_name, content.encode('utf-8')))
+    
+    def _is_variant_owned_part(self, part_name: str) -> bool:
+        """Parts every variant must carry at its own location (each layout belongs to one master)"""
+        return (
+            part_name.endswith(('theme/theme/theme1.xml', 'theme/presentation.xml'))
+            or '/slideMasters/' in f"/{part_name}"
+            or '/slideLayouts/' in f"/{part_name}"
+        )
+    
+    def _add_core_files(self, parts: List[Tuple[str, bytes]], variant_manager_xml: str, 
                        relationships: Dict[str, str]) -> None:
-        """Add core SuperTheme files to ZIP"""
+        """Queue core SuperTheme parts for packaging"""
         # Content Types
         content_types = self._generate_content_types()
-        zf.writestr('[Content_Types].xml', content_types)
+        self._write_part(parts, '[Content_Types].xml', content_types)
         
         # Main relationships
-        zf.writestr('_rels/.rels', relationships['main'])
+        self._write_part(parts, '_rels/.rels', relationships['main'])
         
         # Theme variant manager
-        zf.writestr('themeVariants/themeVariantManager.xml', variant_manager_xml)
-        zf.writestr('themeVariants/_rels/themeVariantManager.xml.rels', relationships['variant_manager'])
+        self._write_part(parts, 'themeVariants/themeVariantManager.xml', variant_manager_xml)
+        self._write_part(parts, 'themeVariants/_rels/themeVariantManager.xml.rels', relationships['variant_manager'])
     
-    def _add_all_variants(self, zf: zipfile.ZipFile, theme_variants: List[SuperThemeVariant]) -> None:
-        """Add all theme variants to ZIP"""
+    def _add_all_variants(self, parts: List[Tuple[str, bytes]], theme_variants: List[SuperThemeVariant]) -> None:
+        """Queue the parts of every theme variant for packaging"""
         for variant in theme_variants:
             variant_dir = f"themeVariants/variant{variant.variant_id}"
-            
-            # Theme XML (simplified for now)
-            theme_xml = self._generate_theme_xml(variant.theme)
-            zf.writestr(f"{variant_dir}/theme/theme/theme1.xml", theme_xml)
-            
-            # Presentation XML
-            zf.writestr(f"{variant_dir}/theme/presentation.xml", variant.presentation_xml)
-            
-            # Variant relationships (always add them)
-            variant_rels = self._generate_variant_relationships()
-            zf.writestr(f"{variant_dir}/_rels/.rels", variant_rels)
-            
-            # Basic slide structures (minimal for now)
-            self._add_basic_slide_structures(zf, variant_dir, variant.aspect_ratio_token)
+            for part_name, payload in self._variant_parts(variant):
+                parts.append((f"{variant_dir}/{part_name}", payload))
     
-    def _add_main_theme(self, zf: zipfile.ZipFile, main_variant: SuperThemeVariant) -> None:
-        """Add main theme (default variant)"""
-        # Main theme XML (simplified for now)
-        theme_xml = self._generate_theme_xml(main_variant.theme)
-        zf.writestr('theme/theme/theme1.xml', theme_xml)
+    def _add_main_theme(self, parts: List[Tuple[str, bytes]], main_variant: SuperThemeVariant) -> None:
+        """Queue the main theme parts (default variant)"""
+        # Same payloads as the variant, laid out at the package's theme/ root
+        for part_name, payload in self._variant_parts(main_variant):
+            parts.append((self._main_theme_part_name(part_name), payload))
+    
+    def _main_theme_part_name(self, variant_part_name: str) -> str:
+        """Map a variant-relative part name to its main theme location"""
+        if variant_part_name == '_rels/.rels':
+            return 'theme/_rels/presentation.xml.rels'
+        if variant_part_name.startswith(('theme/slideMasters/', 'theme/slideLayouts/')):
+            return f"theme/{variant_part_name}"
+        return variant_part_name
+    
+    def _variant_parts(self, variant: SuperThemeVariant) -> List[Tuple[str, bytes]]:
+        """Package parts of one variant, relative to its variant directory"""
+        if variant.parts is not None:
+            # Restored from a build cache
+            return variant.parts
+        
+        parts: List[Tuple[str, bytes]] = []
+        
+        # Theme XML (simplified for now)
+        self._write_part(parts, 'theme/theme/theme1.xml', self._generate_theme_xml(variant.theme))
         
-        # Main presentation XML
-        zf.writestr('theme/presentation.xml', main_variant.presentation_xml)
+        # Presentation XML
+        self._write_part(parts, 'theme/presentation.xml', variant.presentation_xml)
         
-        # Main theme relationships
-        main_rels = self._generate_variant_relationships()
-        zf.writestr('theme/_rels/presentation.xml.rels', main_rels)
+        # Variant relationships (always add them)
+        self._write_part(parts, '_rels/.rels', self._generate_variant_relationships())
         
-        # Basic slide structures
-        self._add_basic_slide_structures(zf, 'theme', main_variant.aspect_ratio_token)
+        # Basic slide structures (minimal for now)
+        self._add_basic_slide_structures(parts, variant.aspect_ratio_token)
+        return parts
     
-    def _add_basic_slide_structures(self, zf: zipfile.ZipFile, base_dir: str, aspect_ratio_token: str) -> None:
+    def _add_basic_slide_structures(self, parts: List[Tuple[str, bytes]], aspect_ratio_token: str) -> None:
         """Add basic slide master and layout structures"""
         # This is a simplified implementation - production would need complete slide structures
         
         # Placeholder slide master
         slide_master_xml = self._generate_minimal_slide_master(aspect_ratio_token)
-        zf.writestr(f'{base_dir}/theme/slideMasters/slideMaster1.xml', slide_master_xml)
+        self._write_part(parts, 'theme/slideMasters/slideMaster1.xml', slide_master_xml)
         
         # Placeholder slide layouts (minimal set)
         for layout_num in range(1, 5):  # 4 basic layouts
             layout_xml = self._generate_minimal_slide_layout(layout_num, aspect_ratio_token)
-            zf.writestr(f'{base_dir}/theme/slideLayouts/slideLayout{layout_num}.xml', layout_xml)
+            self._write_part(parts, f'theme/slideLayouts/slideLayout{layout_num}.xml', layout_xml)
         
         # Relationship files for slide structures
         master_rels = self._generate_slide_master_relationships()
-        zf.writestr(f'{base_dir}/theme/slideMasters/_rels/slideMaster1.xml.rels', master_rels)
+        self._write_part(parts, 'theme/slideMasters/_rels/slideMaster1.xml.rels', master_rels)
     
     def _generate_minimal_slide_master(self, aspect_ratio_token: str) -> str:
         """Generate minimal slide master XML"""
@@ -826,6 +1138,34 @@ class SuperThemeGenerator:
 </a:theme>'''
 
 
+# Process-pool workers: each worker receives the design token trees once
+# through the pool initializer and keeps its own generator and resolver caches
+
+_worker_generator: Optional[SuperThemeGenerator] = None
+_worker_trees: Dict[str, Dict[str, Any]] = {}
+_worker_standard_aspect_ratios: Dict[str, Any] = {}
+
+
+def _init_variant_worker(design_variants: Dict[str, Dict[str, Any]],
+                         standard_aspect_ratios: Dict[str, Any],
+                         verbose: bool,
+                         enable_cache: bool) -> None:
+    global _worker_generator, _worker_trees, _worker_standard_aspect_ratios
+    _worker_generator = SuperThemeGenerator(verbose=verbose, enable_cache=enable_cache)
+    _worker_standard_aspect_ratios = standard_aspect_ratios
+    _worker_trees = {
+        design_name: _worker_generator._combine_design_tokens(design_tokens, standard_aspect_ratios)
+        for design_name, design_tokens in design_variants.items()
+    }
+
+
+def _generate_variant_in_worker(job: Tuple[str, str]) -> VariantResult:
+    design_name, aspect_ratio_token = job
+    return _worker_generator._timed_variant(
+        design_name, _worker_trees[design_name], aspect_ratio_token, _worker_standard_aspect_ratios
+    )
+
+
 if __name__ == "__main__":
     # Demo usage
     generator = SuperThemeGenerator(verbose=True)
@@ -11,10 +11,14 @@ Features:
 - GUID format validation
 - File size and performance validation
 - Cross-platform compatibility checks
+- Streaming reads from paths or file objects, concurrent per-variant checks
+- Optional fail-fast mode that stops at the first error
 
 Usage:
     validator = SuperThemeValidator()
     result = validator.validate_package(supertheme_bytes)
+    # or, without loading the package into memory
+    result = SuperThemeValidator(fail_fast=True).validate_package(Path("brand.thmx"))
     if result.is_valid:
         print("SuperTheme package is valid!")
     else:
@@ -24,13 +28,17 @@ Usage:
 
 # Use shared utilities to eliminate duplication
 from tools.core import (
-    zipfile, Path, get_logger, List, Dict, Any, Optional, Tuple,
+    zipfile, Path, get_logger, List, Dict, Any, Optional, Tuple, dataclass,
     ValidationResult, ValidationError as CoreValidationError,
     safe_ooxml_reader, error_boundary, handle_processing_error
 )
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Union
 import io
 import re
 import hashlib
+import threading
+import zlib
 
 # Use lxml for robust XML processing
 try:
@@ -42,6 +50,41 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Bytes, a path to a .thmx file, or a seekable binary file object
+PackageSource = Union[bytes, str, Path, BinaryIO]
+
+# Worker threads used when max_workers is not given (decompression and lxml parsing release the GIL)
+DEFAULT_VALIDATION_WORKERS = 8
+
+# Parts that are not parsed are streamed in chunks of this size to verify their CRC
+_READ_CHUNK_SIZE = 1 << 20
+
+# Finding order within the per-part pass; matches the order the checks used to run in
+_STAGE_INTEGRITY = -1
+_STAGE_VARIANTS = 0
+_STAGE_XML = 1
+_STAGE_RELATIONSHIPS = 2
+
+
+@dataclass
+class _Finding:
+    """A finding from a part check, recorded into the result once all parts are done"""
+    order: Tuple[int, ...]
+    severity: str
+    category: str
+    message: str
+    file_path: Optional[str] = None
+    
+    def record(self, result: ValidationResult):
+        if self.file_path is None:
+            args = (self.category, self.message)
+        else:
+            args = (self.category, self.message, self.file_path)
+        if self.severity == 'error':
+            result.add_error(*args)
+        else:
+            result.add_warning(*args)
+
 
 # Using shared ValidationResult from tools.core - eliminates duplicate class
 # Extended with SuperTheme-specific metadata fields
@@ -140,67 +183,71 @@ class SuperThemeValidator:
         "application/vnd.openxmlformats-officedocument.theme+xml"
     ]
     
-    def __init__(self, strict_mode: bool = False):
+    def __init__(self, strict_mode: bool = False, max_workers: Optional[int] = None,
+                 fail_fast: bool = False):
         """
         Initialize validator.
         
         Args:
             strict_mode: If True, apply stricter validation rules
+            max_workers: Threads validating variants concurrently (1 validates serially)
+            fail_fast: If True, stop at the first error instead of collecting all findings
         """
         self.strict_mode = strict_mode
+        self.max_workers = max_workers
+        self.fail_fast = fail_fast
         self.guid_pattern = re.compile(
             r'\{[A-F0-9]{8}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{12}\}',
             re.IGNORECASE
         )
     
-    def validate_package(self, package_data: bytes) -> SuperThemeValidationResult:
+    def validate_package(self, package: PackageSource) -> SuperThemeValidationResult:
         """
         Validate complete SuperTheme package.
         
+        The package is opened through its ZIP central directory and each part
+        is read once, when it is validated, so large packages are never held
+        in memory as a whole. Variants are validated concurrently.
+        
         Args:
-            package_data: SuperTheme package bytes
+            package: SuperTheme package bytes, a path to a .thmx file, or a
+                     seekable binary file object
             
         Returns:
             ValidationResult with all validation findings
         """
         result = SuperThemeValidationResult()
-        result.package_size_mb = len(package_data) / (1024 * 1024)
         
         try:
-            # Basic ZIP validation
-            with zipfile.ZipFile(io.BytesIO(package_data), 'r') as zf:
+            result.package_size_mb = self._package_size(package) / (1024 * 1024)
+            
+            # Basic ZIP validation (reads the central directory only)
+            with zipfile.ZipFile(self._open_source(package), 'r') as zf:
                 result.file_count = len(zf.namelist())
                 
-                # Test ZIP integrity
-                try:
-                    zf.testzip()
-                except Exception as e:
-                    result.add_error("structure", f"ZIP integrity check failed: {e}")
-                    return result
-                
                 # Validate package structure
                 self._validate_package_structure(zf, result)
                 
                 # Validate content types
-                self._validate_content_types(zf, result)
+                if not self._should_stop(result):
+                    self._validate_content_types(zf, result)
                 
                 # Validate theme variant manager
-                self._validate_theme_variant_manager(zf, result)
-                
-                # Validate individual variants
-                self._validate_theme_variants(zf, result)
+                if not self._should_stop(result):
+                    self._validate_theme_variant_manager(zf, result)
                 
-                # Validate XML files
-                self._validate_xml_files(zf, result)
-                
-                # Validate relationships
-                self._validate_relationships(zf, result)
+                # Validate individual variants, XML well-formedness and relationships
+                if not self._should_stop(result):
+                    if not self._validate_parts(zf, result):
+                        return result
                 
                 # Performance and size validation
-                self._validate_performance(zf, result)
+                if not self._should_stop(result):
+                    self._validate_performance(zf, result)
                 
                 # Cross-platform compatibility
-                self._validate_cross_platform(zf, result)
+                if not self._should_stop(result):
+                    self._validate_cross_platform(zf, result)
         
         except zipfile.BadZipFile:
             result.add_error("structure", "Invalid ZIP file format")
@@ -209,6 +256,30 @@ class SuperThemeValidator:
         
         return result
     
+    def _package_size(self, package: PackageSource) -> int:
+        """Package size in bytes without reading the package"""
+        if isinstance(package, (bytes, bytearray, memoryview)):
+            return len(package)
+        if isinstance(package, (str, Path)):
+            return Path(package).stat().st_size
+        position = package.tell()
+        size = package.seek(0, io.SEEK_END)
+        package.seek(position)
+        return size
+    
+    def _open_source(self, package: PackageSource):
+        """Path or file object ZipFile can read entries from on demand"""
+        if isinstance(package, (bytes, bytearray, memoryview)):
+            return io.BytesIO(package)
+        return package
+    
+    def _should_stop(self, result: SuperThemeValidationResult) -> bool:
+        """Whether fail-fast validation should skip the remaining checks"""
+        if self.fail_fast and not result.is_valid:
+            result.metadata['stopped_early'] = True
+            return True
+        return False
+    
     def _validate_package_structure(self, zf: zipfile.ZipFile, result: ValidationResult):
         """Validate required package structure"""
         file_list = zf.namelist()
@@ -317,138 +388,227 @@ class SuperThemeValidator:
         except Exception as e:
             result.add_error("parsing", f"Failed to parse themeVariantManager.xml: {e}")
     
-    def _validate_theme_variants(self, zf: zipfile.ZipFile, result: ValidationResult):
-        """Validate individual theme variants"""
-        file_list = zf.namelist()
-        variant_dirs = set()
+    def _validate_parts(self, zf: zipfile.ZipFile, result: SuperThemeValidationResult) -> bool:
+        """
+        Validate every part in one pass, one worker per variant directory.
         
-        for file_path in file_list:
-            if 'themeVariants/variant' in file_path:
-                parts = file_path.split('/')
-                if len(parts) >= 2 and parts[1].startswith('variant'):
-                    variant_dirs.add(parts[1])
+        Each part is read once; its parse tree serves the variant, XML and
+        relationship checks. Findings are merged in the same order the checks
+        would report them one after another.
         
-        for variant_dir in variant_dirs:
-            # Validate theme XML
-            theme_path = f"themeVariants/{variant_dir}/theme/theme/theme1.xml"
-            if theme_path in file_list:
-                try:
-                    theme_xml = zf.read(theme_path).decode('utf-8')
-                    if LXML_AVAILABLE:
-                        parser = etree.XMLParser(recover=True, remove_comments=False)
-                        theme_root = etree.fromstring(theme_xml.encode('utf-8'), parser)
-                    else:
-                        theme_root = etree.fromstring(theme_xml)
-                    
-                    # Check for required theme elements
-                    required_elements = [
-                        './/themeElements',
-                        './/clrScheme',
-                        './/fontScheme'
-                    ]
-                    
-                    for element_path in required_elements:
-                        if theme_root.find(element_path) is None:
-                            # Try with namespace - fix the XPath construction
-                            element_name = element_path.replace('.//', '')
-                            ns_path = f'.//{{{self.REQUIRED_NAMESPACES["drawingml"]}}}{element_name}'
-                            if theme_root.find(ns_path) is None:
-                                result.add_warning("theme", 
-                                                  f"Missing {element_name} in theme",
-                                                  theme_path)
-                
-                except Exception as e:
-                    result.add_error("parsing", f"Failed to parse theme XML: {e}", theme_path)
+        Returns:
+            False if the ZIP data itself is damaged and validation cannot continue
+        """
+        groups: Dict[str, List[Tuple[int, str]]] = {}
+        for index, name in enumerate(zf.namelist()):
+            groups.setdefault(self._variant_dir_of(name) or '', []).append((index, name))
+        variant_ranks = {
+            variant_dir: rank
+            for rank, variant_dir in enumerate(sorted(filter(None, groups), key=self._variant_sort_key))
+        }
+        
+        stop = threading.Event()
+        workers = min(self.max_workers or DEFAULT_VALIDATION_WORKERS, len(groups))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._validate_part_group, zf, entries, variant_ranks, stop)
+                    for entries in groups.values()
+                ]
+                group_findings = [future.result() for future in futures]
+        else:
+            group_findings = [
+                self._validate_part_group(zf, entries, variant_ranks, stop)
+                for entries in groups.values()
+            ]
+        
+        findings = sorted((finding for group in group_findings for finding in group),
+                          key=lambda finding: finding.order)
+        integrity_errors = [finding for finding in findings if finding.order[0] == _STAGE_INTEGRITY]
+        if integrity_errors:
+            # Damaged archive: report the first bad entry only
+            integrity_errors[0].record(result)
+            return False
+        
+        for finding in findings:
+            finding.record(result)
+        if stop.is_set():
+            result.metadata['stopped_early'] = True
+        return True
+    
+    def _validate_part_group(self, zf: zipfile.ZipFile, entries: List[Tuple[int, str]],
+                             variant_ranks: Dict[str, int], stop: threading.Event) -> List['_Finding']:
+        """Validate the parts of one variant directory (or the package root)"""
+        findings: List[_Finding] = []
+        for index, name in entries:
+            if stop.is_set():
+                break
+            part_findings = self._validate_part(zf, index, name, variant_ranks)
+            findings.extend(part_findings)
+            if any(finding.severity == 'error' for finding in part_findings):
+                if self.fail_fast or part_findings[0].order[0] == _STAGE_INTEGRITY:
+                    stop.set()
+        return findings
+    
+    def _validate_part(self, zf: zipfile.ZipFile, index: int, name: str,
+                       variant_ranks: Dict[str, int]) -> List['_Finding']:
+        """Read one part (verifying its CRC) and run every check that applies to it"""
+        is_xml = name.endswith('.xml')
+        is_rels = name.endswith('.rels')
+        
+        try:
+            if is_xml or is_rels:
+                payload = zf.read(name)
+            else:
+                # Not parsed; stream it through to verify the stored CRC
+                with zf.open(name) as part:
+                    while part.read(_READ_CHUNK_SIZE):
+                        pass
+                return []
+        except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+            return [_Finding((_STAGE_INTEGRITY, index), 'error', "structure",
+                             f"ZIP integrity check failed: {e}")]
+        
+        text, root, parse_error = None, None, None
+        try:
+            text = payload.decode('utf-8')
+            root = self._parse_xml(text)
+        except Exception as e:
+            parse_error = e
+        
+        findings: List[_Finding] = []
+        variant_dir = self._variant_dir_of(name)
+        if variant_dir:
+            rank = variant_ranks[variant_dir]
+            if name == f"themeVariants/{variant_dir}/theme/theme/theme1.xml":
+                self._check_theme_part(name, root, parse_error, (_STAGE_VARIANTS, rank, 0), findings)
+            elif name == f"themeVariants/{variant_dir}/theme/presentation.xml":
+                self._check_presentation_part(name, root, parse_error, (_STAGE_VARIANTS, rank, 1), findings)
+        if is_xml:
+            self._check_xml_part(name, text, parse_error, (_STAGE_XML, index), findings)
+        if is_rels:
+            self._check_relationships_part(name, text, root, parse_error, (_STAGE_RELATIONSHIPS, index), findings)
+        return findings
+    
+    def _check_theme_part(self, theme_path: str, theme_root, parse_error: Optional[Exception],
+                          order: Tuple[int, ...], findings: List['_Finding']):
+        """Check a variant's theme XML has the required theme elements"""
+        try:
+            if parse_error is not None:
+                raise parse_error
             
-            # Validate presentation XML
-            pres_path = f"themeVariants/{variant_dir}/theme/presentation.xml"
-            if pres_path in file_list:
-                try:
-                    pres_xml = zf.read(pres_path).decode('utf-8')
-                    if LXML_AVAILABLE:
-                        parser = etree.XMLParser(recover=True, remove_comments=False)
-                        pres_root = etree.fromstring(pres_xml.encode('utf-8'), parser)
-                    else:
-                        pres_root = etree.fromstring(pres_xml)
-                    
-                    # Check slide size is defined
-                    slide_size = pres_root.find('.//sldSz')
-                    if slide_size is None:
-                        # Try with namespace
-                        slide_size = pres_root.find(f'.//{{{self.REQUIRED_NAMESPACES["presentationml"]}}}sldSz')
-                    
-                    if slide_size is None:
-                        result.add_warning("presentation", "Missing slide size definition", pres_path)
-                    else:
-                        # Validate dimensions
-                        width = slide_size.get('cx')
-                        height = slide_size.get('cy')
-                        if not width or not height:
-                            result.add_error("presentation", "Missing slide dimensions", pres_path)
-                        elif not width.isdigit() or not height.isdigit():
-                            result.add_error("presentation", "Invalid slide dimensions", pres_path)
-                
-                except Exception as e:
-                    result.add_error("parsing", f"Failed to parse presentation XML: {e}", pres_path)
-    
-    def _validate_xml_files(self, zf: zipfile.ZipFile, result: ValidationResult):
-        """Validate all XML files are well-formed"""
-        xml_files = [f for f in zf.namelist() if f.endswith('.xml')]
-        
-        for xml_file in xml_files:
-            try:
-                xml_content = zf.read(xml_file).decode('utf-8')
-                if LXML_AVAILABLE:
-                    parser = etree.XMLParser(recover=True, remove_comments=False)
-                    etree.fromstring(xml_content.encode('utf-8'), parser)
-                else:
-                    etree.fromstring(xml_content)
-                
-                # Check for XML declaration
-                if not xml_content.strip().startswith('<?xml'):
-                    result.add_warning("xml", f"Missing XML declaration", xml_file)
-                
-            except (etree.XMLSyntaxError if LXML_AVAILABLE else etree.ParseError) as e:
-                result.add_error("xml", f"XML parse error: {e}", xml_file)
-            except UnicodeDecodeError as e:
-                result.add_error("encoding", f"Character encoding error: {e}", xml_file)
-    
-    def _validate_relationships(self, zf: zipfile.ZipFile, result: ValidationResult):
-        """Validate relationship files"""
-        rels_files = [f for f in zf.namelist() if f.endswith('.rels')]
-        
-        for rels_file in rels_files:
-            try:
-                rels_xml = zf.read(rels_file).decode('utf-8')
-                if LXML_AVAILABLE:
-                    parser = etree.XMLParser(recover=True, remove_comments=False)
-                    root = etree.fromstring(rels_xml.encode('utf-8'), parser)
+            # Check for required theme elements
+            required_elements = [
+                './/themeElements',
+                './/clrScheme',
+                './/fontScheme'
+            ]
+            
+            for element_path in required_elements:
+                if theme_root.find(element_path) is None:
+                    # Try with namespace - fix the XPath construction
+                    element_name = element_path.replace('.//', '')
+                    ns_path = f'.//{{{self.REQUIRED_NAMESPACES["drawingml"]}}}{element_name}'
+                    if theme_root.find(ns_path) is None:
+                        findings.append(_Finding(order, 'warning', "theme",
+                                                 f"Missing {element_name} in theme", theme_path))
+        
+        except Exception as e:
+            findings.append(_Finding(order, 'error', "parsing", f"Failed to parse theme XML: {e}", theme_path))
+    
+    def _check_presentation_part(self, pres_path: str, pres_root, parse_error: Optional[Exception],
+                                 order: Tuple[int, ...], findings: List['_Finding']):
+        """Check a variant's presentation XML defines a valid slide size"""
+        try:
+            if parse_error is not None:
+                raise parse_error
+            
+            # Check slide size is defined
+            slide_size = pres_root.find('.//sldSz')
+            if slide_size is None:
+                # Try with namespace
+                slide_size = pres_root.find(f'.//{{{self.REQUIRED_NAMESPACES["presentationml"]}}}sldSz')
+            
+            if slide_size is None:
+                findings.append(_Finding(order, 'warning', "presentation", "Missing slide size definition", pres_path))
+            else:
+                # Validate dimensions
+                width = slide_size.get('cx')
+                height = slide_size.get('cy')
+                if not width or not height:
+                    findings.append(_Finding(order, 'error', "presentation", "Missing slide dimensions", pres_path))
+                elif not width.isdigit() or not height.isdigit():
+                    findings.append(_Finding(order, 'error', "presentation", "Invalid slide dimensions", pres_path))
+        
+        except Exception as e:
+            findings.append(_Finding(order, 'error', "parsing", f"Failed to parse presentation XML: {e}", pres_path))
+    
+    def _check_xml_part(self, xml_file: str, xml_content: Optional[str], parse_error: Optional[Exception],
+                        order: Tuple[int, ...], findings: List['_Finding']):
+        """Check an XML part is well-formed"""
+        if isinstance(parse_error, UnicodeDecodeError):
+            findings.append(_Finding(order, 'error', "encoding", f"Character encoding error: {parse_error}", xml_file))
+        elif isinstance(parse_error, etree.XMLSyntaxError if LXML_AVAILABLE else etree.ParseError):
+            findings.append(_Finding(order, 'error', "xml", f"XML parse error: {parse_error}", xml_file))
+        elif parse_error is not None:
+            raise parse_error
+        # Check for XML declaration
+        elif not xml_content.strip().startswith('<?xml'):
+            findings.append(_Finding(order, 'warning', "xml", "Missing XML declaration", xml_file))
+    
+    def _check_relationships_part(self, rels_file: str, rels_xml: Optional[str], root,
+                                  parse_error: Optional[Exception],
+                                  order: Tuple[int, ...], findings: List['_Finding']):
+        """Check a relationship part declares well-formed relationships"""
+        try:
+            if parse_error is not None:
+                raise parse_error
+            
+            # Check namespace
+            if self.REQUIRED_NAMESPACES["relationships"] not in rels_xml:
+                findings.append(_Finding(order, 'warning', "relationships", "Missing relationships namespace", rels_file))
+            
+            # Check for at least one relationship
+            relationships = root.findall('.//Relationship')
+            if len(relationships) == 0:
+                # Try with namespace
+                ns_relationships = root.findall(f'.//{{{self.REQUIRED_NAMESPACES["relationships"]}}}Relationship')
+                if len(ns_relationships) == 0:
+                    findings.append(_Finding(order, 'warning', "relationships", "No relationships found", rels_file))
                 else:
-                    root = etree.fromstring(rels_xml)
-                
-                # Check namespace
-                if self.REQUIRED_NAMESPACES["relationships"] not in rels_xml:
-                    result.add_warning("relationships", "Missing relationships namespace", rels_file)
-                
-                # Check for at least one relationship
-                relationships = root.findall('.//Relationship')
-                if len(relationships) == 0:
-                    # Try with namespace
-                    ns_relationships = root.findall(f'.//{{{self.REQUIRED_NAMESPACES["relationships"]}}}Relationship')
-                    if len(ns_relationships) == 0:
-                        result.add_warning("relationships", "No relationships found", rels_file)
-                    else:
-                        relationships = ns_relationships
-                
-                # Validate relationship attributes
-                for rel in relationships:
-                    if not rel.get('Id'):
-                        result.add_error("relationships", "Missing relationship Id", rels_file)
-                    if not rel.get('Target'):
-                        result.add_error("relationships", "Missing relationship Target", rels_file)
+                    relationships = ns_relationships
             
-            except Exception as e:
-                result.add_error("parsing", f"Failed to parse relationships: {e}", rels_file)
+            # Validate relationship attributes
+            for rel in relationships:
+                if not rel.get('Id'):
+                    findings.append(_Finding(order, 'error', "relationships", "Missing relationship Id", rels_file))
+                if not rel.get('Target'):
+                    findings.append(_Finding(order, 'error', "relationships", "Missing relationship Target", rels_file))
+        
+        except Exception as e:
+            findings.append(_Finding(order, 'error', "parsing", f"Failed to parse relationships: {e}", rels_file))
+    
+    def _parse_xml(self, xml_content: str):
+        """Parse XML text with the lenient parser every check shares"""
+        if LXML_AVAILABLE:
+            parser = etree.XMLParser(recover=True, remove_comments=False)
+            return etree.fromstring(xml_content.encode('utf-8'), parser)
+        return etree.fromstring(xml_content)
+    
+    def _variant_dir_of(self, file_path: str) -> Optional[str]:
+        """variantN directory a part belongs to, if any"""
+        if 'themeVariants/variant' in file_path:
+            parts = file_path.split('/')
+            if len(parts) >= 2 and parts[1].startswith('variant'):
+                return parts[1]
+        return None
+    
+    def _variant_sort_key(self, variant_dir: str) -> Tuple[int, int, str]:
+        """Numeric order for variant directories (variant2 before variant10)"""
+        suffix = variant_dir[len('variant'):]
+        if suffix.isdigit():
+            return (0, int(suffix), '')
+        return (1, 0, variant_dir)
     
     def _validate_performance(self, zf: zipfile.ZipFile, result: ValidationResult):
         """Validate performance characteristics"""
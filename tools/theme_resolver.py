@@ -8,6 +8,8 @@ Features:
 - Complete theme color slot resolution (accent1-6, dk1/lt1, etc.)
 - Theme font resolution (majorFont/minorFont) with fallbacks
 - Color transformations (tint/shade/lumMod/lumOff) matching Office algorithms
+- Batch transformation chains with an optional NumPy backend and a memo table
+- WCAG contrast validation of theme palettes via a cached contrast matrix
 - Theme inheritance validation across PowerPoint, Word, Excel
 - Cross-platform compatibility validation
 - Performance optimization for large theme processing
@@ -21,12 +23,17 @@ Usage:
     # Apply Office-style transformations
     tinted_color = resolver.apply_color_transformation('4472C4', 'tint', 50000)
     
+    # Tint/shade ramps for many colors in one pass
+    ramps = resolver.color_engine.generate_color_ramps(
+        ['4472C4', '70AD47'], [[('tint', 40000)], [('shade', 25000)]]
+    )
+    
     # Extract theme from OOXML
     theme = resolver.extract_theme_from_ooxml_file('template.potx')
 """
 
 
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 import xml.etree.ElementTree as ET
 import colorsys
 import zipfile
@@ -34,8 +41,33 @@ from pathlib import Path
 from dataclasses import dataclass, field
 import logging
 
+# Optional vectorized backend for batch color transformations
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from .contrast_matrix import ContrastPair, compute_contrast_matrix
+except ImportError:
+    from contrast_matrix import ContrastPair, compute_contrast_matrix
+
 logger = logging.getLogger(__name__)
 
+# colorsys divides by 2.0-maxc-minc for lightness > 0.5 from Python 3.11.5/3.12
+# (gh-106498) and by 2.0-sumc before; the two can differ in the last bit, so
+# probe the running interpreter and let the NumPy backend do the same
+_COLORSYS_SEPARATE_SATURATION_TERMS = (
+    colorsys.rgb_to_hls(134 / 255.0, 133 / 255.0, 133 / 255.0)[2]
+    == (134 / 255.0 - 133 / 255.0) / (2.0 - 134 / 255.0 - 133 / 255.0)
+)
+
+# (transformation type, value in Office units), e.g. ('lumMod', 75000)
+ColorTransform = Tuple[str, float]
+ColorTransformChain = Sequence[ColorTransform]
+
 
 @dataclass
 class ThemeColor:
@@ -118,11 +150,41 @@ class Theme:
 class ColorTransformationEngine:
     """Engine for Office-compatible color transformations"""
     
+    # Transformation type -> method applying it to an RGB tuple
+    TRANSFORM_METHODS = {
+        'tint': 'apply_tint',
+        'shade': 'apply_shade',
+        'lumMod': 'apply_lum_mod',
+        'lumOff': 'apply_lum_off',
+        'satMod': 'apply_sat_mod',
+        'satOff': 'apply_sat_off',
+        'hueMod': 'apply_hue_mod',
+        'hueOff': 'apply_hue_off'
+    }
+    
+    # Batches below this size are faster without array conversion
+    NUMPY_MIN_BATCH = 64
+    
+    def __init__(self, use_numpy: Optional[bool] = None, memo_size_limit: int = 100000):
+        """
+        Args:
+            use_numpy: Vectorize batches with NumPy (None: when NumPy is installed)
+            memo_size_limit: Most (color, chain) results kept; the memo is reset when full
+        """
+        if use_numpy and not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is not installed; use use_numpy=None or False")
+        self.use_numpy = NUMPY_AVAILABLE if use_numpy is None else use_numpy
+        self.memo_size_limit = memo_size_limit
+        # Distinct chains get small integer ids, so memo keys hash cheaply
+        self._chain_ids: Dict[Tuple[ColorTransform, ...], int] = {}
+        self._chains: List[Tuple[ColorTransform, ...]] = []
+        self._chain_memo: Dict[Tuple[str, int], str] = {}
+    
     @staticmethod
     def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple"""
         hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return (int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
     
     @staticmethod
     def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
@@ -132,8 +194,8 @@ class ColorTransformationEngine:
     @staticmethod
     def rgb_to_hsl(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
         """Convert RGB to HSL (0-1 range)"""
-        r, g, b = [x / 255.0 for x in rgb]
-        return colorsys.rgb_to_hls(r, g, b)
+        r, g, b = rgb
+        return colorsys.rgb_to_hls(r / 255.0, g / 255.0, b / 255.0)
     
     @staticmethod
     def hsl_to_rgb(hsl: Tuple[float, float, float]) -> Tuple[int, int, int]:
@@ -146,19 +208,19 @@ class ColorTransformationEngine:
         """Apply tint transformation (mix with white)"""
         # Office tint: RGB = RGB * (1 - tint) + 255 * tint
         tint_factor = tint_value / 100000.0
-        return tuple(
-            int(rgb[i] * (1 - tint_factor) + 255 * tint_factor)
-            for i in range(3)
+        r, g, b = rgb
+        return (
+            int(r * (1 - tint_factor) + 255 * tint_factor),
+            int(g * (1 - tint_factor) + 255 * tint_factor),
+            int(b * (1 - tint_factor) + 255 * tint_factor)
         )
     
     def apply_shade(self, rgb: Tuple[int, int, int], shade_value: float) -> Tuple[int, int, int]:
         """Apply shade transformation (mix with black)"""
         # Office shade: RGB = RGB * (1 - shade)
         shade_factor = shade_value / 100000.0
-        return tuple(
-            int(rgb[i] * (1 - shade_factor))
-            for i in range(3)
-        )
+        r, g, b = rgb
+        return (int(r * (1 - shade_factor)), int(g * (1 - shade_factor)), int(b * (1 - shade_factor)))
     
     def apply_lum_mod(self, rgb: Tuple[int, int, int], lum_mod_value: float) -> Tuple[int, int, int]:
         """Apply luminance modulation"""
@@ -204,23 +266,239 @@ class ColorTransformationEngine:
         """Apply specified transformation to color"""
         rgb = self.hex_to_rgb(base_color)
         
-        transform_methods = {
-            'tint': self.apply_tint,
-            'shade': self.apply_shade,
-            'lumMod': self.apply_lum_mod,
-            'lumOff': self.apply_lum_off,
-            'satMod': self.apply_sat_mod,
-            'satOff': self.apply_sat_off,
-            'hueMod': self.apply_hue_mod,
-            'hueOff': self.apply_hue_off
-        }
-        
-        if transform_type in transform_methods:
-            transformed_rgb = transform_methods[transform_type](rgb, value)
+        if transform_type in self.TRANSFORM_METHODS:
+            transformed_rgb = getattr(self, self.TRANSFORM_METHODS[transform_type])(rgb, value)
             return self.rgb_to_hex(transformed_rgb)
         else:
             logger.warning(f"Unknown color transformation: {transform_type}")
             return base_color  # Return original if unknown transformation
+    
+    def apply_transformation_chains(self, base_colors: Sequence[str],
+                                    chains: Sequence[ColorTransformChain]) -> List[str]:
+        """
+        Apply one transformation chain per base color in a single pass.
+        
+        Each result equals applying the chain's steps one after another with
+        apply_transformation, bit for bit, whichever backend computes it.
+        Repeated (color, chain) pairs are served from a memo table.
+        
+        Args:
+            base_colors: Base colors (6-character hex)
+            chains: One sequence of (transform type, value) steps per base color
+            
+        Returns:
+            Transformed colors in input order
+        """
+        if len(base_colors) != len(chains):
+            raise ValueError(f"Got {len(base_colors)} base colors but {len(chains)} transformation chains")
+        
+        if len(self._chains) > self.memo_size_limit:
+            self.clear_memo()
+        
+        results: List[Optional[str]] = [None] * len(base_colors)
+        # Chains are usually shared between many colors: look each object up once
+        chain_ids_by_object: Dict[int, int] = {}
+        # Distinct uncached pairs -> positions in the batch
+        pending: Dict[Tuple[str, int], List[int]] = {}
+        for index, (base_color, chain) in enumerate(zip(base_colors, chains)):
+            chain_id = chain_ids_by_object.get(id(chain))
+            if chain_id is None:
+                chain_id = chain_ids_by_object[id(chain)] = self._chain_id(chain)
+            key = (base_color, chain_id)
+            cached = self._chain_memo.get(key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(key, []).append(index)
+        
+        if pending:
+            keys = list(pending)
+            self._warn_unknown_transforms(keys)
+            if self.use_numpy and len(keys) >= self.NUMPY_MIN_BATCH:
+                computed = self._apply_chains_numpy(keys)
+            else:
+                computed = self._apply_chains_python(keys)
+            
+            if len(self._chain_memo) + len(keys) > self.memo_size_limit:
+                self._chain_memo.clear()
+            # A batch larger than the memo only memoizes its first results
+            room = self.memo_size_limit - len(self._chain_memo)
+            for position, (key, color) in enumerate(zip(keys, computed)):
+                if position < room:
+                    self._chain_memo[key] = color
+                for index in pending[key]:
+                    results[index] = color
+        
+        return results
+    
+    def generate_color_ramps(self, base_colors: Sequence[str],
+                             chains: Sequence[ColorTransformChain]) -> List[List[str]]:
+        """
+        Apply every chain to every base color (e.g. tint/shade ramps per theme slot).
+        
+        Returns:
+            One row per base color, one column per chain
+        """
+        flat = self.apply_transformation_chains(
+            [base_color for base_color in base_colors for _ in chains],
+            [chain for _ in base_colors for chain in chains]
+        )
+        width = len(chains)
+        return [flat[row * width:(row + 1) * width] for row in range(len(base_colors))]
+    
+    def clear_memo(self) -> None:
+        """Forget memoized batch results"""
+        self._chain_memo.clear()
+        self._chain_ids.clear()
+        self._chains.clear()
+    
+    def _chain_id(self, chain: ColorTransformChain) -> int:
+        chain_key = tuple((step[0], step[1]) for step in chain)
+        chain_id = self._chain_ids.get(chain_key)
+        if chain_id is None:
+            chain_id = self._chain_ids[chain_key] = len(self._chains)
+            self._chains.append(chain_key)
+        return chain_id
+    
+    def _warn_unknown_transforms(self, keys: List[Tuple[str, int]]) -> None:
+        unknown = {transform_type for chain_id in {chain_id for _, chain_id in keys}
+                   for transform_type, _ in self._chains[chain_id]
+                   if transform_type not in self.TRANSFORM_METHODS}
+        for transform_type in sorted(unknown):
+            logger.warning(f"Unknown color transformation: {transform_type}")
+    
+    def _apply_chains_python(self, keys: List[Tuple[str, int]]) -> List[str]:
+        """Pure-Python path: the per-color transformation methods, each color and chain prepared once"""
+        rgb_by_color: Dict[str, Tuple[int, int, int]] = {}
+        steps_by_chain: Dict[int, list] = {}
+        results = []
+        for base_color, chain_id in keys:
+            steps = steps_by_chain.get(chain_id)
+            if steps is None:
+                # Unknown types are skipped, as apply_transformation leaves the color unchanged
+                steps = steps_by_chain[chain_id] = [
+                    (getattr(self, self.TRANSFORM_METHODS[transform_type]), value)
+                    for transform_type, value in self._chains[chain_id]
+                    if transform_type in self.TRANSFORM_METHODS
+                ]
+            if not steps:
+                # Like apply_transformation, a chain without known steps returns the input untouched
+                results.append(base_color)
+                continue
+            
+            rgb = rgb_by_color.get(base_color)
+            if rgb is None:
+                rgb = rgb_by_color[base_color] = self.hex_to_rgb(base_color)
+            for step_number, (method, value) in enumerate(steps):
+                if step_number and not (0 <= min(rgb) and max(rgb) <= 255):
+                    rgb = self._reparse_out_of_range(rgb)
+                rgb = method(rgb, value)
+            results.append(self.rgb_to_hex(rgb))
+        return results
+    
+    def _reparse_out_of_range(self, rgb: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """What the next step sees when one-at-a-time calls pass an out-of-range color on as hex"""
+        return self.hex_to_rgb(self.rgb_to_hex(rgb))
+    
+    def _apply_chains_numpy(self, keys: List[Tuple[str, int]]) -> List[str]:
+        """NumPy path: step k of every chain is applied to all colors at once, grouped by type"""
+        rgb = np.array([self.hex_to_rgb(base_color) for base_color, _ in keys], dtype=np.int64)
+        chains = [self._chains[chain_id] for _, chain_id in keys]
+        transformed = np.zeros(len(keys), dtype=bool)
+        out_of_range = np.zeros(len(keys), dtype=bool)
+        
+        for step in range(max(len(chain) for chain in chains)):
+            rows_by_type: Dict[str, Tuple[List[int], List[float]]] = {}
+            for row, chain in enumerate(chains):
+                if step < len(chain) and chain[step][0] in self.TRANSFORM_METHODS:
+                    rows, values = rows_by_type.setdefault(chain[step][0], ([], []))
+                    rows.append(row)
+                    values.append(chain[step][1])
+            for transform_type, (rows, values) in rows_by_type.items():
+                rows = np.array(rows, dtype=np.intp)
+                rgb[rows] = _np_apply_transform(rgb[rows], transform_type, np.array(values, dtype=np.float64))
+                transformed[rows] = True
+            # Out-of-range intermediates are re-parsed from hex between steps; leave those rows to Python
+            out_of_range |= ((rgb < 0) | (rgb > 255)).any(axis=1)
+        
+        fallback = set(np.flatnonzero(out_of_range).tolist())
+        if fallback:
+            fallback_keys = [keys[row] for row in sorted(fallback)]
+            fallback_colors = dict(zip(sorted(fallback), self._apply_chains_python(fallback_keys)))
+        return [
+            fallback_colors[row] if row in fallback
+            else self.rgb_to_hex(tuple(channels)) if was_transformed else base_color
+            for row, ((base_color, _), channels, was_transformed)
+            in enumerate(zip(keys, rgb.tolist(), transformed.tolist()))
+        ]
+
+
+def _np_rgb_to_hls(rgb):
+    """colorsys.rgb_to_hls over an (n, 3) array, operation for operation"""
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    gray = minc == maxc
+    with np.errstate(divide='ignore', invalid='ignore'):
+        upper = 2.0 - maxc - minc if _COLORSYS_SEPARATE_SATURATION_TERMS else 2.0 - sumc
+        s = np.where(l <= 0.5, rangec / sumc, rangec / upper)
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+        h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+        h = np.mod(h / 6.0, 1.0)
+    return np.where(gray, 0.0, h), l, np.where(gray, 0.0, s)
+
+
+def _np_hls_channel(m1, m2, hue):
+    """colorsys._v over arrays"""
+    hue = np.mod(hue, 1.0)
+    return np.where(hue < colorsys.ONE_SIXTH, m1 + (m2 - m1) * hue * 6.0,
+                    np.where(hue < 0.5, m2,
+                             np.where(hue < colorsys.TWO_THIRD,
+                                      m1 + (m2 - m1) * (colorsys.TWO_THIRD - hue) * 6.0, m1)))
+
+
+def _np_hls_to_rgb(h, l, s):
+    """colorsys.hls_to_rgb over arrays, returning an (n, 3) array"""
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+    rgb = np.stack([
+        _np_hls_channel(m1, m2, h + colorsys.ONE_THIRD),
+        _np_hls_channel(m1, m2, h),
+        _np_hls_channel(m1, m2, h - colorsys.ONE_THIRD)
+    ], axis=1)
+    gray = s == 0.0
+    rgb[gray] = l[gray, None]
+    return rgb
+
+
+def _np_apply_transform(rgb, transform_type: str, values):
+    """Vectorized ColorTransformationEngine.apply_<type> over an (n, 3) int array"""
+    factor = values / 100000.0
+    if transform_type == 'tint':
+        return (rgb * (1 - factor)[:, None] + 255 * factor[:, None]).astype(np.int64)
+    if transform_type == 'shade':
+        return (rgb * (1 - factor)[:, None]).astype(np.int64)
+    
+    # Same unpacking as rgb_to_hsl/hsl_to_rgb above, so results match them exactly
+    h, s, l = _np_rgb_to_hls(rgb / 255.0)
+    if transform_type == 'lumMod':
+        l = np.maximum(0.0, np.minimum(1.0, l * factor))
+    elif transform_type == 'lumOff':
+        l = np.maximum(0.0, np.minimum(1.0, l + factor))
+    elif transform_type == 'satMod':
+        s = np.maximum(0.0, np.minimum(1.0, s * factor))
+    elif transform_type == 'satOff':
+        s = np.maximum(0.0, np.minimum(1.0, s + factor))
+    elif transform_type == 'hueMod':
+        h = np.mod(h * factor, 1.0)
+    elif transform_type == 'hueOff':
+        h = np.mod(h + factor, 1.0)
+    return (_np_hls_to_rgb(h, l, s) * 255).astype(np.int64)
 
 
 class ThemeResolver:
@@ -265,6 +543,9 @@ class ThemeResolver:
         'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
     }
     
+    # Color types checked as text against 'background' slots
+    CONTRAST_FOREGROUND_TYPES = ('text', 'hyperlink')
+    
     def __init__(self):
         self.color_engine = ColorTransformationEngine()
         self._theme_cache = {}  # Cache for parsed themes
@@ -632,6 +913,47 @@ class ThemeResolver:
         
         return theme_variants
     
+    def validate_theme_contrast(self, theme: Theme, level: str = 'AA',
+                                large_text: bool = False) -> List[ContrastPair]:
+        """
+        Text and link colours that lack contrast against the theme backgrounds.
+        
+        Args:
+            theme: Theme to check
+            level: WCAG level ('AA' or 'AAA')
+            large_text: Use the large-text thresholds
+            
+        Returns:
+            Failing foreground/background pairs (hex values without '#')
+        """
+        foregrounds = [color.rgb_value for color in theme.colors.values()
+                       if color.color_type in self.CONTRAST_FOREGROUND_TYPES]
+        backgrounds = [color.rgb_value for color in theme.colors.values()
+                       if color.color_type == 'background']
+        if not foregrounds or not backgrounds:
+            return []
+        
+        # One matrix per palette; themes sharing a palette hit the cache
+        matrix = compute_contrast_matrix(color.rgb_value for color in theme.colors.values())
+        return matrix.failing_pairs(level, large_text, foregrounds=foregrounds, backgrounds=backgrounds)
+    
+    def validate_theme_variants_contrast(self, theme_variants: Dict[str, Dict[str, Theme]],
+                                         level: str = 'AA',
+                                         large_text: bool = False) -> Dict[str, Dict[str, List[ContrastPair]]]:
+        """
+        Contrast check for every theme from generate_theme_variants_from_tokens.
+        
+        Returns:
+            Variant name -> aspect ratio token -> failing pairs
+        """
+        return {
+            variant_name: {
+                aspect_ratio: self.validate_theme_contrast(theme, level, large_text)
+                for aspect_ratio, theme in variant_themes.items()
+            }
+            for variant_name, variant_themes in theme_variants.items()
+        }
+    
     def create_theme_from_tokens_with_aspect_ratio(self, design_tokens: Dict[str, Any], 
                                                  variant_name: str,
                                                  aspect_ratio_token: str) -> Theme:
@@ -11,7 +11,7 @@ Part of the StyleStack JSON-to-OOXML Processing Engine.
 
 from typing import Dict, List, Any, Optional, Union, Callable
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 import re
@@ -19,12 +19,18 @@ import re
 from tools.formula_parser import FormulaParser, FormulaError
 from tools.variable_resolver import VariableResolver as ProductionVariableResolver
 from tools.formula_variable_resolver import FormulaVariableResolver
-from tools.emu_types import EMUValue, EMUConversionError
+from tools.emu_types import EMUValue, EMUConversionError, EMU_PER_POINT, EMU_PER_INCH, EMU_PER_CM
 from tools.json_patch_parser import JSONPatchParser
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+UNIT_EXPRESSION_PATTERN = re.compile(r'^([0-9]*\.?[0-9]+)\s*(pt|in|cm|emu)?$', re.IGNORECASE)
+
+class FormattedEMUValue(EMUValue):
+    """EMUValue that carries per-instance OOXML format methods (EMUValue itself is slotted)."""
+
+
 # Production EMU Type System for integration
 class ProductionEMUTypeSystem:
     """Production EMU type system with comprehensive format support."""
@@ -47,13 +53,13 @@ class ProductionEMUTypeSystem:
             if expression.strip().startswith('='):
                 result = self.formula_parser.parse_formula(expression[1:])
                 if hasattr(result, 'value'):
-                    emu_val = EMUValue(result.value)
+                    emu_val = FormattedEMUValue(result.value)
                 else:
-                    emu_val = EMUValue(result)
+                    emu_val = FormattedEMUValue(result)
             else:
                 # Parse as unit expression or direct EMU value
                 parsed_value = self._parse_unit_expression(expression)
-                emu_val = EMUValue(parsed_value)
+                emu_val = FormattedEMUValue(parsed_value)
             
             # Add format methods for different OOXML contexts
             self._add_format_methods(emu_val)
@@ -67,8 +73,7 @@ class ProductionEMUTypeSystem:
         expr = expression.strip()
         
         # Try to extract number and unit
-        import re
-        match = re.match(r'^([0-9]*\.?[0-9]+)\s*(pt|in|cm|emu)?$', expr, re.IGNORECASE)
+        match = UNIT_EXPRESSION_PATTERN.match(expr)
         
         if not match:
             # Try parsing as direct number
@@ -91,7 +96,7 @@ class ProductionEMUTypeSystem:
         else:
             raise ValueError(f"Unsupported unit: '{unit}'")
     
-    def _add_format_methods(self, emu_val: EMUValue):
+    def _add_format_methods(self, emu_val: FormattedEMUValue):
         """Add context-specific format methods to EMUValue."""
         def to_presentation_format():
             """Format for PowerPoint presentation contexts (points)."""
@@ -151,6 +156,24 @@ class TokenResolutionResult:
             self.errors = []
 
 
+@dataclass
+class ResolutionMemo:
+    """Memoized resolutions for one call site (e.g. one integrated processor).
+
+    ``strings`` maps (value, token-set version, scope, template type) to the
+    resolved string; ``emu`` maps (EMU expression, template type) to its
+    formatted conversion, which does not depend on the token set.
+    """
+    strings: Dict[tuple, str] = field(default_factory=dict)
+    emu: Dict[tuple, str] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+    def clear(self):
+        self.strings.clear()
+        self.emu.clear()
+
+
 class TokenIntegrationLayer:
     """
     Integration layer between token systems and OOXML processing.
@@ -190,6 +213,12 @@ class TokenIntegrationLayer:
         self.resolution_cache = {}
         self.cache_size_limit = 1000
         
+        # Memoized patch-value resolution; keys carry the token-set version,
+        # which changes whenever registered or production tokens change
+        self._token_version = 0
+        self._memo = ResolutionMemo()
+        self.memo_size_limit = 10000
+        
         # Production variable resolution cache
         self._resolved_variables_cache: Dict[str, Any] = {}
         self._cache_context: Optional[str] = None
@@ -244,6 +273,7 @@ class TokenIntegrationLayer:
                 self._resolved_variables_cache[name] = resolved_var.final_value
                 
             self._cache_context = context_key
+            self._bump_token_version()
             logger.info(f"Cached {len(resolved_vars)} production variables")
             
         except Exception as e:
@@ -271,7 +301,8 @@ class TokenIntegrationLayer:
             scope_registry[template_type][name] = value
         else:
             scope_registry[name] = value
-            
+        
+        self._bump_token_version()
         logger.debug(f"Registered token '{name}' in {scope.value} scope for {template_type or 'all'} templates")
     
     def integrate_with_processor(self, processor: JSONPatchParser):
@@ -283,6 +314,7 @@ class TokenIntegrationLayer:
         """
         # Add token resolution as a pre-processing step
         original_apply_patch = processor.apply_patch
+        memo = ResolutionMemo()
         
         def token_aware_apply_patch(xml_doc, patch_data, context=None):
             # Create token context
@@ -295,7 +327,7 @@ class TokenIntegrationLayer:
             )
             
             # Resolve tokens in patch data
-            resolved_patch = self.resolve_patch_tokens(patch_data, token_context)
+            resolved_patch = self.resolve_patch_tokens(patch_data, token_context, memo)
             
             # Apply the patch with resolved tokens
             return original_apply_patch(xml_doc, resolved_patch, context)
@@ -304,36 +336,60 @@ class TokenIntegrationLayer:
         logger.info("Integrated token resolution with JSON-to-OOXML processor")
     
     def resolve_patch_tokens(self, patch_data: Dict[str, Any], 
-                           context: TokenContext) -> Dict[str, Any]:
+                           context: TokenContext,
+                           memo: Optional[ResolutionMemo] = None) -> Dict[str, Any]:
         """
         Resolve all tokens in a patch operation.
         
         Args:
             patch_data: Patch operation data
             context: Token resolution context
+            memo: Call-site memo (defaults to the layer's shared memo)
             
         Returns:
             Patch data with resolved tokens
         """
+        memo = memo if memo is not None else self._memo
         resolved_patch = {}
         
         for key, value in patch_data.items():
-            resolved_patch[key] = self._resolve_value_tokens(value, context)
+            resolved_patch[key] = self._resolve_value_tokens(value, context, memo)
             
         return resolved_patch
     
-    def _resolve_value_tokens(self, value: Any, context: TokenContext) -> Any:
+    def _resolve_value_tokens(self, value: Any, context: TokenContext,
+                              memo: Optional[ResolutionMemo] = None) -> Any:
         """Recursively resolve tokens in any value type."""
         if isinstance(value, str):
-            return self._resolve_string_tokens(value, context)
+            # Fast path: literals without '{' hold no ${}, @{} or #{} tokens
+            if '{' not in value:
+                return value
+            return self._resolve_string_memoized(value, context, memo or self._memo)
         elif isinstance(value, dict):
-            return {k: self._resolve_value_tokens(v, context) for k, v in value.items()}
+            return {k: self._resolve_value_tokens(v, context, memo) for k, v in value.items()}
         elif isinstance(value, list):
-            return [self._resolve_value_tokens(item, context) for item in value]
+            return [self._resolve_value_tokens(item, context, memo) for item in value]
         else:
             return value
     
-    def _resolve_string_tokens(self, text: str, context: TokenContext) -> str:
+    def _resolve_string_memoized(self, text: str, context: TokenContext,
+                                 memo: ResolutionMemo) -> str:
+        """Resolve a token string once per (value, token-set version, scope, template)."""
+        key = (text, self._token_version, context.scope, context.template_type)
+        resolved = memo.strings.get(key)
+        if resolved is not None:
+            memo.hits += 1
+            return resolved
+        
+        memo.misses += 1
+        resolved = self._resolve_string_tokens(text, context, memo.emu)
+        if len(memo.strings) >= self.memo_size_limit:
+            memo.strings.clear()
+        memo.strings[key] = resolved
+        return resolved
+    
+    def _resolve_string_tokens(self, text: str, context: TokenContext,
+                               emu_cache: Optional[Dict[tuple, str]] = None) -> str:
         """Resolve tokens in a string value."""
         result = text
         
@@ -348,12 +404,26 @@ class TokenIntegrationLayer:
         )
         
         # Resolve EMU tokens: #{emu_expression}
-        result = self.emu_pattern.sub(
-            lambda m: self._resolve_emu_token(m.group(1), context), result
-        )
+        if emu_cache is None:
+            resolve_emu = lambda m: self._resolve_emu_token(m.group(1), context)
+        else:
+            resolve_emu = lambda m: self._resolve_emu_token_cached(m.group(1), context, emu_cache)
+        result = self.emu_pattern.sub(resolve_emu, result)
         
         return result
     
+    def _resolve_emu_token_cached(self, emu_expression: str, context: TokenContext,
+                                  emu_cache: Dict[tuple, str]) -> str:
+        """Resolve an EMU token through a call-site conversion cache."""
+        key = (emu_expression, context.template_type)
+        result = emu_cache.get(key)
+        if result is None:
+            result = self._resolve_emu_token(emu_expression, context)
+            if len(emu_cache) >= self.memo_size_limit:
+                emu_cache.clear()
+            emu_cache[key] = result
+        return result
+    
     def _resolve_variable_token(self, token_name: str, context: TokenContext) -> str:
         """Resolve a variable token."""
         cache_key = f"var_{token_name}_{context.scope.value}_{context.template_type}"
@@ -534,13 +604,24 @@ class TokenIntegrationLayer:
     def clear_cache(self):
         """Clear the resolution cache."""
         self.resolution_cache.clear()
+        self._memo.clear()
         logger.debug("Token resolution cache cleared")
     
+    def _bump_token_version(self):
+        """Invalidate memoized resolutions after the token set changed."""
+        self._token_version += 1
+        self.resolution_cache.clear()
+        self._memo.strings.clear()
+    
     def get_resolution_statistics(self) -> Dict[str, Any]:
         """Get statistics about token resolution performance."""
         return {
             'cache_size': len(self.resolution_cache),
             'cache_limit': self.cache_size_limit,
+            'token_version': self._token_version,
+            'memoized_values': len(self._memo.strings),
+            'memo_hits': self._memo.hits,
+            'memo_misses': self._memo.misses,
             'registered_tokens_by_scope': {
                 scope.value: len(registry) for scope, registry in self.token_registry.items()
             },
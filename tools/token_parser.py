@@ -27,6 +27,8 @@ from tools.core import (
 )
 import re
 
+from tools.reference_scanner import LITERAL, VARIABLE, scan
+
 # Configure logging
 logger = get_logger(__name__)
 
@@ -197,10 +199,8 @@ class TokenParser:
         self.errors.clear()
         self.parsed_tokens.clear()
         
-        # Find all token matches
-        matches = list(self.TOKEN_PATTERN.finditer(content))
-        
-        for match in matches:
+        # Find all token matches among the scanned reference segments
+        for match in self._token_matches(content):
             try:
                 token = self._parse_single_token(match, content, source_file)
                 if token:
@@ -214,6 +214,17 @@ class TokenParser:
         
         return self.parsed_tokens
     
+    def _token_matches(self, content: str):
+        """Yield TOKEN_PATTERN matches at the {references} found by the shared scanner"""
+        for segment in scan(content).segments:
+            if segment.kind == LITERAL or not segment.name.startswith('tokens.'):
+                continue
+            # ${tokens.x.y} still carries a {tokens.x.y} token after the '$'
+            start = segment.start + 1 if segment.kind == VARIABLE else segment.start
+            match = self.TOKEN_PATTERN.match(content, start)
+            if match:
+                yield match
+    
     def _parse_single_token(self, match: re.Match, content: str, source_file: Optional[str]) -> Optional[VariableToken]:
         """Parse and validate a single token match"""
         full_token = match.group(0)
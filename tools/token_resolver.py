@@ -6,15 +6,25 @@ Material Web-inspired token resolution with layered overrides:
 Core → Channel → Organization → Group → Personal
 
 Resolves token references like {colors.primary.500} to actual values.
+Each token value is compiled once into a template of literal and reference
+segments; references are resolved through a memoized walk of the reference
+graph, so a whole token set resolves in a single linear pass.
 """
 
 
-from typing import Any, Dict, Optional
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Tuple
 import json
-import re
 from pathlib import Path
 import click
 
+from tools.layered_tokens import LayeredTokenMap
+from tools.reference_scanner import REFERENCE, scan
+
+
+# Compiled template segment: (is_reference, literal text or token path)
+TemplateSegment = Tuple[bool, str]
+
 
 class TokenResolver:
     """Design token resolution engine following Material Web patterns"""
@@ -23,6 +33,10 @@ class TokenResolver:
         self.verbose = verbose
         self.tokens: Dict[str, Any] = {}
         self.resolved: Dict[str, str] = {}
+        # Compiled templates keyed by raw token value
+        self._template_cache: Dict[str, Optional[Tuple[TemplateSegment, ...]]] = {}
+        # Reference cycles found by the last resolve_token_references call
+        self.circular_references: List[List[str]] = []
         
     def load_core_tokens(self, tokens_dir: Path = None) -> Dict[str, Any]:
         """Load core primitive tokens"""
@@ -62,28 +76,13 @@ class TokenResolver:
             
         return layer_data.get('overrides', {})
     
-    def apply_overrides(self, base_tokens: Dict[str, Any], overrides: Dict[str, str]) -> Dict[str, Any]:
-        """Apply layer overrides to base tokens using dot notation"""
-        result = base_tokens.copy()
+    def apply_overrides(self, base_tokens: Mapping, overrides: Dict[str, str]) -> LayeredTokenMap:
+        """Apply layer overrides to base tokens using dot notation
         
-        for dot_path, new_value in overrides.items():
-            self._set_nested_value(result, dot_path, new_value)
-            
-        return result
-    
-    def _set_nested_value(self, obj: Dict[str, Any], dot_path: str, value: Any):
-        """Set nested dictionary value using dot notation path"""
-        keys = dot_path.split('.')
-        current = obj
-        
-        # Navigate to parent of target key
-        for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-        
-        # Set the final value
-        current[keys[-1]] = value
+        The base tokens are never copied or modified: the result is a layered
+        view holding only the overridden paths on top of the base.
+        """
+        return LayeredTokenMap(base_tokens).with_overrides(overrides)
     
     def _get_nested_value(self, obj: Dict[str, Any], dot_path: str) -> Any:
         """Get nested dictionary value using dot notation path"""
@@ -97,14 +96,14 @@ class TokenResolver:
         except (KeyError, TypeError):
             return None
     
-    def flatten_tokens(self, tokens: Dict[str, Any], prefix: str = "") -> Dict[str, str]:
+    def flatten_tokens(self, tokens: Mapping, prefix: str = "") -> Dict[str, str]:
         """Flatten nested token structure to dot notation dictionary"""
         flattened = {}
         
         for key, value in tokens.items():
             current_key = f"{prefix}.{key}" if prefix else key
             
-            if isinstance(value, dict):
+            if isinstance(value, Mapping):
                 if 'value' in value:
                     # This is a token with value
                     flattened[current_key] = value['value']
@@ -118,46 +117,104 @@ class TokenResolver:
         return flattened
     
     def resolve_token_references(self, flattened: Dict[str, str]) -> Dict[str, str]:
-        """Resolve token references like {colors.primary.500} to actual values"""
-        resolved = {}
-        max_iterations = 10  # Prevent infinite loops
+        """Resolve token references like {colors.primary.500} to actual values
+        
+        Every token is resolved exactly once, after the tokens it references,
+        so alias chains of any depth resolve in one pass. Circular references
+        are detected exactly; the reference closing a cycle is left unresolved.
+        """
+        resolved: Dict[str, Any] = {}
+        self.circular_references = []
+        
+        for key in flattened:
+            if key not in resolved:
+                self._resolve_token(key, flattened, resolved)
+        
+        return {key: resolved[key] for key in flattened}
+    
+    def _resolve_token(self, root_key: str, flattened: Dict[str, Any],
+                       resolved: Dict[str, Any]) -> None:
+        """Resolve a token and everything it references (iterative depth-first walk)"""
+        # Frames are [token path, index of the next template segment to visit],
+        # so each reference of a template is visited once
+        stack = [[root_key, 0]]
+        on_stack = {root_key}
+        reported = set()
         
-        for iteration in range(max_iterations):
-            changed = False
+        while stack:
+            frame = stack[-1]
+            key = frame[0]
+            template = self._compile_template(flattened[key])
             
-            for key, value in flattened.items():
-                if isinstance(value, str) and '{' in value:
-                    # Find token references in the value
-                    resolved_value = self._resolve_references_in_string(value, flattened)
-                    if resolved_value != value:
-                        flattened[key] = resolved_value
-                        changed = True
+            if template is not None:
+                pending = None
+                while frame[1] < len(template):
+                    is_reference, token_path = template[frame[1]]
+                    frame[1] += 1
+                    if not is_reference or token_path in resolved or token_path not in flattened:
+                        continue
+                    if token_path in on_stack:
+                        if (key, token_path) not in reported:
+                            reported.add((key, token_path))
+                            path = [frame_key for frame_key, _ in stack]
+                            cycle = path[path.index(token_path):] + [token_path]
+                            self.circular_references.append(cycle)
+                            click.echo(f"⚠️  Warning: Circular token reference: {' → '.join(cycle)}")
+                        continue
+                    pending = token_path
+                    break
                 
-                resolved[key] = flattened[key]
-            
-            if not changed:
-                break
+                if pending is not None:
+                    stack.append([pending, 0])
+                    on_stack.add(pending)
+                    continue
                 
-        if iteration == max_iterations - 1:
-            click.echo("⚠️  Warning: Maximum resolution iterations reached")
+                resolved[key] = self._render_template(template, resolved)
+            else:
+                resolved[key] = flattened[key]
             
-        return resolved
+            stack.pop()
+            on_stack.discard(key)
     
-    def _resolve_references_in_string(self, text: str, token_dict: Dict[str, str]) -> str:
-        """Resolve all token references in a string"""
-        # Pattern to match {token.path.here}
-        pattern = r'\{([^}]+)\}'
+    def _compile_template(self, value: Any) -> Optional[Tuple[TemplateSegment, ...]]:
+        """Compile a token value into literal/reference segments (None if it has no references)"""
+        if not isinstance(value, str) or '{' not in value:
+            return None
+        
+        if value in self._template_cache:
+            return self._template_cache[value]
         
-        def replace_token(match):
-            token_path = match.group(1)
-            if token_path in token_dict:
-                return str(token_dict[token_path])
+        scanned = scan(value)
+        template = None
+        if scanned.references:
+            template = tuple(
+                (True, segment.name) if segment.kind == REFERENCE else (False, segment.text)
+                for segment in scanned.segments
+            )
+        self._template_cache[value] = template
+        return template
+    
+    def _render_template(self, template: Tuple[TemplateSegment, ...],
+                         token_dict: Dict[str, Any]) -> str:
+        """Substitute resolved values into a compiled template"""
+        parts = []
+        for is_reference, text in template:
+            if not is_reference:
+                parts.append(text)
+            elif text in token_dict:
+                parts.append(str(token_dict[text]))
             else:
                 if self.verbose:
-                    click.echo(f"⚠️  Unresolved token reference: {token_path}")
-                return match.group(0)  # Return original if not found
-        
-        return re.sub(pattern, replace_token, text)
+                    click.echo(f"⚠️  Unresolved token reference: {text}")
+                parts.append(f"{{{text}}}")  # Keep original if not found
+        return "".join(parts)
+    
+    def _resolve_references_in_string(self, text: str, token_dict: Dict[str, str]) -> str:
+        """Resolve all token references in a string (single level)"""
+        template = self._compile_template(text)
+        if template is None:
+            return text
+        return self._render_template(template, token_dict)
     
     def resolve_tokens(self, 
                       fork: Optional[str] = None,
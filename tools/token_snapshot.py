@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+StyleStack Token Hierarchy Snapshots
+
+Compiles a token layer stack (core → fork → org → group ...) into a versioned
+binary snapshot that worker processes memory-map instead of parsing JSON.
+Precedence between layers is applied at compile time; token references are
+left in place and resolved by the reader at lookup time. Layers are either
+flattened to dot paths with their raw values (the default) or kept as whole
+top-level entries (flatten=False), the key space BulkTokenResolver reads.
+
+Snapshot layout (little-endian):
+
+- header: magic, format version, level count, entry count, SHA-256 digest
+  of the source files the snapshot was compiled from
+- level names: length-prefixed UTF-8 strings
+- index: fixed-size records sorted by token path, so lookups binary-search
+  the mapped file without decoding anything but the probed keys
+- data: token paths and values (strings as raw UTF-8, other values as JSON)
+
+Snapshot file names embed the source digest, so ``load_or_compile_snapshot``
+rebuilds automatically whenever any source file changes.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import click
+
+from tools.token_store import TokenStore
+
+SNAPSHOT_MAGIC = b'SSTOKSNP'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = '.snap'
+
+# magic, version, level count, entry count, source digest
+_HEADER = struct.Struct('<8sHHI32s')
+# key offset, key length, value offset, value length, level index, value kind
+_RECORD = struct.Struct('<IIIIBB2x')
+
+_VALUE_STR = 0
+_VALUE_JSON = 1
+
+# Layers accepted by the compile-tokens command, lowest precedence first
+DEFAULT_LAYER_ORDER = ('core', 'fork', 'org', 'group', 'personal', 'channel', 'extension')
+
+Layers = Sequence[Tuple[str, Path]]
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is missing, corrupt or of another format version"""
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_token_sources(layers: Layers, flatten: bool = True) -> bytes:
+    """Digest identifying a layer stack by level order, source file contents and key space"""
+    digest = hashlib.sha256(f"stylestack-token-snapshot:{SNAPSHOT_VERSION}".encode())
+    if not flatten:
+        digest.update(b"\0top-level")
+    for level_name, path in layers:
+        digest.update(f"\0{level_name}\0{hash_file(Path(path))}".encode())
+    return digest.digest()
+
+
+def snapshot_path_for(layers: Layers, cache_dir: Path, flatten: bool = True) -> Path:
+    """Cache location of the snapshot for a layer stack"""
+    return Path(cache_dir) / f"tokens-{hash_token_sources(layers, flatten).hex()[:24]}{SNAPSHOT_SUFFIX}"
+
+
+def _read_layer(path: Path, flatten: bool) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        tokens = json.load(f)
+    return TokenStore.from_tree(tokens).flatten() if flatten else tokens
+
+
+def compile_token_snapshot(layers: Layers, output_path: Path, flatten: bool = True) -> int:
+    """Compile a layer stack (lowest precedence first) into a snapshot file
+
+    Args:
+        layers: (level name, token JSON path) pairs, lowest precedence first
+        output_path: Snapshot file to write (replaced atomically)
+        flatten: Key tokens by dot path; otherwise by the layers' top-level keys
+
+    Returns:
+        Number of tokens in the snapshot
+    """
+    layers = [(level_name, Path(path)) for level_name, path in layers]
+    if len(layers) > 255:
+        raise SnapshotError("A snapshot holds at most 255 layers")
+
+    merged: Dict[str, Tuple[Any, int]] = {}
+    for level_index, (_, path) in enumerate(layers):
+        for token_path, value in _read_layer(path, flatten).items():
+            merged[token_path] = (value, level_index)
+
+    level_table = bytearray()
+    for level_name, _ in layers:
+        encoded = level_name.encode('utf-8')
+        level_table += struct.pack('<B', len(encoded)) + encoded
+
+    records = bytearray()
+    data = bytearray()
+    entries = sorted((key.encode('utf-8'), value, level) for key, (value, level) in merged.items())
+    for key, value, level_index in entries:
+        if isinstance(value, str):
+            kind, encoded = _VALUE_STR, value.encode('utf-8')
+        else:
+            kind, encoded = _VALUE_JSON, json.dumps(value, separators=(',', ':')).encode('utf-8')
+        key_offset = len(data)
+        data += key
+        value_offset = len(data)
+        data += encoded
+        records += _RECORD.pack(key_offset, len(key), value_offset, len(encoded), level_index, kind)
+
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(layers), len(entries),
+                          hash_token_sources(layers, flatten))
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=output_path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(level_table)
+            f.write(records)
+            f.write(data)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return len(entries)
+
+
+class TokenSnapshot(Mapping):
+    """Read-only, memory-mapped view of a compiled token snapshot
+
+    Values are decoded on lookup; the mapping is backed by the page cache and
+    shared between every process that opens the same snapshot file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise SnapshotError(f"Empty snapshot file: {self.path}") from e
+
+        try:
+            self._read_header()
+        except (SnapshotError, struct.error) as e:
+            self._mmap.close()
+            raise SnapshotError(f"Invalid token snapshot {self.path}: {e}") from e
+
+    def _read_header(self) -> None:
+        magic, version, level_count, entry_count, digest = _HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError("bad magic")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"format version {version}, expected {SNAPSHOT_VERSION}")
+
+        offset = _HEADER.size
+        levels = []
+        for _ in range(level_count):
+            length = self._mmap[offset]
+            levels.append(self._mmap[offset + 1:offset + 1 + length].decode('utf-8'))
+            offset += 1 + length
+
+        self.levels: List[str] = levels
+        self.source_digest: bytes = digest
+        self._count = entry_count
+        self._index_offset = offset
+        self._data_offset = offset + entry_count * _RECORD.size
+        if self._data_offset > len(self._mmap):
+            raise SnapshotError("truncated index")
+
+    def _record(self, position: int) -> Tuple[int, int, int, int, int, int]:
+        return _RECORD.unpack_from(self._mmap, self._index_offset + position * _RECORD.size)
+
+    def _key_bytes(self, record: Tuple[int, ...]) -> bytes:
+        start = self._data_offset + record[0]
+        return self._mmap[start:start + record[1]]
+
+    def _find(self, token_path: str) -> Optional[Tuple[int, ...]]:
+        target = token_path.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            record = self._record(middle)
+            key = self._key_bytes(record)
+            if key < target:
+                low = middle + 1
+            elif key > target:
+                high = middle
+            else:
+                return record
+        return None
+
+    def _decode_value(self, record: Tuple[int, ...]) -> Any:
+        start = self._data_offset + record[2]
+        raw = self._mmap[start:start + record[3]]
+        if record[5] == _VALUE_STR:
+            return raw.decode('utf-8')
+        return json.loads(raw)
+
+    def get_entry(self, token_path: str) -> Optional[Tuple[Any, str]]:
+        """Get (raw value, source level name) for a token path, or None"""
+        record = self._find(token_path)
+        if record is None:
+            return None
+        return self._decode_value(record), self.levels[record[4]]
+
+    def __getitem__(self, token_path: str) -> Any:
+        record = self._find(token_path) if isinstance(token_path, str) else None
+        if record is None:
+            raise KeyError(token_path)
+        return self._decode_value(record)
+
+    def __contains__(self, token_path: object) -> bool:
+        return isinstance(token_path, str) and self._find(token_path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._key_bytes(self._record(position)).decode('utf-8')
+
+    def __len__(self) -> int:
+        return self._count
+
+    def matches_sources(self, layers: Layers, flatten: bool = True) -> bool:
+        """Whether the snapshot was compiled from exactly these source files"""
+        return self.source_digest == hash_token_sources(layers, flatten)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> 'TokenSnapshot':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_or_compile_snapshot(layers: Layers, cache_dir: Path, flatten: bool = True) -> TokenSnapshot:
+    """Open the cached snapshot for a layer stack, compiling it if missing or stale"""
+    snapshot_path = snapshot_path_for(layers, cache_dir, flatten)
+    if snapshot_path.exists():
+        try:
+            snapshot = TokenSnapshot(snapshot_path)
+            if snapshot.matches_sources(layers, flatten):
+                return snapshot
+            snapshot.close()
+        except SnapshotError:
+            pass
+
+    compile_token_snapshot(layers, snapshot_path, flatten)
+    return TokenSnapshot(snapshot_path)
+
+
+@click.command('compile-tokens')
+@click.option('--core', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='Core token file')
+@click.option('--fork', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='Fork token file')
+@click.option('--org', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='Organization token file')
+@click.option('--group', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='Group token file')
+@click.option('--personal', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='Personal token file')
+@click.option('--channel', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='Channel token file')
+@click.option('--extension', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='Extension variables file')
+@click.option('--out', '-o', type=click.Path(path_type=Path), help='Snapshot file (default: content-addressed in --cache-dir)')
+@click.option('--cache-dir', type=click.Path(file_okay=False, path_type=Path), default=Path('.stylestack-cache'),
+              show_default=True, help='Snapshot cache directory')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def compile_tokens(out, cache_dir, verbose, **layer_files):
+    """Compile a token layer stack into a memory-mappable snapshot"""
+    layers = [(level, layer_files[level]) for level in DEFAULT_LAYER_ORDER if layer_files[level]]
+    if not layers:
+        raise click.UsageError("At least one token layer is required")
+
+    output_path = out or snapshot_path_for(layers, cache_dir)
+    if out is None and output_path.exists():
+        click.echo(f"✅ Snapshot up to date: {output_path}")
+        return
+
+    token_count = compile_token_snapshot(layers, output_path)
+    if verbose:
+        click.echo(f"   📚 Layers: {' → '.join(level for level, _ in layers)}")
+    click.echo(f"✅ Compiled {token_count} tokens to {output_path}")
+
+
+if __name__ == '__main__':
+    compile_tokens()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+StyleStack Columnar Token Store
+
+Compact in-memory representation for large design-token trees. Instead of
+one dict per token and group, every node gets an integer ID and its data is
+kept in parallel arrays:
+
+- interned local keys and parent IDs (``array('i')``); dot paths are derived
+- type IDs into a shared type-name table (``array('H')``)
+- raw values
+- reference targets, as tuples of token IDs parsed from ``{path}`` references
+
+Auxiliary token keys (``description``, ``$extensions``, ...) are stored as a
+shared key schema plus a tuple of values, and the values themselves are shared
+rather than copied. ``TokenTreeView`` and ``TokenView`` are zero-copy,
+read-only ``Mapping`` facades that behave like the nested dicts the resolvers
+consume today, so callers can adopt the store gradually.
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from tools.reference_scanner import scan
+
+ROOT_ID = 0
+MISSING_REFERENCE = -1
+
+# Keys that hold a token's value / type, in lookup order
+VALUE_KEYS = ('$value', 'value')
+TYPE_KEYS = ('$type', 'type')
+
+# Node kinds
+_GROUP = 0
+_SCALAR = 1     # bare value in the tree, e.g. "primary": "#0066CC"
+_TOKEN = 2      # dict token with a value key
+_DETACHED = 3   # descendant of a group that a later layer replaced with a token
+
+# Dict token shape flags: which value/type keys the source dict used
+_DOLLAR_VALUE = 1
+_HAS_TYPE = 2
+_DOLLAR_TYPE = 4
+
+
+class TokenStore:
+    """Columnar design-token store with integer node IDs"""
+
+    def __init__(self):
+        self._keys: List[str] = ['']
+        self._parents = array('i', [MISSING_REFERENCE])
+        self._kinds = bytearray([_GROUP])
+        self._shapes = bytearray([0])
+        self._type_ids = array('H', [0])
+        self._values: List[Any] = [None]
+        self._references: List[Tuple[int, ...]] = [()]
+        self._extra_schema_ids = array('H', [0])
+        self._extra_values: List[Tuple[Any, ...]] = [()]
+        # Group children keyed by local key, in insertion order
+        self._children: Dict[int, Dict[str, int]] = {ROOT_ID: {}}
+        self._type_names: List[str] = ['']
+        self._type_index: Dict[str, int] = {'': 0}
+        self._extra_schemas: List[Tuple[str, ...]] = [()]
+        self._extra_schema_index: Dict[Tuple[str, ...], int] = {(): 0}
+        self._token_count = 0
+
+    @classmethod
+    def from_tree(cls, tree: Mapping) -> 'TokenStore':
+        """Build a store from a nested token dict"""
+        store = cls()
+        store.load_tree(tree)
+        return store
+
+    def load_tree(self, tree: Mapping, parent_id: int = ROOT_ID) -> None:
+        """Add a nested token dict below a group; later loads override earlier ones"""
+        stack = [(parent_id, iter(tree.items()))]
+        while stack:
+            group_id, items = stack[-1]
+            for key, value in items:
+                if isinstance(key, str) and key.startswith('$'):
+                    # Group-level metadata such as $schema or $description
+                    continue
+                if isinstance(value, Mapping) and not self._is_token_dict(value):
+                    child_id = self._add_node(group_id, key, _GROUP, None, 0)
+                    stack.append((child_id, iter(value.items())))
+                    break
+                self._add_token(group_id, key, value)
+            else:
+                stack.pop()
+        self._link_references()
+
+    @staticmethod
+    def _is_token_dict(value: Mapping) -> bool:
+        return any(key in value for key in VALUE_KEYS)
+
+    def _add_token(self, group_id: int, key: str, value: Any) -> int:
+        if not isinstance(value, Mapping):
+            return self._add_node(group_id, key, _SCALAR, value, 0)
+
+        value_key = '$value' if '$value' in value else 'value'
+        shape = _DOLLAR_VALUE if value_key == '$value' else 0
+        type_key = next((k for k in TYPE_KEYS if k in value), None)
+        type_id = 0
+        if type_key is not None:
+            shape |= _HAS_TYPE | (_DOLLAR_TYPE if type_key == '$type' else 0)
+            type_id = self._type_id(value[type_key])
+
+        token_id = self._add_node(group_id, key, _TOKEN, value[value_key], type_id)
+        self._shapes[token_id] = shape
+
+        extra_keys = tuple(k for k in value if k != value_key and k != type_key)
+        if extra_keys:
+            schema_id = self._extra_schema_index.get(extra_keys)
+            if schema_id is None:
+                schema_id = len(self._extra_schemas)
+                self._extra_schemas.append(tuple(sys.intern(str(k)) for k in extra_keys))
+                self._extra_schema_index[extra_keys] = schema_id
+            self._extra_schema_ids[token_id] = schema_id
+            self._extra_values[token_id] = tuple(value[k] for k in extra_keys)
+        return token_id
+
+    def _add_node(self, group_id: int, key: str, kind: int, value: Any, type_id: int) -> int:
+        key = sys.intern(str(key))
+        existing = self._children[group_id].get(key)
+        if existing is not None:
+            return self._replace_node(existing, kind, value, type_id)
+
+        node_id = len(self._keys)
+        self._keys.append(key)
+        self._parents.append(group_id)
+        self._kinds.append(kind)
+        self._shapes.append(0)
+        self._type_ids.append(type_id)
+        self._values.append(value)
+        self._references.append(())
+        self._extra_schema_ids.append(0)
+        self._extra_values.append(())
+        self._children[group_id][key] = node_id
+        if kind == _GROUP:
+            self._children[node_id] = {}
+        else:
+            self._token_count += 1
+        return node_id
+
+    def _replace_node(self, node_id: int, kind: int, value: Any, type_id: int) -> int:
+        """Override a node in place; a group overriding a group merges"""
+        was_group = self._kinds[node_id] == _GROUP
+        if was_group and kind != _GROUP:
+            self._detach_children(node_id)
+            self._token_count += 1
+        elif not was_group and kind == _GROUP:
+            self._children[node_id] = {}
+            self._token_count -= 1
+
+        self._kinds[node_id] = kind
+        self._shapes[node_id] = 0
+        self._type_ids[node_id] = type_id
+        self._values[node_id] = value
+        self._extra_schema_ids[node_id] = 0
+        self._extra_values[node_id] = ()
+        return node_id
+
+    def _detach_children(self, group_id: int) -> None:
+        stack = list(self._children.pop(group_id).values())
+        while stack:
+            node_id = stack.pop()
+            if self._kinds[node_id] == _GROUP:
+                stack.extend(self._children.pop(node_id).values())
+            else:
+                self._token_count -= 1
+            self._kinds[node_id] = _DETACHED
+            self._values[node_id] = None
+
+    def _type_id(self, type_name: Any) -> int:
+        type_name = str(type_name)
+        type_id = self._type_index.get(type_name)
+        if type_id is None:
+            type_id = len(self._type_names)
+            self._type_names.append(sys.intern(type_name))
+            self._type_index[type_name] = type_id
+        return type_id
+
+    def _link_references(self) -> None:
+        """Resolve {path} references in string values to target token IDs"""
+        for node_id in range(len(self._values)):
+            self._link_node(node_id)
+
+    def _link_node(self, node_id: int) -> None:
+        value = self._values[node_id]
+        if isinstance(value, str) and '{' in value:
+            targets = (self.id_of(path) for path in scan(value).references)
+            self._references[node_id] = tuple(
+                MISSING_REFERENCE if target is None else target for target in targets
+            )
+        else:
+            self._references[node_id] = ()
+
+    # ------------------------------------------------------------------
+    # Columnar accessors
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._token_count
+
+    def __contains__(self, path: object) -> bool:
+        node_id = self.id_of(path) if isinstance(path, str) else None
+        return node_id is not None and self._kinds[node_id] != _GROUP
+
+    def id_of(self, path: str) -> Optional[int]:
+        """Get the node ID for a dot path (None if absent)"""
+        node_id = ROOT_ID
+        if not path:
+            return node_id
+        for key in path.split('.'):
+            children = self._children.get(node_id)
+            if children is None:
+                return None
+            node_id = children.get(key)
+            if node_id is None:
+                return None
+        return node_id
+
+    def path_of(self, node_id: int) -> str:
+        keys = []
+        while node_id > ROOT_ID:
+            keys.append(self._keys[node_id])
+            node_id = self._parents[node_id]
+        return '.'.join(reversed(keys))
+
+    def parent_of(self, node_id: int) -> int:
+        return self._parents[node_id]
+
+    def value_of(self, node_id: int) -> Any:
+        return self._values[node_id]
+
+    def type_of(self, node_id: int) -> Optional[str]:
+        return self._type_names[self._type_ids[node_id]] or None
+
+    def references_of(self, node_id: int) -> Tuple[int, ...]:
+        """Target IDs of the references in a token value (MISSING_REFERENCE if unknown)"""
+        return self._references[node_id]
+
+    def is_group(self, node_id: int) -> bool:
+        return self._kinds[node_id] == _GROUP
+
+    def token_ids(self) -> Iterator[int]:
+        """Iterate token (non-group) IDs in load order"""
+        kinds = self._kinds
+        return (
+            node_id for node_id in range(len(kinds))
+            if kinds[node_id] == _SCALAR or kinds[node_id] == _TOKEN
+        )
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """Get a token's raw value by dot path"""
+        node_id = self.id_of(path)
+        if node_id is None or self._kinds[node_id] == _GROUP:
+            return default
+        return self._values[node_id]
+
+    def set_value(self, path: str, value: Any) -> int:
+        """Set a token value by dot path, creating groups as needed"""
+        *group_keys, key = path.split('.')
+        node_count = len(self._keys)
+        group_id = ROOT_ID
+        for group_key in group_keys:
+            group_id = self._add_node(group_id, group_key, _GROUP, None, 0)
+
+        node_id = self._children[group_id].get(key)
+        if node_id is not None and self._kinds[node_id] == _TOKEN and not isinstance(value, Mapping):
+            # Keep the token's type and metadata, replace only its value
+            self._values[node_id] = value
+        else:
+            node_id = self._add_token(group_id, key, value)
+
+        if len(self._keys) != node_count:
+            # New paths may satisfy previously missing references
+            self._link_references()
+        else:
+            self._link_node(node_id)
+        return node_id
+
+    def flatten(self) -> Dict[str, Any]:
+        """Flat dot-path -> raw value dict, as produced by TokenResolver.flatten_tokens"""
+        flattened = {}
+        stack = [(ROOT_ID, '')]
+        while stack:
+            group_id, prefix = stack.pop()
+            for key, node_id in self._children[group_id].items():
+                path = f"{prefix}.{key}" if prefix else key
+                if self._kinds[node_id] == _GROUP:
+                    stack.append((node_id, path))
+                else:
+                    flattened[path] = self._values[node_id]
+        return flattened
+
+    def view(self, path: str = '') -> 'TokenTreeView':
+        """Read-only nested-dict view of a group"""
+        node_id = self.id_of(path)
+        if node_id is None or self._kinds[node_id] != _GROUP:
+            raise KeyError(path)
+        return TokenTreeView(self, node_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the store back into plain nested dicts"""
+        return _materialize(self.view())
+
+    def node_view(self, node_id: int) -> Any:
+        """The value a nested dict would hold for this node"""
+        kind = self._kinds[node_id]
+        if kind == _GROUP:
+            return TokenTreeView(self, node_id)
+        if kind == _TOKEN:
+            return TokenView(self, node_id)
+        return self._values[node_id]
+
+
+class TokenTreeView(Mapping):
+    """Zero-copy read-only view of a token group"""
+
+    __slots__ = ('_store', '_node_id')
+
+    def __init__(self, store: TokenStore, node_id: int = ROOT_ID):
+        self._store = store
+        self._node_id = node_id
+
+    @property
+    def path(self) -> str:
+        return self._store.path_of(self._node_id)
+
+    def __getitem__(self, key: str) -> Any:
+        child_id = self._store._children[self._node_id].get(key)
+        if child_id is None:
+            raise KeyError(key)
+        return self._store.node_view(child_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store._children[self._node_id])
+
+    def __len__(self) -> int:
+        return len(self._store._children[self._node_id])
+
+    def __repr__(self) -> str:
+        return f"TokenTreeView({self.path!r}, {len(self)} entries)"
+
+
+class TokenView(Mapping):
+    """Zero-copy read-only view of a dict token; the value reflects set_value"""
+
+    __slots__ = ('_store', '_node_id')
+
+    def __init__(self, store: TokenStore, node_id: int):
+        self._store = store
+        self._node_id = node_id
+
+    @property
+    def path(self) -> str:
+        return self._store.path_of(self._node_id)
+
+    @property
+    def value(self) -> Any:
+        return self._store._values[self._node_id]
+
+    @property
+    def type(self) -> Optional[str]:
+        return self._store.type_of(self._node_id)
+
+    @property
+    def references(self) -> Tuple[int, ...]:
+        return self._store._references[self._node_id]
+
+    def _value_key(self) -> str:
+        return '$value' if self._store._shapes[self._node_id] & _DOLLAR_VALUE else 'value'
+
+    def _type_key(self) -> Optional[str]:
+        shape = self._store._shapes[self._node_id]
+        if not shape & _HAS_TYPE:
+            return None
+        return '$type' if shape & _DOLLAR_TYPE else 'type'
+
+    def _extra_keys(self) -> Tuple[str, ...]:
+        return self._store._extra_schemas[self._store._extra_schema_ids[self._node_id]]
+
+    def __getitem__(self, key: str) -> Any:
+        store, node_id = self._store, self._node_id
+        if key == self._value_key():
+            return store._values[node_id]
+        if key == self._type_key():
+            return store._type_names[store._type_ids[node_id]]
+        extra_keys = self._extra_keys()
+        if key in extra_keys:
+            return store._extra_values[node_id][extra_keys.index(key)]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield self._value_key()
+        type_key = self._type_key()
+        if type_key is not None:
+            yield type_key
+        yield from self._extra_keys()
+
+    def __len__(self) -> int:
+        return 1 + (self._type_key() is not None) + len(self._extra_keys())
+
+    def __repr__(self) -> str:
+        return f"TokenView({self.path!r}, value={self.value!r})"
+
+
+def _materialize(view: Mapping) -> Dict[str, Any]:
+    result = {}
+    for key, value in view.items():
+        result[key] = _materialize(value) if isinstance(value, (TokenTreeView, TokenView)) else value
+    return result
@@ -20,6 +20,7 @@ from pathlib import Path
 import json
 import logging
 
+from tools.core.imports import DATACLASS_SLOTS
 from tools.variable_resolver import ResolvedVariable, VariableResolver
 from tools.token_parser import TokenType, TokenScope
 
@@ -63,7 +64,7 @@ TYPOGRAPHY_SCALES = {
 }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TypographyToken:
     """W3C DTCG-compliant typography token with EMU precision"""
     id: str
@@ -561,23 +562,27 @@ class TypographyTokenHierarchyResolver:
                 # Keep non-inheritance tokens as-is
                 resolved_tokens[token_id] = token
 
-        # Resolve inheritance for tokens that have inheritance relationships
-        for token_id, inherited_token in inherited_tokens.items():
-            try:
-                # Create hierarchy for this token resolution
-                token_hierarchy = inherited_tokens.copy()
-
-                # Resolve inheritance
-                resolved_inherited_token = self.inheritance_resolver.resolve_inheritance(
-                    inherited_token, token_hierarchy
-                )
-
+        # Resolve all inheritance relationships in one pass over the hierarchy
+        try:
+            resolved_inherited_tokens = self.inheritance_resolver.resolve_hierarchy(inherited_tokens)
+        except Exception as e:
+            logger.warning(f"Failed to resolve inheritance hierarchy: {e}; resolving tokens one by one")
+            resolved_inherited_tokens = {}
+            for token_id, inherited_token in inherited_tokens.items():
+                try:
+                    resolved_inherited_tokens[token_id] = self.inheritance_resolver.resolve_inheritance(
+                        inherited_token, inherited_tokens.copy()
+                    )
+                except Exception as token_error:
+                    logger.warning(f"Failed to resolve inheritance for token {token_id}: {token_error}")
+
+        for token_id in inherited_tokens:
+            if token_id in resolved_inherited_tokens:
                 # Convert back to TypographyToken with resolved inheritance data
-                resolved_token = self._convert_inherited_to_typography_token(resolved_inherited_token)
-                resolved_tokens[token_id] = resolved_token
-
-            except Exception as e:
-                logger.warning(f"Failed to resolve inheritance for token {token_id}: {e}")
+                resolved_tokens[token_id] = self._convert_inherited_to_typography_token(
+                    resolved_inherited_tokens[token_id]
+                )
+            else:
                 # Fallback to original token without inheritance
                 fallback_token = tokens[token_id]
                 fallback_token.inheritance_mode = "manual_override"
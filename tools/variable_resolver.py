@@ -13,12 +13,13 @@ Integrates with existing token_resolver.py while adding OOXML-native capabilitie
 """
 
 
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Set, Union, Tuple
 import re
+from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
 from dataclasses import dataclass, field
 import xml.etree.ElementTree as ET
-import hashlib
 import time
 
 from tools.token_parser import TokenType, TokenScope, TokenParser
@@ -26,6 +27,7 @@ import logging
 
 # Import existing components
 from tools.token_resolver import TokenResolver
+from tools.reference_scanner import scan
 from tools.ooxml_extension_manager import OOXMLExtensionManager, StyleStackExtension
 from tools.aspect_ratio_resolver import AspectRatioResolver, AspectRatioTokenError
 
@@ -69,6 +71,86 @@ class ResolvedVariable:
         return (self.hierarchy_level, scope_precedence.get(self.scope, 0))
 
 
+@dataclass
+class ResolutionGraph:
+    """
+    Persistent resolution state kept by resolve_all for incremental updates.
+    
+    Forward edges record the variables each resolution actually read (including
+    names that were missing at the time); reverse edges map a name to the
+    variables whose resolved value depends on it.
+    """
+    raw: Dict[str, ResolvedVariable] = field(default_factory=dict)
+    resolved: Dict[str, ResolvedVariable] = field(default_factory=dict)
+    dependencies: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    dependents: Dict[str, Set[str]] = field(default_factory=dict)
+    
+    def set_dependencies(self, var_id: str, names: Iterable[str]) -> None:
+        """Replace the forward edges of a variable and keep reverse edges in sync"""
+        for name in self.dependencies.get(var_id, ()):
+            dependents = self.dependents.get(name)
+            if dependents is not None:
+                dependents.discard(var_id)
+                if not dependents:
+                    del self.dependents[name]
+        
+        names = tuple(name for name in names if name != var_id)
+        if names:
+            self.dependencies[var_id] = names
+            for name in names:
+                self.dependents.setdefault(name, set()).add(var_id)
+        else:
+            self.dependencies.pop(var_id, None)
+    
+    def transitive_dependents(self, names: Iterable[str]) -> Set[str]:
+        """All variables whose resolution (directly or indirectly) read any of names"""
+        affected: Set[str] = set()
+        stack = list(names)
+        while stack:
+            for dependent in self.dependents.get(stack.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
+        return affected
+
+
+class DependencyTrackingContext(Mapping):
+    """
+    Read-only view over a resolution context that records which variables were read.
+    
+    Membership tests and lookups are recorded (including misses, since a later
+    definition of a missing variable changes the result). Iterating the whole
+    context makes the resolution depend on every variable, so it is flagged as
+    not cacheable by dependency.
+    """
+    
+    __slots__ = ('_context', 'reads', 'cacheable')
+    
+    def __init__(self, context: Mapping):
+        self._context = context
+        self.reads: set = set()
+        self.cacheable = True
+    
+    def __getitem__(self, key: str) -> 'ResolvedVariable':
+        self.reads.add(key)
+        return self._context[key]
+    
+    def __contains__(self, key: object) -> bool:
+        self.reads.add(key)
+        return key in self._context
+    
+    def __iter__(self) -> Iterator[str]:
+        self.cacheable = False
+        return iter(self._context)
+    
+    def __len__(self) -> int:
+        return len(self._context)
+    
+    def dependency_names(self) -> Tuple[str, ...]:
+        """Sorted names of all variables read so far"""
+        return tuple(sorted(self.reads))
+
+
 class VariableResolver:
     """
     Advanced variable resolution engine that unifies JSON tokens with OOXML extension variables.
@@ -95,10 +177,19 @@ class VariableResolver:
         self._extension_variables_cache: Dict[str, List[StyleStackExtension]] = {}
         self._resolved_cache: Dict[str, ResolvedVariable] = {}
         
-        # Nested reference resolution
-        self._nested_resolution_cache: Dict[str, str] = {}
+        # Nested reference resolution. Cache keys are built from the variables a
+        # resolution actually read; _cache_dependency_sets remembers, per pattern,
+        # which variable name sets have been seen so lookups stay O(dependencies).
+        self._nested_resolution_cache: "OrderedDict[Tuple[str, tuple], str]" = OrderedDict()
+        self._cache_dependency_sets: Dict[str, List[Tuple[str, ...]]] = {}
+        self._max_dependency_sets_per_pattern = 8
         self._resolution_depth_limit = 5
         self._max_cache_size = 1000
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Persistent graph from the last resolve_all, used by update_variables
+        self.resolution_graph: Optional[ResolutionGraph] = None
         
         # Regex patterns for nested reference detection
         self._nested_reference_regex = re.compile(
@@ -330,8 +421,9 @@ class VariableResolver:
                 
                 # Resolve token references in value
                 if '{' in variable.value:
-                    resolved_value = self._resolve_token_references_in_value(
-                        variable.value, variables
+                    resolved_value, _ = self._resolve_with_cache(
+                        variable.value, variables,
+                        lambda ctx, value=variable.value: self._resolve_token_references_in_value(value, ctx)
                     )
                     if resolved_value != variable.value:
                         # Create new variable with resolved value
@@ -378,30 +470,6 @@ class VariableResolver:
         
         return result
     
-    def _resolve_token_references_in_value(self, value: str, 
-                                         variables: Dict[str, ResolvedVariable]) -> str:
-        """Resolve {token.references} in variable values"""
-        pattern = r'\{([^}]+)\}'
-        
-        def replace_reference(match):
-            reference = match.group(1)
-            
-            # Try direct lookup first
-            if reference in variables:
-                return variables[reference].value
-            
-            # Try with scope prefix lookup
-            for var_id, variable in variables.items():
-                if var_id.endswith(reference) or variable.id == reference:
-                    return variable.value
-            
-            # Return original if not found
-            if self.verbose:
-                logger.warning(f"Unresolved variable reference: {reference}")
-            return match.group(0)
-        
-        return re.sub(pattern, replace_reference, value)
-    
     def _infer_scope_and_type_from_path(self, token_path: str) -> Tuple[TokenScope, TokenType]:
         """Infer scope and type from JSON token path"""
         parts = token_path.split('.')
@@ -638,24 +706,16 @@ class VariableResolver:
             CircularReferenceError: If circular references detected
             ValueError: If pattern is invalid or depth limit exceeded
         """
-        # Check cache first
-        if self.enable_cache:
-            cache_key = self._generate_cache_key(pattern, context)
-            if cache_key in self._nested_resolution_cache:
-                return self._nested_resolution_cache[cache_key]
-        
         # Validate pattern
         self._validate_nested_pattern(pattern)
         
-        # Resolve with depth tracking
-        result = self._resolve_nested_reference_recursive(
-            pattern, context, depth=0, resolution_path=[]
+        # Resolve with depth tracking (cached by the variables actually read)
+        result, _ = self._resolve_with_cache(
+            pattern, context,
+            lambda ctx: self._resolve_nested_reference_recursive(
+                pattern, ctx, depth=0, resolution_path=[]
+            )
         )
-        
-        # Cache result
-        if self.enable_cache:
-            self._update_cache(cache_key, result)
-        
         return result
 
     def _resolve_nested_reference_recursive(self, pattern: str, context: Dict[str, ResolvedVariable], 
@@ -744,8 +804,7 @@ class VariableResolver:
 
     def _contains_references(self, value: str) -> bool:
         """Check if a value contains any type of token references"""
-        simple_ref_pattern = r'\{[a-zA-Z][a-zA-Z0-9._]*\}'
-        return bool(re.search(simple_ref_pattern, value) or self._is_nested_reference(value))
+        return bool(scan(value).paths or self._is_nested_reference(value))
 
     def _resolve_token_references_in_value(self, value: str, context: Dict[str, ResolvedVariable], 
                                          depth: int = 0, resolution_path: List[str] = None) -> str:
@@ -772,10 +831,8 @@ class VariableResolver:
                         logger.warning(f"⚠️  Failed to resolve nested reference '{pattern}': {e}")
         
         # Handle simple references with existing logic
-        simple_pattern = re.compile(r'\{([a-zA-Z][a-zA-Z0-9._]*)\}')
-        for match in simple_pattern.finditer(value):
-            ref_name = match.group(1)
-            full_pattern = match.group(0)
+        for ref_name in dict.fromkeys(scan(value).paths):
+            full_pattern = f"{{{ref_name}}}"
             
             if ref_name in context:
                 resolved_ref = context[ref_name].value
@@ -790,31 +847,81 @@ class VariableResolver:
         
         return value
 
-    def _generate_cache_key(self, pattern: str, context: Dict[str, ResolvedVariable]) -> str:
-        """Generate cache key based on pattern and context state"""
-        # Create hash of context values that could affect resolution
-        context_hash = hashlib.md5()
+    def _resolve_with_cache(self, text: str, context: Mapping,
+                            resolve: Callable[[Mapping], str]) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Run a resolution through the dependency-scoped cache.
         
-        # Sort by key for consistent hashing
-        for key in sorted(context.keys()):
-            var = context[key]
-            context_hash.update(f"{key}:{var.value}:{var.hierarchy_level}".encode())
+        Args:
+            text: Pattern or value being resolved (first part of the cache key)
+            context: Variables available to the resolution
+            resolve: Callable performing the resolution against a context mapping
+            
+        Returns:
+            Tuple of (resolved value, names of the variables the resolution read)
+        """
+        if not self.enable_cache:
+            tracker = DependencyTrackingContext(context)
+            return resolve(tracker), tracker.dependency_names()
         
-        return f"{pattern}:{context_hash.hexdigest()[:8]}"
+        for names in self._cache_dependency_sets.get(text, ()):
+            cache_key = self._generate_cache_key(text, context, names)
+            if cache_key in self._nested_resolution_cache:
+                self._nested_resolution_cache.move_to_end(cache_key)
+                self._cache_hits += 1
+                return self._nested_resolution_cache[cache_key], names
+        
+        self._cache_misses += 1
+        tracker = DependencyTrackingContext(context)
+        result = resolve(tracker)
+        names = tracker.dependency_names()
+        
+        if tracker.cacheable:
+            known_sets = self._cache_dependency_sets.setdefault(text, [])
+            if names not in known_sets:
+                known_sets.append(names)
+                if len(known_sets) > self._max_dependency_sets_per_pattern:
+                    known_sets.pop(0)
+            self._update_cache(self._generate_cache_key(text, context, names), result)
+        
+        return result, names
 
-    def _update_cache(self, cache_key: str, result: str) -> None:
-        """Update cache with size limiting"""
-        if len(self._nested_resolution_cache) >= self._max_cache_size:
-            # Simple LRU: remove oldest entries (first 10%)
-            items_to_remove = list(self._nested_resolution_cache.keys())[:self._max_cache_size // 10]
-            for key in items_to_remove:
-                del self._nested_resolution_cache[key]
+    def _generate_cache_key(self, pattern: str, context: Mapping,
+                            dependencies: Optional[Tuple[str, ...]] = None) -> Tuple[str, tuple]:
+        """
+        Generate cache key from the pattern and the state of the variables it depends on.
+        
+        Only the named dependencies are inspected, so key generation is
+        O(dependencies) rather than O(context size). Missing variables are part of
+        the key since defining them later can change the result.
+        """
+        if dependencies is None:
+            dependencies = ()
+        
+        signature = []
+        for name in dependencies:
+            variable = context.get(name)
+            if variable is None:
+                signature.append((name, None, None))
+            else:
+                signature.append((name, variable.value, variable.hierarchy_level))
         
+        return (pattern, tuple(signature))
+
+    def _update_cache(self, cache_key: Tuple[str, tuple], result: str) -> None:
+        """Insert into the LRU cache, evicting least recently used entries"""
         self._nested_resolution_cache[cache_key] = result
+        self._nested_resolution_cache.move_to_end(cache_key)
+        
+        while len(self._nested_resolution_cache) > self._max_cache_size:
+            self._nested_resolution_cache.popitem(last=False)
 
     def clear_nested_cache(self) -> None:
         """Clear the nested resolution cache"""
         self._nested_resolution_cache.clear()
+        self._cache_dependency_sets.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
         if self.verbose:
             logger.info("🧹 Cleared nested reference resolution cache")
 
@@ -823,6 +930,8 @@ class VariableResolver:
         return {
             'nested_cache_size': len(self._nested_resolution_cache),
             'nested_cache_limit': self._max_cache_size,
+            'nested_cache_hits': self._cache_hits,
+            'nested_cache_misses': self._cache_misses,
             'resolution_depth_limit': self._resolution_depth_limit
         }
 
@@ -832,43 +941,116 @@ class VariableResolver:
             context = {}
         
         # Convert context to ResolvedVariable format if needed
-        resolved_context = {}
-        for key, value in context.items():
-            if isinstance(value, ResolvedVariable):
-                resolved_context[key] = value
-            else:
-                # Convert to ResolvedVariable
-                resolved_context[key] = ResolvedVariable(
-                    id=key,
-                    value=str(value),
-                    type=TokenType.TEXT,  # Default type
-                    scope=TokenScope.THEME,
-                    source='manual'
-                )
+        resolved_context = {
+            key: self._to_resolved_variable(key, value) for key, value in context.items()
+        }
+        graph = ResolutionGraph(raw=dict(resolved_context), resolved=resolved_context)
         
         # Resolve any nested references in values
-        for var_id, variable in resolved_context.items():
-            if self._contains_references(variable.value):
-                try:
-                    resolved_value = self._resolve_token_references_in_value(variable.value, resolved_context)
-                    # Create new variable with resolved value
-                    resolved_context[var_id] = ResolvedVariable(
-                        id=variable.id,
-                        value=resolved_value,
-                        type=variable.type,
-                        scope=variable.scope,
-                        source=variable.source,
-                        xpath=variable.xpath,
-                        ooxml_mapping=variable.ooxml_mapping,
-                        hierarchy_level=variable.hierarchy_level,
-                        dependencies=variable.dependencies
-                    )
-                except (KeyError, CircularReferenceError) as e:
-                    if self.verbose:
-                        logger.warning(f"⚠️  Failed to resolve references in '{var_id}': {e}")
+        for var_id in list(resolved_context):
+            self._resolve_graph_variable(graph, var_id)
         
+        self.resolution_graph = graph
         return resolved_context
 
+    def update_variables(self, changes: Dict[str, Any]) -> Dict[str, ResolvedVariable]:
+        """
+        Incrementally apply token changes to the graph built by the last resolve_all.
+        
+        Only the changed variables and their transitive dependents (found through
+        the reverse dependency edges) are re-resolved, in dependency order.
+        
+        Args:
+            changes: Mapping of variable id to new raw value or ResolvedVariable
+            
+        Returns:
+            The resolved variables whose value actually changed (or were added)
+            
+        Raises:
+            ValueError: If resolve_all has not been called yet
+        """
+        graph = self.resolution_graph
+        if graph is None:
+            raise ValueError("resolve_all must be called before update_variables")
+        
+        for var_id, value in changes.items():
+            graph.raw[var_id] = self._to_resolved_variable(var_id, value)
+        
+        affected = graph.transitive_dependents(changes) | set(changes)
+        previous = {var_id: graph.resolved.get(var_id) for var_id in affected}
+        
+        # Reset affected entries to their raw values, then re-resolve in dependency order
+        for var_id in affected:
+            graph.resolved[var_id] = graph.raw[var_id]
+        order = self._topological_sort({
+            var_id: [name for name in graph.dependencies.get(var_id, ()) if name in affected]
+            for var_id in affected
+        })
+        for var_id in order:
+            self._resolve_graph_variable(graph, var_id)
+        
+        changed = {}
+        for var_id in order:
+            old = previous[var_id]
+            new = graph.resolved[var_id]
+            if old is None or old.value != new.value:
+                changed[var_id] = new
+        
+        if self.verbose:
+            logger.info(f"🔁 Re-resolved {len(affected)} variables, {len(changed)} values changed")
+        
+        return changed
+
+    def _to_resolved_variable(self, key: str, value: Any) -> ResolvedVariable:
+        """Wrap a raw context value in a ResolvedVariable"""
+        if isinstance(value, ResolvedVariable):
+            return value
+        return ResolvedVariable(
+            id=key,
+            value=str(value),
+            type=TokenType.TEXT,  # Default type
+            scope=TokenScope.THEME,
+            source='manual'
+        )
+
+    def _resolve_graph_variable(self, graph: ResolutionGraph, var_id: str) -> None:
+        """Resolve one variable of the graph in place and record what it read"""
+        variable = graph.raw[var_id]
+        if not self._contains_references(variable.value):
+            graph.resolved[var_id] = variable
+            graph.set_dependencies(var_id, ())
+            return
+        
+        try:
+            resolved_value, read_names = self._resolve_with_cache(
+                variable.value, graph.resolved,
+                lambda ctx, value=variable.value: self._resolve_token_references_in_value(value, ctx)
+            )
+        except (KeyError, CircularReferenceError) as e:
+            if self.verbose:
+                logger.warning(f"⚠️  Failed to resolve references in '{var_id}': {e}")
+            # Keep edges to the referenced names so defining them later retries this variable
+            graph.set_dependencies(var_id, scan(variable.value).paths)
+            graph.resolved[var_id] = variable
+            return
+        
+        graph.set_dependencies(var_id, read_names)
+        # Create new variable with resolved value, recording what it actually read
+        graph.resolved[var_id] = ResolvedVariable(
+            id=variable.id,
+            value=resolved_value,
+            type=variable.type,
+            scope=variable.scope,
+            source=variable.source,
+            xpath=variable.xpath,
+            ooxml_mapping=variable.ooxml_mapping,
+            hierarchy_level=variable.hierarchy_level,
+            dependencies=variable.dependencies or [
+                name for name in read_names
+                if name != var_id and name in graph.resolved
+            ]
+        )
+
     def resolve_aspect_ratio_conditional_tokens(self, 
                                               base_tokens: Dict[str, Any], 
                                               aspect_ratio_token: str,
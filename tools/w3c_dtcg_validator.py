@@ -12,6 +12,7 @@ from tools.core import (
     ValidationResult, ValidationError as CoreValidationError,
     safe_load_json, error_boundary, handle_processing_error
 )
+from tools.reference_scanner import scan
 import re
 import math
 from enum import Enum
@@ -482,7 +483,7 @@ class W3CDTCGValidator:
             return
             
         # Check for various expression types
-        if self._expression_patterns['reference'].search(value):
+        if scan(value).paths:
             self._validate_token_references_in_value(value, result, token_path)
         
         if self._expression_patterns['arithmetic'].search(value):
@@ -584,7 +585,7 @@ class W3CDTCGValidator:
     
     def _validate_token_references_in_value(self, value: str, result: ValidationResult, token_path: str):
         """Validate token references within a value"""
-        references = self._expression_patterns['reference'].findall(value)
+        references = scan(value).paths
         
         for ref in references:
             if not self._is_valid_token_reference(ref):
@@ -870,8 +871,7 @@ class W3CDTCGValidator:
         
         if isinstance(value, str):
             # Simple references like {token.name}
-            matches = self._expression_patterns['reference'].findall(value)
-            references.extend(matches)
+            references.extend(scan(value).paths)
             
             # Nested references like {color.{theme}.primary}
             nested_matches = self._expression_patterns['nested_reference'].findall(value)
@@ -910,7 +910,7 @@ class W3CDTCGValidator:
     def _is_token_reference_or_expression(self, value: str) -> bool:
         """Check if value is a token reference or mathematical expression"""
         return bool(
-            self._expression_patterns['reference'].search(value) or
+            bool(scan(value).paths) or
             self._expression_patterns['arithmetic'].search(value) or
             self._expression_patterns['function_call'].search(value) or
             self._expression_patterns['calc_function'].search(value)
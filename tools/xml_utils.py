@@ -6,8 +6,15 @@ Common XML processing utilities shared across StyleStack modules.
 """
 
 
-from typing import Optional
+from typing import Optional, Union
 import xml.etree.ElementTree as ET
+import zipfile
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 
 def indent_xml(elem: ET.Element, level: int = 0) -> None:
@@ -68,4 +75,35 @@ def safe_parse_xml(xml_content: str) -> Optional[ET.Element]:
     try:
         return ET.fromstring(xml_content)
     except ET.ParseError:
-        return None
\ No newline at end of file
+        return None
+
+
+def write_xml_to_zip(zip_file: zipfile.ZipFile,
+                     zip_info: Union[str, zipfile.ZipInfo],
+                     root,
+                     pretty_print: bool = False,
+                     xml_declaration: bool = True) -> None:
+    """Serialize an element tree straight into a ZIP entry stream.
+
+    The tree is written through ``ZipFile.open(..., 'w')`` so no intermediate
+    string or bytes copy of the part is ever materialized. Both lxml and
+    ElementTree elements are supported; lxml trees keep their ``standalone``
+    declaration.
+
+    Args:
+        zip_file: ZIP archive opened for writing
+        zip_info: Entry name or ZipInfo describing the entry
+        root: Root element of the part to write
+        pretty_print: Indent the output (inflates part size, off by default)
+        xml_declaration: Whether to emit an XML declaration
+    """
+    with zip_file.open(zip_info, "w") as stream:
+        if LXML_AVAILABLE and isinstance(root, etree._Element):
+            tree = root.getroottree()
+            tree.write(stream, encoding="UTF-8", xml_declaration=xml_declaration,
+                       standalone=tree.docinfo.standalone, pretty_print=pretty_print)
+        else:
+            if pretty_print:
+                indent_xml(root)
+            ET.ElementTree(root).write(stream, encoding="UTF-8",
+                                       xml_declaration=xml_declaration)